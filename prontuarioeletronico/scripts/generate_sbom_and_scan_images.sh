@@ -20,10 +20,11 @@ mkdir -p "${SBOM_DIR}"
 
 for service in "${SERVICES[@]}"; do
   image="tcc/${service}:docker03-ci"
-  context_path="${ROOT_DIR}/services/${service}"
+  # Contexto comum em services/ para as imagens copiarem shared/service-client e shared/db-session.
+  context_path="${ROOT_DIR}/services"
 
-  echo "[DOCKER-03] Building ${image} from ${context_path}"
-  docker build -t "${image}" "${context_path}"
+  echo "[DOCKER-03] Building ${image} from ${context_path}/${service}"
+  docker build -t "${image}" -f "${context_path}/${service}/Dockerfile" "${context_path}"
 
   echo "[DOCKER-03] Scanning critical CVEs in ${image}"
   docker run --rm \
@@ -5,6 +5,9 @@ from fastapi import Depends, FastAPI, Header, HTTPException, Query, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, ConfigDict
 
+from db_session import DatabaseSessionMiddleware
+from service_client import AuthServiceClient
+
 from ...application.audit.create_audit_event_usecase import (
     CreateAuditEventInputDTO,
     CreateAuditEventUseCase,
@@ -17,9 +20,13 @@ from ...application.audit.list_audit_events_usecase import (
     ListAuditEventsInputDTO,
     ListAuditEventsUseCase,
 )
-from ...infra.audit.database import SessionLocal, init_database
+from ...infra.audit.database import (
+    ScopedSession,
+    init_database,
+    pool_status,
+    request_sessions,
+)
 from ...infra.audit.sqlalchemy_audit_event_repository import SqlAlchemyAuditEventRepository
-from ...infra.auth.auth_service_client import AuthServiceClient
 
 
 app = FastAPI(
@@ -27,6 +34,7 @@ app = FastAPI(
     version="1.0.0",
     description="Microsservico de auditoria em Clean Architecture (MS-05)",
 )
+app.add_middleware(DatabaseSessionMiddleware, sessions=request_sessions)
 
 
 APP_ENV = os.getenv("APP_ENV", "development")
@@ -66,12 +74,12 @@ class CreateAuditEventRequest(BaseModel):
 
 
 init_database()
-_db_session = SessionLocal()
+_db_session = ScopedSession
 _repository = SqlAlchemyAuditEventRepository(_db_session)
 _create_usecase = CreateAuditEventUseCase(_repository)
 _find_usecase = FindAuditEventUseCase(_repository)
 _list_usecase = ListAuditEventsUseCase(_repository)
-_auth_client = AuthServiceClient(base_url=AUTH_SERVICE_URL)
+_auth_client = AuthServiceClient.from_env(AUTH_SERVICE_URL)
 _bearer_scheme = HTTPBearer(auto_error=False)
 
 
@@ -97,18 +105,13 @@ def _require_roles(required_roles: list[str]):
         token = bearer.credentials if bearer else _extract_bearer_token(authorization)
 
         try:
-            verified = _auth_client.verify(token)
+            introspection = _auth_client.introspect(token, required_roles)
         except ValueError as error:
             raise HTTPException(status_code=401, detail=str(error)) from error
 
-        for role in required_roles:
-            try:
-                if _auth_client.authorize(token, role):
-                    return verified
-            except ValueError:
-                continue
-
-        raise HTTPException(status_code=403, detail="insufficient role")
+        if not introspection.get("authorized"):
+            raise HTTPException(status_code=403, detail="insufficient role")
+        return introspection
 
     return dependency
 
@@ -127,6 +130,11 @@ def service_info():
     }
 
 
+@app.get("/api/v1/maintenance/db-pool")
+def db_pool_status(_auth: dict = Depends(_require_roles(["admin"]))):
+    return pool_status()
+
+
 @app.post("/api/v1/audit/events", status_code=201)
 def create_audit_event(
     payload: CreateAuditEventRequest,
@@ -0,0 +1,203 @@
+"""
+Processo do auth-service usado pelos benchmarks.
+
+Sobe a aplicação real com uvicorn e acrescenta dois endpoints só de benchmark:
+
+- `GET /__bench/usage`: tempo de CPU e RSS do próprio processo;
+- `GET /__bench/profile`: contadores acumulados por operação (login, verify, authorize,
+  refresh, logout): requisições, queries SQL, CPU gasto no driver do banco, CPU de
+  JWT (assinar/validar) e chamadas de bcrypt, além do CPU total de bcrypt nos workers.
+
+O harness lê esses endpoints antes e depois da janela medida e usa a diferença, para
+isolar o custo do serviço do gerador de carga. Os tempos de CPU são por thread
+(`time.thread_time`), então requisições concorrentes não se somam entre si.
+
+Uso (a partir de services/auth-service, chamado pelos harnesses):
+    PYTHONPATH=. python benchmarks/auth_process.py --port 18081
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from pathlib import Path
+
+import uvicorn
+from sqlalchemy import event
+
+SERVICE_ROOT = Path(__file__).resolve().parents[1]
+if str(SERVICE_ROOT) not in sys.path:
+    sys.path.insert(0, str(SERVICE_ROOT))
+
+from src.auth.infra.api import main as auth_main  # noqa: E402
+from src.auth.infra.auth import database, pooled_password_hasher  # noqa: E402
+
+app = auth_main.app
+
+OPERATIONS = {
+    "/api/v1/auth/login": "login",
+    "/api/v1/auth/verify": "verify",
+    "/api/v1/auth/authorize": "authorize",
+    "/api/v1/auth/introspect": "introspect",
+    "/api/v1/auth/refresh": "refresh",
+    "/api/v1/auth/logout": "logout",
+}
+
+_current_operation: ContextVar[str | None] = ContextVar("bench_operation", default=None)
+
+
+class _Profile:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._operations: dict[str, Counter] = defaultdict(Counter)
+        self._bcrypt = Counter()
+
+    def add(self, key: str, value: float = 1) -> None:
+        operation = _current_operation.get() or "background"
+        with self._lock:
+            self._operations[operation][key] += value
+
+    def add_request(self, operation: str) -> None:
+        with self._lock:
+            self._operations[operation]["requests"] += 1
+
+    def add_bcrypt(self, cpu_seconds: float) -> None:
+        with self._lock:
+            self._bcrypt["calls"] += 1
+            self._bcrypt["cpu_seconds"] += cpu_seconds
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "operations": {name: dict(counters) for name, counters in self._operations.items()},
+                "bcrypt": dict(self._bcrypt),
+            }
+
+
+_profile = _Profile()
+
+
+class _OperationMiddleware:
+    # Marca a operação da requisição; o contexto segue para a threadpool dos endpoints.
+    def __init__(self, app):
+        self._app = app
+
+    async def __call__(self, scope, receive, send):
+        operation = OPERATIONS.get(scope.get("path")) if scope["type"] == "http" else None
+        token = _current_operation.set(operation)
+        try:
+            await self._app(scope, receive, send)
+        finally:
+            _current_operation.reset(token)
+        if operation is not None:
+            _profile.add_request(operation)
+
+
+def _timed(key: str, function):
+    def wrapper(*args, **kwargs):
+        started = time.thread_time()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _profile.add(key, time.thread_time() - started)
+
+    return wrapper
+
+
+def _counted(key: str, function):
+    def wrapper(*args, **kwargs):
+        _profile.add(key)
+        return function(*args, **kwargs)
+
+    return wrapper
+
+
+def _counted_async(key: str, function):
+    async def wrapper(*args, **kwargs):
+        _profile.add(key)
+        return await function(*args, **kwargs)
+
+    return wrapper
+
+
+def _bcrypt_timed(function):
+    def wrapper(*args):
+        started = time.thread_time()
+        try:
+            return function(*args)
+        finally:
+            _profile.add_bcrypt(time.thread_time() - started)
+
+    return wrapper
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("bench_started", []).append(time.thread_time())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["bench_started"].pop()
+    _profile.add("db_queries")
+    _profile.add("db_cpu_seconds", time.thread_time() - started)
+
+
+def install_profiling() -> None:
+    event.listen(database.engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(database.engine, "after_cursor_execute", _after_cursor_execute)
+
+    token_service = auth_main._token_service
+    for name in ("create_access_token", "create_refresh_token", "decode_token"):
+        setattr(token_service, name, _timed("jwt_cpu_seconds", getattr(token_service, name)))
+
+    hasher = auth_main._password_hasher
+    for name in ("hash", "verify"):
+        setattr(hasher, name, _counted("bcrypt_calls", getattr(hasher, name)))
+    for name in ("hash_async", "verify_async"):
+        setattr(hasher, name, _counted_async("bcrypt_calls", getattr(hasher, name)))
+    if hasher.snapshot()["executor"] == "thread":
+        # Com workers em processo o CPU do bcrypt fica fora deste processo.
+        for name in ("hash_password", "verify_password"):
+            setattr(
+                pooled_password_hasher,
+                name,
+                _bcrypt_timed(getattr(pooled_password_hasher, name)),
+            )
+
+    app.add_middleware(_OperationMiddleware)
+
+
+def _rss_bytes() -> int | None:
+    statm = Path("/proc/self/statm")
+    if statm.exists():
+        return int(statm.read_text().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    return None
+
+
+async def usage():
+    return {"cpu_seconds": time.process_time(), "rss_bytes": _rss_bytes()}
+
+
+async def profile():
+    return _profile.snapshot()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, required=True)
+    args = parser.parse_args()
+
+    install_profiling()
+    app.add_api_route("/__bench/usage", usage, methods=["GET"], include_in_schema=False)
+    app.add_api_route("/__bench/profile", profile, methods=["GET"], include_in_schema=False)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning", access_log=False)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
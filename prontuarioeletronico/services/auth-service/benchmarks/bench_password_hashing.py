@@ -0,0 +1,212 @@
+"""
+Benchmark de login e verify sob carga mista no auth-service.
+
+Sobe o serviço real (benchmarks/auth_process.py) com um SQLite temporário e, por
+--duration segundos, mantém --login-concurrency clientes fazendo login em laço e
+--verify-concurrency clientes chamando /api/v1/auth/verify. Roda duas vezes:
+
+- unbounded: pool de hashing grande e sem limite de admissão prático, equivalente
+  a fazer bcrypt direto nas threads de requisição (comportamento anterior);
+- bounded: configuração padrão (pool do tamanho dos núcleos e limite de admissão).
+
+Imprime em JSON a vazão de login (com respostas 503 separadas), a vazão e as
+latências p50/p95/p99 do verify e o snapshot do pool de hashing.
+
+Uso (a partir de services/auth-service):
+    PYTHONPATH=. python benchmarks/bench_password_hashing.py --duration 10 \\
+        --login-concurrency 8 --verify-concurrency 8 --rounds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+SERVICE_ROOT = Path(__file__).resolve().parents[1]
+
+PROFILES = {
+    "unbounded": {"AUTH_PASSWORD_HASH_WORKERS": "64", "AUTH_PASSWORD_HASH_MAX_PENDING": "10000"},
+    "bounded": {},
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _start_service(port: int, database_path: str, extra_env: dict) -> subprocess.Popen:
+    env = dict(os.environ)
+    env.update(
+        {
+            "APP_ENV": "development",
+            "AUTH_JWT_SECRET": "bench-secret",
+            "AUTH_DATABASE_URL": f"sqlite:///{database_path}",
+            "PYTHONPATH": str(SERVICE_ROOT),
+        }
+    )
+    env.update(extra_env)
+    return subprocess.Popen(
+        [sys.executable, str(SERVICE_ROOT / "benchmarks" / "auth_process.py"), "--port", str(port)],
+        cwd=str(SERVICE_ROOT),
+        env=env,
+    )
+
+
+async def _wait_ready(client: httpx.AsyncClient, process: subprocess.Popen) -> None:
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("auth-service exited during startup")
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("auth-service did not become ready")
+
+
+async def _login(client: httpx.AsyncClient) -> httpx.Response:
+    return await client.post(
+        "/api/v1/auth/login",
+        json={"username": "admin", "password": "admin123"},
+    )
+
+
+async def _measure(client: httpx.AsyncClient, args) -> dict:
+    access_token = (await _login(client)).json()["access_token"]
+    verify_headers = {"Authorization": f"Bearer {access_token}"}
+    login_statuses: Counter = Counter()
+    login_latencies: list[float] = []
+    verify_latencies: list[float] = []
+    verify_errors = 0
+    deadline = time.perf_counter() + args.duration
+
+    async def _login_loop() -> None:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await _login(client)
+            except httpx.TransportError:
+                login_statuses["transport_error"] += 1
+                continue
+            login_statuses[response.status_code] += 1
+            if response.status_code == 200:
+                login_latencies.append(time.perf_counter() - started)
+            elif response.status_code == 503:
+                await asyncio.sleep(float(response.headers.get("retry-after", "1")))
+
+    async def _verify_loop() -> None:
+        nonlocal verify_errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await client.get("/api/v1/auth/verify", headers=verify_headers)
+            except httpx.TransportError:
+                verify_errors += 1
+                continue
+            verify_latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                verify_errors += 1
+
+    usage_before = (await client.get("/__bench/usage")).json()
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(_login_loop() for _ in range(args.login_concurrency)),
+        *(_verify_loop() for _ in range(args.verify_concurrency)),
+    )
+    elapsed = time.perf_counter() - started
+    usage_after = (await client.get("/__bench/usage")).json()
+    hashing = (
+        await client.get("/api/v1/auth/maintenance/password-hashing", headers=verify_headers)
+    ).json()
+
+    return {
+        "login": {
+            "per_second": round(login_statuses[200] / elapsed, 2),
+            "statuses": {str(status): count for status, count in sorted(login_statuses.items(), key=str)},
+            "latency_ms": {
+                "p50": round(_percentile(login_latencies, 50) * 1000, 2),
+                "p99": round(_percentile(login_latencies, 99) * 1000, 2),
+            },
+        },
+        "verify": {
+            "per_second": round(len(verify_latencies) / elapsed, 1),
+            "errors": verify_errors,
+            "latency_ms": {
+                "p50": round(_percentile(verify_latencies, 50) * 1000, 2),
+                "p95": round(_percentile(verify_latencies, 95) * 1000, 2),
+                "p99": round(_percentile(verify_latencies, 99) * 1000, 2),
+            },
+        },
+        "service_cpu_seconds": round(usage_after["cpu_seconds"] - usage_before["cpu_seconds"], 3),
+        "password_hashing": hashing,
+    }
+
+
+async def _run_profile(name: str, args) -> dict:
+    port = _free_port()
+    with tempfile.TemporaryDirectory() as directory:
+        env = {"AUTH_BCRYPT_ROUNDS": str(args.rounds), "AUTH_REAPER_ENABLED": "false", **PROFILES[name]}
+        if args.executor:
+            env["AUTH_PASSWORD_HASH_EXECUTOR"] = args.executor
+        process = _start_service(port, str(Path(directory) / "auth.db"), env)
+        limits = httpx.Limits(max_connections=args.login_concurrency + args.verify_concurrency + 2)
+        try:
+            async with httpx.AsyncClient(
+                base_url=f"http://127.0.0.1:{port}",
+                timeout=60,
+                limits=limits,
+            ) as client:
+                await _wait_ready(client, process)
+                return await _measure(client, args)
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--login-concurrency", type=int, default=8)
+    parser.add_argument("--verify-concurrency", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--executor", choices=["thread", "process"], default=None)
+    parser.add_argument("--profile", choices=sorted(PROFILES), action="append")
+    args = parser.parse_args()
+
+    report = {
+        "cpu_count": os.cpu_count(),
+        "rounds": args.rounds,
+        "duration_seconds": args.duration,
+        "login_concurrency": args.login_concurrency,
+        "verify_concurrency": args.verify_concurrency,
+        "profiles": {name: asyncio.run(_run_profile(name, args)) for name in args.profile or PROFILES},
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,460 @@
+"""
+Benchmark de vazão do auth-service: login, verify, authorize, refresh e logout.
+
+Cria N usuários no banco (SQLite temporário por padrão, ou `--database-url` para um
+banco compatível com Postgres), sobe o serviço real em um processo separado
+(benchmarks/auth_process.py) e, para cada nível de concorrência do cenário, mantém
+esse número de clientes em malha fechada por `duration_seconds`. Cada cliente loga
+com um usuário próprio e sorteia a próxima operação pelo `mix` do cenário; operações
+que precisam de sessão (verify, authorize, refresh, logout) fazem login antes quando
+o cliente ainda não tem tokens ou acabou de fazer logout.
+
+O relatório JSON traz, por nível de concorrência e por operação: vazão, latências
+p50/p95/p99/max, contagem por status, queries SQL por operação e CPU por operação
+separado em bcrypt, JWT e banco; e, para o processo todo, CPU, RSS e a divisão do
+CPU entre bcrypt, JWT, banco e o restante (HTTP, validação, ORM).
+
+Uso (a partir de services/auth-service):
+    PYTHONPATH=. python benchmarks/load_test.py --scenario benchmarks/scenarios/smoke.json
+    PYTHONPATH=. python benchmarks/load_test.py --scenario benchmarks/scenarios/mixed.json \\
+        --concurrency 1,8,32 --users 1000 --output relatorio.json
+    PYTHONPATH=. python benchmarks/load_test.py --scenario benchmarks/scenarios/smoke.json \\
+        --baseline benchmarks/baselines/smoke.json --tolerance 0.3 --latency-tolerance 1.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+SERVICE_ROOT = Path(__file__).resolve().parents[1]
+if str(SERVICE_ROOT) not in sys.path:
+    sys.path.insert(0, str(SERVICE_ROOT))
+
+from src.auth.infra.auth.bcrypt_password_hasher import BcryptPasswordHasher  # noqa: E402
+from src.auth.infra.auth.sqlalchemy_base import Base  # noqa: E402
+from src.auth.infra.auth.sqlalchemy_models import UserModel  # noqa: E402
+
+OPERATIONS = ("login", "verify", "authorize", "refresh", "logout")
+SESSION_OPERATIONS = {"verify", "authorize", "refresh", "logout"}
+BENCH_USER_PREFIX = "bench-user-"
+BENCH_PASSWORD = "bench-password"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def seed_users(database_url: str, count: int, rounds: int) -> list[str]:
+    # Um único hash para todos: o custo do bcrypt no login é o mesmo e o seed fica rápido.
+    connect_args = {"check_same_thread": False} if database_url.startswith("sqlite") else {}
+    engine = create_engine(database_url, connect_args=connect_args)
+    Base.metadata.create_all(bind=engine)
+    password_hash = BcryptPasswordHasher(rounds=rounds).hash(BENCH_PASSWORD)
+    roles = ("admin", "profissional")
+    usernames = [f"{BENCH_USER_PREFIX}{index:06d}" for index in range(count)]
+    with Session(engine) as session:
+        session.query(UserModel).filter(UserModel.username.like(f"{BENCH_USER_PREFIX}%")).delete(
+            synchronize_session=False
+        )
+        session.add_all(
+            UserModel(
+                id=f"u-{username}",
+                username=username,
+                password_hash=password_hash,
+                role=roles[index % len(roles)],
+                active=True,
+            )
+            for index, username in enumerate(usernames)
+        )
+        session.commit()
+    engine.dispose()
+    return usernames
+
+
+def _start_service(port: int, database_url: str, extra_env: dict) -> subprocess.Popen:
+    env = dict(os.environ)
+    env.update(
+        {
+            "APP_ENV": "development",
+            "AUTH_JWT_SECRET": env.get("AUTH_JWT_SECRET", "bench-secret"),
+            "AUTH_DATABASE_URL": database_url,
+            "AUTH_BOOTSTRAP_DEFAULT_USERS": "false",
+            "PYTHONPATH": str(SERVICE_ROOT),
+        }
+    )
+    env.update({key: str(value) for key, value in extra_env.items()})
+    return subprocess.Popen(
+        [sys.executable, str(SERVICE_ROOT / "benchmarks" / "auth_process.py"), "--port", str(port)],
+        cwd=str(SERVICE_ROOT),
+        env=env,
+    )
+
+
+async def _wait_ready(client: httpx.AsyncClient, process: subprocess.Popen) -> None:
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("auth-service exited during startup")
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError("auth-service did not become ready within 60s")
+
+
+async def _bench_get(client: httpx.AsyncClient, path: str) -> dict:
+    # O servidor fecha a conexão depois de um 500; uma conexão morta do pool não é erro
+    # da medição.
+    for attempt in range(3):
+        try:
+            return (await client.get(path)).json()
+        except httpx.TransportError:
+            if attempt == 2:
+                raise
+    raise AssertionError("unreachable")
+
+
+class _Recorder:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, Counter] = defaultdict(Counter)
+
+    def record(self, operation: str, started: float, status: str) -> None:
+        self.latencies[operation].append(time.perf_counter() - started)
+        self.statuses[operation][status] += 1
+
+
+class _VirtualUser:
+    def __init__(self, client: httpx.AsyncClient, username: str, roles: list[str], recorder: _Recorder):
+        self._client = client
+        self._username = username
+        self._roles = roles
+        self._recorder = recorder
+        self._tokens: dict | None = None
+
+    async def run(self, operation: str, rng: random.Random) -> None:
+        if operation in SESSION_OPERATIONS and self._tokens is None:
+            await self._call("login")
+            if self._tokens is None:
+                return
+        await self._call(operation, rng)
+
+    async def _call(self, operation: str, rng: random.Random | None = None) -> None:
+        started = time.perf_counter()
+        try:
+            response = await self._send(operation, rng)
+        except httpx.HTTPError as error:
+            self._recorder.record(operation, started, type(error).__name__)
+            return
+        self._recorder.record(operation, started, str(response.status_code))
+
+        if operation in ("login", "refresh") and response.status_code == 200:
+            self._tokens = response.json()
+        elif operation == "logout" or response.status_code == 401:
+            self._tokens = None
+
+    async def _send(self, operation: str, rng: random.Random | None) -> httpx.Response:
+        if operation == "login":
+            return await self._client.post(
+                "/api/v1/auth/login",
+                json={"username": self._username, "password": BENCH_PASSWORD},
+            )
+        bearer = {"Authorization": f"Bearer {self._tokens['access_token']}"}
+        if operation == "verify":
+            return await self._client.get("/api/v1/auth/verify", headers=bearer)
+        if operation == "authorize":
+            return await self._client.get(
+                "/api/v1/auth/authorize",
+                params={"required_role": rng.choice(self._roles)},
+                headers=bearer,
+            )
+        if operation == "refresh":
+            return await self._client.post(
+                "/api/v1/auth/refresh",
+                json={"refresh_token": self._tokens["refresh_token"]},
+            )
+        return await self._client.post(
+            "/api/v1/auth/logout",
+            json={"refresh_token": self._tokens["refresh_token"]},
+            headers=bearer,
+        )
+
+
+async def _closed_loop(
+    client: httpx.AsyncClient,
+    scenario: dict,
+    usernames: list[str],
+    concurrency: int,
+    duration_seconds: float,
+    seed: int,
+) -> tuple[_Recorder, float]:
+    mix = scenario["mix"]
+    operations = [name for name in OPERATIONS if mix.get(name, 0) > 0]
+    weights = [mix[name] for name in operations]
+    roles = scenario.get("authorize_roles", ["admin", "profissional"])
+    recorder = _Recorder()
+    deadline = time.perf_counter() + duration_seconds
+
+    async def worker(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        user = _VirtualUser(client, usernames[index % len(usernames)], roles, recorder)
+        while time.perf_counter() < deadline:
+            await user.run(rng.choices(operations, weights=weights)[0], rng)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    return recorder, time.perf_counter() - started
+
+
+def _profile_delta(before: dict, after: dict) -> dict:
+    operations = {}
+    for name, counters in after["operations"].items():
+        previous = before["operations"].get(name, {})
+        operations[name] = {key: value - previous.get(key, 0) for key, value in counters.items()}
+    bcrypt = {key: value - before["bcrypt"].get(key, 0) for key, value in after["bcrypt"].items()}
+    return {"operations": operations, "bcrypt": bcrypt}
+
+
+def _level_report(
+    concurrency: int,
+    recorder: _Recorder,
+    elapsed: float,
+    profile: dict,
+    cpu_seconds: float,
+    rss_bytes: int | None,
+) -> dict:
+    bcrypt_calls = profile["bcrypt"].get("calls", 0)
+    bcrypt_cpu_per_call = profile["bcrypt"].get("cpu_seconds", 0.0) / bcrypt_calls if bcrypt_calls else 0.0
+    split = Counter()
+    operations = {}
+    total_requests = 0
+    total_succeeded = 0
+
+    for name in OPERATIONS:
+        latencies = recorder.latencies.get(name)
+        if not latencies:
+            continue
+        statuses = recorder.statuses[name]
+        succeeded = sum(count for status, count in statuses.items() if status.startswith("2"))
+        counters = profile["operations"].get(name, {})
+        served = counters.get("requests", 0) or 1
+        cpu = {
+            "bcrypt": counters.get("bcrypt_calls", 0) * bcrypt_cpu_per_call,
+            "jwt": counters.get("jwt_cpu_seconds", 0.0),
+            "db": counters.get("db_cpu_seconds", 0.0),
+        }
+        split.update(cpu)
+        total_requests += len(latencies)
+        total_succeeded += succeeded
+        operations[name] = {
+            "requests": len(latencies),
+            "throughput_rps": round(succeeded / elapsed, 1),
+            "statuses": dict(sorted(statuses.items())),
+            "latency_ms": {
+                "p50": round(_percentile(latencies, 50) * 1000, 3),
+                "p95": round(_percentile(latencies, 95) * 1000, 3),
+                "p99": round(_percentile(latencies, 99) * 1000, 3),
+                "max": round(max(latencies) * 1000, 3),
+            },
+            "db_queries_per_op": round(counters.get("db_queries", 0) / served, 2),
+            "cpu_ms_per_op": {key: round(value / served * 1000, 3) for key, value in cpu.items()},
+        }
+
+    background = profile["operations"].get("background", {})
+    split["db"] += background.get("db_cpu_seconds", 0.0)
+    split["other"] = max(0.0, cpu_seconds - sum(split.values()))
+    return {
+        "concurrency": concurrency,
+        "elapsed_seconds": round(elapsed, 3),
+        "requests": total_requests,
+        "throughput_rps": round(total_succeeded / elapsed, 1),
+        "error_rate": round((total_requests - total_succeeded) / max(1, total_requests), 4),
+        "operations": operations,
+        "service": {
+            "cpu_seconds": round(cpu_seconds, 3),
+            "cpu_percent": round(100 * cpu_seconds / elapsed, 1),
+            "rss_mb": round(rss_bytes / (1024 * 1024), 1) if rss_bytes is not None else None,
+            "cpu_split_seconds": {key: round(split[key], 3) for key in ("bcrypt", "jwt", "db", "other")},
+            "background_db_queries": background.get("db_queries", 0),
+        },
+    }
+
+
+async def _run_levels(scenario: dict, usernames: list[str], base_url: str, process: subprocess.Popen) -> list[dict]:
+    max_concurrency = max(scenario["concurrency"])
+    limits = httpx.Limits(max_connections=max_concurrency + 2, max_keepalive_connections=max_concurrency + 2)
+    seed = scenario.get("seed", 0)
+    duration = float(scenario["duration_seconds"])
+    warmup = float(scenario.get("warmup_seconds", 1))
+    levels = []
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        await _wait_ready(client, process)
+        for concurrency in scenario["concurrency"]:
+            if warmup:
+                await _closed_loop(client, scenario, usernames, concurrency, warmup, seed)
+
+            usage_before = await _bench_get(client, "/__bench/usage")
+            profile_before = await _bench_get(client, "/__bench/profile")
+            recorder, elapsed = await _closed_loop(client, scenario, usernames, concurrency, duration, seed)
+            usage_after = await _bench_get(client, "/__bench/usage")
+            profile_after = await _bench_get(client, "/__bench/profile")
+
+            levels.append(
+                _level_report(
+                    concurrency,
+                    recorder,
+                    elapsed,
+                    _profile_delta(profile_before, profile_after),
+                    usage_after["cpu_seconds"] - usage_before["cpu_seconds"],
+                    usage_after["rss_bytes"],
+                )
+            )
+    return levels
+
+
+def compare_with_baseline(
+    report: dict,
+    baseline: dict,
+    tolerance: float,
+    latency_tolerance: float | None = None,
+) -> list[str]:
+    # p95 swings with the runner far more than throughput does; each gets its own
+    # tolerance so the throughput check stays meaningful on CI.
+    latency_tolerance = tolerance if latency_tolerance is None else latency_tolerance
+    regressions = []
+    reference_levels = {level["concurrency"]: level for level in baseline["levels"]}
+    for level in report["levels"]:
+        reference = reference_levels.get(level["concurrency"])
+        if reference is None:
+            continue
+        prefix = f"c={level['concurrency']}"
+        if level["error_rate"] > reference["error_rate"] + tolerance * 0.1:
+            regressions.append(f"{prefix} error_rate {level['error_rate']} > baseline {reference['error_rate']}")
+        for name, current in level["operations"].items():
+            expected = reference["operations"].get(name)
+            if expected is None:
+                continue
+            if current["throughput_rps"] < expected["throughput_rps"] * (1 - tolerance):
+                regressions.append(
+                    f"{prefix} {name} throughput_rps {current['throughput_rps']} "
+                    f"< baseline {expected['throughput_rps']}"
+                )
+            if current["latency_ms"]["p95"] > expected["latency_ms"]["p95"] * (1 + latency_tolerance):
+                regressions.append(
+                    f"{prefix} {name} latency p95 {current['latency_ms']['p95']}ms "
+                    f"> baseline {expected['latency_ms']['p95']}ms"
+                )
+            # Queries por operação não dependem da máquina: meia query a mais já é regressão.
+            if current["db_queries_per_op"] > expected["db_queries_per_op"] + 0.5:
+                regressions.append(
+                    f"{prefix} {name} db_queries_per_op {current['db_queries_per_op']} "
+                    f"> baseline {expected['db_queries_per_op']}"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--scenario", required=True, type=Path)
+    parser.add_argument("--concurrency", help="níveis de concorrência separados por vírgula (ex.: 1,8,32)")
+    parser.add_argument("--duration", type=float, help="sobrescreve a duração medida por nível (s)")
+    parser.add_argument("--users", type=int, help="sobrescreve o número de usuários criados")
+    parser.add_argument("--database-url", help="banco do serviço (default: SQLite temporário)")
+    parser.add_argument("--output", type=Path, help="grava o relatório JSON neste arquivo")
+    parser.add_argument("--baseline", type=Path, help="relatório de referência para comparar")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument(
+        "--latency-tolerance",
+        type=float,
+        help="tolerância para o p95 (default: --tolerance)",
+    )
+    args = parser.parse_args()
+    if not 0 <= args.tolerance < 1:
+        parser.error("--tolerance deve estar em [0, 1): com 1 a queda de vazão nunca falha")
+
+    scenario = json.loads(args.scenario.read_text(encoding="utf-8"))
+    if args.concurrency:
+        scenario["concurrency"] = [int(value) for value in args.concurrency.split(",")]
+    if args.duration is not None:
+        scenario["duration_seconds"] = args.duration
+    if args.users is not None:
+        scenario["users"] = args.users
+
+    rounds = int(scenario.get("bcrypt_rounds", 12))
+    service_env = {"AUTH_BCRYPT_ROUNDS": rounds, "AUTH_REAPER_ENABLED": "false", **scenario.get("auth_env", {})}
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or f"sqlite:///{Path(directory) / 'auth-bench.db'}"
+        usernames = seed_users(database_url, int(scenario["users"]), rounds)
+        port = _free_port()
+        process = _start_service(port, database_url, service_env)
+        try:
+            levels = asyncio.run(_run_levels(scenario, usernames, f"http://127.0.0.1:{port}", process))
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+
+    report = {
+        "scenario": scenario.get("name", args.scenario.stem),
+        "database": database_url.split(":", 1)[0] if args.database_url else "sqlite",
+        "users": scenario["users"],
+        "bcrypt_rounds": rounds,
+        "duration_seconds": scenario["duration_seconds"],
+        "mix": scenario["mix"],
+        "cpu_count": os.cpu_count(),
+        "levels": levels,
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare_with_baseline(
+            report,
+            baseline,
+            args.tolerance,
+            args.latency_tolerance,
+        )
+        if regressions:
+            print("Regressão em relação ao baseline:", file=sys.stderr)
+            for item in regressions:
+                print(f"- {item}", file=sys.stderr)
+            return 1
+        print("Dentro da tolerância do baseline.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,8 +1,10 @@
+import asyncio
 from dataclasses import dataclass
 
 from datetime import datetime, timezone
 
 from ...domain.__seedwork.use_case_interface import UseCase
+from ...domain.auth.user_entity import User
 from ...domain.auth.user_repository_interface import UserRepositoryInterface
 from .contracts import PasswordHasher, RefreshTokenRepository, RefreshTokenState, TokenService
 
@@ -35,20 +37,47 @@ class AuthenticateUserUseCase(UseCase[AuthenticateUserInputDTO, AuthenticateUser
         self._refresh_token_repository = refresh_token_repository
 
     def execute(self, input_dto: AuthenticateUserInputDTO) -> AuthenticateUserOutputDTO:
+        user = self._find_user(input_dto)
+        if not self._password_hasher.verify(input_dto.password, user.password_hash):
+            raise ValueError("invalid credentials")
+        if self._password_hasher.needs_rehash(user.password_hash):
+            user = self._store_rehash(user, self._password_hasher.hash(input_dto.password))
+        return self._issue_tokens(user)
+
+    async def execute_async(self, input_dto: AuthenticateUserInputDTO) -> AuthenticateUserOutputDTO:
+        # Same steps as execute. bcrypt is awaited on the hasher's own pool and the short
+        # repository calls run in worker threads, so no thread sits blocked on a hash.
+        user = await asyncio.to_thread(self._find_user, input_dto)
+        if not await self._password_hasher.verify_async(input_dto.password, user.password_hash):
+            raise ValueError("invalid credentials")
+        if self._password_hasher.needs_rehash(user.password_hash):
+            password_hash = await self._password_hasher.hash_async(input_dto.password)
+            user = await asyncio.to_thread(self._store_rehash, user, password_hash)
+        return await asyncio.to_thread(self._issue_tokens, user)
+
+    def _find_user(self, input_dto: AuthenticateUserInputDTO) -> User:
         if not input_dto.username or not input_dto.password:
             raise ValueError("username and password are required")
 
         user = self._user_repository.find_by_username(input_dto.username)
         if user is None or not user.active:
             raise ValueError("invalid credentials")
+        return user
 
-        is_valid_password = self._password_hasher.verify(
-            input_dto.password,
-            user.password_hash,
+    def _store_rehash(self, user: User, password_hash: str) -> User:
+        # The configured cost changed since this hash was stored; the plain password
+        # is only available at login, so the upgraded hash is saved now.
+        user = User(
+            id=user.id,
+            username=user.username,
+            password_hash=password_hash,
+            role=user.role,
+            active=user.active,
         )
-        if not is_valid_password:
-            raise ValueError("invalid credentials")
+        self._user_repository.update(user)
+        return user
 
+    def _issue_tokens(self, user: User) -> AuthenticateUserOutputDTO:
         access_token = self._token_service.create_access_token(
             user_id=user.id,
             username=user.username,
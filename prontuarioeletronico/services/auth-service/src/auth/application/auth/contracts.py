@@ -4,6 +4,10 @@ from datetime import datetime
 from typing import Optional
 
 
+class PasswordHashingBusyError(RuntimeError):
+    pass
+
+
 class PasswordHasher(ABC):
     @abstractmethod
     def hash(self, plain_password: str) -> str:
@@ -13,6 +17,15 @@ class PasswordHasher(ABC):
     def verify(self, plain_password: str, password_hash: str) -> bool:
         raise NotImplementedError
 
+    def needs_rehash(self, password_hash: str) -> bool:
+        return False
+
+    async def hash_async(self, plain_password: str) -> str:
+        return self.hash(plain_password)
+
+    async def verify_async(self, plain_password: str, password_hash: str) -> bool:
+        return self.verify(plain_password, password_hash)
+
 
 class TokenService(ABC):
     @abstractmethod
@@ -57,6 +70,7 @@ class RefreshTokenRepository(ABC):
 class AccessTokenBlacklistState:
     jti: str
     expires_at: datetime
+    revoked_at: Optional[datetime] = None
 
 
 class AccessTokenBlacklistRepository(ABC):
@@ -67,3 +81,7 @@ class AccessTokenBlacklistRepository(ABC):
     @abstractmethod
     def is_blacklisted(self, jti: str, now: datetime) -> bool:
         raise NotImplementedError
+
+    @abstractmethod
+    def list_active(self, now: datetime) -> list[AccessTokenBlacklistState]:
+        raise NotImplementedError
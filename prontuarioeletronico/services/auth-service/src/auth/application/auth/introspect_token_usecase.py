@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+
+from ...domain.__seedwork.use_case_interface import UseCase
+from ...domain.auth.role import Role
+
+
+@dataclass
+class IntrospectTokenInputDTO:
+    claims: dict
+    required_roles: list[str] = field(default_factory=list)
+
+
+@dataclass
+class IntrospectTokenOutputDTO:
+    authorized: bool
+    role: str | None
+    matched_role: str | None
+
+
+class IntrospectTokenUseCase(UseCase[IntrospectTokenInputDTO, IntrospectTokenOutputDTO]):
+    # Works on claims already validated by the caller, so one request decodes the JWT
+    # and checks the blacklist once regardless of how many roles are acceptable.
+    def execute(self, input_dto: IntrospectTokenInputDTO) -> IntrospectTokenOutputDTO:
+        role = input_dto.claims.get("role")
+        if not input_dto.required_roles:
+            return IntrospectTokenOutputDTO(authorized=True, role=role, matched_role=None)
+
+        for required_role in input_dto.required_roles:
+            if role == required_role or role == Role.ADMIN.value:
+                return IntrospectTokenOutputDTO(
+                    authorized=True,
+                    role=role,
+                    matched_role=required_role,
+                )
+        return IntrospectTokenOutputDTO(authorized=False, role=role, matched_role=None)
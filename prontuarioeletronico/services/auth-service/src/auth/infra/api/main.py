@@ -1,7 +1,10 @@
 import os
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
-from fastapi import FastAPI, Header, HTTPException, Security
+import jwt
+from db_session import DatabaseSessionMiddleware
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Response, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, ConfigDict
 
@@ -9,6 +12,7 @@ from ...application.auth.authenticate_user_usecase import (
     AuthenticateUserInputDTO,
     AuthenticateUserUseCase,
 )
+from ...application.auth.contracts import PasswordHashingBusyError
 from ...application.auth.logout_usecase import LogoutInputDTO, LogoutUseCase
 from ...application.auth.refresh_access_token_usecase import (
     RefreshAccessTokenInputDTO,
@@ -18,9 +22,23 @@ from ...application.auth.authorize_role_usecase import (
     AuthorizeRoleInputDTO,
     AuthorizeRoleUseCase,
 )
-from ..auth.bcrypt_password_hasher import BcryptPasswordHasher
-from ..auth.database import SessionLocal, init_database
+from ...application.auth.introspect_token_usecase import (
+    IntrospectTokenInputDTO,
+    IntrospectTokenUseCase,
+)
+from ..auth.bcrypt_password_hasher import DEFAULT_BCRYPT_ROUNDS, BcryptPasswordHasher
+from ..auth.cached_access_token_blacklist_repository import CachedAccessTokenBlacklistRepository
+from ..auth.database import (
+    ScopedSession,
+    SessionLocal,
+    init_database,
+    pool_status,
+    request_sessions,
+)
+from ..auth.expired_token_reaper import ExpiredTokenReaper
 from ..auth.jwt_token_service import JwtTokenService
+from ..auth.pooled_password_hasher import PooledPasswordHasher
+from ..auth.signing_keys import ASYMMETRIC_ALGORITHMS, SigningKeyRing, generate_signing_key
 from ..auth.sqlalchemy_access_token_blacklist_repository import (
     SqlAlchemyAccessTokenBlacklistRepository,
 )
@@ -28,11 +46,24 @@ from ..auth.sqlalchemy_refresh_token_repository import SqlAlchemyRefreshTokenRep
 from ..auth.sqlalchemy_user_repository import SqlAlchemyUserRepository
 
 
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    _access_token_blacklist_repository.start()
+    if REAPER_ENABLED:
+        _expired_token_reaper.start()
+    yield
+    _expired_token_reaper.stop()
+    _access_token_blacklist_repository.stop()
+    _password_hasher.shutdown()
+
+
 app = FastAPI(
     title="Auth Service",
     version="1.0.0",
     description="Serviço de autenticação (JWT + RBAC) em Clean Architecture",
+    lifespan=_lifespan,
 )
+app.add_middleware(DatabaseSessionMiddleware, sessions=request_sessions)
 
 
 class LoginRequest(BaseModel):
@@ -74,20 +105,71 @@ class LogoutRequest(BaseModel):
 
 
 JWT_SECRET = os.getenv("AUTH_JWT_SECRET")
+JWT_ALGORITHM = os.getenv("AUTH_JWT_ALGORITHM", "HS256")
+JWT_KEYS_DIR = os.getenv("AUTH_JWT_KEYS_DIR")
+JWT_ACTIVE_KID = os.getenv("AUTH_JWT_ACTIVE_KID")
+JWKS_MAX_AGE_SECONDS = int(os.getenv("AUTH_JWKS_MAX_AGE_SECONDS", "300"))
+REVOCATION_SYNC_SECONDS = float(os.getenv("AUTH_REVOCATION_SYNC_SECONDS", "2"))
+REVOCATION_SYNC_OVERLAP_SECONDS = float(os.getenv("AUTH_REVOCATION_SYNC_OVERLAP_SECONDS", "30"))
+REAPER_ENABLED = os.getenv("AUTH_REAPER_ENABLED", "true").lower() == "true"
+REAPER_INTERVAL_SECONDS = float(os.getenv("AUTH_REAPER_INTERVAL_SECONDS", "60"))
+REAPER_BATCH_SIZE = int(os.getenv("AUTH_REAPER_BATCH_SIZE", "500"))
+REAPER_MAX_BATCHES = int(os.getenv("AUTH_REAPER_MAX_BATCHES", "20"))
+BCRYPT_ROUNDS = int(os.getenv("AUTH_BCRYPT_ROUNDS", str(DEFAULT_BCRYPT_ROUNDS)))
+PASSWORD_HASH_EXECUTOR = os.getenv("AUTH_PASSWORD_HASH_EXECUTOR", "thread")
+PASSWORD_HASH_WORKERS = int(os.getenv("AUTH_PASSWORD_HASH_WORKERS", "0")) or None
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("AUTH_PASSWORD_HASH_MAX_PENDING", "0")) or None
+PASSWORD_HASH_ADMISSION_TIMEOUT_SECONDS = float(
+    os.getenv("AUTH_PASSWORD_HASH_ADMISSION_TIMEOUT_SECONDS", "0.5")
+)
 APP_ENV = os.getenv("APP_ENV", "development")
 
-if not JWT_SECRET:
+if JWT_ALGORITHM not in ("HS256", *ASYMMETRIC_ALGORITHMS):
+    raise RuntimeError(f"AUTH_JWT_ALGORITHM '{JWT_ALGORITHM}' is not supported")
+
+_signing_key_ring: SigningKeyRing | None = None
+if JWT_ALGORITHM in ASYMMETRIC_ALGORITHMS:
+    if JWT_KEYS_DIR:
+        _signing_key_ring = SigningKeyRing.from_directory(JWT_KEYS_DIR, active_kid=JWT_ACTIVE_KID)
+    elif APP_ENV in {"production", "staging"}:
+        raise RuntimeError(f"AUTH_JWT_KEYS_DIR is required for environment '{APP_ENV}'")
+    else:
+        # Development only: a per-process key, so tokens do not survive a restart.
+        _signing_key_ring = SigningKeyRing(generate_signing_key(JWT_ALGORITHM))
+elif not JWT_SECRET:
     raise RuntimeError(
         f"AUTH_JWT_SECRET is required for environment '{APP_ENV}'"
     )
 
-init_database()
-_db_session = SessionLocal()
+init_database(password_hasher=BcryptPasswordHasher(rounds=BCRYPT_ROUNDS))
+_db_session = ScopedSession
 _user_repository = SqlAlchemyUserRepository(_db_session)
 _refresh_token_repository = SqlAlchemyRefreshTokenRepository(_db_session)
-_access_token_blacklist_repository = SqlAlchemyAccessTokenBlacklistRepository(_db_session)
-_password_hasher = BcryptPasswordHasher()
-_token_service = JwtTokenService(secret_key=JWT_SECRET)
+# Token validation reads the revocation set from memory; a background thread polls
+# the table (on its own sessions) for logouts made on other replicas.
+_access_token_blacklist_repository = CachedAccessTokenBlacklistRepository(
+    SqlAlchemyAccessTokenBlacklistRepository(_db_session),
+    sync_interval_seconds=REVOCATION_SYNC_SECONDS,
+    sync_overlap_seconds=REVOCATION_SYNC_OVERLAP_SECONDS,
+    session_factory=SessionLocal,
+)
+_access_token_blacklist_repository.load()
+# Purges expired refresh tokens and blacklist rows on its own sessions.
+_expired_token_reaper = ExpiredTokenReaper(
+    SessionLocal,
+    interval_seconds=REAPER_INTERVAL_SECONDS,
+    batch_size=REAPER_BATCH_SIZE,
+    max_batches_per_table=REAPER_MAX_BATCHES,
+)
+# Login hashes on its own bounded pool; verify/authorize never touch bcrypt.
+_password_hasher = PooledPasswordHasher(
+    rounds=BCRYPT_ROUNDS,
+    workers=PASSWORD_HASH_WORKERS,
+    max_pending=PASSWORD_HASH_MAX_PENDING,
+    admission_timeout_seconds=PASSWORD_HASH_ADMISSION_TIMEOUT_SECONDS,
+    executor_kind=PASSWORD_HASH_EXECUTOR,
+)
+_token_service = JwtTokenService(secret_key=JWT_SECRET, key_ring=_signing_key_ring)
 _authenticate_user_usecase = AuthenticateUserUseCase(
     user_repository=_user_repository,
     password_hasher=_password_hasher,
@@ -95,6 +177,7 @@ _authenticate_user_usecase = AuthenticateUserUseCase(
     refresh_token_repository=_refresh_token_repository,
 )
 _authorize_role_usecase = AuthorizeRoleUseCase(token_service=_token_service)
+_introspect_token_usecase = IntrospectTokenUseCase()
 _refresh_access_token_usecase = RefreshAccessTokenUseCase(
     token_service=_token_service,
     refresh_token_repository=_refresh_token_repository,
@@ -123,7 +206,10 @@ def _extract_bearer_token(authorization: str | None) -> str:
 
 
 def _validate_active_access_token(token: str) -> dict:
-    claims = _token_service.decode_token(token)
+    try:
+        claims = _token_service.decode_token(token)
+    except jwt.ExpiredSignatureError as error:
+        raise HTTPException(status_code=401, detail="token expired") from error
     if claims.get("type") != "access":
         raise HTTPException(status_code=401, detail="invalid access token type")
 
@@ -141,11 +227,37 @@ def _validate_active_access_token(token: str) -> dict:
     return claims
 
 
+def _require_admin(
+    authorization: str | None = Header(default=None),
+    bearer: HTTPAuthorizationCredentials | None = Security(_bearer_scheme),
+) -> dict:
+    token = bearer.credentials if bearer else _extract_bearer_token(authorization)
+    try:
+        claims = _validate_active_access_token(token)
+    except HTTPException:
+        raise
+    except Exception as error:
+        raise HTTPException(status_code=401, detail="invalid token") from error
+
+    if claims.get("role") != "admin":
+        raise HTTPException(status_code=403, detail="insufficient role")
+    return claims
+
+
 @app.get("/health")
 def health_check():
     return {"status": "healthy", "service": "auth"}
 
 
+@app.get("/.well-known/jwks.json")
+def jwks(response: Response):
+    # Public keys for offline verification; empty while tokens are signed with HS256.
+    response.headers["Cache-Control"] = f"public, max-age={JWKS_MAX_AGE_SECONDS}"
+    if _signing_key_ring is None:
+        return {"keys": []}
+    return _signing_key_ring.jwks()
+
+
 @app.get("/api/v1/info")
 def service_info():
     return {
@@ -158,10 +270,22 @@ def service_info():
     }
 
 
-@app.post("/api/v1/auth/login")
-def login(payload: LoginRequest):
+@app.post(
+    "/api/v1/auth/login",
+    responses={
+        503: {
+            "description": "Fila de hashing de senha cheia; tente novamente",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "password hashing saturated"}
+                }
+            },
+        }
+    },
+)
+async def login(payload: LoginRequest):
     try:
-        output = _authenticate_user_usecase.execute(
+        output = await _authenticate_user_usecase.execute_async(
             AuthenticateUserInputDTO(
                 username=payload.username,
                 password=payload.password,
@@ -173,6 +297,12 @@ def login(payload: LoginRequest):
             "token_type": output.token_type,
             "role": output.role,
         }
+    except PasswordHashingBusyError as error:
+        raise HTTPException(
+            status_code=503,
+            detail=str(error),
+            headers={"Retry-After": "1"},
+        ) from error
     except ValueError as error:
         raise HTTPException(status_code=401, detail=str(error)) from error
 
@@ -186,6 +316,7 @@ def login(payload: LoginRequest):
                 "application/json": {
                     "examples": {
                         "revoked": {"value": {"detail": "access token revoked"}},
+                        "expired": {"value": {"detail": "token expired"}},
                         "invalid": {"value": {"detail": "invalid token"}},
                     }
                 }
@@ -285,6 +416,42 @@ def logout(
         raise HTTPException(status_code=401, detail=str(error)) from error
 
 
+@app.get("/api/v1/auth/revocations")
+def list_revocations():
+    # Anonymous on purpose, like the JWKS: the gateway and the services' local verification
+    # poll it without a token of their own. It carries only random jtis and their exp, and
+    # the gateway does not route it, so it is reachable on the internal network only.
+    now = datetime.now(timezone.utc)
+    revoked = _access_token_blacklist_repository.list_active(now=now)
+    return {
+        "generated_at": int(now.timestamp()),
+        "revoked": [
+            {"jti": item.jti, "expires_at": int(item.expires_at.timestamp())}
+            for item in revoked
+        ],
+    }
+
+
+@app.get("/api/v1/auth/maintenance/reaper")
+def reaper_status(_claims: dict = Depends(_require_admin)):
+    return _expired_token_reaper.snapshot()
+
+
+@app.get("/api/v1/auth/maintenance/revocation-sync")
+def revocation_sync_status(_claims: dict = Depends(_require_admin)):
+    return _access_token_blacklist_repository.snapshot()
+
+
+@app.get("/api/v1/auth/maintenance/password-hashing")
+def password_hashing_status(_claims: dict = Depends(_require_admin)):
+    return _password_hasher.snapshot()
+
+
+@app.get("/api/v1/auth/maintenance/db-pool")
+def db_pool_status(_claims: dict = Depends(_require_admin)):
+    return pool_status()
+
+
 @app.get(
     "/api/v1/auth/authorize",
     responses={
@@ -294,6 +461,7 @@ def logout(
                 "application/json": {
                     "examples": {
                         "revoked": {"value": {"detail": "access token revoked"}},
+                        "expired": {"value": {"detail": "token expired"}},
                         "invalid": {"value": {"detail": "invalid token"}},
                     }
                 }
@@ -323,3 +491,50 @@ def authorize(
         raise
     except Exception as error:
         raise HTTPException(status_code=401, detail="invalid token") from error
+
+
+@app.get(
+    "/api/v1/auth/introspect",
+    responses={
+        401: {
+            "description": "Token inválido, ausente ou revogado",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "revoked": {"value": {"detail": "access token revoked"}},
+                        "expired": {"value": {"detail": "token expired"}},
+                        "invalid": {"value": {"detail": "invalid token"}},
+                    }
+                }
+            },
+        }
+    },
+)
+def introspect(
+    roles: list[str] = Query(default=[]),
+    authorization: str | None = Header(default=None),
+    bearer: HTTPAuthorizationCredentials | None = Security(_bearer_scheme),
+):
+    token = bearer.credentials if bearer else _extract_bearer_token(authorization)
+    try:
+        claims = _validate_active_access_token(token)
+    except HTTPException:
+        raise
+    except Exception as error:
+        raise HTTPException(status_code=401, detail="invalid token") from error
+
+    output = _introspect_token_usecase.execute(
+        IntrospectTokenInputDTO(claims=claims, required_roles=roles)
+    )
+    return {
+        "valid": True,
+        "claims": {
+            "sub": claims.get("sub"),
+            "username": claims.get("username"),
+            "role": claims.get("role"),
+            "exp": claims.get("exp"),
+        },
+        "authorized": output.authorized,
+        "matched_role": output.matched_role,
+        "required_roles": roles,
+    }
@@ -1,14 +1,47 @@
+from functools import lru_cache
+
 from passlib.context import CryptContext
 
 from ...application.auth.contracts import PasswordHasher
 
+DEFAULT_BCRYPT_ROUNDS = 12
+
+
+@lru_cache(maxsize=None)
+def crypt_context(rounds: int = DEFAULT_BCRYPT_ROUNDS) -> CryptContext:
+    # Pinning min and max to the configured cost makes needs_update() flag any hash
+    # produced with a different cost, in either direction.
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+def hash_password(rounds: int, plain_password: str) -> str:
+    return crypt_context(rounds).hash(plain_password)
+
+
+def verify_password(rounds: int, plain_password: str, password_hash: str) -> bool:
+    return crypt_context(rounds).verify(plain_password, password_hash)
+
 
 class BcryptPasswordHasher(PasswordHasher):
-    def __init__(self):
-        self._context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    def __init__(self, rounds: int = DEFAULT_BCRYPT_ROUNDS):
+        self._rounds = rounds
+        self._context = crypt_context(rounds)
+
+    @property
+    def rounds(self) -> int:
+        return self._rounds
 
     def hash(self, plain_password: str) -> str:
         return self._context.hash(plain_password)
 
     def verify(self, plain_password: str, password_hash: str) -> bool:
         return self._context.verify(plain_password, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        return self._context.needs_update(password_hash)
@@ -0,0 +1,130 @@
+import threading
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+
+from ...application.auth.contracts import (
+    AccessTokenBlacklistRepository,
+    AccessTokenBlacklistState,
+)
+from .revocation_set import RevocationSet
+from .sqlalchemy_access_token_blacklist_repository import SqlAlchemyAccessTokenBlacklistRepository
+
+
+class CachedAccessTokenBlacklistRepository(AccessTokenBlacklistRepository):
+    # Serves is_blacklisted and list_active from memory. The set is loaded from the table
+    # at startup and updated in place on logout. A background thread (start/stop) picks
+    # up revocations made by other replicas by polling for rows revoked since the last
+    # watermark every sync_interval_seconds, so token validation never waits on the
+    # database. The poll re-reads sync_overlap_seconds behind the watermark so slow
+    # commits and clock skew between replicas are not missed.
+    def __init__(
+        self,
+        repository: SqlAlchemyAccessTokenBlacklistRepository,
+        sync_interval_seconds: float = 2.0,
+        sync_overlap_seconds: float = 30.0,
+        session_factory: sessionmaker | None = None,
+    ):
+        self._repository = repository
+        self._sync_interval_seconds = sync_interval_seconds
+        self._sync_overlap = timedelta(seconds=sync_overlap_seconds)
+        # Polls read on their own short-lived sessions when a factory is given, so the
+        # thread neither shares the request sessions nor pins a pooled connection.
+        self._session_factory = session_factory
+        self._revocations = RevocationSet()
+        self._sync_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._watermark: datetime | None = None
+        self._lookups = 0
+        self._syncs = 0
+        self._sync_failures = 0
+
+    def load(self, now: datetime | None = None) -> None:
+        self.sync_once(now)
+
+    def sync_once(self, now: datetime | None = None) -> None:
+        with self._sync_lock:
+            self._sync(now or datetime.now(timezone.utc))
+
+    def start(self) -> None:
+        if self._thread is not None or self._sync_interval_seconds <= 0:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="revocation-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def add(self, token_state: AccessTokenBlacklistState) -> None:
+        token_state = replace(
+            token_state,
+            revoked_at=token_state.revoked_at or datetime.now(timezone.utc),
+        )
+        self._repository.add(token_state)
+        self._revocations.add(token_state.jti, token_state.expires_at.timestamp())
+
+    def is_blacklisted(self, jti: str, now: datetime) -> bool:
+        self._lookups += 1
+        return self._revocations.contains(jti, now.timestamp())
+
+    def list_active(self, now: datetime) -> list[AccessTokenBlacklistState]:
+        return [
+            AccessTokenBlacklistState(
+                jti=jti,
+                expires_at=datetime.fromtimestamp(expires_at, tz=timezone.utc),
+            )
+            for jti, expires_at in self._revocations.active(now.timestamp())
+        ]
+
+    def snapshot(self) -> dict:
+        return {
+            "running": self._thread is not None,
+            "sync_interval_seconds": self._sync_interval_seconds,
+            "revoked": len(self._revocations),
+            "lookups": self._lookups,
+            "syncs": self._syncs,
+            "sync_failures": self._sync_failures,
+            "watermark": self._watermark.isoformat() if self._watermark else None,
+        }
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self._sync_interval_seconds):
+            try:
+                self.sync_once()
+            except SQLAlchemyError:
+                # Keep serving the last known set; retry on the next interval.
+                self._sync_failures += 1
+
+    def _sync(self, now: datetime) -> None:
+        if self._session_factory is None:
+            states = self._read(self._repository, now)
+        else:
+            session: Session = self._session_factory()
+            try:
+                states = self._read(SqlAlchemyAccessTokenBlacklistRepository(session), now)
+            finally:
+                session.close()
+
+        watermark = self._watermark or now
+        for state in states:
+            self._revocations.add(state.jti, state.expires_at.timestamp())
+            if state.revoked_at is not None and state.revoked_at > watermark:
+                watermark = state.revoked_at
+        self._watermark = watermark
+        self._syncs += 1
+
+    def _read(
+        self,
+        repository: SqlAlchemyAccessTokenBlacklistRepository,
+        now: datetime,
+    ) -> list[AccessTokenBlacklistState]:
+        if self._watermark is None:
+            return repository.list_active(now)
+        return repository.list_revoked_since(self._watermark - self._sync_overlap, now)
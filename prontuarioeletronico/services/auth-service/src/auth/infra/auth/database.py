@@ -1,8 +1,15 @@
 import os
 
-from sqlalchemy import create_engine
+from db_session import (
+    DatabasePoolSettings,
+    RequestScopedSession,
+    create_pooled_engine,
+    describe_pool,
+)
+from sqlalchemy import inspect, text
 from sqlalchemy.orm import sessionmaker
 
+from ...application.auth.contracts import PasswordHasher
 from .sqlalchemy_base import Base
 from .sqlalchemy_models import UserModel
 from .bcrypt_password_hasher import BcryptPasswordHasher
@@ -15,22 +22,28 @@ BOOTSTRAP_DEFAULT_USERS = os.getenv("AUTH_BOOTSTRAP_DEFAULT_USERS", "true").lowe
 if APP_ENV in {"production", "staging"} and "AUTH_DATABASE_URL" not in os.environ:
     raise RuntimeError("AUTH_DATABASE_URL is required for production/staging")
 
-_engine_kwargs = {}
-if DATABASE_URL.startswith("sqlite"):
-    _engine_kwargs["connect_args"] = {"check_same_thread": False}
+POOL_SETTINGS = DatabasePoolSettings.from_env("AUTH", DATABASE_URL)
 
-engine = create_engine(DATABASE_URL, **_engine_kwargs)
+engine = create_pooled_engine(DATABASE_URL, POOL_SETTINGS)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+request_sessions = RequestScopedSession(SessionLocal, name="auth")
+ScopedSession = request_sessions.session
 
 
-def init_database() -> None:
+def pool_status() -> dict:
+    return describe_pool(engine, POOL_SETTINGS)
+
+
+def init_database(password_hasher: PasswordHasher | None = None) -> None:
     Base.metadata.create_all(bind=engine)
+    if DATABASE_URL.startswith("sqlite"):
+        _ensure_legacy_columns()
 
     session = SessionLocal()
     try:
         existing_count = session.query(UserModel).count()
         if existing_count == 0 and BOOTSTRAP_DEFAULT_USERS and APP_ENV in {"development", "test"}:
-            hasher = BcryptPasswordHasher()
+            hasher = password_hasher or BcryptPasswordHasher()
             session.add_all(
                 [
                     UserModel(
@@ -52,3 +65,37 @@ def init_database() -> None:
             session.commit()
     finally:
         session.close()
+
+
+def _ensure_legacy_columns() -> None:
+    with engine.begin() as connection:
+        inspector = inspect(connection)
+        table_names = set(inspector.get_table_names())
+
+        if "auth_refresh_tokens" in table_names:
+            # Used by the expired token reaper.
+            connection.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_auth_refresh_tokens_expires_at "
+                    "ON auth_refresh_tokens (expires_at)"
+                )
+            )
+
+        if "auth_access_token_blacklist" not in table_names:
+            return
+
+        blacklist_columns = {
+            column["name"] for column in inspector.get_columns("auth_access_token_blacklist")
+        }
+        if "revoked_at" not in blacklist_columns:
+            connection.execute(
+                text(
+                    "ALTER TABLE auth_access_token_blacklist ADD COLUMN revoked_at DATETIME NOT NULL DEFAULT '1970-01-01 00:00:00'"
+                )
+            )
+            connection.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_auth_access_token_blacklist_revoked_at "
+                    "ON auth_access_token_blacklist (revoked_at)"
+                )
+            )
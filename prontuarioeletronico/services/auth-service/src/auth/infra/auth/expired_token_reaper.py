@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+
+from .sqlalchemy_models import AccessTokenBlacklistModel, RefreshTokenModel
+
+
+class ExpiredTokenReaper:
+    # Deletes expired refresh tokens and blacklist rows in the background. Each batch
+    # selects at most batch_size rows through the expires_at index and deletes them in
+    # its own short transaction; a run stops after max_batches_per_table per table so a
+    # large backlog is drained over several intervals instead of one long lock.
+    _MODELS = (RefreshTokenModel, AccessTokenBlacklistModel)
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        interval_seconds: float = 60.0,
+        batch_size: int = 500,
+        max_batches_per_table: int = 20,
+    ):
+        self._session_factory = session_factory
+        self._interval_seconds = interval_seconds
+        self._batch_size = batch_size
+        self._max_batches_per_table = max_batches_per_table
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._rows_reaped: Counter = Counter()
+        self._runs = 0
+        self._failures = 0
+        self._seconds_total = 0.0
+        self._last_run_seconds = 0.0
+
+    def run_once(self, now: datetime | None = None) -> dict[str, int]:
+        now = now or datetime.now(timezone.utc)
+        started = time.perf_counter()
+        reaped = {model.__tablename__: self._reap(model, now) for model in self._MODELS}
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._rows_reaped.update(reaped)
+            self._runs += 1
+            self._seconds_total += elapsed
+            self._last_run_seconds = elapsed
+        return reaped
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="expired-token-reaper", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "running": self._thread is not None,
+                "interval_seconds": self._interval_seconds,
+                "batch_size": self._batch_size,
+                "runs": self._runs,
+                "failures": self._failures,
+                "rows_reaped": dict(self._rows_reaped),
+                "seconds_total": round(self._seconds_total, 6),
+                "last_run_seconds": round(self._last_run_seconds, 6),
+            }
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self._interval_seconds):
+            try:
+                self.run_once()
+            except SQLAlchemyError:
+                # Retry on the next interval.
+                with self._lock:
+                    self._failures += 1
+
+    def _reap(self, model, now: datetime) -> int:
+        reaped = 0
+        for _ in range(self._max_batches_per_table):
+            session: Session = self._session_factory()
+            try:
+                jtis = [
+                    row.jti
+                    for row in session.query(model.jti)
+                    .filter(model.expires_at <= now)
+                    .order_by(model.expires_at)
+                    .limit(self._batch_size)
+                ]
+                if jtis:
+                    session.query(model).filter(model.jti.in_(jtis)).delete(synchronize_session=False)
+                    session.commit()
+            finally:
+                session.close()
+            reaped += len(jtis)
+            if len(jtis) < self._batch_size:
+                break
+        return reaped
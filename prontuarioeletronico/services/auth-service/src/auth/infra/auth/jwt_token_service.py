@@ -4,20 +4,29 @@ from uuid import uuid4
 import jwt
 
 from ...application.auth.contracts import TokenService
+from .signing_keys import SigningKeyRing
 
 
 class JwtTokenService(TokenService):
     def __init__(
         self,
-        secret_key: str,
+        secret_key: str | None = None,
         algorithm: str = "HS256",
         access_expires_minutes: int = 15,
         refresh_expires_minutes: int = 60 * 24 * 7,
+        key_ring: SigningKeyRing | None = None,
     ):
+        if key_ring is None and not secret_key:
+            raise ValueError("secret_key or key_ring is required")
         self._secret_key = secret_key
         self._algorithm = algorithm
         self._access_expires_minutes = access_expires_minutes
         self._refresh_expires_minutes = refresh_expires_minutes
+        self._key_ring = key_ring
+
+    @property
+    def key_ring(self) -> SigningKeyRing | None:
+        return self._key_ring
 
     def create_access_token(self, *, user_id: str, username: str, role: str) -> str:
         now = datetime.now(timezone.utc)
@@ -30,7 +39,7 @@ class JwtTokenService(TokenService):
             "iat": int(now.timestamp()),
             "exp": int((now + timedelta(minutes=self._access_expires_minutes)).timestamp()),
         }
-        return jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
+        return self._encode(payload)
 
     def create_refresh_token(self, *, user_id: str, username: str, role: str) -> str:
         now = datetime.now(timezone.utc)
@@ -43,7 +52,25 @@ class JwtTokenService(TokenService):
             "iat": int(now.timestamp()),
             "exp": int((now + timedelta(minutes=self._refresh_expires_minutes)).timestamp()),
         }
-        return jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
+        return self._encode(payload)
 
     def decode_token(self, token: str) -> dict:
-        return jwt.decode(token, self._secret_key, algorithms=[self._algorithm])
+        if self._key_ring is None:
+            return jwt.decode(token, self._secret_key, algorithms=[self._algorithm])
+
+        key = self._key_ring.key_for(jwt.get_unverified_header(token).get("kid"))
+        if key is None:
+            raise jwt.InvalidTokenError("unknown signing key")
+        return jwt.decode(token, key.public_key, algorithms=[key.algorithm])
+
+    def _encode(self, payload: dict) -> str:
+        if self._key_ring is None:
+            return jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
+
+        key = self._key_ring.active
+        return jwt.encode(
+            payload,
+            key.private_key,
+            algorithm=key.algorithm,
+            headers={"kid": key.kid},
+        )
@@ -0,0 +1,149 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+
+from ...application.auth.contracts import PasswordHasher, PasswordHashingBusyError
+from .bcrypt_password_hasher import DEFAULT_BCRYPT_ROUNDS, crypt_context, hash_password, verify_password
+
+EXECUTOR_KINDS = ("thread", "process")
+
+
+class PooledPasswordHasher(PasswordHasher):
+    # Runs bcrypt on a dedicated pool sized to the cores so password checks cannot take
+    # over the request threads that serve verify/authorize. Admission is bounded
+    # separately: at most max_pending hashes are queued or running, and a caller that
+    # cannot get a slot within admission_timeout_seconds gets PasswordHashingBusyError
+    # instead of waiting behind the backlog. The async variants (used by the login
+    # endpoint) never wait for a slot: a full pool is rejected straight away, and the
+    # hash is awaited on the pool instead of holding a request thread.
+    def __init__(
+        self,
+        rounds: int = DEFAULT_BCRYPT_ROUNDS,
+        workers: int | None = None,
+        max_pending: int | None = None,
+        admission_timeout_seconds: float = 0.5,
+        executor_kind: str = "thread",
+    ):
+        if executor_kind not in EXECUTOR_KINDS:
+            raise ValueError(f"unsupported executor kind '{executor_kind}'")
+        self._rounds = rounds
+        self._context = crypt_context(rounds)
+        self._workers = workers or os.cpu_count() or 1
+        self._max_pending = max_pending or self._workers * 2
+        self._admission_timeout_seconds = admission_timeout_seconds
+        self._executor_kind = executor_kind
+        self._admission = threading.BoundedSemaphore(self._max_pending)
+        self._executor: Executor | None = None
+        self._executor_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._admission_wait_seconds = 0.0
+        self._hash_seconds = 0.0
+
+    @property
+    def rounds(self) -> int:
+        return self._rounds
+
+    def hash(self, plain_password: str) -> str:
+        return self._run(hash_password, self._rounds, plain_password)
+
+    def verify(self, plain_password: str, password_hash: str) -> bool:
+        return self._run(verify_password, self._rounds, plain_password, password_hash)
+
+    async def hash_async(self, plain_password: str) -> str:
+        return await self._run_async(hash_password, self._rounds, plain_password)
+
+    async def verify_async(self, plain_password: str, password_hash: str) -> bool:
+        return await self._run_async(verify_password, self._rounds, plain_password, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        return self._context.needs_update(password_hash)
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "executor": self._executor_kind,
+                "rounds": self._rounds,
+                "workers": self._workers,
+                "max_pending": self._max_pending,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "admission_wait_seconds": round(self._admission_wait_seconds, 6),
+                "hash_seconds": round(self._hash_seconds, 6),
+            }
+
+    def _run(self, function, *args):
+        requested = time.perf_counter()
+        if not self._admission.acquire(timeout=self._admission_timeout_seconds):
+            self._reject()
+        admitted = self._admit(requested)
+        try:
+            return self._get_executor().submit(function, *args).result()
+        finally:
+            self._finish(admitted)
+
+    async def _run_async(self, function, *args):
+        requested = time.perf_counter()
+        if not self._admission.acquire(blocking=False):
+            self._reject()
+        admitted = self._admit(requested)
+        try:
+            future = self._get_executor().submit(function, *args)
+        except BaseException:
+            self._finish(admitted)
+            raise
+        # The slot is returned when the hash really ends, not when the awaiting request
+        # goes away (a cancelled login cannot stop a running bcrypt call).
+        future.add_done_callback(lambda _: self._finish(admitted))
+        return await asyncio.wrap_future(future)
+
+    def _reject(self) -> None:
+        with self._lock:
+            self._rejected += 1
+        raise PasswordHashingBusyError("password hashing saturated")
+
+    def _admit(self, requested: float) -> float:
+        admitted = time.perf_counter()
+        with self._lock:
+            self._in_flight += 1
+            self._admission_wait_seconds += admitted - requested
+        return admitted
+
+    def _finish(self, admitted: float) -> None:
+        finished = time.perf_counter()
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+            self._hash_seconds += finished - admitted
+        self._admission.release()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is not None:
+            return self._executor
+        with self._executor_lock:
+            if self._executor is None:
+                if self._executor_kind == "process":
+                    # spawn: the workers only need bcrypt, not a fork of the app with
+                    # its open database connections and background threads.
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self._workers,
+                        mp_context=get_context("spawn"),
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._workers,
+                        thread_name_prefix="password-hash",
+                    )
+            return self._executor
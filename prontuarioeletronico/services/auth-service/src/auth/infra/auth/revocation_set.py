@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import heapq
+import threading
+
+
+class RevocationSet:
+    # Revoked jti -> exp (epoch seconds), with a min-heap on exp as the timer structure:
+    # entries leave in expiry order as time passes, without scanning the whole set.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._expiries: dict[str, float] = {}
+        self._timers: list[tuple[float, str]] = []
+
+    def add(self, jti: str, expires_at: float) -> None:
+        with self._lock:
+            if self._expiries.get(jti, float("-inf")) >= expires_at:
+                return
+            self._expiries[jti] = expires_at
+            heapq.heappush(self._timers, (expires_at, jti))
+
+    def contains(self, jti: str, now: float) -> bool:
+        with self._lock:
+            self._expire(now)
+            return jti in self._expiries
+
+    def active(self, now: float) -> list[tuple[str, float]]:
+        with self._lock:
+            self._expire(now)
+            return list(self._expiries.items())
+
+    def __len__(self) -> int:
+        return len(self._expiries)
+
+    def _expire(self, now: float) -> None:
+        while self._timers and self._timers[0][0] <= now:
+            expires_at, jti = heapq.heappop(self._timers)
+            if self._expiries.get(jti) == expires_at:
+                del self._expiries[jti]
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import uuid4
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+
+ASYMMETRIC_ALGORITHMS = ("RS256", "EdDSA")
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    kid: str
+    algorithm: str
+    public_key: object
+    private_key: object | None = None
+
+    def to_jwk(self) -> dict:
+        jwk = jwt.get_algorithm_by_name(self.algorithm).to_jwk(self.public_key, as_dict=True)
+        return {**jwk, "kid": self.kid, "alg": self.algorithm, "use": "sig"}
+
+
+def _algorithm_for(key: object) -> str:
+    if isinstance(key, (rsa.RSAPrivateKey, rsa.RSAPublicKey)):
+        return "RS256"
+    if isinstance(key, (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey)):
+        return "EdDSA"
+    raise ValueError(f"unsupported signing key type: {type(key).__name__}")
+
+
+def load_signing_key(path: Path) -> SigningKey:
+    data = path.read_bytes()
+    try:
+        private_key = serialization.load_pem_private_key(data, password=None)
+    except ValueError:
+        public_key = serialization.load_pem_public_key(data)
+        return SigningKey(kid=path.stem, algorithm=_algorithm_for(public_key), public_key=public_key)
+    return SigningKey(
+        kid=path.stem,
+        algorithm=_algorithm_for(private_key),
+        public_key=private_key.public_key(),
+        private_key=private_key,
+    )
+
+
+def generate_signing_key(algorithm: str, kid: str | None = None) -> SigningKey:
+    if algorithm == "RS256":
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    elif algorithm == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        raise ValueError(f"unsupported signing algorithm: {algorithm}")
+    return SigningKey(
+        kid=kid or uuid4().hex,
+        algorithm=algorithm,
+        public_key=private_key.public_key(),
+        private_key=private_key,
+    )
+
+
+class SigningKeyRing:
+    # The active key signs new tokens; every key in the ring (active and retired) is
+    # published in the JWKS and accepted when verifying, so a rotation only drops the old
+    # key after the longest-lived token it signed has expired.
+    def __init__(self, active: SigningKey, keys: list[SigningKey] | None = None):
+        if active.private_key is None:
+            raise ValueError(f"active signing key '{active.kid}' has no private key")
+        self._active = active
+        self._keys = {key.kid: key for key in keys or []}
+        self._keys[active.kid] = active
+
+    @classmethod
+    def from_directory(cls, keys_dir: str, active_kid: str | None = None) -> SigningKeyRing:
+        # One PEM per key, named <kid>.pem; retired keys may be public keys only.
+        keys = [load_signing_key(path) for path in sorted(Path(keys_dir).glob("*.pem"))]
+        if not keys:
+            raise ValueError(f"no signing keys (*.pem) found in {keys_dir}")
+        if active_kid is None:
+            if len(keys) > 1:
+                raise ValueError("AUTH_JWT_ACTIVE_KID is required when several keys are configured")
+            active_kid = keys[0].kid
+        active = next((key for key in keys if key.kid == active_kid), None)
+        if active is None:
+            raise ValueError(f"active signing key '{active_kid}' not found in {keys_dir}")
+        return cls(active=active, keys=keys)
+
+    @property
+    def active(self) -> SigningKey:
+        return self._active
+
+    def key_for(self, kid: str | None) -> SigningKey | None:
+        if kid is None:
+            return None
+        return self._keys.get(kid)
+
+    def jwks(self) -> dict:
+        return {"keys": [key.to_jwk() for key in self._keys.values()]}
@@ -9,6 +9,10 @@ from ...application.auth.contracts import (
 from .sqlalchemy_models import AccessTokenBlacklistModel
 
 
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
 class SqlAlchemyAccessTokenBlacklistRepository(AccessTokenBlacklistRepository):
     def __init__(self, session: Session):
         self._session = session
@@ -20,6 +24,7 @@ class SqlAlchemyAccessTokenBlacklistRepository(AccessTokenBlacklistRepository):
                 AccessTokenBlacklistModel(
                     jti=token_state.jti,
                     expires_at=token_state.expires_at,
+                    revoked_at=token_state.revoked_at or datetime.now(timezone.utc),
                 )
             )
             self._session.commit()
@@ -29,9 +34,7 @@ class SqlAlchemyAccessTokenBlacklistRepository(AccessTokenBlacklistRepository):
         if model is None:
             return False
 
-        expires_at = model.expires_at
-        if expires_at.tzinfo is None:
-            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        expires_at = _as_utc(model.expires_at)
 
         if expires_at <= now:
             self._session.delete(model)
@@ -39,3 +42,28 @@ class SqlAlchemyAccessTokenBlacklistRepository(AccessTokenBlacklistRepository):
             return False
 
         return True
+
+    def list_active(self, now: datetime) -> list[AccessTokenBlacklistState]:
+        models = (
+            self._session.query(AccessTokenBlacklistModel)
+            .filter(AccessTokenBlacklistModel.expires_at > now)
+            .all()
+        )
+        return [self._to_state(model) for model in models]
+
+    def list_revoked_since(self, since: datetime, now: datetime) -> list[AccessTokenBlacklistState]:
+        models = (
+            self._session.query(AccessTokenBlacklistModel)
+            .filter(AccessTokenBlacklistModel.revoked_at >= since)
+            .filter(AccessTokenBlacklistModel.expires_at > now)
+            .all()
+        )
+        return [self._to_state(model) for model in models]
+
+    @staticmethod
+    def _to_state(model: AccessTokenBlacklistModel) -> AccessTokenBlacklistState:
+        return AccessTokenBlacklistState(
+            jti=model.jti,
+            expires_at=_as_utc(model.expires_at),
+            revoked_at=_as_utc(model.revoked_at),
+        )
@@ -23,7 +23,7 @@ class RefreshTokenModel(Base):
     user_id: Mapped[str] = mapped_column(String(64), ForeignKey("auth_users.id"), nullable=False, index=True)
     username: Mapped[str] = mapped_column(String(120), nullable=False)
     role: Mapped[str] = mapped_column(String(32), nullable=False)
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
     revoked: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     replaced_by_jti: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
@@ -33,3 +33,5 @@ class AccessTokenBlacklistModel(Base):
 
     jti: Mapped[str] = mapped_column(String(64), primary_key=True)
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    # Watermark for replicas polling for revocations made elsewhere.
+    revoked_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
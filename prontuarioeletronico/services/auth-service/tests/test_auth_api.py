@@ -1,6 +1,9 @@
+import jwt
 from fastapi.testclient import TestClient
 
+from src.auth.infra.api import main
 from src.auth.infra.api.main import app
+from src.auth.infra.auth.jwt_token_service import JwtTokenService
 
 
 client = TestClient(app)
@@ -105,6 +108,22 @@ def test_verify_endpoint_accepts_valid_token():
     assert body["claims"]["role"] == "profissional"
 
 
+def test_verify_endpoint_reports_expired_access_token():
+    expired_token = JwtTokenService(
+        secret_key=main.JWT_SECRET,
+        access_expires_minutes=-1,
+        key_ring=main._token_service.key_ring,
+    ).create_access_token(user_id="u-1", username="profissional", role="profissional")
+
+    verify_response = client.get(
+        "/api/v1/auth/verify",
+        headers={"Authorization": f"Bearer {expired_token}"},
+    )
+
+    assert verify_response.status_code == 401
+    assert verify_response.json() == {"detail": "token expired"}
+
+
 def test_authorize_endpoint_denies_professional_for_admin_resource():
     login_response = client.post(
         "/api/v1/auth/login",
@@ -122,3 +141,92 @@ def test_authorize_endpoint_denies_professional_for_admin_resource():
     body = authorize_response.json()
     assert body["authorized"] is False
     assert body["role"] == "profissional"
+
+
+def test_revocations_endpoint_lists_blacklisted_access_tokens():
+    login_response = client.post(
+        "/api/v1/auth/login",
+        json={"username": "profissional", "password": "prof123"},
+    )
+    tokens = login_response.json()
+    access_claims = jwt.decode(tokens["access_token"], options={"verify_signature": False})
+
+    client.post(
+        "/api/v1/auth/logout",
+        json={"refresh_token": tokens["refresh_token"]},
+        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+    )
+
+    response = client.get("/api/v1/auth/revocations")
+
+    assert response.status_code == 200
+    revoked = {item["jti"]: item["expires_at"] for item in response.json()["revoked"]}
+    assert revoked[access_claims["jti"]] == access_claims["exp"]
+
+
+def _login(username: str, password: str) -> dict:
+    return client.post(
+        "/api/v1/auth/login",
+        json={"username": username, "password": password},
+    ).json()
+
+
+def test_introspect_returns_claims_and_first_matching_role():
+    token = _login("profissional", "prof123")["access_token"]
+
+    response = client.get(
+        "/api/v1/auth/introspect",
+        params=[("roles", "admin"), ("roles", "profissional")],
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["valid"] is True
+    assert body["authorized"] is True
+    assert body["matched_role"] == "profissional"
+    assert body["claims"]["role"] == "profissional"
+    assert body["claims"]["exp"] == jwt.decode(token, options={"verify_signature": False})["exp"]
+
+
+def test_introspect_denies_without_matching_role_and_decodes_once(monkeypatch):
+    from src.auth.infra.api import main as auth_main
+
+    token = _login("profissional", "prof123")["access_token"]
+    decode_calls = []
+    original_decode = auth_main._token_service.decode_token
+
+    def counting_decode(value: str) -> dict:
+        decode_calls.append(value)
+        return original_decode(value)
+
+    monkeypatch.setattr(auth_main._token_service, "decode_token", counting_decode)
+
+    response = client.get(
+        "/api/v1/auth/introspect",
+        params=[("roles", "admin"), ("roles", "auditor")],
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["authorized"] is False
+    assert response.json()["matched_role"] is None
+    assert len(decode_calls) == 1
+
+
+def test_introspect_rejects_revoked_access_token():
+    tokens = _login("admin", "admin123")
+    client.post(
+        "/api/v1/auth/logout",
+        json={"refresh_token": tokens["refresh_token"]},
+        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+    )
+
+    response = client.get(
+        "/api/v1/auth/introspect",
+        params={"roles": "admin"},
+        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+    )
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "access token revoked"
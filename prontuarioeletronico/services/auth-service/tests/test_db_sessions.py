@@ -0,0 +1,71 @@
+from fastapi.testclient import TestClient
+
+from src.auth.infra.api import main
+from src.auth.infra.auth.sqlalchemy_models import UserModel
+
+
+def _login(client: TestClient, username: str = "admin", password: str = "admin123"):
+    return client.post("/api/v1/auth/login", json={"username": username, "password": password})
+
+
+def _bearer(response) -> dict:
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def test_each_request_gets_its_own_session_and_releases_its_connection(monkeypatch):
+    seen = []
+    find_by_username = main._user_repository.find_by_username
+
+    def probe(username):
+        seen.append(main._db_session())
+        return find_by_username(username)
+
+    monkeypatch.setattr(main._user_repository, "find_by_username", probe)
+    client = TestClient(main.app)
+
+    assert _login(client).status_code == 200
+    admin = _login(client)
+    assert admin.status_code == 200
+
+    assert len({id(session) for session in seen}) == 2
+    assert main._db_session() not in seen
+    status = client.get("/api/v1/auth/maintenance/db-pool", headers=_bearer(admin)).json()
+    assert status["checked_out"] == 0
+
+
+def test_failed_flush_does_not_poison_later_requests(monkeypatch):
+    find_by_username = main._user_repository.find_by_username
+
+    def broken(username):
+        main._db_session.add(
+            UserModel(id="u-admin", username="duplicate", password_hash="x", role="admin", active=True)
+        )
+        main._db_session.flush()
+
+    monkeypatch.setattr(main._user_repository, "find_by_username", broken)
+    client = TestClient(main.app, raise_server_exceptions=False)
+    assert _login(client).status_code == 500
+
+    monkeypatch.setattr(main._user_repository, "find_by_username", find_by_username)
+    assert _login(client).status_code == 200
+
+
+def test_db_pool_status_reports_pool_metrics():
+    client = TestClient(main.app)
+    admin = _bearer(_login(client))
+    client.get("/api/v1/auth/verify")
+
+    status = client.get("/api/v1/auth/maintenance/db-pool", headers=admin).json()
+
+    assert status["pool"] == "InstrumentedQueuePool"
+    assert set(status) >= {"size", "max_overflow", "checked_out", "overflow", "checkouts", "wait_seconds_total"}
+
+
+def test_db_pool_status_requires_an_admin_token():
+    client = TestClient(main.app)
+    professional = _bearer(_login(client, "profissional", "prof123"))
+
+    assert client.get("/api/v1/auth/maintenance/db-pool").status_code == 401
+    invalid = client.get("/api/v1/auth/maintenance/db-pool", headers={"Authorization": "Bearer nope"})
+    assert invalid.status_code == 401
+    assert client.get("/api/v1/auth/maintenance/db-pool", headers=professional).status_code == 403
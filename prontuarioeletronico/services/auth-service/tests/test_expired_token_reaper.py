@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.auth.infra.api import main
+from src.auth.infra.auth.expired_token_reaper import ExpiredTokenReaper
+from src.auth.infra.auth.sqlalchemy_base import Base
+from src.auth.infra.auth.sqlalchemy_models import AccessTokenBlacklistModel, RefreshTokenModel
+
+
+def _session_factory() -> sessionmaker:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+
+def _seed(session_factory: sessionmaker, prefix: str, expired: int, live: int, now: datetime) -> None:
+    session = session_factory()
+    for index in range(expired + live):
+        if index < expired:
+            expires_at = now - timedelta(minutes=index + 1)
+        else:
+            expires_at = now + timedelta(minutes=5)
+        session.add(
+            RefreshTokenModel(
+                jti=f"{prefix}-r-{index}",
+                user_id="u-admin",
+                username="admin",
+                role="admin",
+                expires_at=expires_at,
+                revoked=False,
+            )
+        )
+        session.add(
+            AccessTokenBlacklistModel(
+                jti=f"{prefix}-b-{index}",
+                expires_at=expires_at,
+                revoked_at=now - timedelta(minutes=30),
+            )
+        )
+    session.commit()
+    session.close()
+
+
+def _count(session_factory: sessionmaker, model) -> int:
+    session = session_factory()
+    try:
+        return session.query(model).count()
+    finally:
+        session.close()
+
+
+def test_reaper_deletes_expired_rows_in_bounded_batches():
+    session_factory = _session_factory()
+    now = datetime.now(timezone.utc)
+    _seed(session_factory, "t", expired=250, live=7, now=now)
+    reaper = ExpiredTokenReaper(session_factory, batch_size=100, max_batches_per_table=2)
+
+    first = reaper.run_once(now)
+    second = reaper.run_once(now)
+
+    assert first == {"auth_refresh_tokens": 200, "auth_access_token_blacklist": 200}
+    assert second == {"auth_refresh_tokens": 50, "auth_access_token_blacklist": 50}
+    assert _count(session_factory, RefreshTokenModel) == 7
+    assert _count(session_factory, AccessTokenBlacklistModel) == 7
+    snapshot = reaper.snapshot()
+    assert snapshot["runs"] == 2
+    assert snapshot["rows_reaped"] == {"auth_refresh_tokens": 250, "auth_access_token_blacklist": 250}
+    assert snapshot["seconds_total"] > 0
+
+
+def test_table_size_stays_flat_under_continuous_logins():
+    session_factory = _session_factory()
+    reaper = ExpiredTokenReaper(session_factory, batch_size=50)
+    sizes = []
+
+    for minute in range(5):
+        now = datetime.now(timezone.utc) + timedelta(minutes=minute * 10)
+        _seed(session_factory, f"m{minute}", expired=40, live=10, now=now)
+        reaper.run_once(now)
+        sizes.append(_count(session_factory, RefreshTokenModel))
+
+    assert sizes == [10, 10, 10, 10, 10]
+
+
+def test_reaper_runs_with_the_app_lifespan_and_exposes_metrics():
+    with TestClient(main.app) as client:
+        login = client.post("/api/v1/auth/login", json={"username": "admin", "password": "admin123"})
+        admin = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        running = client.get("/api/v1/auth/maintenance/reaper", headers=admin).json()
+
+    assert running["running"] is True
+    assert set(running) >= {"runs", "rows_reaped", "seconds_total", "batch_size"}
+    assert main._expired_token_reaper.snapshot()["running"] is False
+
+
+def test_reaper_status_requires_an_admin_token():
+    client = TestClient(main.app)
+    login = client.post("/api/v1/auth/login", json={"username": "profissional", "password": "prof123"})
+    professional = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    assert client.get("/api/v1/auth/maintenance/reaper").status_code == 401
+    assert client.get("/api/v1/auth/maintenance/reaper", headers=professional).status_code == 403
@@ -0,0 +1,91 @@
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from fastapi.testclient import TestClient
+
+from src.auth.infra.api import main
+from src.auth.infra.auth.jwt_token_service import JwtTokenService
+from src.auth.infra.auth.signing_keys import SigningKey, SigningKeyRing, generate_signing_key
+
+
+client = TestClient(main.app)
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "EdDSA"])
+def test_asymmetric_tokens_carry_kid_and_verify_with_published_jwk(algorithm):
+    ring = SigningKeyRing(generate_signing_key(algorithm, kid="k1"))
+    service = JwtTokenService(key_ring=ring)
+
+    token = service.create_access_token(user_id="1", username="admin", role="admin")
+
+    assert jwt.get_unverified_header(token) == {"alg": algorithm, "kid": "k1", "typ": "JWT"}
+    assert service.decode_token(token)["role"] == "admin"
+    published = jwt.PyJWK(ring.jwks()["keys"][0])
+    assert jwt.decode(token, published.key, algorithms=[algorithm])["sub"] == "1"
+
+
+def test_rotation_keeps_retired_keys_for_verification_only():
+    old_key = generate_signing_key("EdDSA", kid="2025-01")
+    new_key = generate_signing_key("EdDSA", kid="2025-02")
+    old_token = JwtTokenService(key_ring=SigningKeyRing(old_key)).create_access_token(
+        user_id="1", username="admin", role="admin"
+    )
+    retired = SigningKey(kid=old_key.kid, algorithm=old_key.algorithm, public_key=old_key.public_key)
+    rotated = JwtTokenService(key_ring=SigningKeyRing(new_key, keys=[retired]))
+
+    new_token = rotated.create_access_token(user_id="2", username="prof", role="profissional")
+
+    assert rotated.decode_token(old_token)["sub"] == "1"
+    assert jwt.get_unverified_header(new_token)["kid"] == "2025-02"
+    assert [key["kid"] for key in rotated.key_ring.jwks()["keys"]] == ["2025-01", "2025-02"]
+    with pytest.raises(jwt.InvalidTokenError):
+        JwtTokenService(key_ring=SigningKeyRing(new_key)).decode_token(old_token)
+
+
+def test_key_ring_loads_pem_directory(tmp_path):
+    active = generate_signing_key("RS256")
+    retired = generate_signing_key("EdDSA")
+    (tmp_path / "active.pem").write_bytes(
+        active.private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    (tmp_path / "retired.pem").write_bytes(
+        retired.public_key.public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    )
+
+    ring = SigningKeyRing.from_directory(str(tmp_path), active_kid="active")
+
+    assert ring.active.algorithm == "RS256"
+    assert ring.key_for("retired").private_key is None
+    with pytest.raises(ValueError):
+        SigningKeyRing.from_directory(str(tmp_path))
+    with pytest.raises(ValueError):
+        SigningKeyRing.from_directory(str(tmp_path), active_kid="retired")
+
+
+def test_jwks_endpoint_is_empty_for_hs256_and_publishes_ring(monkeypatch):
+    hs256 = client.get("/.well-known/jwks.json")
+
+    assert hs256.status_code == 200
+    assert hs256.json() == {"keys": []}
+    assert hs256.headers["cache-control"].startswith("public, max-age=")
+
+    ring = SigningKeyRing(generate_signing_key("EdDSA", kid="k-api"))
+    monkeypatch.setattr(main, "_signing_key_ring", ring)
+    monkeypatch.setattr(main._token_service, "_key_ring", ring)
+
+    login = client.post("/api/v1/auth/login", json={"username": "admin", "password": "admin123"})
+    token = login.json()["access_token"]
+    keys = client.get("/.well-known/jwks.json").json()["keys"]
+    verified = client.get("/api/v1/auth/verify", headers={"Authorization": f"Bearer {token}"})
+
+    assert [key["kid"] for key in keys] == ["k-api"]
+    assert "d" not in keys[0]
+    assert jwt.decode(token, jwt.PyJWK(keys[0]).key, algorithms=["EdDSA"])["role"] == "admin"
+    assert verified.status_code == 200
@@ -18,6 +18,7 @@ def test_openapi_contains_auth_contract_paths():
     assert "/api/v1/auth/logout" in paths
     assert "/api/v1/auth/verify" in paths
     assert "/api/v1/auth/authorize" in paths
+    assert "/api/v1/auth/introspect" in paths
 
 
 def test_openapi_contains_bearer_security_scheme_and_protected_operations():
@@ -31,10 +32,12 @@ def test_openapi_contains_bearer_security_scheme_and_protected_operations():
     verify_security = spec["paths"]["/api/v1/auth/verify"]["get"].get("security", [])
     authorize_security = spec["paths"]["/api/v1/auth/authorize"]["get"].get("security", [])
     logout_security = spec["paths"]["/api/v1/auth/logout"]["post"].get("security", [])
+    introspect_security = spec["paths"]["/api/v1/auth/introspect"]["get"].get("security", [])
 
     assert {"HTTPBearer": []} in verify_security
     assert {"HTTPBearer": []} in authorize_security
     assert {"HTTPBearer": []} in logout_security
+    assert {"HTTPBearer": []} in introspect_security
 
 
 def test_openapi_contains_request_examples_and_security_error_examples():
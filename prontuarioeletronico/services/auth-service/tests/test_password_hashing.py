@@ -0,0 +1,182 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.auth.application.auth.authenticate_user_usecase import (
+    AuthenticateUserInputDTO,
+    AuthenticateUserUseCase,
+)
+from src.auth.application.auth.contracts import PasswordHashingBusyError
+from src.auth.infra.api import main
+from src.auth.infra.auth import pooled_password_hasher
+from src.auth.infra.auth.bcrypt_password_hasher import BcryptPasswordHasher
+from src.auth.infra.auth.jwt_token_service import JwtTokenService
+from src.auth.infra.auth.pooled_password_hasher import PooledPasswordHasher
+from src.auth.infra.auth.sqlalchemy_base import Base
+from src.auth.infra.auth.sqlalchemy_models import UserModel
+from src.auth.infra.auth.sqlalchemy_refresh_token_repository import (
+    SqlAlchemyRefreshTokenRepository,
+)
+from src.auth.infra.auth.sqlalchemy_user_repository import SqlAlchemyUserRepository
+
+
+def _login_usecase(stored_rounds: int, hasher) -> tuple[AuthenticateUserUseCase, SqlAlchemyUserRepository]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine, autoflush=False, autocommit=False)()
+    session.add(
+        UserModel(
+            id="u-admin",
+            username="admin",
+            password_hash=BcryptPasswordHasher(rounds=stored_rounds).hash("admin123"),
+            role="admin",
+            active=True,
+        )
+    )
+    session.commit()
+    user_repository = SqlAlchemyUserRepository(session)
+    usecase = AuthenticateUserUseCase(
+        user_repository=user_repository,
+        password_hasher=hasher,
+        token_service=JwtTokenService(secret_key="test-secret"),
+        refresh_token_repository=SqlAlchemyRefreshTokenRepository(session),
+    )
+    return usecase, user_repository
+
+
+def test_login_rehashes_when_the_configured_cost_changes():
+    hasher = PooledPasswordHasher(rounds=5, workers=1)
+    usecase, user_repository = _login_usecase(stored_rounds=4, hasher=hasher)
+
+    asyncio.run(usecase.execute_async(AuthenticateUserInputDTO(username="admin", password="admin123")))
+    upgraded = user_repository.find_by_id("u-admin").password_hash
+    usecase.execute(AuthenticateUserInputDTO(username="admin", password="admin123"))
+
+    assert upgraded.startswith("$2b$05$")
+    assert user_repository.find_by_id("u-admin").password_hash == upgraded
+    assert hasher.snapshot()["completed"] == 3
+    hasher.shutdown()
+
+
+def test_admission_limit_rejects_instead_of_queueing(monkeypatch):
+    release = threading.Event()
+    started = threading.Event()
+
+    def _blocking_hash(rounds, plain_password):
+        started.set()
+        release.wait(5)
+        return "hashed"
+
+    monkeypatch.setattr(pooled_password_hasher, "hash_password", _blocking_hash)
+    hasher = PooledPasswordHasher(rounds=4, workers=1, max_pending=1, admission_timeout_seconds=0.01)
+    holder = threading.Thread(target=hasher.hash, args=("first",))
+    holder.start()
+    started.wait(5)
+
+    with pytest.raises(PasswordHashingBusyError):
+        hasher.hash("second")
+    snapshot = hasher.snapshot()
+    release.set()
+    holder.join(5)
+
+    assert snapshot["in_flight"] == 1
+    assert snapshot["rejected"] == 1
+    assert hasher.snapshot()["completed"] == 1
+    hasher.shutdown()
+
+
+def test_process_pool_hashes_and_verifies():
+    hasher = PooledPasswordHasher(rounds=4, workers=1, executor_kind="process")
+    password_hash = hasher.hash("secret")
+
+    assert hasher.verify("secret", password_hash) is True
+    assert hasher.verify("wrong", password_hash) is False
+    assert hasher.needs_rehash(password_hash) is False
+    hasher.shutdown()
+
+
+def test_login_fails_fast_with_503_when_hashing_is_saturated(monkeypatch):
+    release = threading.Event()
+    started = threading.Event()
+
+    def _blocking_verify(rounds, plain_password, password_hash):
+        started.set()
+        release.wait(5)
+        return True
+
+    monkeypatch.setattr(pooled_password_hasher, "verify_password", _blocking_verify)
+    # A long admission timeout: the async login path must not wait on it.
+    hasher = PooledPasswordHasher(rounds=4, workers=1, max_pending=1, admission_timeout_seconds=5)
+    monkeypatch.setattr(main._authenticate_user_usecase, "_password_hasher", hasher)
+    holder = threading.Thread(target=hasher.verify, args=("secret", "hash"))
+    holder.start()
+    started.wait(5)
+    client = TestClient(main.app)
+
+    requested = time.perf_counter()
+    response = client.post("/api/v1/auth/login", json={"username": "admin", "password": "admin123"})
+    elapsed = time.perf_counter() - requested
+    release.set()
+    holder.join(5)
+    login = client.post("/api/v1/auth/login", json={"username": "admin", "password": "admin123"})
+    admin = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    status = client.get("/api/v1/auth/maintenance/password-hashing", headers=admin).json()
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert elapsed < 1
+    assert hasher.snapshot()["rejected"] == 1
+    assert set(status) >= {"workers", "max_pending", "in_flight", "rejected", "rounds"}
+    hasher.shutdown()
+
+
+def test_async_hashing_keeps_the_slot_until_a_cancelled_hash_finishes(monkeypatch):
+    release = threading.Event()
+    started = threading.Event()
+
+    def _blocking_hash(rounds, plain_password):
+        started.set()
+        release.wait(5)
+        return "hashed"
+
+    monkeypatch.setattr(pooled_password_hasher, "hash_password", _blocking_hash)
+    hasher = PooledPasswordHasher(rounds=4, workers=1, max_pending=1)
+
+    async def scenario() -> tuple[int, int]:
+        login = asyncio.ensure_future(hasher.hash_async("first"))
+        await asyncio.to_thread(started.wait, 5)
+        login.cancel()
+        await asyncio.sleep(0)
+        with pytest.raises(PasswordHashingBusyError):
+            await hasher.hash_async("second")
+        in_flight = hasher.snapshot()["in_flight"]
+        release.set()
+        while hasher.snapshot()["in_flight"]:
+            await asyncio.sleep(0.01)
+        return in_flight, len(await asyncio.gather(hasher.hash_async("third")))
+
+    in_flight_after_cancel, admitted_later = asyncio.run(scenario())
+
+    assert in_flight_after_cancel == 1
+    assert admitted_later == 1
+    assert hasher.snapshot()["rejected"] == 1
+    hasher.shutdown()
+
+
+def test_password_hashing_status_requires_an_admin_token():
+    client = TestClient(main.app)
+    login = client.post("/api/v1/auth/login", json={"username": "profissional", "password": "prof123"})
+    professional = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    assert client.get("/api/v1/auth/maintenance/password-hashing").status_code == 401
+    assert client.get("/api/v1/auth/maintenance/password-hashing", headers=professional).status_code == 403
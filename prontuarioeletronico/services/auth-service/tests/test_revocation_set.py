@@ -0,0 +1,145 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.auth.application.auth.contracts import AccessTokenBlacklistState
+from src.auth.infra.api import main
+from src.auth.infra.auth.cached_access_token_blacklist_repository import (
+    CachedAccessTokenBlacklistRepository,
+)
+from src.auth.infra.auth.revocation_set import RevocationSet
+from src.auth.infra.auth.sqlalchemy_access_token_blacklist_repository import (
+    SqlAlchemyAccessTokenBlacklistRepository,
+)
+from src.auth.infra.auth.sqlalchemy_base import Base
+
+
+def _shared_database():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    statements: list[str] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return sessionmaker(bind=engine, autoflush=False, autocommit=False), statements
+
+
+def _replica(session_factory, sync_interval_seconds: float = 2) -> CachedAccessTokenBlacklistRepository:
+    repository = CachedAccessTokenBlacklistRepository(
+        SqlAlchemyAccessTokenBlacklistRepository(session_factory()),
+        sync_interval_seconds=sync_interval_seconds,
+        sync_overlap_seconds=30,
+        session_factory=session_factory,
+    )
+    repository.load()
+    return repository
+
+
+def _revoke(jti: str, now: datetime, **overrides) -> AccessTokenBlacklistState:
+    return AccessTokenBlacklistState(jti=jti, expires_at=now + timedelta(minutes=15), **overrides)
+
+
+def test_revocation_set_drops_entries_in_expiry_order():
+    revocations = RevocationSet()
+    revocations.add("a", 10)
+    revocations.add("b", 20)
+    revocations.add("a", 30)
+
+    assert revocations.contains("a", 15) is True
+    assert revocations.contains("b", 20) is False
+    assert revocations.active(25) == [("a", 30)]
+    assert revocations.contains("a", 30) is False
+    assert len(revocations) == 0
+
+
+def test_validation_reads_memory_and_logout_writes_through():
+    session_factory, statements = _shared_database()
+    repository = _replica(session_factory)
+    now = datetime.now(timezone.utc)
+
+    repository.add(_revoke("jti-1", now))
+    statements.clear()
+    for _ in range(100):
+        assert repository.is_blacklisted("jti-1", now) is True
+        assert repository.is_blacklisted("jti-2", now) is False
+
+    assert statements == []
+    assert [state.jti for state in repository.list_active(now)] == ["jti-1"]
+    assert repository.is_blacklisted("jti-1", now + timedelta(minutes=16)) is False
+    assert repository.snapshot()["lookups"] == 201
+
+
+def test_replicas_converge_through_the_polling_watermark():
+    session_factory, statements = _shared_database()
+    replica_a = _replica(session_factory)
+    replica_b = _replica(session_factory)
+    now = datetime.now(timezone.utc)
+
+    replica_a.add(_revoke("jti-a", now))
+    statements.clear()
+    # Lookups never poll; only the sync picks up the other replica's logout.
+    assert replica_b.is_blacklisted("jti-a", now) is False
+    assert statements == []
+
+    replica_b.sync_once(now)
+    assert replica_b.is_blacklisted("jti-a", now) is True
+
+    # A row committed late with an older revoked_at is still inside the overlap window.
+    replica_a.add(_revoke("jti-late", now, revoked_at=now - timedelta(seconds=10)))
+    statements.clear()
+    replica_b.sync_once(now)
+    assert replica_b.is_blacklisted("jti-late", now) is True
+    assert len(statements) == 1
+    assert replica_b.snapshot()["syncs"] == 3
+
+
+def test_background_thread_polls_without_blocking_lookups():
+    session_factory, statements = _shared_database()
+    replica_a = _replica(session_factory)
+    replica_b = _replica(session_factory, sync_interval_seconds=0.02)
+    now = datetime.now(timezone.utc)
+
+    replica_b.start()
+    try:
+        replica_a.add(_revoke("jti-remote", now))
+        deadline = time.monotonic() + 2
+        while not replica_b.is_blacklisted("jti-remote", now) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert replica_b.is_blacklisted("jti-remote", now) is True
+        assert replica_b.snapshot()["running"] is True
+    finally:
+        replica_b.stop()
+
+    syncs = replica_b.snapshot()["syncs"]
+    time.sleep(0.05)
+    assert replica_b.snapshot()["syncs"] == syncs
+    assert replica_b.snapshot()["running"] is False
+
+
+def test_revocation_sync_runs_with_the_app_lifespan():
+    with TestClient(main.app) as client:
+        login = client.post("/api/v1/auth/login", json={"username": "admin", "password": "admin123"})
+        admin = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        running = client.get("/api/v1/auth/maintenance/revocation-sync", headers=admin).json()
+
+    assert running["running"] is True
+    assert main._access_token_blacklist_repository.snapshot()["running"] is False
+
+
+def test_revocation_sync_status_requires_an_admin_token():
+    client = TestClient(main.app)
+    login = client.post("/api/v1/auth/login", json={"username": "profissional", "password": "prof123"})
+    professional = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    assert client.get("/api/v1/auth/maintenance/revocation-sync").status_code == 401
+    assert client.get("/api/v1/auth/maintenance/revocation-sync", headers=professional).status_code == 403
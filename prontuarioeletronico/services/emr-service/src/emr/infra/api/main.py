@@ -6,6 +6,9 @@ from fastapi import Depends, FastAPI, Header, HTTPException, Query, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, ConfigDict
 
+from db_session import DatabaseSessionMiddleware
+from service_client import AuditServiceClient, AuthServiceClient
+
 from ...application.emr.create_problem_usecase import (
     CreateProblemInputDTO,
     CreateProblemUseCase,
@@ -21,9 +24,12 @@ from ...application.emr.validate_terminology_code_usecase import (
     ValidateTerminologyCodeInputDTO,
     ValidateTerminologyCodeUseCase,
 )
-from ...infra.audit.audit_service_client import AuditServiceClient
-from ...infra.auth.auth_service_client import AuthServiceClient
-from ...infra.emr.database import SessionLocal, init_database
+from ...infra.emr.database import (
+    ScopedSession,
+    init_database,
+    pool_status,
+    request_sessions,
+)
 from ...infra.emr.sqlalchemy_problem_repository import SqlAlchemyProblemRepository
 from ...infra.emr.sqlalchemy_soap_repository import SqlAlchemySOAPRepository
 
@@ -33,6 +39,7 @@ app = FastAPI(
     version="1.0.0",
     description="Microsserviço EMR RCOP/SOAP em Clean Architecture (MS-03)",
 )
+app.add_middleware(DatabaseSessionMiddleware, sessions=request_sessions)
 
 
 APP_ENV = os.getenv("APP_ENV", "development")
@@ -93,7 +100,7 @@ class CreateSOAPRequest(BaseModel):
 
 
 init_database()
-_db_session = SessionLocal()
+_db_session = ScopedSession
 _problem_repository = SqlAlchemyProblemRepository(_db_session)
 _soap_repository = SqlAlchemySOAPRepository(_db_session)
 _validate_terminology_code_usecase = ValidateTerminologyCodeUseCase()
@@ -105,8 +112,8 @@ _find_problem_usecase = FindProblemUseCase(_problem_repository)
 _create_soap_usecase = CreateSOAPUseCase(_soap_repository, _problem_repository)
 _find_soap_usecase = FindSOAPUseCase(_soap_repository)
 _list_timeline_usecase = ListProblemTimelineUseCase(_problem_repository, _soap_repository)
-_auth_client = AuthServiceClient(base_url=AUTH_SERVICE_URL)
-_audit_client = AuditServiceClient(base_url=AUDIT_SERVICE_URL)
+_auth_client = AuthServiceClient.from_env(AUTH_SERVICE_URL)
+_audit_client = AuditServiceClient.from_env(AUDIT_SERVICE_URL)
 _bearer_scheme = HTTPBearer(auto_error=False)
 
 
@@ -132,18 +139,13 @@ def _require_roles(required_roles: list[str]):
         token = bearer.credentials if bearer else _extract_bearer_token(authorization)
 
         try:
-            verified = _auth_client.verify(token)
+            introspection = _auth_client.introspect(token, required_roles)
         except ValueError as error:
             raise HTTPException(status_code=401, detail=str(error)) from error
 
-        for role in required_roles:
-            try:
-                if _auth_client.authorize(token, role):
-                    return verified
-            except ValueError:
-                continue
-
-        raise HTTPException(status_code=403, detail="insufficient role")
+        if not introspection.get("authorized"):
+            raise HTTPException(status_code=403, detail="insufficient role")
+        return introspection
 
     return dependency
 
@@ -197,6 +199,11 @@ def service_info():
     }
 
 
+@app.get("/api/v1/maintenance/db-pool")
+def db_pool_status(_auth: dict = Depends(_require_roles(["admin"]))):
+    return pool_status()
+
+
 @app.post("/api/v1/emr/problems", status_code=201)
 def create_problem(
     payload: CreateProblemRequest,
@@ -0,0 +1,137 @@
+"""
+Benchmark do pool de conexões do HttpServiceProxy contra um downstream stub local.
+
+Compara o comportamento anterior (um httpx.Client novo por chamada) com o
+proxy atual (cliente persistente com keep-alive) e imprime requests/s e
+latências p50/p99 em JSON.
+
+Uso (a partir de services/gateway-service):
+    PYTHONPATH=. python benchmarks/bench_proxy_pooling.py --requests 2000 --concurrency 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+SERVICE_ROOT = Path(__file__).resolve().parents[1]
+if str(SERVICE_ROOT) not in sys.path:
+    sys.path.insert(0, str(SERVICE_ROOT))
+
+from src.gateway.infra.proxy.http_service_proxy import HttpServiceProxy  # noqa: E402
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    payload = b'{"id": "p-1", "name": "Paciente Benchmark"}'
+    latency_seconds = 0.0
+
+    def do_GET(self):  # noqa: N802
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.payload)))
+        self.end_headers()
+        self.wfile.write(self.payload)
+
+    def log_message(self, format, *args):  # noqa: A002
+        return
+
+
+class _PerRequestClientProxy:
+    """Reproduz o proxy anterior: um cliente HTTP aberto e fechado por chamada."""
+
+    def __init__(self, base_url: str, timeout_seconds: float = 10.0):
+        self._base_url = base_url.rstrip("/")
+        self._timeout_seconds = timeout_seconds
+
+    async def request(self, method: str, path: str) -> tuple[int, object]:
+        async with httpx.AsyncClient(timeout=self._timeout_seconds) as client:
+            response = await client.request(method=method, url=f"{self._base_url}{path}")
+        return response.status_code, response.json()
+
+    async def aclose(self) -> None:
+        return
+
+
+def _start_stub(latency_seconds: float) -> ThreadingHTTPServer:
+    handler = type("StubHandler", (_StubHandler,), {"latency_seconds": latency_seconds})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _run(proxy, total_requests: int, concurrency: int) -> dict:
+    slots = asyncio.Semaphore(concurrency)
+
+    async def _call() -> float:
+        async with slots:
+            started = time.perf_counter()
+            status_code, _body = await proxy.request("GET", "/api/v1/patients/p-1")
+            if status_code != 200:
+                raise RuntimeError(f"unexpected status {status_code}")
+            return time.perf_counter() - started
+
+    # Warm-up fora da janela medida.
+    await asyncio.gather(*(_call() for _ in range(min(concurrency, total_requests))))
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(_call() for _ in range(total_requests)))
+    elapsed = time.perf_counter() - started
+    await proxy.aclose()
+
+    return {
+        "requests": total_requests,
+        "concurrency": concurrency,
+        "requests_per_second": round(total_requests / elapsed, 1),
+        "latency_ms": {
+            "p50": round(statistics.median(latencies) * 1000, 3),
+            "p99": round(_percentile(latencies, 99) * 1000, 3),
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = _start_stub(args.latency_ms / 1000)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        report = {
+            "before_per_request_client": asyncio.run(
+                _run(_PerRequestClientProxy(base_url), args.requests, args.concurrency)
+            ),
+            "after_pooled_client": asyncio.run(
+                _run(HttpServiceProxy(base_url=base_url), args.requests, args.concurrency)
+            ),
+        }
+    finally:
+        server.shutdown()
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
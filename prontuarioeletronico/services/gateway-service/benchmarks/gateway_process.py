@@ -0,0 +1,61 @@
+"""
+Processo do gateway usado por benchmarks/load_test.py.
+
+Sobe a aplicação real com uvicorn e acrescenta `GET /__bench/usage`, que devolve o
+tempo de CPU e o RSS do próprio processo; o harness lê esse endpoint antes e depois
+da janela medida para isolar o custo do gateway do gerador de carga e dos stubs.
+
+Uso (a partir de services/gateway-service, chamado pelo harness):
+    PYTHONPATH=. python benchmarks/gateway_process.py --port 18080
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import uvicorn
+
+SERVICE_ROOT = Path(__file__).resolve().parents[1]
+if str(SERVICE_ROOT) not in sys.path:
+    sys.path.insert(0, str(SERVICE_ROOT))
+
+from src.gateway.infra.api.main import app  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _rss_bytes() -> int | None:
+    statm = Path("/proc/self/statm")
+    if statm.exists():
+        return int(statm.read_text().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss é reportado em bytes no macOS e em KiB no Linux.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+async def usage():
+    return {"cpu_seconds": time.process_time(), "rss_bytes": _rss_bytes()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, required=True)
+    args = parser.parse_args()
+
+    app.add_api_route("/__bench/usage", usage, methods=["GET"], include_in_schema=False)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning", access_log=False)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
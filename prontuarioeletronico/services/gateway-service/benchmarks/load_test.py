@@ -0,0 +1,282 @@
+"""
+Teste de carga do gateway contra downstreams stub locais.
+
+Sobe os stubs (benchmarks/stub_downstream.py) e o gateway real em um processo
+separado (benchmarks/gateway_process.py), aplica carga em malha aberta na taxa
+alvo do cenário e imprime um relatório JSON com vazão, latências p50/p95/p99,
+erros por status e CPU/RSS do processo do gateway. Roda offline.
+
+A latência de cada requisição é medida a partir do instante em que ela deveria
+ter sido enviada, não de quando foi enviada, para não esconder filas quando o
+gateway satura (coordinated omission).
+
+Uso (a partir de services/gateway-service):
+    PYTHONPATH=. python benchmarks/load_test.py --scenario benchmarks/scenarios/smoke.json
+    PYTHONPATH=. python benchmarks/load_test.py --scenario benchmarks/scenarios/smoke.json \\
+        --baseline benchmarks/baselines/smoke.json --tolerance 0.3 --latency-tolerance 1.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+SERVICE_ROOT = Path(__file__).resolve().parents[1]
+if str(SERVICE_ROOT) not in sys.path:
+    sys.path.insert(0, str(SERVICE_ROOT))
+
+from benchmarks.stub_downstream import StubFleet, StubProfile  # noqa: E402
+
+DOWNSTREAM_URL_ENV = {
+    "auth-service": "AUTH_SERVICE_URL",
+    "patient-service": "PATIENT_SERVICE_URL",
+    "emr-service": "EMR_SERVICE_URL",
+    "scheduling-service": "SCHEDULING_SERVICE_URL",
+    "audit-service": "AUDIT_SERVICE_URL",
+    "professional-service": "PROFESSIONAL_SERVICE_URL",
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _start_gateway(port: int, downstream_urls: dict[str, str], extra_env: dict) -> subprocess.Popen:
+    env = dict(os.environ)
+    env.update({DOWNSTREAM_URL_ENV[name]: url for name, url in downstream_urls.items()})
+    env.update({key: str(value) for key, value in extra_env.items()})
+    env.setdefault("APP_ENV", "development")
+    env["PYTHONPATH"] = str(SERVICE_ROOT)
+    return subprocess.Popen(
+        [sys.executable, str(SERVICE_ROOT / "benchmarks" / "gateway_process.py"), "--port", str(port)],
+        cwd=str(SERVICE_ROOT),
+        env=env,
+    )
+
+
+async def _wait_ready(client: httpx.AsyncClient, process: subprocess.Popen) -> None:
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("gateway process exited during startup")
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError("gateway did not become ready within 30s")
+
+
+def _request_plan(scenario: dict, total: int, rng: random.Random) -> list[dict]:
+    requests = scenario["requests"]
+    weights = [item.get("weight", 1) for item in requests]
+    return rng.choices(requests, weights=weights, k=total)
+
+
+async def _open_loop(
+    client: httpx.AsyncClient,
+    plan: list[dict],
+    rps: float,
+    max_outstanding: int,
+) -> dict:
+    # Malha aberta: as requisições saem no ritmo da taxa alvo, sem esperar as
+    # anteriores terminarem; acima de max_outstanding em voo, são descartadas.
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    outstanding = 0
+    dropped = 0
+
+    async def send(item: dict, scheduled: float) -> None:
+        nonlocal outstanding
+        try:
+            response = await client.request(
+                item.get("method", "GET"),
+                item["path"],
+                json=item.get("body"),
+                headers=item.get("headers"),
+            )
+            statuses[str(response.status_code)] += 1
+        except httpx.HTTPError as error:
+            statuses[type(error).__name__] += 1
+        finally:
+            latencies.append(time.perf_counter() - scheduled)
+            outstanding -= 1
+
+    tasks = []
+    started = time.perf_counter()
+    for index, item in enumerate(plan):
+        scheduled = started + index / rps
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if outstanding >= max_outstanding:
+            dropped += 1
+            continue
+        outstanding += 1
+        tasks.append(asyncio.ensure_future(send(item, scheduled)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    completed = sum(statuses.values())
+    succeeded = sum(count for status, count in statuses.items() if status.startswith("2"))
+    return {
+        "elapsed_seconds": round(elapsed, 3),
+        "sent": len(tasks),
+        "dropped": dropped,
+        "completed": completed,
+        "throughput_rps": round(succeeded / elapsed, 1),
+        "error_rate": round((completed - succeeded + dropped) / max(1, len(plan)), 4),
+        "statuses": dict(sorted(statuses.items())),
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 50) * 1000, 3),
+            "p95": round(_percentile(latencies, 95) * 1000, 3),
+            "p99": round(_percentile(latencies, 99) * 1000, 3),
+            "max": round(max(latencies, default=0.0) * 1000, 3),
+        },
+    }
+
+
+async def _run_scenario(scenario: dict, gateway_url: str, process: subprocess.Popen) -> dict:
+    rps = float(scenario["rps"])
+    max_outstanding = int(scenario.get("max_outstanding", 1000))
+    rng = random.Random(scenario.get("seed", 0))
+    limits = httpx.Limits(max_connections=max_outstanding, max_keepalive_connections=max_outstanding)
+
+    async with httpx.AsyncClient(base_url=gateway_url, limits=limits, timeout=30.0) as client:
+        await _wait_ready(client, process)
+
+        warmup = int(rps * float(scenario.get("warmup_seconds", 1)))
+        if warmup:
+            await _open_loop(client, _request_plan(scenario, warmup, rng), rps, max_outstanding)
+
+        before = (await client.get("/__bench/usage")).json()
+        total = int(rps * float(scenario["duration_seconds"]))
+        result = await _open_loop(client, _request_plan(scenario, total, rng), rps, max_outstanding)
+        after = (await client.get("/__bench/usage")).json()
+
+    cpu_seconds = after["cpu_seconds"] - before["cpu_seconds"]
+    rss_bytes = after["rss_bytes"]
+    result["gateway"] = {
+        "cpu_seconds": round(cpu_seconds, 3),
+        "cpu_percent": round(100 * cpu_seconds / result["elapsed_seconds"], 1),
+        "rss_mb": round(rss_bytes / (1024 * 1024), 1) if rss_bytes is not None else None,
+    }
+    return result
+
+
+def compare_with_baseline(
+    report: dict,
+    baseline: dict,
+    tolerance: float,
+    latency_tolerance: float | None = None,
+) -> list[str]:
+    # Throughput at a fixed open-loop rate barely moves between machines, latency does;
+    # each gets its own tolerance so the throughput check stays meaningful on CI.
+    latency_tolerance = tolerance if latency_tolerance is None else latency_tolerance
+    regressions = []
+    if report["throughput_rps"] < baseline["throughput_rps"] * (1 - tolerance):
+        regressions.append(
+            f"throughput_rps {report['throughput_rps']} < baseline {baseline['throughput_rps']}"
+        )
+    for key in ("p50", "p95", "p99"):
+        current, reference = report["latency_ms"][key], baseline["latency_ms"][key]
+        if current > reference * (1 + latency_tolerance):
+            regressions.append(f"latency {key} {current}ms > baseline {reference}ms")
+    if report["error_rate"] > baseline["error_rate"] + tolerance * 0.1:
+        regressions.append(f"error_rate {report['error_rate']} > baseline {baseline['error_rate']}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--scenario", required=True, type=Path)
+    parser.add_argument("--rps", type=float, help="sobrescreve a taxa alvo do cenário")
+    parser.add_argument("--duration", type=float, help="sobrescreve a duração medida (s)")
+    parser.add_argument("--output", type=Path, help="grava o relatório JSON neste arquivo")
+    parser.add_argument("--baseline", type=Path, help="relatório de referência para comparar")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument(
+        "--latency-tolerance",
+        type=float,
+        help="tolerância para p50/p95/p99 (default: --tolerance)",
+    )
+    args = parser.parse_args()
+    if not 0 <= args.tolerance < 1:
+        parser.error("--tolerance deve estar em [0, 1): com 1 a queda de vazão nunca falha")
+
+    scenario = json.loads(args.scenario.read_text(encoding="utf-8"))
+    if args.rps is not None:
+        scenario["rps"] = args.rps
+    if args.duration is not None:
+        scenario["duration_seconds"] = args.duration
+
+    profiles = {name: StubProfile() for name in DOWNSTREAM_URL_ENV}
+    for name, profile in scenario.get("downstreams", {}).items():
+        profiles[name] = StubProfile.from_dict(profile)
+
+    fleet = StubFleet(profiles, seed=scenario.get("seed", 0))
+    downstream_urls = fleet.start()
+    port = _free_port()
+    process = _start_gateway(port, downstream_urls, scenario.get("gateway_env", {}))
+    try:
+        result = asyncio.run(_run_scenario(scenario, f"http://127.0.0.1:{port}", process))
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+        fleet.stop()
+
+    report = {
+        "scenario": scenario.get("name", args.scenario.stem),
+        "target_rps": scenario["rps"],
+        "duration_seconds": scenario["duration_seconds"],
+        **result,
+        "downstream_requests": fleet.request_counts(),
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare_with_baseline(
+            report,
+            baseline,
+            args.tolerance,
+            args.latency_tolerance,
+        )
+        if regressions:
+            print("Regressão em relação ao baseline:", file=sys.stderr)
+            for item in regressions:
+                print(f"- {item}", file=sys.stderr)
+            return 1
+        print("Dentro da tolerância do baseline.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
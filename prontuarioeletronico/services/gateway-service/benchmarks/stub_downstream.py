@@ -0,0 +1,166 @@
+"""
+Downstream stub para os benchmarks do gateway.
+
+Servidor HTTP/1.1 mínimo (asyncio puro, com keep-alive) que responde qualquer rota
+com latência, taxa de erro e tamanho de payload configuráveis, sem dependências
+externas nem rede fora de 127.0.0.1.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import threading
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    # distribution: fixed (value_ms), uniform (min_ms, max_ms),
+    # lognormal (median_ms, sigma) ou exponential (mean_ms).
+    distribution: str = "fixed"
+    value_ms: float = 0.0
+    min_ms: float = 0.0
+    max_ms: float = 0.0
+    median_ms: float = 0.0
+    sigma: float = 0.5
+    mean_ms: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: dict | float | int | None) -> LatencyModel:
+        if data is None:
+            return cls()
+        if isinstance(data, (int, float)):
+            return cls(value_ms=float(data))
+        return cls(**data)
+
+    def sample_seconds(self, rng: random.Random) -> float:
+        if self.distribution == "fixed":
+            value = self.value_ms
+        elif self.distribution == "uniform":
+            value = rng.uniform(self.min_ms, self.max_ms)
+        elif self.distribution == "lognormal":
+            value = self.median_ms * rng.lognormvariate(0.0, self.sigma)
+        elif self.distribution == "exponential":
+            value = rng.expovariate(1.0 / self.mean_ms) if self.mean_ms > 0 else 0.0
+        else:
+            raise ValueError(f"unknown latency distribution: {self.distribution}")
+        return max(0.0, value) / 1000
+
+
+@dataclass(frozen=True)
+class StubProfile:
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    error_rate: float = 0.0
+    error_status: int = 503
+    payload_bytes: int = 256
+
+    @classmethod
+    def from_dict(cls, data: dict) -> StubProfile:
+        return cls(
+            latency=LatencyModel.from_dict(data.get("latency_ms")),
+            error_rate=float(data.get("error_rate", 0.0)),
+            error_status=int(data.get("error_status", 503)),
+            payload_bytes=int(data.get("payload_bytes", 256)),
+        )
+
+
+def _json_body(size: int) -> bytes:
+    # Objeto JSON válido com aproximadamente `size` bytes.
+    skeleton = {"id": "stub", "padding": ""}
+    overhead = len(json.dumps(skeleton))
+    skeleton["padding"] = "x" * max(0, size - overhead)
+    return json.dumps(skeleton).encode("utf-8")
+
+
+class StubDownstream:
+    def __init__(self, profile: StubProfile, seed: int = 0):
+        self._profile = profile
+        self._rng = random.Random(seed)
+        self._ok_body = _json_body(profile.payload_bytes)
+        self._error_body = json.dumps({"detail": "stub failure"}).encode("utf-8")
+        self._server: asyncio.AbstractServer | None = None
+        self.port = 0
+        self.requests = 0
+
+    async def start(self, host: str = "127.0.0.1") -> None:
+        self._server = await asyncio.start_server(self._serve, host, 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                content_length = 0
+                keep_alive = True
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    name = name.strip().lower()
+                    if name == "content-length":
+                        content_length = int(value.strip())
+                    elif name == "connection" and value.strip().lower() == "close":
+                        keep_alive = False
+                if content_length:
+                    await reader.readexactly(content_length)
+
+                self.requests += 1
+                delay = self._profile.latency.sample_seconds(self._rng)
+                if delay:
+                    await asyncio.sleep(delay)
+                failed = self._rng.random() < self._profile.error_rate
+                status = self._profile.error_status if failed else 200
+                body = self._error_body if failed else self._ok_body
+                writer.write(
+                    f"HTTP/1.1 {status} {'Error' if failed else 'OK'}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode(
+                        "latin-1"
+                    )
+                    + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            return
+        finally:
+            writer.close()
+
+
+class StubFleet:
+    """Sobe um stub por downstream em uma thread com event loop próprio."""
+
+    def __init__(self, profiles: dict[str, StubProfile], seed: int = 0):
+        self._stubs = {
+            name: StubDownstream(profile, seed=seed + index)
+            for index, (name, profile) in enumerate(sorted(profiles.items()))
+        }
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def start(self) -> dict[str, str]:
+        self._thread.start()
+        for stub in self._stubs.values():
+            asyncio.run_coroutine_threadsafe(stub.start(), self._loop).result()
+        return {name: f"http://127.0.0.1:{stub.port}" for name, stub in self._stubs.items()}
+
+    def request_counts(self) -> dict[str, int]:
+        return {name: stub.requests for name, stub in self._stubs.items()}
+
+    def stop(self) -> None:
+        for stub in self._stubs.values():
+            asyncio.run_coroutine_threadsafe(stub.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
@@ -1,18 +1,75 @@
 import os
+from contextlib import asynccontextmanager
+from dataclasses import replace
+
+from fastapi import Depends, FastAPI, Header, HTTPException
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..auth.edge_auth_middleware import EdgeAuthMiddleware, EdgeAuthPolicy, RouteRoleTable
+from ..auth.edge_token_verifier import EdgeTokenVerifier, JwksKeyCache, RevocationCache
+from ..cache.response_cache import ResponseCache, ResponseCacheMiddleware
+from ..compression.response_compression import (
+    ResponseCompression,
+    ResponseCompressionMiddleware,
+)
+from ..metrics.gateway_metrics import (
+    REGISTRY as METRICS_REGISTRY,
+    GatewayStateCollector,
+    MetricsMiddleware,
+    render_latest,
+)
+from ..proxy.bulkhead import BulkheadSettings
+from ..proxy.circuit_breaker import CircuitBreaker, CircuitBreakerSettings
+from ..proxy.fan_out import FanOutCall, fan_out
+from ..proxy.http_service_proxy import (
+    UNAVAILABLE_DETAIL,
+    HttpServiceProxy,
+    ProxiedStream,
+    ProxyPoolSettings,
+)
+from ..proxy.path_templates import PathTemplateSet
+from ..proxy.request_coalescer import BufferedResponse, RequestCoalescer
+from ..proxy.retry_policy import RetryBudget, RetryPolicy
+from .batch_dispatcher import BatchCall, dispatch_batch, validate_batch
+from .raw_body_route import RawBody, RawBodyPolicy, raw_body_route_class
+from .route_table import (
+    ProxyRoute,
+    QueryParam,
+    RoutePolicy,
+    add_proxy_routes,
+    cached_route_ttls,
+    compression_route_levels,
+    required_roles,
+    route_templates,
+)
 
-from fastapi import FastAPI, Header, Query
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, ConfigDict
 
-from ..proxy.http_service_proxy import HttpServiceProxy
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    verifier = _edge_auth.verifier if _edge_auth.enabled else None
+    if verifier is not None:
+        verifier.revocations.start()
+    yield
+    if verifier is not None:
+        await verifier.revocations.stop()
+    for proxy in _all_proxies():
+        aclose = getattr(proxy, "aclose", None)
+        if aclose is not None:
+            await aclose()
 
 
 app = FastAPI(
     title="Gateway Service",
     version="1.0.0",
     description="API Gateway para roteamento de Auth e Patient Services",
+    lifespan=_lifespan,
 )
 
+_raw_body_policy = RawBodyPolicy.from_env()
+app.router.route_class = raw_body_route_class(_raw_body_policy)
+
 
 class LoginRequest(BaseModel):
     username: str
@@ -96,7 +153,294 @@ class AuditEventPayload(BaseModel):
     metadata: dict | None = None
 
 
+class BatchItem(BaseModel):
+    id: str
+    method: str
+    path: str
+    body: dict | list | None = None
+    depends_on: list[str] = Field(default_factory=list)
+
+
+class BatchRequest(BaseModel):
+    requests: list[BatchItem]
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "requests": [
+                    {"id": "paciente", "method": "GET", "path": "/api/v1/patients/p-1"},
+                    {
+                        "id": "consentimentos",
+                        "method": "GET",
+                        "path": "/api/v1/patients/p-1/consents",
+                    },
+                    {
+                        "id": "revogar",
+                        "method": "POST",
+                        "path": "/api/v1/patients/p-1/consents/c-1/revoke",
+                        "depends_on": ["consentimentos"],
+                    },
+                ]
+            }
+        }
+    )
+
+
+_ADMIN_AND_PROFESSIONAL = ("admin", "profissional")
+_ADMIN_ONLY = ("admin",)
+
+_CLINICAL = RoutePolicy(roles=_ADMIN_AND_PROFESSIONAL)
+_ADMIN = RoutePolicy(roles=_ADMIN_ONLY)
+
+# Plain proxy routes: one entry per gateway operation, forwarded to the same path on
+# its downstream. Roles mirror the _require_roles dependencies of each service, so a
+# request that would be rejected there is answered at the edge instead. Handlers with
+# their own logic (logout, chart, batch) are declared further down.
+PROXY_ROUTES: tuple[ProxyRoute, ...] = (
+    ProxyRoute(
+        name="auth_login",
+        method="POST",
+        path="/api/v1/auth/login",
+        downstream="auth-service",
+        body=LoginRequest,
+        authorization=False,
+    ),
+    ProxyRoute(
+        name="auth_refresh",
+        method="POST",
+        path="/api/v1/auth/refresh",
+        downstream="auth-service",
+        body=RefreshRequest,
+        authorization=False,
+    ),
+    ProxyRoute(
+        name="auth_verify",
+        method="GET",
+        path="/api/v1/auth/verify",
+        downstream="auth-service",
+    ),
+    ProxyRoute(
+        name="auth_authorize",
+        method="GET",
+        path="/api/v1/auth/authorize",
+        downstream="auth-service",
+        query=(QueryParam("required_role", required=True),),
+    ),
+    ProxyRoute(
+        name="create_patient",
+        method="POST",
+        path="/api/v1/patients",
+        downstream="patient-service",
+        body=PatientPayload,
+        policy=_CLINICAL,
+    ),
+    ProxyRoute(
+        name="list_patients",
+        method="GET",
+        path="/api/v1/patients",
+        downstream="patient-service",
+        policy=_CLINICAL,
+    ),
+    ProxyRoute(
+        name="get_patient",
+        method="GET",
+        path="/api/v1/patients/{patient_id}",
+        downstream="patient-service",
+        policy=replace(_CLINICAL, cache_ttl_seconds=30.0),
+    ),
+    ProxyRoute(
+        name="update_patient",
+        method="PUT",
+        path="/api/v1/patients/{patient_id}",
+        downstream="patient-service",
+        body=PatientPayload,
+        policy=_CLINICAL,
+    ),
+    ProxyRoute(
+        name="delete_patient",
+        method="DELETE",
+        path="/api/v1/patients/{patient_id}",
+        downstream="patient-service",
+        policy=_ADMIN,
+    ),
+    ProxyRoute(
+        name="create_patient_consent",
+        method="POST",
+        path="/api/v1/patients/{patient_id}/consents",
+        downstream="patient-service",
+        body=ConsentPayload,
+        policy=_CLINICAL,
+    ),
+    ProxyRoute(
+        name="list_patient_consents",
+        method="GET",
+        path="/api/v1/patients/{patient_id}/consents",
+        downstream="patient-service",
+        query=(QueryParam("status"),),
+        policy=replace(_CLINICAL, cache_ttl_seconds=30.0),
+    ),
+    ProxyRoute(
+        name="revoke_patient_consent",
+        method="POST",
+        path="/api/v1/patients/{patient_id}/consents/{consent_id}/revoke",
+        downstream="patient-service",
+        policy=_CLINICAL,
+    ),
+    ProxyRoute(
+        name="create_problem",
+        method="POST",
+        path="/api/v1/emr/problems",
+        downstream="emr-service",
+        body=ProblemPayload,
+        policy=_CLINICAL,
+    ),
+    ProxyRoute(
+        name="get_problem",
+        method="GET",
+        path="/api/v1/emr/problems/{problem_id}",
+        downstream="emr-service",
+        policy=_CLINICAL,
+    ),
+    ProxyRoute(
+        name="get_timeline",
+        method="GET",
+        path="/api/v1/emr/timeline",
+        downstream="emr-service",
+        query=(
+            QueryParam("patient_id", required=True),
+            QueryParam("problem_id"),
+        ),
+        policy=replace(_CLINICAL, compression_level=7),
+    ),
+    ProxyRoute(
+        name="create_soap",
+        method="POST",
+        path="/api/v1/emr/soap",
+        downstream="emr-service",
+        body=SOAPPayload,
+        policy=_CLINICAL,
+    ),
+    ProxyRoute(
+        name="get_soap",
+        method="GET",
+        path="/api/v1/emr/soap/{soap_id}",
+        downstream="emr-service",
+        policy=_CLINICAL,
+    ),
+    ProxyRoute(
+        name="create_professional",
+        method="POST",
+        path="/api/v1/professionals",
+        downstream="professional-service",
+        body=ProfessionalPayload,
+        policy=_ADMIN,
+    ),
+    ProxyRoute(
+        name="list_professionals",
+        method="GET",
+        path="/api/v1/professionals",
+        downstream="professional-service",
+        query=(
+            QueryParam("council_type"),
+            QueryParam("council_uf"),
+            QueryParam("council_number"),
+            QueryParam("status"),
+        ),
+        policy=replace(_CLINICAL, coalesce=True),
+    ),
+    ProxyRoute(
+        name="get_professional",
+        method="GET",
+        path="/api/v1/professionals/{professional_id}",
+        downstream="professional-service",
+        policy=replace(_CLINICAL, cache_ttl_seconds=30.0),
+    ),
+    ProxyRoute(
+        name="activate_professional",
+        method="POST",
+        path="/api/v1/professionals/{professional_id}/activate",
+        downstream="professional-service",
+        policy=_ADMIN,
+    ),
+    ProxyRoute(
+        name="deactivate_professional",
+        method="POST",
+        path="/api/v1/professionals/{professional_id}/deactivate",
+        downstream="professional-service",
+        policy=_ADMIN,
+    ),
+    ProxyRoute(
+        name="create_appointment",
+        method="POST",
+        path="/api/v1/scheduling/appointments",
+        downstream="scheduling-service",
+        body=AppointmentPayload,
+        policy=_CLINICAL,
+    ),
+    ProxyRoute(
+        name="list_appointments",
+        method="GET",
+        path="/api/v1/scheduling/appointments",
+        downstream="scheduling-service",
+        policy=replace(_CLINICAL, coalesce=True),
+    ),
+    ProxyRoute(
+        name="get_appointment",
+        method="GET",
+        path="/api/v1/scheduling/appointments/{appointment_id}",
+        downstream="scheduling-service",
+        policy=_CLINICAL,
+    ),
+    ProxyRoute(
+        name="delete_appointment",
+        method="DELETE",
+        path="/api/v1/scheduling/appointments/{appointment_id}",
+        downstream="scheduling-service",
+        policy=_ADMIN,
+    ),
+    ProxyRoute(
+        name="create_audit_event",
+        method="POST",
+        path="/api/v1/audit/events",
+        downstream="audit-service",
+        body=AuditEventPayload,
+        policy=_CLINICAL,
+    ),
+    ProxyRoute(
+        name="list_audit_events",
+        method="GET",
+        path="/api/v1/audit/events",
+        downstream="audit-service",
+        query=(
+            QueryParam("actor_id"),
+            QueryParam("operation"),
+            QueryParam("from"),
+            QueryParam("to"),
+        ),
+        policy=replace(_ADMIN, compression_level=7),
+    ),
+    ProxyRoute(
+        name="get_audit_event",
+        method="GET",
+        path="/api/v1/audit/events/{event_id}",
+        downstream="audit-service",
+        policy=_ADMIN,
+    ),
+)
+
+
 APP_ENV = os.getenv("APP_ENV", "development")
+BATCH_MAX_ITEMS = int(os.getenv("GATEWAY_BATCH_MAX_ITEMS", "20"))
+STREAM_RESPONSES = os.getenv("GATEWAY_STREAM_RESPONSES", "true").lower() == "true"
+EDGE_AUTH_ENABLED = os.getenv("GATEWAY_EDGE_AUTH_ENABLED", "false").lower() == "true"
+EDGE_JWT_SECRET = os.getenv("GATEWAY_JWT_SECRET") or os.getenv("AUTH_JWT_SECRET")
+REVOCATION_REFRESH_SECONDS = float(os.getenv("GATEWAY_REVOCATION_REFRESH_SECONDS", "5"))
+REVOCATION_MAX_STALENESS_SECONDS = float(
+    os.getenv("GATEWAY_REVOCATION_MAX_STALENESS_SECONDS", "30")
+)
+EDGE_JWKS_ENABLED = os.getenv("GATEWAY_JWKS_ENABLED", "true").lower() == "true"
+JWKS_MIN_REFRESH_SECONDS = float(os.getenv("GATEWAY_JWKS_MIN_REFRESH_SECONDS", "30"))
+CHART_SECTION_TIMEOUT_SECONDS = float(os.getenv("GATEWAY_CHART_SECTION_TIMEOUT_SECONDS", "3"))
 AUTH_SERVICE_URL = os.getenv("AUTH_SERVICE_URL")
 PATIENT_SERVICE_URL = os.getenv("PATIENT_SERVICE_URL")
 EMR_SERVICE_URL = os.getenv("EMR_SERVICE_URL")
@@ -118,6 +462,13 @@ if APP_ENV in {"production", "staging"}:
     if PROFESSIONAL_SERVICE_URL is None:
         raise RuntimeError("PROFESSIONAL_SERVICE_URL is required for production/staging")
 
+if EDGE_AUTH_ENABLED:
+    if not EDGE_JWT_SECRET and not EDGE_JWKS_ENABLED:
+        raise RuntimeError(
+            "GATEWAY_JWT_SECRET or GATEWAY_JWKS_ENABLED=true is required "
+            "when GATEWAY_EDGE_AUTH_ENABLED=true"
+        )
+
 if AUTH_SERVICE_URL is None:
     AUTH_SERVICE_URL = "http://localhost:8001"
 if PATIENT_SERVICE_URL is None:
@@ -131,417 +482,445 @@ if AUDIT_SERVICE_URL is None:
 if PROFESSIONAL_SERVICE_URL is None:
     PROFESSIONAL_SERVICE_URL = "http://localhost:8006"
 
-_auth_proxy = HttpServiceProxy(base_url=AUTH_SERVICE_URL)
-_patient_proxy = HttpServiceProxy(base_url=PATIENT_SERVICE_URL)
-_emr_proxy = HttpServiceProxy(base_url=EMR_SERVICE_URL)
-_scheduling_proxy = HttpServiceProxy(base_url=SCHEDULING_SERVICE_URL)
-_audit_proxy = HttpServiceProxy(base_url=AUDIT_SERVICE_URL)
-_professional_proxy = HttpServiceProxy(base_url=PROFESSIONAL_SERVICE_URL)
-
-
-def _forward_response(status_code: int, body: object) -> JSONResponse:
-    return JSONResponse(status_code=status_code, content=body)
-
-
-@app.get("/health")
-def health_check():
-    return {"status": "healthy", "service": "gateway"}
+# One budget for every downstream: hedges and connect retries together stay around
+# GATEWAY_RETRY_BUDGET_RATIO of real traffic.
+_retry_budget = RetryBudget.from_env()
+
+_auth_proxy = HttpServiceProxy(
+    base_url=AUTH_SERVICE_URL,
+    settings=ProxyPoolSettings.from_env("AUTH_SERVICE"),
+    breaker=CircuitBreaker(CircuitBreakerSettings.from_env("AUTH_SERVICE")),
+    name="auth-service",
+    retry_policy=RetryPolicy.from_env("AUTH_SERVICE"),
+    retry_budget=_retry_budget,
+    bulkhead_settings=BulkheadSettings.from_env("AUTH_SERVICE"),
+)
+_patient_proxy = HttpServiceProxy(
+    base_url=PATIENT_SERVICE_URL,
+    settings=ProxyPoolSettings.from_env("PATIENT_SERVICE"),
+    breaker=CircuitBreaker(CircuitBreakerSettings.from_env("PATIENT_SERVICE")),
+    name="patient-service",
+    retry_policy=RetryPolicy.from_env("PATIENT_SERVICE"),
+    retry_budget=_retry_budget,
+    bulkhead_settings=BulkheadSettings.from_env("PATIENT_SERVICE"),
+)
+_emr_proxy = HttpServiceProxy(
+    base_url=EMR_SERVICE_URL,
+    settings=ProxyPoolSettings.from_env("EMR_SERVICE"),
+    breaker=CircuitBreaker(CircuitBreakerSettings.from_env("EMR_SERVICE")),
+    name="emr-service",
+    retry_policy=RetryPolicy.from_env("EMR_SERVICE"),
+    retry_budget=_retry_budget,
+    bulkhead_settings=BulkheadSettings.from_env("EMR_SERVICE"),
+)
+_scheduling_proxy = HttpServiceProxy(
+    base_url=SCHEDULING_SERVICE_URL,
+    settings=ProxyPoolSettings.from_env("SCHEDULING_SERVICE"),
+    breaker=CircuitBreaker(CircuitBreakerSettings.from_env("SCHEDULING_SERVICE")),
+    name="scheduling-service",
+    retry_policy=RetryPolicy.from_env("SCHEDULING_SERVICE"),
+    retry_budget=_retry_budget,
+    bulkhead_settings=BulkheadSettings.from_env("SCHEDULING_SERVICE"),
+)
+_audit_proxy = HttpServiceProxy(
+    base_url=AUDIT_SERVICE_URL,
+    settings=ProxyPoolSettings.from_env("AUDIT_SERVICE"),
+    breaker=CircuitBreaker(CircuitBreakerSettings.from_env("AUDIT_SERVICE")),
+    name="audit-service",
+    retry_policy=RetryPolicy.from_env("AUDIT_SERVICE"),
+    retry_budget=_retry_budget,
+    bulkhead_settings=BulkheadSettings.from_env("AUDIT_SERVICE"),
+)
+_professional_proxy = HttpServiceProxy(
+    base_url=PROFESSIONAL_SERVICE_URL,
+    settings=ProxyPoolSettings.from_env("PROFESSIONAL_SERVICE"),
+    breaker=CircuitBreaker(CircuitBreakerSettings.from_env("PROFESSIONAL_SERVICE")),
+    name="professional-service",
+    retry_policy=RetryPolicy.from_env("PROFESSIONAL_SERVICE"),
+    retry_budget=_retry_budget,
+    bulkhead_settings=BulkheadSettings.from_env("PROFESSIONAL_SERVICE"),
+)
 
 
-@app.get("/api/v1/info")
-def service_info():
+def _downstream_proxies() -> dict[str, object]:
     return {
-        "service": "gateway",
-        "architecture": "clean-architecture",
-        "layers": ["domain", "application", "infra"],
-        "routes": ["auth", "patients", "emr", "scheduling", "audit", "professional"],
+        "auth-service": _auth_proxy,
+        "patient-service": _patient_proxy,
+        "emr-service": _emr_proxy,
+        "scheduling-service": _scheduling_proxy,
+        "audit-service": _audit_proxy,
+        "professional-service": _professional_proxy,
     }
 
 
-@app.post("/api/v1/auth/login")
-def auth_login(payload: LoginRequest):
-    status_code, body = _auth_proxy.request(
-        method="POST",
-        path="/api/v1/auth/login",
-        json_body=payload.model_dump(),
-    )
-    return _forward_response(status_code, body)
-
-
-@app.post("/api/v1/auth/refresh")
-def auth_refresh(payload: RefreshRequest):
-    status_code, body = _auth_proxy.request(
-        method="POST",
-        path="/api/v1/auth/refresh",
-        json_body=payload.model_dump(),
-    )
-    return _forward_response(status_code, body)
+def _all_proxies() -> list:
+    return list(_downstream_proxies().values())
 
 
-@app.post("/api/v1/auth/logout")
-def auth_logout(payload: LogoutRequest, authorization: str | None = Header(default=None)):
-    status_code, body = _auth_proxy.request(
-        method="POST",
-        path="/api/v1/auth/logout",
-        json_body=payload.model_dump(),
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+# Gateway state (limits, breakers, cache and budget counters): admin only, out of the OpenAPI.
+_INTROSPECTION_PATHS = tuple(
+    f"/api/v1/gateway/{name}"
+    for name in ("circuits", "bulkheads", "coalescing", "cache", "compression", "retries")
+)
+# Roles from the route table plus the handlers implemented by the gateway itself.
+_ROUTE_REQUIRED_ROLES: dict[tuple[str, str], tuple[str, ...]] = {
+    **required_roles(PROXY_ROUTES),
+    ("POST", "/api/v1/batch"): _ADMIN_AND_PROFESSIONAL,
+    ("GET", "/api/v1/patients/{patient_id}/chart"): _ADMIN_AND_PROFESSIONAL,
+    **{("GET", path): _ADMIN_ONLY for path in _INTROSPECTION_PATHS},
+}
 
 
-@app.get("/api/v1/auth/verify")
-def auth_verify(authorization: str | None = Header(default=None)):
-    status_code, body = _auth_proxy.request(
+async def _fetch_revocations() -> list[tuple[str, float]]:
+    status_code, body = await _auth_proxy.request(
         method="GET",
-        path="/api/v1/auth/verify",
-        authorization=authorization,
+        path="/api/v1/auth/revocations",
     )
-    return _forward_response(status_code, body)
+    if status_code != 200 or not isinstance(body, dict):
+        raise ValueError("revocation feed unavailable")
+    return [(item["jti"], float(item["expires_at"])) for item in body.get("revoked", [])]
 
 
-@app.get("/api/v1/auth/authorize")
-def auth_authorize(
-    required_role: str = Query(...),
-    authorization: str | None = Header(default=None),
-):
-    status_code, body = _auth_proxy.request(
+async def _introspect_token(token: str) -> dict | None:
+    status_code, body = await _auth_proxy.request(
         method="GET",
-        path="/api/v1/auth/authorize",
-        authorization=authorization,
-        params={"required_role": required_role},
+        path="/api/v1/auth/introspect",
+        authorization=f"Bearer {token}",
     )
-    return _forward_response(status_code, body)
+    if status_code == 401:
+        detail = body.get("detail") if isinstance(body, dict) else None
+        raise ValueError(detail or "invalid token")
+    if status_code != 200 or not isinstance(body, dict) or not body.get("valid"):
+        return None
+    return body["claims"]
+
+
+async def _fetch_jwks() -> dict:
+    status_code, body = await _auth_proxy.request(method="GET", path="/.well-known/jwks.json")
+    if status_code != 200 or not isinstance(body, dict):
+        raise ValueError("jwks unavailable")
+    return body
+
+
+_edge_auth = EdgeAuthPolicy(
+    route_roles=RouteRoleTable(_ROUTE_REQUIRED_ROLES),
+    verifier=(
+        EdgeTokenVerifier(
+            secret_key=EDGE_JWT_SECRET,
+            revocations=RevocationCache(
+                fetcher=_fetch_revocations,
+                refresh_interval_seconds=REVOCATION_REFRESH_SECONDS,
+                max_staleness_seconds=REVOCATION_MAX_STALENESS_SECONDS,
+            ),
+            keys=(
+                JwksKeyCache(fetcher=_fetch_jwks, min_refresh_seconds=JWKS_MIN_REFRESH_SECONDS)
+                if EDGE_JWKS_ENABLED
+                else None
+            ),
+        )
+        if EDGE_JWT_SECRET or EDGE_JWKS_ENABLED
+        else None
+    ),
+    enabled=EDGE_AUTH_ENABLED,
+    introspect=_introspect_token,
+)
+# Read-mostly resources cached per credential for a short TTL (seconds). Added before
+# the edge middleware so requests are authenticated before a cached response is served.
+_CACHED_ROUTE_TTLS = cached_route_ttls(PROXY_ROUTES)
+_response_cache = ResponseCache.from_env(_CACHED_ROUTE_TTLS)
+app.add_middleware(
+    ResponseCacheMiddleware,
+    cache=_response_cache,
+    revocations=lambda: _edge_auth.verifier.revocations if _edge_auth.verifier else None,
+)
+app.add_middleware(EdgeAuthMiddleware, policy=_edge_auth)
+# Wraps the cache so cached and pass-through bodies are compressed on the way out;
+# large list routes trade more CPU for smaller payloads through their table level.
+_response_compression = ResponseCompression.from_env(compression_route_levels(PROXY_ROUTES))
+app.add_middleware(ResponseCompressionMiddleware, compression=_response_compression)
+# Outermost, so edge rejections and cache hits are timed and counted as well.
+app.add_middleware(MetricsMiddleware, router=app.router)
+
+
+# Polled list endpoints whose identical concurrent GETs share one downstream call.
+_COALESCED_ROUTES = route_templates(PROXY_ROUTES, "coalesce")
+_coalescer = RequestCoalescer.from_env(_COALESCED_ROUTES)
+
+# GET routes allowed to send a hedged second attempt; GATEWAY_HEDGE_ROUTES replaces
+# the table defaults (comma-separated templates).
+_hedged_routes = PathTemplateSet.from_env(
+    "GATEWAY_HEDGE_ROUTES",
+    route_templates(PROXY_ROUTES, "hedge"),
+)
 
 
-@app.post("/api/v1/patients")
-def create_patient(payload: PatientPayload, authorization: str | None = Header(default=None)):
-    status_code, body = _patient_proxy.request(
-        method="POST",
-        path="/api/v1/patients",
-        json_body=payload.model_dump(),
-        authorization=authorization,
+METRICS_REGISTRY.register(
+    GatewayStateCollector(
+        proxies=_downstream_proxies,
+        response_cache=lambda: _response_cache,
+        coalescer=lambda: _coalescer,
+        edge_verifier=lambda: _edge_auth.verifier if _edge_auth.enabled else None,
     )
-    return _forward_response(status_code, body)
+)
 
 
-@app.get("/api/v1/patients")
-def list_patients(authorization: str | None = Header(default=None)):
-    status_code, body = _patient_proxy.request(
-        method="GET",
-        path="/api/v1/patients",
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+def _forward_response(status_code: int, body: object) -> JSONResponse:
+    return JSONResponse(status_code=status_code, content=body)
 
 
-@app.get("/api/v1/patients/{patient_id}")
-def get_patient(patient_id: str, authorization: str | None = Header(default=None)):
-    status_code, body = _patient_proxy.request(
-        method="GET",
-        path=f"/api/v1/patients/{patient_id}",
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+class _ProxiedStreamingResponse(StreamingResponse):
+    # Closes the downstream stream however the response ends. A background task
+    # only runs after a complete send, so a client disconnect or a downstream
+    # error mid-body would otherwise keep the bulkhead slot.
+    def __init__(self, stream: ProxiedStream):
+        super().__init__(stream.chunks, status_code=stream.status_code, headers=stream.headers)
+        self._stream = stream
 
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self._stream.aclose()
 
-@app.put("/api/v1/patients/{patient_id}")
-def update_patient(
-    patient_id: str,
-    payload: PatientPayload,
-    authorization: str | None = Header(default=None),
-):
-    status_code, body = _patient_proxy.request(
-        method="PUT",
-        path=f"/api/v1/patients/{patient_id}",
-        json_body=payload.model_dump(),
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
 
+def _forward_stream(stream: ProxiedStream) -> StreamingResponse:
+    return _ProxiedStreamingResponse(stream)
 
-@app.delete("/api/v1/patients/{patient_id}")
-def delete_patient(patient_id: str, authorization: str | None = Header(default=None)):
-    status_code, body = _patient_proxy.request(
-        method="DELETE",
-        path=f"/api/v1/patients/{patient_id}",
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
 
+def _body_kwargs(payload: BaseModel | RawBody) -> dict:
+    if isinstance(payload, RawBody):
+        return {"content": payload.content}
+    return {"json_body": payload.model_dump()}
 
-@app.post("/api/v1/patients/{patient_id}/consents")
-def create_patient_consent(
-    patient_id: str,
-    payload: ConsentPayload,
-    authorization: str | None = Header(default=None),
-):
-    status_code, body = _patient_proxy.request(
-        method="POST",
-        path=f"/api/v1/patients/{patient_id}/consents",
-        json_body=payload.model_dump(),
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
 
+async def _buffer_downstream(proxy, request_kwargs: dict) -> BufferedResponse:
+    stream = await proxy.stream(**request_kwargs)
+    try:
+        body = b"".join([chunk async for chunk in stream.chunks])
+    finally:
+        await stream.aclose()
+    return BufferedResponse(status_code=stream.status_code, headers=stream.headers, body=body)
 
-@app.get("/api/v1/patients/{patient_id}/consents")
-def list_patient_consents(
-    patient_id: str,
-    status: str | None = Query(default=None),
-    authorization: str | None = Header(default=None),
-):
-    params: dict[str, str] = {}
-    if status is not None:
-        params["status"] = status
 
-    status_code, body = _patient_proxy.request(
-        method="GET",
-        path=f"/api/v1/patients/{patient_id}/consents",
-        params=params,
-        authorization=authorization,
+async def _forward_route(route: ProxyRoute, payload=None, **request_kwargs) -> Response:
+    if payload is not None:
+        request_kwargs.update(_body_kwargs(payload))
+    return await _proxy_call(
+        _downstream_proxies()[route.downstream],
+        retry=route.policy.retry,
+        timeout_seconds=route.policy.timeout_seconds,
+        **request_kwargs,
     )
-    return _forward_response(status_code, body)
 
 
-@app.post("/api/v1/patients/{patient_id}/consents/{consent_id}/revoke")
-def revoke_patient_consent(
-    patient_id: str,
-    consent_id: str,
-    authorization: str | None = Header(default=None),
-):
-    status_code, body = _patient_proxy.request(
-        method="POST",
-        path=f"/api/v1/patients/{patient_id}/consents/{consent_id}/revoke",
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
-
+async def _proxy_call(proxy, **request_kwargs) -> Response:
+    method, path = request_kwargs["method"], request_kwargs["path"]
+    request_kwargs["hedge"] = method == "GET" and _hedged_routes.matches(path)
+    if _coalescer.applies_to(method, path):
+        key = _coalescer.key_for(
+            method,
+            path,
+            request_kwargs.get("params"),
+            request_kwargs.get("authorization"),
+        )
+        shared = await _coalescer.run(key, lambda: _buffer_downstream(proxy, request_kwargs))
+        return Response(
+            content=shared.body,
+            status_code=shared.status_code,
+            headers=shared.headers,
+        )
+
+    if STREAM_RESPONSES:
+        return _forward_stream(await proxy.stream(**request_kwargs))
+
+    status_code, body = await proxy.request(**request_kwargs)
+    response = _forward_response(status_code, body)
+    if status_code == 503 and body == UNAVAILABLE_DETAIL:
+        response.headers["Retry-After"] = str(proxy.retry_after_seconds())
+    return response
 
-@app.post("/api/v1/emr/problems")
-def create_problem(payload: ProblemPayload, authorization: str | None = Header(default=None)):
-    status_code, body = _emr_proxy.request(
-        method="POST",
-        path="/api/v1/emr/problems",
-        json_body=payload.model_dump(),
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
 
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy", "service": "gateway"}
 
-@app.get("/api/v1/emr/problems/{problem_id}")
-def get_problem(problem_id: str, authorization: str | None = Header(default=None)):
-    status_code, body = _emr_proxy.request(
-        method="GET",
-        path=f"/api/v1/emr/problems/{problem_id}",
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
 
+@app.get("/api/v1/info")
+async def service_info():
+    return {
+        "service": "gateway",
+        "architecture": "clean-architecture",
+        "layers": ["domain", "application", "infra"],
+        "routes": ["auth", "patients", "emr", "scheduling", "audit", "professional"],
+    }
 
-@app.get("/api/v1/emr/timeline")
-def get_timeline(
-    patient_id: str = Query(...),
-    problem_id: str | None = Query(default=None),
-    authorization: str | None = Header(default=None),
-):
-    params: dict[str, str] = {"patient_id": patient_id}
-    if problem_id is not None:
-        params["problem_id"] = problem_id
 
-    status_code, body = _emr_proxy.request(
-        method="GET",
-        path="/api/v1/emr/timeline",
-        params=params,
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    payload, content_type = render_latest()
+    return Response(content=payload, media_type=content_type)
 
 
-@app.post("/api/v1/emr/soap")
-def create_soap(payload: SOAPPayload, authorization: str | None = Header(default=None)):
-    status_code, body = _emr_proxy.request(
-        method="POST",
-        path="/api/v1/emr/soap",
-        json_body=payload.model_dump(),
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+async def _require_admin(authorization: str | None = Header(default=None)) -> dict:
+    return await _edge_auth.require(authorization, _ADMIN_ONLY)
 
 
-@app.get("/api/v1/emr/soap/{soap_id}")
-def get_soap(soap_id: str, authorization: str | None = Header(default=None)):
-    status_code, body = _emr_proxy.request(
-        method="GET",
-        path=f"/api/v1/emr/soap/{soap_id}",
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+@app.get("/api/v1/gateway/circuits", include_in_schema=False)
+async def circuit_breakers(_claims: dict = Depends(_require_admin)):
+    circuits = {}
+    for name, proxy in _downstream_proxies().items():
+        breaker = getattr(proxy, "breaker", None)
+        if breaker is not None:
+            circuits[name] = breaker.snapshot()
+    return {"circuits": circuits}
 
 
-@app.post("/api/v1/professionals")
-def create_professional(
-    payload: ProfessionalPayload,
-    authorization: str | None = Header(default=None),
-):
-    status_code, body = _professional_proxy.request(
-        method="POST",
-        path="/api/v1/professionals",
-        json_body=payload.model_dump(),
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+@app.get("/api/v1/gateway/bulkheads", include_in_schema=False)
+async def bulkheads(_claims: dict = Depends(_require_admin)):
+    limits = {}
+    for name, proxy in _downstream_proxies().items():
+        bulkhead = getattr(proxy, "bulkhead", None)
+        if bulkhead is not None:
+            limits[name] = bulkhead.snapshot()
+    return {"bulkheads": limits}
 
 
-@app.get("/api/v1/professionals")
-def list_professionals(
-    council_type: str | None = Query(default=None),
-    council_uf: str | None = Query(default=None),
-    council_number: str | None = Query(default=None),
-    status: str | None = Query(default=None),
-    authorization: str | None = Header(default=None),
-):
-    params: dict[str, str] = {}
-    if council_type is not None:
-        params["council_type"] = council_type
-    if council_uf is not None:
-        params["council_uf"] = council_uf
-    if council_number is not None:
-        params["council_number"] = council_number
-    if status is not None:
-        params["status"] = status
-
-    status_code, body = _professional_proxy.request(
-        method="GET",
-        path="/api/v1/professionals",
-        params=params or None,
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+@app.get("/api/v1/gateway/coalescing", include_in_schema=False)
+async def request_coalescing(_claims: dict = Depends(_require_admin)):
+    return _coalescer.snapshot()
 
 
-@app.get("/api/v1/professionals/{professional_id}")
-def get_professional(professional_id: str, authorization: str | None = Header(default=None)):
-    status_code, body = _professional_proxy.request(
-        method="GET",
-        path=f"/api/v1/professionals/{professional_id}",
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+@app.get("/api/v1/gateway/cache", include_in_schema=False)
+async def response_cache(_claims: dict = Depends(_require_admin)):
+    return _response_cache.snapshot()
 
 
-@app.post("/api/v1/professionals/{professional_id}/activate")
-def activate_professional(professional_id: str, authorization: str | None = Header(default=None)):
-    status_code, body = _professional_proxy.request(
-        method="POST",
-        path=f"/api/v1/professionals/{professional_id}/activate",
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+@app.get("/api/v1/gateway/compression", include_in_schema=False)
+async def response_compression(_claims: dict = Depends(_require_admin)):
+    return _response_compression.snapshot()
 
 
-@app.post("/api/v1/professionals/{professional_id}/deactivate")
-def deactivate_professional(
-    professional_id: str,
-    authorization: str | None = Header(default=None),
-):
-    status_code, body = _professional_proxy.request(
-        method="POST",
-        path=f"/api/v1/professionals/{professional_id}/deactivate",
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+@app.get("/api/v1/gateway/retries", include_in_schema=False)
+async def retry_budget(_claims: dict = Depends(_require_admin)):
+    return {"budget": _retry_budget.snapshot(), "hedged_routes": list(_hedged_routes.templates)}
 
 
-@app.post("/api/v1/scheduling/appointments")
-def create_appointment(
-    payload: AppointmentPayload,
-    authorization: str | None = Header(default=None),
-):
-    status_code, body = _scheduling_proxy.request(
-        method="POST",
-        path="/api/v1/scheduling/appointments",
-        json_body=payload.model_dump(),
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+# Sub-requests may only target the proxied API: the gateway's own handlers (batch, chart,
+# state endpoints) and /metrics are not reachable from a batch.
+_BATCH_ROUTES = {
+    method: PathTemplateSet(tuple(route.path for route in PROXY_ROUTES if route.method == method))
+    for method in {route.method for route in PROXY_ROUTES}
+}
 
 
-@app.get("/api/v1/scheduling/appointments")
-def list_appointments(authorization: str | None = Header(default=None)):
-    status_code, body = _scheduling_proxy.request(
-        method="GET",
-        path="/api/v1/scheduling/appointments",
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+async def _require_clinical(authorization: str | None = Header(default=None)) -> dict:
+    return await _edge_auth.require(authorization, _ADMIN_AND_PROFESSIONAL)
 
 
-@app.get("/api/v1/scheduling/appointments/{appointment_id}")
-def get_appointment(appointment_id: str, authorization: str | None = Header(default=None)):
-    status_code, body = _scheduling_proxy.request(
-        method="GET",
-        path=f"/api/v1/scheduling/appointments/{appointment_id}",
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+async def run_batch(
+    payload: BatchRequest,
+    authorization: str | None = Header(default=None),
+    _claims: dict = Depends(_require_clinical),
+):
+    calls = [
+        BatchCall(
+            id=item.id,
+            method=item.method.upper(),
+            path=item.path,
+            body=item.body,
+            depends_on=tuple(item.depends_on),
+        )
+        for item in payload.requests
+    ]
+    try:
+        validate_batch(calls, routes=_BATCH_ROUTES, max_items=BATCH_MAX_ITEMS)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
+
+    outcomes = await dispatch_batch(app, calls, authorization)
+    return {"responses": [outcome.to_dict() for outcome in outcomes]}
+
+
+# Handled by the gateway itself rather than forwarded, so the batch envelope is always
+# validated, including when GATEWAY_FORWARD_RAW_BODY is on.
+app.router.add_api_route(
+    "/api/v1/batch",
+    run_batch,
+    methods=["POST"],
+    route_class_override=APIRoute,
+)
 
 
-@app.delete("/api/v1/scheduling/appointments/{appointment_id}")
-def delete_appointment(appointment_id: str, authorization: str | None = Header(default=None)):
-    status_code, body = _scheduling_proxy.request(
-        method="DELETE",
-        path=f"/api/v1/scheduling/appointments/{appointment_id}",
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+add_proxy_routes(app, PROXY_ROUTES, _forward_route)
 
 
-@app.post("/api/v1/audit/events")
-def create_audit_event(
-    payload: AuditEventPayload,
-    authorization: str | None = Header(default=None),
-):
-    status_code, body = _audit_proxy.request(
+@app.post("/api/v1/auth/logout")
+async def auth_logout(payload: LogoutRequest, authorization: str | None = Header(default=None)):
+    response = await _proxy_call(
+        _auth_proxy,
         method="POST",
-        path="/api/v1/audit/events",
-        json_body=payload.model_dump(),
+        path="/api/v1/auth/logout",
+        **_body_kwargs(payload),
         authorization=authorization,
     )
-    return _forward_response(status_code, body)
-
-
-@app.get("/api/v1/audit/events")
-def list_audit_events(
-    actor_id: str | None = Query(default=None),
-    operation: str | None = Query(default=None),
-    from_datetime: str | None = Query(default=None, alias="from"),
-    to_datetime: str | None = Query(default=None, alias="to"),
-    authorization: str | None = Header(default=None),
-):
-    params: dict[str, str] = {}
-    if actor_id is not None:
-        params["actor_id"] = actor_id
-    if operation is not None:
-        params["operation"] = operation
-    if from_datetime is not None:
-        params["from"] = from_datetime
-    if to_datetime is not None:
-        params["to"] = to_datetime
-
-    status_code, body = _audit_proxy.request(
-        method="GET",
-        path="/api/v1/audit/events",
-        params=params or None,
+    if response.status_code == 200:
+        _edge_auth.remember_logout(authorization)
+    return response
+
+
+def _chart_section_timeout(section: str) -> float:
+    value = os.getenv(f"GATEWAY_CHART_{section.upper()}_TIMEOUT_SECONDS")
+    return CHART_SECTION_TIMEOUT_SECONDS if value is None else float(value)
+
+
+@app.get("/api/v1/patients/{patient_id}/chart")
+async def get_patient_chart(patient_id: str, authorization: str | None = Header(default=None)):
+    sections = await fan_out(
+        [
+            FanOutCall(
+                name="patient",
+                proxy=_patient_proxy,
+                path=f"/api/v1/patients/{patient_id}",
+                timeout_seconds=_chart_section_timeout("patient"),
+            ),
+            FanOutCall(
+                name="consents",
+                proxy=_patient_proxy,
+                path=f"/api/v1/patients/{patient_id}/consents",
+                timeout_seconds=_chart_section_timeout("consents"),
+            ),
+            FanOutCall(
+                name="timeline",
+                proxy=_emr_proxy,
+                path="/api/v1/emr/timeline",
+                params={"patient_id": patient_id},
+                timeout_seconds=_chart_section_timeout("timeline"),
+            ),
+            FanOutCall(
+                name="appointments",
+                proxy=_scheduling_proxy,
+                path="/api/v1/scheduling/appointments",
+                timeout_seconds=_chart_section_timeout("appointments"),
+            ),
+        ],
         authorization=authorization,
     )
-    return _forward_response(status_code, body)
 
+    patient = sections["patient"]
+    if not patient.ok and patient.status_code is not None and patient.status_code < 500:
+        # Without the patient record (unknown id, bad token, wrong role) there is no chart.
+        return _forward_response(patient.status_code, {"detail": patient.detail})
 
-@app.get("/api/v1/audit/events/{event_id}")
-def get_audit_event(event_id: str, authorization: str | None = Header(default=None)):
-    status_code, body = _audit_proxy.request(
-        method="GET",
-        path=f"/api/v1/audit/events/{event_id}",
-        authorization=authorization,
-    )
-    return _forward_response(status_code, body)
+    appointments = sections["appointments"]
+    if appointments.ok and isinstance(appointments.data, list):
+        # scheduling-service has no patient filter; narrow the list here.
+        sections["appointments"] = replace(
+            appointments,
+            data=[item for item in appointments.data if item.get("patient_id") == patient_id],
+        )
+
+    return {
+        "patient_id": patient_id,
+        "partial": not all(section.ok for section in sections.values()),
+        "sections": {name: section.to_dict() for name, section in sections.items()},
+    }
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+from copy import copy
+from dataclasses import dataclass, field
+
+from fastapi import HTTPException, Request
+from fastapi.routing import APIRoute, get_request_handler
+
+
+_REQUEST_PARAM_NAME = "_raw_body_request"
+
+
+@dataclass
+class RawBodyPolicy:
+    enabled: bool = False
+    max_body_bytes: int = 1024 * 1024
+    allowed_content_types: tuple[str, ...] = field(default=("application/json",))
+
+    @classmethod
+    def from_env(cls) -> RawBodyPolicy:
+        defaults = cls()
+        return cls(
+            enabled=os.getenv("GATEWAY_FORWARD_RAW_BODY", "false").lower() == "true",
+            max_body_bytes=int(
+                os.getenv("GATEWAY_MAX_BODY_BYTES", str(defaults.max_body_bytes))
+            ),
+        )
+
+    def accepts_content_type(self, content_type: str | None) -> bool:
+        media_type = (content_type or "").split(";", 1)[0].strip().lower()
+        return media_type in self.allowed_content_types or media_type.endswith("+json")
+
+
+@dataclass(frozen=True)
+class RawBody:
+    content: bytes
+
+
+def raw_body_route_class(policy: RawBodyPolicy) -> type[APIRoute]:
+    class RawBodyRoute(APIRoute):
+        # The body model stays on the route so the published OpenAPI schema is the
+        # same in both modes; only the runtime handler skips Pydantic validation and
+        # leaves the downstream contract as the single validator.
+        def get_route_handler(self):
+            validated_handler = super().get_route_handler()
+            if not self.dependant.body_params:
+                return validated_handler
+
+            raw_handler = self._build_raw_handler()
+
+            async def handler(request: Request):
+                if policy.enabled:
+                    return await raw_handler(request)
+                return await validated_handler(request)
+
+            return handler
+
+        def _build_raw_handler(self):
+            endpoint = self.dependant.call
+            endpoint_request_param = self.dependant.request_param_name
+            body_param_names = [param.name for param in self.dependant.body_params]
+
+            async def call_with_raw_body(**values):
+                request: Request = values.pop(_REQUEST_PARAM_NAME)
+                if endpoint_request_param:
+                    values[endpoint_request_param] = request
+                raw_body = await _read_checked_body(request, policy)
+                for name in body_param_names:
+                    values[name] = raw_body
+                return await endpoint(**values)
+
+            dependant = copy(self.dependant)
+            dependant.body_params = []
+            dependant.request_param_name = _REQUEST_PARAM_NAME
+            dependant.call = call_with_raw_body
+            return get_request_handler(
+                dependant=dependant,
+                status_code=self.status_code,
+                response_class=self.response_class,
+                response_field=self.secure_cloned_response_field,
+                dependency_overrides_provider=self.dependency_overrides_provider,
+            )
+
+    return RawBodyRoute
+
+
+async def _read_checked_body(request: Request, policy: RawBodyPolicy) -> RawBody:
+    if not policy.accepts_content_type(request.headers.get("content-type")):
+        raise HTTPException(status_code=415, detail="unsupported media type")
+
+    declared_length = request.headers.get("content-length")
+    if declared_length and declared_length.isdigit():
+        if int(declared_length) > policy.max_body_bytes:
+            raise HTTPException(status_code=413, detail="request body too large")
+
+    content = await request.body()
+    if len(content) > policy.max_body_bytes:
+        raise HTTPException(status_code=413, detail="request body too large")
+    return RawBody(content=content)
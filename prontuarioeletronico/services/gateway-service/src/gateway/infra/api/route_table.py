@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import inspect
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from string import Formatter
+
+from fastapi import FastAPI, Header, Query
+from pydantic import BaseModel
+
+
+@dataclass(frozen=True)
+class RoutePolicy:
+    roles: tuple[str, ...] = ()
+    cache_ttl_seconds: float | None = None
+    coalesce: bool = False
+    hedge: bool = False
+    retry: bool = True
+    timeout_seconds: float | None = None
+    compression_level: int | None = None
+
+
+@dataclass(frozen=True)
+class QueryParam:
+    name: str
+    required: bool = False
+
+
+@dataclass(frozen=True)
+class ProxyRoute:
+    name: str
+    method: str
+    path: str
+    downstream: str
+    body: type[BaseModel] | None = None
+    query: tuple[QueryParam, ...] = ()
+    authorization: bool = True
+    policy: RoutePolicy = field(default_factory=RoutePolicy)
+
+
+Forwarder = Callable[..., Awaitable[object]]
+
+
+def required_roles(routes: tuple[ProxyRoute, ...]) -> dict[tuple[str, str], tuple[str, ...]]:
+    return {(route.method, route.path): route.policy.roles for route in routes if route.policy.roles}
+
+
+def cached_route_ttls(routes: tuple[ProxyRoute, ...]) -> dict[str, float]:
+    return {
+        route.path: route.policy.cache_ttl_seconds
+        for route in routes
+        if route.method == "GET" and route.policy.cache_ttl_seconds is not None
+    }
+
+
+def compression_route_levels(routes: tuple[ProxyRoute, ...]) -> dict[str, int]:
+    return {
+        route.path: route.policy.compression_level
+        for route in routes
+        if route.method == "GET" and route.policy.compression_level is not None
+    }
+
+
+def route_templates(routes: tuple[ProxyRoute, ...], flag: str) -> tuple[str, ...]:
+    return tuple(
+        route.path for route in routes if route.method == "GET" and getattr(route.policy, flag)
+    )
+
+
+def add_proxy_routes(app: FastAPI, routes: tuple[ProxyRoute, ...], forward: Forwarder) -> None:
+    # Runs once at import: every entry becomes a regular FastAPI route, so OpenAPI,
+    # validation and the raw-body route class behave as for hand-written handlers.
+    for route in routes:
+        app.add_api_route(
+            route.path,
+            _build_endpoint(route, forward),
+            methods=[route.method],
+            name=route.name,
+        )
+
+
+def _build_endpoint(route: ProxyRoute, forward: Forwarder):
+    render_path = _compile_path(route.path)
+    # Query values arrive under generated identifiers, so names such as "from" can be
+    # declared as aliases and forwarded under their public name.
+    query_names = {f"query_{index}": param.name for index, param in enumerate(route.query)}
+
+    async def endpoint(**values):
+        params = {
+            public: values[local]
+            for local, public in query_names.items()
+            if values[local] is not None
+        }
+        request_kwargs: dict = {"method": route.method, "path": render_path(values)}
+        if params:
+            request_kwargs["params"] = params
+        if route.body is not None:
+            request_kwargs["payload"] = values["payload"]
+        if route.authorization:
+            request_kwargs["authorization"] = values["authorization"]
+        return await forward(route, **request_kwargs)
+
+    endpoint.__name__ = route.name
+    endpoint.__signature__ = inspect.Signature(_parameters(route, query_names))
+    return endpoint
+
+
+def _compile_path(template: str) -> Callable[[dict], str]:
+    parts = [(literal, name) for literal, name, _, _ in Formatter().parse(template)]
+
+    def render(values: dict) -> str:
+        return "".join(
+            literal if name is None else f"{literal}{values[name]}" for literal, name in parts
+        )
+
+    return render
+
+
+def _parameters(route: ProxyRoute, query_names: dict[str, str]) -> list[inspect.Parameter]:
+    keyword = inspect.Parameter.KEYWORD_ONLY
+    parameters = [
+        inspect.Parameter(name, keyword, annotation=str)
+        for _, name, _, _ in Formatter().parse(route.path)
+        if name is not None
+    ]
+    if route.body is not None:
+        parameters.append(inspect.Parameter("payload", keyword, annotation=route.body))
+    for (local, public), param in zip(query_names.items(), route.query):
+        if param.required:
+            annotation, default = str, Query(..., alias=public)
+        else:
+            annotation, default = str | None, Query(default=None, alias=public)
+        parameters.append(inspect.Parameter(local, keyword, annotation=annotation, default=default))
+    if route.authorization:
+        parameters.append(
+            inspect.Parameter(
+                "authorization",
+                keyword,
+                annotation=str | None,
+                default=Header(default=None),
+            )
+        )
+    return parameters
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+
+from ..proxy.path_templates import compile_path_template
+from .edge_token_verifier import EdgeTokenVerifier
+
+
+_verified_claims: ContextVar[dict | None] = ContextVar("gateway_verified_claims", default=None)
+
+_ADMIN_ROLE = "admin"
+
+
+def current_verified_claims() -> dict | None:
+    return _verified_claims.get()
+
+
+class RouteRoleTable:
+    def __init__(self, required_roles: dict[tuple[str, str], tuple[str, ...]]):
+        self._entries = [
+            (method.upper(), compile_path_template(template), roles)
+            for (method, template), roles in required_roles.items()
+        ]
+
+    def required_roles_for(self, method: str, path: str) -> tuple[str, ...] | None:
+        for entry_method, pattern, roles in self._entries:
+            if entry_method == method and pattern.fullmatch(path):
+                return roles
+        return None
+
+
+@dataclass
+class EdgeAuthPolicy:
+    route_roles: RouteRoleTable
+    verifier: EdgeTokenVerifier | None = None
+    enabled: bool = False
+    # Claims of a token checked at auth-service; raises ValueError (with the auth-service
+    # detail) for a rejected token and returns None when auth-service cannot answer.
+    introspect: Callable[[str], Awaitable[dict | None]] | None = None
+
+    async def authenticate(
+        self,
+        authorization: str | None,
+        required_roles: tuple[str, ...],
+    ) -> dict:
+        if self.verifier is None:
+            raise _EdgeRejection(503, "edge authentication not configured")
+        token = _bearer_token(authorization)
+        try:
+            claims = await self.verifier.verify(token)
+        except ValueError as error:
+            raise _EdgeRejection(401, str(error)) from error
+
+        return self.authorize(claims, required_roles)
+
+    async def require(self, authorization: str | None, required_roles: tuple[str, ...]) -> dict:
+        # For handlers the gateway answers itself: reuses the claims the edge (or the outer
+        # batch request) already verified, otherwise checks the token once, at the edge when
+        # it is on and at auth-service when it is off.
+        try:
+            claims = current_verified_claims()
+            if claims is not None:
+                return self.authorize(claims, required_roles)
+            if self.enabled:
+                return await self.authenticate(authorization, required_roles)
+            return self.authorize(await self._introspect(authorization), required_roles)
+        except _EdgeRejection as rejection:
+            raise HTTPException(status_code=rejection.status_code, detail=rejection.detail) from rejection
+
+    async def _introspect(self, authorization: str | None) -> dict:
+        if self.introspect is None:
+            raise _EdgeRejection(503, "edge authentication not configured")
+        token = _bearer_token(authorization)
+        try:
+            claims = await self.introspect(token)
+        except ValueError as error:
+            raise _EdgeRejection(401, str(error)) from error
+        if claims is None:
+            raise _EdgeRejection(503, "authentication unavailable")
+        return claims
+
+    def authorize(self, claims: dict, required_roles: tuple[str, ...]) -> dict:
+        role = claims.get("role")
+        if role not in required_roles and role != _ADMIN_ROLE:
+            raise _EdgeRejection(403, "insufficient role")
+        return claims
+
+    def remember_logout(self, authorization: str | None) -> None:
+        if self.verifier is None or not authorization:
+            return
+        prefix = "Bearer "
+        if authorization.startswith(prefix):
+            self.verifier.remember_revoked(authorization[len(prefix):].strip())
+
+
+def _bearer_token(authorization: str | None) -> str:
+    if not authorization:
+        raise _EdgeRejection(401, "missing authorization header")
+
+    prefix = "Bearer "
+    if not authorization.startswith(prefix):
+        raise _EdgeRejection(401, "invalid authorization scheme")
+
+    token = authorization[len(prefix):].strip()
+    if not token:
+        raise _EdgeRejection(401, "empty bearer token")
+    return token
+
+
+class _EdgeRejection(Exception):
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class EdgeAuthMiddleware:
+    def __init__(self, app, policy: EdgeAuthPolicy):
+        self._app = app
+        self._policy = policy
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._policy.enabled:
+            await self._app(scope, receive, send)
+            return
+
+        required_roles = self._policy.route_roles.required_roles_for(
+            scope["method"], scope["path"]
+        )
+        if required_roles is None:
+            await self._app(scope, receive, send)
+            return
+
+        inherited_claims = current_verified_claims()
+        try:
+            if inherited_claims is not None:
+                # In-process sub-request (batch): the token was already verified for the
+                # outer request, so only the route's role requirement is checked.
+                claims = self._policy.authorize(inherited_claims, required_roles)
+            else:
+                claims = await self._policy.authenticate(
+                    Headers(scope=scope).get("authorization"),
+                    required_roles,
+                )
+        except _EdgeRejection as rejection:
+            response = JSONResponse(
+                status_code=rejection.status_code,
+                content={"detail": rejection.detail},
+            )
+            await response(scope, receive, send)
+            return
+
+        token = _verified_claims.set(claims)
+        try:
+            await self._app(scope, receive, send)
+        finally:
+            _verified_claims.reset(token)
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+import jwt
+
+
+RevocationFetcher = Callable[[], Awaitable[list[tuple[str, float]]]]
+JwksFetcher = Callable[[], Awaitable[dict]]
+
+ASYMMETRIC_ALGORITHMS = ("RS256", "EdDSA")
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationCache:
+    # The revoked-jti set is refreshed by a background task (start/stop), so checking
+    # a token at the edge is a dictionary lookup and never waits on the auth-service.
+    # Past max_staleness_seconds without a successful refresh the set is reported as
+    # stale (is_stale, snapshot): it may be missing recent logouts.
+    def __init__(
+        self,
+        fetcher: RevocationFetcher | None = None,
+        refresh_interval_seconds: float = 5.0,
+        max_staleness_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._fetcher = fetcher
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._max_staleness_seconds = max_staleness_seconds
+        self._clock = clock
+        self._revoked: dict[str, float] = {}
+        self._task: asyncio.Task | None = None
+        self._synced_at = float("-inf")
+        self._refresh_failures = 0
+
+    def add(self, jti: str, expires_at: float) -> None:
+        self._revoked[jti] = expires_at
+
+    def is_revoked(self, jti: str, now: float | None = None) -> bool:
+        now = time.time() if now is None else now
+        expires_at = self._revoked.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at <= now:
+            self._revoked.pop(jti, None)
+            return False
+        return True
+
+    def is_stale(self) -> bool:
+        if self._fetcher is None:
+            return False
+        return self._clock() - self._synced_at > self._max_staleness_seconds
+
+    def snapshot(self) -> dict:
+        return {
+            "running": self._task is not None,
+            "revoked": len(self._revoked),
+            "stale": self.is_stale(),
+            "seconds_since_sync": round(self._clock() - self._synced_at, 3)
+            if self._synced_at != float("-inf")
+            else None,
+            "refresh_failures": self._refresh_failures,
+        }
+
+    async def refresh(self) -> bool:
+        if self._fetcher is None:
+            return False
+        try:
+            entries = await self._fetcher()
+            now = time.time()
+            revoked = {
+                jti: float(expires_at)
+                for jti, expires_at in [*self._revoked.items(), *entries]
+                if float(expires_at) > now
+            }
+        except Exception:
+            # Unreachable feed or a malformed item: keep serving the last known set and
+            # retry on the next interval; a failure must never end the refresh task.
+            self._refresh_failures += 1
+            logger.warning("revocation refresh failed", exc_info=True)
+            return False
+
+        self._revoked = revoked
+        self._synced_at = self._clock()
+        return True
+
+    def start(self) -> None:
+        if self._fetcher is None or self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._refresh_forever())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self._refresh_interval_seconds)
+
+
+class JwksKeyCache:
+    # Public keys from the auth-service JWKS. Refetched after max_age_seconds or when a
+    # token names an unknown kid (key rotation), at most once per min_refresh_seconds.
+    def __init__(
+        self,
+        fetcher: JwksFetcher,
+        max_age_seconds: float = 300.0,
+        min_refresh_seconds: float = 30.0,
+    ):
+        self._fetcher = fetcher
+        self._max_age_seconds = max_age_seconds
+        self._min_refresh_seconds = min_refresh_seconds
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._fetched_at = float("-inf")
+        self._attempted_at = float("-inf")
+        self._refresh_lock = asyncio.Lock()
+
+    def cached(self, kid: str) -> jwt.PyJWK | None:
+        return self._keys.get(kid)
+
+    async def key_for(self, kid: str) -> jwt.PyJWK | None:
+        now = time.monotonic()
+        key = self._keys.get(kid)
+        if key is not None and now - self._fetched_at < self._max_age_seconds:
+            return key
+        if now - self._attempted_at < self._min_refresh_seconds or self._refresh_lock.locked():
+            return key
+
+        async with self._refresh_lock:
+            self._attempted_at = now
+            try:
+                body = await self._fetcher()
+            except ValueError:
+                # Known keys keep working while the JWKS endpoint is unreachable.
+                return self._keys.get(kid)
+
+        keys = {}
+        for data in body.get("keys", []):
+            if data.get("alg") not in ASYMMETRIC_ALGORITHMS or not data.get("kid"):
+                continue
+            try:
+                keys[data["kid"]] = jwt.PyJWK(data)
+            except jwt.PyJWTError:
+                continue
+        self._keys = keys
+        self._fetched_at = now
+        return self._keys.get(kid)
+
+
+class EdgeTokenVerifier:
+    # HS256 tokens are checked with the shared secret; tokens carrying a kid are
+    # checked with the matching auth-service JWKS key.
+    def __init__(
+        self,
+        secret_key: str | None,
+        revocations: RevocationCache,
+        algorithm: str = "HS256",
+        keys: JwksKeyCache | None = None,
+    ):
+        self._secret_key = secret_key
+        self._revocations = revocations
+        self._algorithm = algorithm
+        self._keys = keys
+
+    @property
+    def revocations(self) -> RevocationCache:
+        return self._revocations
+
+    def snapshot(self) -> dict:
+        return {"revocations": self._revocations.snapshot()}
+
+    async def verify(self, token: str) -> dict:
+        key, algorithm = self._secret_key, self._algorithm
+        kid = self._kid(token)
+        if kid is not None:
+            jwk = await self._keys.key_for(kid)
+            if jwk is None:
+                raise ValueError("invalid token")
+            key, algorithm = jwk.key, jwk.algorithm_name
+        if key is None:
+            raise ValueError("invalid token")
+
+        try:
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=[algorithm],
+                options={"require": ["exp"]},
+            )
+        except jwt.ExpiredSignatureError as error:
+            raise ValueError("token expired") from error
+        except jwt.PyJWTError as error:
+            raise ValueError("invalid token") from error
+
+        if claims.get("type") != "access":
+            raise ValueError("invalid access token type")
+
+        jti = claims.get("jti")
+        if not jti:
+            raise ValueError("invalid access token payload")
+        if self._revocations.is_revoked(jti):
+            raise ValueError("access token revoked")
+
+        return claims
+
+    def remember_revoked(self, token: str) -> None:
+        key, algorithm = self._secret_key, self._algorithm
+        kid = self._kid(token)
+        if kid is not None:
+            jwk = self._keys.cached(kid)
+            if jwk is None:
+                return
+            key, algorithm = jwk.key, jwk.algorithm_name
+        if key is None:
+            return
+        try:
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=[algorithm],
+                options={"verify_exp": False},
+            )
+        except jwt.PyJWTError:
+            return
+
+        jti, exp = claims.get("jti"), claims.get("exp")
+        if jti and exp:
+            self._revocations.add(jti, float(exp))
+
+    def _kid(self, token: str) -> str | None:
+        if self._keys is None:
+            return None
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.PyJWTError:
+            return None
+        if header.get("alg") not in ASYMMETRIC_ALGORITHMS:
+            return None
+        return header.get("kid")
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from urllib.parse import parse_qsl
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from ..auth.edge_auth_middleware import current_verified_claims
+from ..auth.edge_token_verifier import RevocationCache
+from ..proxy.path_templates import compile_path_template
+
+
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+_NOT_MODIFIED_HEADERS = frozenset({b"etag", b"cache-control", b"last-modified"})
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...], str]
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    path: str
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        route_ttls: dict[str, float],
+        max_entries: int = 1024,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.enabled = enabled
+        self._route_ttls = dict(route_ttls)
+        self._routes = [
+            (compile_path_template(template), ttl) for template, ttl in route_ttls.items()
+        ]
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        # Bumped on every invalidation; a GET that started before a write must not
+        # store what it read once that write has invalidated the resource.
+        self._generation = 0
+        self._hits_total = 0
+        self._misses_total = 0
+        self._not_modified_total = 0
+        self._refused_total = 0
+        self._invalidations_total = 0
+        self._evictions_total = 0
+
+    @classmethod
+    def from_env(cls, default_route_ttls: dict[str, float]) -> ResponseCache:
+        route_ttls = default_route_ttls
+        routes = os.getenv("GATEWAY_CACHE_ROUTES")
+        if routes is not None:
+            route_ttls = {}
+            for item in routes.split(","):
+                template, _, ttl = item.strip().rpartition("=")
+                if template:
+                    route_ttls[template] = float(ttl)
+        return cls(
+            route_ttls=route_ttls,
+            max_entries=int(os.getenv("GATEWAY_CACHE_MAX_ENTRIES", "1024")),
+            enabled=os.getenv("GATEWAY_CACHE_ENABLED", "true").lower() == "true",
+        )
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def ttl_for(self, method: str, path: str) -> float | None:
+        if method != "GET":
+            return None
+        for pattern, ttl in self._routes:
+            if pattern.fullmatch(path):
+                return ttl
+        return None
+
+    @staticmethod
+    def key_for(path: str, query_string: bytes, authorization: str | None) -> CacheKey:
+        query = tuple(sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)))
+        # Scope by credential so one user's response is never served to another.
+        scope = hashlib.sha256((authorization or "").encode("utf-8")).hexdigest()
+        return path, query, scope
+
+    def get(self, key: CacheKey) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= self._clock():
+            if entry is not None:
+                del self._entries[key]
+            self._misses_total += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits_total += 1
+        return entry
+
+    def put(
+        self,
+        key: CacheKey,
+        response: CachedResponse,
+        generation: int,
+    ) -> None:
+        if generation != self._generation:
+            return
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions_total += 1
+
+    def invalidate(self, path: str) -> None:
+        # A write drops the resource itself, its sub-resources and the collections
+        # above it, e.g. POST .../{id}/activate drops /{id} and the list.
+        self._generation += 1
+        self._invalidations_total += 1
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if entry.path == path
+            or entry.path.startswith(path + "/")
+            or path.startswith(entry.path + "/")
+        ]
+        for key in stale:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def record_not_modified(self) -> None:
+        self._not_modified_total += 1
+
+    def record_refused(self) -> None:
+        self._refused_total += 1
+
+    def expires_at(self, ttl: float) -> float:
+        return self._clock() + ttl
+
+    def snapshot(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "routes": dict(self._route_ttls),
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits_total": self._hits_total,
+            "misses_total": self._misses_total,
+            "not_modified_total": self._not_modified_total,
+            "refused_total": self._refused_total,
+            "invalidations_total": self._invalidations_total,
+            "evictions_total": self._evictions_total,
+        }
+
+
+def _etag_for(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+class ResponseCacheMiddleware:
+    # Entries are stored and served only for requests whose token the edge verified
+    # (EdgeAuthMiddleware runs first). Each entry lives at most until the token's exp,
+    # and a hit is refused once the token's jti is revoked or the revocation list is
+    # stale. With edge auth off, cached routes go to the downstream on every call.
+    def __init__(
+        self,
+        app,
+        cache: ResponseCache,
+        revocations: Callable[[], RevocationCache | None] = lambda: None,
+    ):
+        self._app = app
+        self._cache = cache
+        self._revocations = revocations
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._cache.enabled:
+            await self._app(scope, receive, send)
+            return
+
+        method, path = scope["method"], scope["path"]
+        if method in _WRITE_METHODS:
+            try:
+                await self._app(scope, receive, send)
+            finally:
+                self._cache.invalidate(path)
+            return
+
+        ttl = self._cache.ttl_for(method, path)
+        if ttl is not None:
+            ttl = self._ttl_for_token(ttl, current_verified_claims())
+        if ttl is None:
+            await self._app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        key = self._cache.key_for(
+            path,
+            scope.get("query_string", b""),
+            request_headers.get("authorization"),
+        )
+        if_none_match = request_headers.get("if-none-match")
+
+        entry = self._cache.get(key)
+        if entry is None:
+            generation = self._cache.generation
+            entry = await self._fetch(scope, receive, path, ttl)
+            if entry.status_code != 200:
+                await self._send(send, entry.status_code, entry.headers, entry.body)
+                return
+            if not _is_no_store(entry.headers):
+                self._cache.put(key, entry, generation)
+
+        if _etag_matches(if_none_match, entry.etag):
+            self._cache.record_not_modified()
+            headers = [
+                (name, value) for name, value in entry.headers if name in _NOT_MODIFIED_HEADERS
+            ]
+            await self._send(send, 304, headers, b"")
+            return
+        await self._send(send, entry.status_code, entry.headers, entry.body)
+
+    def _ttl_for_token(self, ttl: float, claims: dict | None) -> float | None:
+        if claims is None:
+            return None
+        revocations = self._revocations()
+        if revocations is None or revocations.is_stale() or revocations.is_revoked(claims["jti"]):
+            self._cache.record_refused()
+            return None
+        ttl = min(ttl, float(claims["exp"]) - time.time())
+        return ttl if ttl > 0 else None
+
+    async def _fetch(self, scope, receive, path: str, ttl: float) -> CachedResponse:
+        start: dict = {}
+        chunks: list[bytes] = []
+
+        async def capture(message) -> None:
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self._app(scope, receive, capture)
+
+        body = b"".join(chunks)
+        headers = MutableHeaders(raw=list(start.get("headers", [])))
+        etag = headers.get("etag") or _etag_for(body)
+        status_code = start.get("status", 500)
+        if status_code == 200:
+            headers["etag"] = etag
+        return CachedResponse(
+            path=path,
+            status_code=status_code,
+            headers=list(headers.raw),
+            body=body,
+            etag=etag,
+            expires_at=self._cache.expires_at(ttl),
+        )
+
+    @staticmethod
+    async def _send(send, status_code: int, headers: list[tuple[bytes, bytes]], body: bytes):
+        await send({"type": "http.response.start", "status": status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+def _is_no_store(headers: list[tuple[bytes, bytes]]) -> bool:
+    return any(
+        name == b"cache-control" and b"no-store" in value.lower() for name, value in headers
+    )
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import os
+import zlib
+from collections import Counter
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from ..proxy.path_templates import compile_path_template
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install zstandard
+    zstandard = None
+
+
+# Server preference when the client weighs several encodings equally.
+_PREFERENCE = ("br", "zstd", "gzip")
+_COMPRESSIBLE_TYPES = ("application/json", "application/xml", "application/javascript")
+
+
+def available_encodings() -> tuple[str, ...]:
+    optional = {"br": brotli is not None, "zstd": zstandard is not None, "gzip": True}
+    return tuple(encoding for encoding in _PREFERENCE if optional[encoding])
+
+
+class _GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=min(level, 11))
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+_ENCODERS = {"gzip": _GzipEncoder, "br": _BrotliEncoder, "zstd": _ZstdEncoder}
+
+
+class ResponseCompression:
+    def __init__(
+        self,
+        route_levels: dict[str, int],
+        default_level: int = 5,
+        min_bytes: int = 1024,
+        enabled: bool = True,
+        encodings: tuple[str, ...] | None = None,
+    ):
+        self.enabled = enabled
+        self._route_levels = dict(route_levels)
+        self._routes = [
+            (compile_path_template(template), level) for template, level in route_levels.items()
+        ]
+        self._default_level = default_level
+        self.min_bytes = min_bytes
+        self._encodings = available_encodings() if encodings is None else encodings
+        self._compressed_total: Counter = Counter()
+        self._bytes_in_total = 0
+        self._bytes_out_total = 0
+
+    @classmethod
+    def from_env(cls, default_route_levels: dict[str, int]) -> ResponseCompression:
+        route_levels = default_route_levels
+        routes = os.getenv("GATEWAY_COMPRESSION_ROUTES")
+        if routes is not None:
+            route_levels = {}
+            for item in routes.split(","):
+                template, _, level = item.strip().rpartition("=")
+                if template:
+                    route_levels[template] = int(level)
+        return cls(
+            route_levels=route_levels,
+            default_level=int(os.getenv("GATEWAY_COMPRESSION_LEVEL", "5")),
+            min_bytes=int(os.getenv("GATEWAY_COMPRESSION_MIN_BYTES", "1024")),
+            enabled=os.getenv("GATEWAY_COMPRESSION_ENABLED", "true").lower() == "true",
+        )
+
+    def level_for(self, path: str) -> int:
+        for pattern, level in self._routes:
+            if pattern.fullmatch(path):
+                return level
+        return self._default_level
+
+    def negotiate(self, accept_encoding: str | None) -> str | None:
+        if not accept_encoding:
+            return None
+        weights: dict[str, float] = {}
+        for item in accept_encoding.split(","):
+            coding, _, params = item.strip().partition(";")
+            weight = 1.0
+            name, _, value = params.strip().partition("=")
+            if name.strip() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+            weights[coding.strip().lower()] = weight
+
+        wildcard = weights.get("*", 0.0)
+        best, best_weight = None, 0.0
+        for encoding in self._encodings:
+            weight = weights.get(encoding, wildcard)
+            if weight > best_weight:
+                best, best_weight = encoding, weight
+        return best
+
+    def encoder(self, encoding: str, level: int):
+        return _ENCODERS[encoding](level)
+
+    def record(self, encoding: str, bytes_in: int, bytes_out: int) -> None:
+        self._compressed_total[encoding] += 1
+        self._bytes_in_total += bytes_in
+        self._bytes_out_total += bytes_out
+
+    def snapshot(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "encodings": list(self._encodings),
+            "default_level": self._default_level,
+            "min_bytes": self.min_bytes,
+            "routes": dict(self._route_levels),
+            "compressed_total": dict(self._compressed_total),
+            "bytes_in_total": self._bytes_in_total,
+            "bytes_out_total": self._bytes_out_total,
+        }
+
+
+class ResponseCompressionMiddleware:
+    def __init__(self, app, compression: ResponseCompression):
+        self._app = app
+        self._compression = compression
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._compression.enabled or scope["method"] == "HEAD":
+            await self._app(scope, receive, send)
+            return
+
+        level = self._compression.level_for(scope["path"])
+        if level <= 0:
+            await self._app(scope, receive, send)
+            return
+
+        encoding = self._compression.negotiate(Headers(scope=scope).get("accept-encoding"))
+        responder = _CompressingResponder(send, self._compression, encoding, level)
+        await self._app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    # Bodies that are already encoded, not compressible or below min_bytes go out
+    # untouched. Larger ones are compressed as they stream; a body that arrives in a
+    # single message keeps an exact Content-Length.
+    def __init__(self, send, compression: ResponseCompression, encoding: str | None, level: int):
+        self._send = send
+        self._compression = compression
+        self._encoding = encoding
+        self._level = level
+        self._start: dict | None = None
+        self._mode = "passthrough"
+        self._buffer = bytearray()
+        self._encoder = None
+        self._bytes_in = 0
+        self._bytes_out = 0
+
+    async def send(self, message) -> None:
+        if message["type"] == "http.response.start":
+            self._on_start(message)
+            if self._mode == "passthrough":
+                await self._send(self._start)
+            return
+        if message["type"] != "http.response.body" or self._mode == "passthrough":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._mode == "streaming":
+            await self._send_compressed(body, more_body)
+            return
+
+        self._buffer.extend(body)
+        if not more_body:
+            await self._finish_buffered()
+        elif len(self._buffer) >= self._compression.min_bytes:
+            await self._start_streaming()
+
+    def _on_start(self, message) -> None:
+        headers = MutableHeaders(raw=list(message.get("headers", [])))
+        self._start = {**message, "headers": headers.raw}
+        status = message["status"]
+        if (
+            status < 200
+            or status in (204, 304)
+            or "content-encoding" in headers
+            or "no-transform" in headers.get("cache-control", "").lower()
+            or not _is_compressible(headers.get("content-type"))
+        ):
+            return
+        headers.add_vary_header("Accept-Encoding")
+        self._start["headers"] = headers.raw
+        if self._encoding is None:
+            return
+        declared_length = headers.get("content-length")
+        if declared_length and declared_length.isdigit():
+            if int(declared_length) < self._compression.min_bytes:
+                return
+        self._mode = "buffering"
+
+    async def _finish_buffered(self) -> None:
+        body = bytes(self._buffer)
+        if len(body) < self._compression.min_bytes:
+            await self._send(self._start)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+        encoder = self._compression.encoder(self._encoding, self._level)
+        compressed = encoder.compress(body) + encoder.flush()
+        headers = self._encoded_headers()
+        headers["content-length"] = str(len(compressed))
+        await self._send({**self._start, "headers": headers.raw})
+        await self._send({"type": "http.response.body", "body": compressed})
+        self._compression.record(self._encoding, len(body), len(compressed))
+
+    async def _start_streaming(self) -> None:
+        self._encoder = self._compression.encoder(self._encoding, self._level)
+        self._mode = "streaming"
+        headers = self._encoded_headers()
+        del headers["content-length"]
+        await self._send({**self._start, "headers": headers.raw})
+        body = bytes(self._buffer)
+        self._buffer.clear()
+        await self._send_compressed(body, more_body=True)
+
+    async def _send_compressed(self, body: bytes, more_body: bool) -> None:
+        chunk = self._encoder.compress(body)
+        if not more_body:
+            chunk += self._encoder.flush()
+        self._bytes_in += len(body)
+        self._bytes_out += len(chunk)
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+        if not more_body:
+            self._compression.record(self._encoding, self._bytes_in, self._bytes_out)
+
+    def _encoded_headers(self) -> MutableHeaders:
+        headers = MutableHeaders(raw=list(self._start["headers"]))
+        headers["content-encoding"] = self._encoding
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The encoded body differs byte-wise from the identity one.
+            headers["etag"] = "W/" + etag
+        return headers
+
+
+def _is_compressible(content_type: str | None) -> bool:
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in _COMPRESSIBLE_TYPES
+        or media_type.endswith("+json")
+        or media_type.endswith("+xml")
+    )
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from starlette.routing import Match
+
+
+# Dedicated registry: /metrics only carries gateway series, and tests that import the
+# module more than once never hit duplicate-registration errors on the default one.
+REGISTRY = CollectorRegistry()
+
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUESTS = Counter(
+    "gateway_http_requests_total",
+    "Requests handled by the gateway.",
+    ("method", "route", "status"),
+    registry=REGISTRY,
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "gateway_http_request_duration_seconds",
+    "Gateway request latency, from receipt to the last body byte.",
+    ("method", "route", "status"),
+    buckets=_LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+HTTP_IN_FLIGHT = Gauge(
+    "gateway_http_requests_in_flight",
+    "Requests currently being handled by the gateway.",
+    registry=REGISTRY,
+)
+DOWNSTREAM_DURATION = Histogram(
+    "gateway_downstream_request_duration_seconds",
+    "Downstream call latency up to the response head.",
+    ("downstream",),
+    buckets=_LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+DOWNSTREAM_CONNECT_DURATION = Histogram(
+    "gateway_downstream_connect_duration_seconds",
+    "Time spent opening new downstream connections (TCP and TLS).",
+    ("downstream",),
+    buckets=_LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+DOWNSTREAM_IN_FLIGHT = Gauge(
+    "gateway_downstream_in_flight",
+    "Downstream calls currently holding a concurrency slot.",
+    ("downstream",),
+    registry=REGISTRY,
+)
+DOWNSTREAM_UNAVAILABLE = Counter(
+    "gateway_downstream_unavailable_total",
+    "503 'downstream service unavailable' answers by cause.",
+    ("downstream", "cause"),
+    registry=REGISTRY,
+)
+
+DOWNSTREAM_EXTRA_ATTEMPTS = Counter(
+    "gateway_downstream_extra_attempts_total",
+    "Extra downstream attempts by kind (connect_retry, hedge).",
+    ("downstream", "kind"),
+    registry=REGISTRY,
+)
+RETRY_BUDGET_EXHAUSTED = Counter(
+    "gateway_retry_budget_exhausted_total",
+    "Extra attempts skipped because the retry budget was empty.",
+    ("downstream", "kind"),
+    registry=REGISTRY,
+)
+
+
+class DownstreamMetrics:
+    # Label children are resolved once per proxy so the request path only does
+    # lock-protected increments and observations.
+    def __init__(self, downstream: str):
+        self.downstream = downstream
+        self.duration = DOWNSTREAM_DURATION.labels(downstream)
+        self.connect_duration = DOWNSTREAM_CONNECT_DURATION.labels(downstream)
+        self.in_flight = DOWNSTREAM_IN_FLIGHT.labels(downstream)
+
+    def unavailable(self, cause: str) -> None:
+        DOWNSTREAM_UNAVAILABLE.labels(self.downstream, cause).inc()
+
+    def extra_attempt(self, kind: str) -> None:
+        DOWNSTREAM_EXTRA_ATTEMPTS.labels(self.downstream, kind).inc()
+
+    def retry_budget_exhausted(self, kind: str) -> None:
+        RETRY_BUDGET_EXHAUSTED.labels(self.downstream, kind).inc()
+
+    def connect_trace(self) -> Callable:
+        # httpcore trace hook: only fires connect events when a new connection is opened,
+        # so pooled requests record nothing here. TCP and TLS are measured together,
+        # up to the moment the request headers start going out.
+        started: dict[str, float] = {}
+
+        async def trace(event_name: str, info: dict) -> None:
+            if event_name.endswith("connect_tcp.started"):
+                started["at"] = time.perf_counter()
+            elif event_name.endswith("send_request_headers.started") and "at" in started:
+                self.connect_duration.observe(time.perf_counter() - started.pop("at"))
+
+        return trace
+
+
+class MetricsMiddleware:
+    def __init__(self, app, router):
+        self._app = app
+        self._router = router
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_with_status(message) -> None:
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self._app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_FLIGHT.dec()
+            labels = (scope["method"], self._route_template(scope), str(status["code"]))
+            HTTP_REQUESTS.labels(*labels).inc()
+            HTTP_REQUEST_DURATION.labels(*labels).observe(elapsed)
+
+    def _route_template(self, scope) -> str:
+        # Label by template, never by raw path, to keep cardinality bounded.
+        route = scope.get("route")
+        if route is not None:
+            return route.path
+        # Answered before routing (edge rejection, cache hit): resolve it here.
+        for candidate in self._router.routes:
+            match, _ = candidate.matches(scope)
+            if match != Match.NONE:
+                return candidate.path
+        return _UNMATCHED_ROUTE
+
+
+class GatewayStateCollector:
+    # Breaker, cache and coalescing state is read from their snapshots at scrape time,
+    # adding nothing to the request path.
+    def __init__(
+        self,
+        proxies: Callable[[], dict[str, object]],
+        response_cache: Callable[[], object],
+        coalescer: Callable[[], object],
+        edge_verifier: Callable[[], object | None] = lambda: None,
+    ):
+        self._proxies = proxies
+        self._response_cache = response_cache
+        self._coalescer = coalescer
+        self._edge_verifier = edge_verifier
+
+    def collect(self):
+        yield from self._circuit_metrics()
+        yield from self._bulkhead_metrics()
+        yield from self._snapshot_counters(
+            "gateway_cache",
+            self._response_cache().snapshot(),
+            counters=("hits", "misses", "not_modified", "refused", "invalidations", "evictions"),
+            gauges=("entries",),
+        )
+        yield from self._snapshot_counters(
+            "gateway_coalescing",
+            self._coalescer().snapshot(),
+            counters=("requests", "downstream_calls", "collapsed"),
+            gauges=("in_flight",),
+        )
+        yield from self._revocation_metrics()
+
+    def _revocation_metrics(self):
+        verifier = self._edge_verifier()
+        if verifier is None:
+            return
+        snapshot = verifier.snapshot()["revocations"]
+        yield GaugeMetricFamily(
+            "gateway_revocations_stale",
+            "1 when the revoked-token list has not synced within its max staleness.",
+            value=1.0 if snapshot["stale"] else 0.0,
+        )
+        yield GaugeMetricFamily(
+            "gateway_revocations_revoked",
+            "Revoked access tokens currently known at the edge.",
+            value=snapshot["revoked"],
+        )
+        yield CounterMetricFamily(
+            "gateway_revocations_refresh_failures",
+            "Failed refreshes of the revoked-token list.",
+            value=snapshot["refresh_failures"],
+        )
+
+    def _circuit_metrics(self):
+        state = GaugeMetricFamily(
+            "gateway_circuit_state",
+            "Circuit breaker state per downstream (1 for the current state).",
+            labels=("downstream", "state"),
+        )
+        opened = CounterMetricFamily(
+            "gateway_circuit_opened",
+            "Times the circuit opened.",
+            labels=("downstream",),
+        )
+        rejected = CounterMetricFamily(
+            "gateway_circuit_rejected",
+            "Calls rejected while the circuit was open.",
+            labels=("downstream",),
+        )
+        for name, proxy in self._proxies().items():
+            breaker = getattr(proxy, "breaker", None)
+            if breaker is None:
+                continue
+            snapshot = breaker.snapshot()
+            for candidate in ("closed", "open", "half_open"):
+                state.add_metric((name, candidate), 1.0 if snapshot["state"] == candidate else 0.0)
+            opened.add_metric((name,), snapshot["opened_total"])
+            rejected.add_metric((name,), snapshot["rejected_total"])
+        yield state
+        yield opened
+        yield rejected
+
+    def _bulkhead_metrics(self):
+        limit = GaugeMetricFamily(
+            "gateway_bulkhead_limit",
+            "Current (adaptive) concurrency limit per downstream.",
+            labels=("downstream",),
+        )
+        queued = GaugeMetricFamily(
+            "gateway_bulkhead_queued",
+            "Calls waiting for a concurrency slot per downstream.",
+            labels=("downstream",),
+        )
+        for name, proxy in self._proxies().items():
+            bulkhead = getattr(proxy, "bulkhead", None)
+            if bulkhead is None:
+                continue
+            limit.add_metric((name,), bulkhead.limit)
+            queued.add_metric((name,), bulkhead.queued)
+        yield limit
+        yield queued
+
+    @staticmethod
+    def _snapshot_counters(prefix: str, snapshot: dict, counters: tuple, gauges: tuple):
+        for key in counters:
+            yield CounterMetricFamily(
+                f"{prefix}_{key}",
+                f"{prefix} {key}.",
+                value=snapshot[f"{key}_total"],
+            )
+        for key in gauges:
+            yield GaugeMetricFamily(f"{prefix}_{key}", f"{prefix} {key}.", value=snapshot[key])
+
+
+def render_latest() -> tuple[bytes, str]:
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
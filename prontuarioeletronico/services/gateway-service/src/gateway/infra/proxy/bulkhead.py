@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+from collections import deque
+from dataclasses import dataclass
+
+
+QUEUE_FULL = "queue_full"
+QUEUE_TIMEOUT = "queue_timeout"
+
+
+@dataclass(frozen=True)
+class BulkheadSettings:
+    max_queue: int = 50
+    adaptive: bool = True
+    min_limit: int = 4
+    latency_tolerance: float = 2.0
+    smoothing: float = 0.2
+    retry_after_seconds: int = 1
+
+    @classmethod
+    def from_env(cls, prefix: str) -> BulkheadSettings:
+        # Same lookup order as ProxyPoolSettings: EMR_SERVICE_BULKHEAD_MAX_QUEUE,
+        # then GATEWAY_BULKHEAD_MAX_QUEUE, then the default.
+        def _read(name: str, default: object) -> str:
+            value = os.getenv(f"{prefix}_BULKHEAD_{name}")
+            if value is None:
+                value = os.getenv(f"GATEWAY_BULKHEAD_{name}")
+            return str(default) if value is None else value
+
+        defaults = cls()
+        return cls(
+            max_queue=int(_read("MAX_QUEUE", defaults.max_queue)),
+            adaptive=_read("ADAPTIVE", "true").lower() == "true",
+            min_limit=int(_read("MIN_LIMIT", defaults.min_limit)),
+            latency_tolerance=float(_read("LATENCY_TOLERANCE", defaults.latency_tolerance)),
+            smoothing=float(_read("SMOOTHING", defaults.smoothing)),
+            retry_after_seconds=int(_read("RETRY_AFTER_SECONDS", defaults.retry_after_seconds)),
+        )
+
+
+class AdaptiveLimit:
+    # Gradient limiter: a short-term latency average is compared with a long-term one.
+    # While they agree the limit grows by about sqrt(limit) per sample (smoothed); when
+    # recent calls get slower than `tolerance` times the long-term average the limit
+    # shrinks in proportion, never below half per sample nor below `min_limit`.
+    _SHORT_WEIGHT = 0.1
+    _LONG_WEIGHT = 0.01
+
+    def __init__(self, max_limit: int, min_limit: int, tolerance: float, smoothing: float):
+        self._max_limit = max_limit
+        self._min_limit = min(min_limit, max_limit)
+        self._tolerance = tolerance
+        self._smoothing = smoothing
+        self._limit = float(max_limit)
+        self._short_latency: float | None = None
+        self._long_latency: float | None = None
+
+    @property
+    def limit(self) -> int:
+        return max(self._min_limit, int(self._limit))
+
+    def on_sample(self, elapsed_seconds: float, in_flight: int) -> None:
+        elapsed = max(elapsed_seconds, 1e-6)
+        if self._short_latency is None:
+            self._short_latency = self._long_latency = elapsed
+            return
+        self._short_latency += self._SHORT_WEIGHT * (elapsed - self._short_latency)
+        self._long_latency += self._LONG_WEIGHT * (elapsed - self._long_latency)
+        # After a sustained slowdown the long-term average drifts up; once latency
+        # recovers it is pulled back down quickly so the limit can grow again.
+        if self._long_latency > 2 * self._short_latency:
+            self._long_latency *= 0.95
+
+        # Far below the limit the sample says nothing about downstream capacity.
+        if in_flight * 2 < self._limit:
+            return
+
+        gradient = max(
+            0.5,
+            min(1.0, self._tolerance * self._long_latency / self._short_latency),
+        )
+        target = self._limit * gradient + math.sqrt(self._limit)
+        self._limit = (1 - self._smoothing) * self._limit + self._smoothing * target
+        self._limit = min(float(self._max_limit), max(float(self._min_limit), self._limit))
+
+
+class Bulkhead:
+    # Per-downstream concurrency pool with a short FIFO queue. Callers beyond the limit
+    # wait up to `queue_timeout_seconds`; when the queue is already full they are
+    # rejected immediately, so one slow downstream cannot pile up gateway requests.
+    def __init__(
+        self,
+        max_concurrency: int,
+        queue_timeout_seconds: float,
+        settings: BulkheadSettings | None = None,
+    ):
+        self._settings = settings or BulkheadSettings()
+        self._max_concurrency = max_concurrency
+        self._queue_timeout_seconds = queue_timeout_seconds
+        self._adaptive = (
+            AdaptiveLimit(
+                max_limit=max_concurrency,
+                min_limit=self._settings.min_limit,
+                tolerance=self._settings.latency_tolerance,
+                smoothing=self._settings.smoothing,
+            )
+            if self._settings.adaptive
+            else None
+        )
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._admitted_total = 0
+        self._rejected_total = {QUEUE_FULL: 0, QUEUE_TIMEOUT: 0}
+
+    @property
+    def settings(self) -> BulkheadSettings:
+        return self._settings
+
+    @property
+    def limit(self) -> int:
+        if self._adaptive is None:
+            return self._max_concurrency
+        return self._adaptive.limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> str | None:
+        # Returns None once a slot is held, otherwise the rejection cause.
+        if not self._waiters and self._in_flight < self.limit:
+            self._take_slot()
+            return None
+        if len(self._waiters) >= self._settings.max_queue:
+            self._rejected_total[QUEUE_FULL] += 1
+            return QUEUE_FULL
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        expiry = loop.call_later(self._queue_timeout_seconds, self._expire, waiter)
+        try:
+            granted = await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled() and waiter.result():
+                # Slot handed over just as the caller went away: pass it on.
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+        finally:
+            expiry.cancel()
+
+        if not granted:
+            self._rejected_total[QUEUE_TIMEOUT] += 1
+            return QUEUE_TIMEOUT
+        return None
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def observe(self, elapsed_seconds: float) -> None:
+        if self._adaptive is None:
+            return
+        limit = self._adaptive.limit
+        self._adaptive.on_sample(elapsed_seconds, self._in_flight)
+        if self._adaptive.limit > limit:
+            # A grown limit opens slots without a release; queued callers take them now.
+            self._wake_waiters()
+
+    def retry_after_seconds(self) -> int:
+        return self._settings.retry_after_seconds
+
+    def snapshot(self) -> dict:
+        return {
+            "limit": self.limit,
+            "max_concurrency": self._max_concurrency,
+            "adaptive": self._adaptive is not None,
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "max_queue": self._settings.max_queue,
+            "admitted_total": self._admitted_total,
+            "rejected_queue_full_total": self._rejected_total[QUEUE_FULL],
+            "rejected_queue_timeout_total": self._rejected_total[QUEUE_TIMEOUT],
+        }
+
+    def _take_slot(self) -> None:
+        self._in_flight += 1
+        self._admitted_total += 1
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._take_slot()
+            waiter.set_result(True)
+
+    def _expire(self, waiter: asyncio.Future) -> None:
+        if waiter.done():
+            return
+        self._waiters.remove(waiter)
+        waiter.set_result(False)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerSettings:
+    enabled: bool = True
+    window_seconds: float = 30.0
+    minimum_requests: int = 20
+    failure_rate_threshold: float = 0.5
+    slow_call_seconds: float = 2.0
+    slow_call_rate_threshold: float = 0.8
+    open_seconds: float = 10.0
+    half_open_probes: int = 1
+
+    @classmethod
+    def from_env(cls, prefix: str) -> CircuitBreakerSettings:
+        # Same lookup order as ProxyPoolSettings: EMR_SERVICE_CIRCUIT_OPEN_SECONDS,
+        # then GATEWAY_CIRCUIT_OPEN_SECONDS, then the default.
+        def _read(name: str, default: object) -> str:
+            value = os.getenv(f"{prefix}_CIRCUIT_{name}")
+            if value is None:
+                value = os.getenv(f"GATEWAY_CIRCUIT_{name}")
+            return str(default) if value is None else value
+
+        defaults = cls()
+        return cls(
+            enabled=_read("ENABLED", "true").lower() == "true",
+            window_seconds=float(_read("WINDOW_SECONDS", defaults.window_seconds)),
+            minimum_requests=int(_read("MINIMUM_REQUESTS", defaults.minimum_requests)),
+            failure_rate_threshold=float(
+                _read("FAILURE_RATE_THRESHOLD", defaults.failure_rate_threshold)
+            ),
+            slow_call_seconds=float(_read("SLOW_CALL_SECONDS", defaults.slow_call_seconds)),
+            slow_call_rate_threshold=float(
+                _read("SLOW_CALL_RATE_THRESHOLD", defaults.slow_call_rate_threshold)
+            ),
+            open_seconds=float(_read("OPEN_SECONDS", defaults.open_seconds)),
+            half_open_probes=int(_read("HALF_OPEN_PROBES", defaults.half_open_probes)),
+        )
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        settings: CircuitBreakerSettings | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._settings = settings or CircuitBreakerSettings()
+        self._clock = clock
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        # (finished_at, failed, slow) for every call inside the rolling window.
+        self._window: deque[tuple[float, bool, bool]] = deque()
+        self._opened_total = 0
+        self._rejected_total = 0
+        self._failures_total = 0
+        self._slow_calls_total = 0
+
+    @property
+    def settings(self) -> CircuitBreakerSettings:
+        return self._settings
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and self._open_elapsed():
+            return HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        if not self._settings.enabled:
+            return True
+
+        if self._state == OPEN and self._open_elapsed():
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+
+        if self._state == CLOSED:
+            return True
+        if self._state == HALF_OPEN and self._probes_in_flight < self._settings.half_open_probes:
+            self._probes_in_flight += 1
+            return True
+
+        self._rejected_total += 1
+        return False
+
+    def record(self, failed: bool, elapsed_seconds: float) -> None:
+        if not self._settings.enabled:
+            return
+
+        slow = elapsed_seconds >= self._settings.slow_call_seconds
+        self._failures_total += int(failed)
+        self._slow_calls_total += int(slow)
+
+        if self._state == HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if failed or slow:
+                self._trip()
+            else:
+                self._state = CLOSED
+                self._window.clear()
+            return
+        if self._state == OPEN:
+            # A call admitted before the circuit opened; it no longer changes the state.
+            return
+
+        now = self._clock()
+        self._window.append((now, failed, slow))
+        self._trim(now)
+        if len(self._window) < self._settings.minimum_requests:
+            return
+
+        failure_rate, slow_call_rate = self._rates()
+        if (
+            failure_rate >= self._settings.failure_rate_threshold
+            or slow_call_rate >= self._settings.slow_call_rate_threshold
+        ):
+            self._trip()
+
+    def cancel(self) -> None:
+        # An admitted call that never reached the downstream (no slot, client gone).
+        if self._state == HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def retry_after_seconds(self) -> float:
+        if self._state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self._settings.open_seconds - self._clock())
+
+    def snapshot(self) -> dict:
+        self._trim(self._clock())
+        failure_rate, slow_call_rate = self._rates()
+        return {
+            "state": self.state,
+            "enabled": self._settings.enabled,
+            "window_requests": len(self._window),
+            "failure_rate": round(failure_rate, 4),
+            "slow_call_rate": round(slow_call_rate, 4),
+            "retry_after_seconds": round(self.retry_after_seconds(), 3),
+            "opened_total": self._opened_total,
+            "rejected_total": self._rejected_total,
+            "failures_total": self._failures_total,
+            "slow_calls_total": self._slow_calls_total,
+        }
+
+    def _trip(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._probes_in_flight = 0
+        self._opened_total += 1
+        self._window.clear()
+
+    def _open_elapsed(self) -> bool:
+        return self._clock() - self._opened_at >= self._settings.open_seconds
+
+    def _trim(self, now: float) -> None:
+        horizon = now - self._settings.window_seconds
+        while self._window and self._window[0][0] < horizon:
+            self._window.popleft()
+
+    def _rates(self) -> tuple[float, float]:
+        total = len(self._window)
+        if total == 0:
+            return 0.0, 0.0
+        failures = sum(1 for _, failed, _ in self._window if failed)
+        slow = sum(1 for _, _, slow in self._window if slow)
+        return failures / total, slow / total
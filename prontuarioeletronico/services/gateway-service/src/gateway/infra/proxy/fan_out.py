@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+
+from .http_service_proxy import HttpServiceProxy
+
+
+@dataclass(frozen=True)
+class FanOutCall:
+    name: str
+    proxy: HttpServiceProxy
+    path: str
+    timeout_seconds: float
+    params: dict | None = None
+
+
+@dataclass(frozen=True)
+class SectionResult:
+    status: str
+    status_code: int | None = None
+    data: object = None
+    detail: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+    def to_dict(self) -> dict:
+        if self.ok:
+            return {"status": self.status, "data": self.data}
+        section: dict = {"status": self.status, "detail": self.detail}
+        if self.status_code is not None:
+            section["status_code"] = self.status_code
+        return section
+
+
+async def fan_out(
+    calls: list[FanOutCall],
+    authorization: str | None = None,
+) -> dict[str, SectionResult]:
+    # All GETs start together, so the total wait is the slowest section (bounded by
+    # its own timeout) rather than the sum; one failing section does not fail the rest.
+    results = await asyncio.gather(
+        *(_run_section(call, authorization) for call in calls)
+    )
+    return {call.name: result for call, result in zip(calls, results)}
+
+
+async def _run_section(
+    call: FanOutCall,
+    authorization: str | None,
+) -> SectionResult:
+    try:
+        status_code, body = await asyncio.wait_for(
+            call.proxy.request(
+                method="GET",
+                path=call.path,
+                params=call.params,
+                authorization=authorization,
+            ),
+            timeout=call.timeout_seconds,
+        )
+    except asyncio.TimeoutError:
+        return SectionResult(
+            status="timeout",
+            detail=f"{call.name} did not respond within {call.timeout_seconds}s",
+        )
+
+    if 200 <= status_code < 300:
+        return SectionResult(status="ok", status_code=status_code, data=body)
+
+    detail = body.get("detail") if isinstance(body, dict) else None
+    return SectionResult(
+        status="error",
+        status_code=status_code,
+        detail=str(detail) if detail is not None else None,
+    )
@@ -1,41 +1,545 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import math
+import os
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field, replace
+from functools import partial
+from urllib.parse import urlsplit
+
 import httpx
 
+from ..metrics.gateway_metrics import DownstreamMetrics
+from .bulkhead import Bulkhead, BulkheadSettings
+from .circuit_breaker import CircuitBreaker
+from .retry_policy import LatencyTracker, RetryBudget, RetryPolicy
+
+
+UNAVAILABLE_DETAIL = {"detail": "downstream service unavailable"}
+
+PASSTHROUGH_RESPONSE_HEADERS = (
+    "content-type",
+    "content-length",
+    "content-encoding",
+    "etag",
+    "last-modified",
+    "cache-control",
+    "location",
+)
+
+
+@dataclass(frozen=True)
+class ProxyPoolSettings:
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 30.0
+    connect_timeout_seconds: float = 2.0
+    read_timeout_seconds: float = 10.0
+    write_timeout_seconds: float = 10.0
+    pool_timeout_seconds: float = 2.0
+    max_concurrency: int = 100
+
+    @classmethod
+    def from_env(cls, prefix: str) -> ProxyPoolSettings:
+        # Per-downstream override (e.g. EMR_SERVICE_READ_TIMEOUT_SECONDS) first,
+        # then the gateway-wide default (GATEWAY_PROXY_READ_TIMEOUT_SECONDS).
+        def _read(name: str, default: object) -> str:
+            value = os.getenv(f"{prefix}_{name}")
+            if value is None:
+                value = os.getenv(f"GATEWAY_PROXY_{name}")
+            return str(default) if value is None else value
+
+        defaults = cls()
+        return cls(
+            max_connections=int(_read("MAX_CONNECTIONS", defaults.max_connections)),
+            max_keepalive_connections=int(
+                _read("MAX_KEEPALIVE_CONNECTIONS", defaults.max_keepalive_connections)
+            ),
+            keepalive_expiry_seconds=float(
+                _read("KEEPALIVE_EXPIRY_SECONDS", defaults.keepalive_expiry_seconds)
+            ),
+            connect_timeout_seconds=float(
+                _read("CONNECT_TIMEOUT_SECONDS", defaults.connect_timeout_seconds)
+            ),
+            read_timeout_seconds=float(
+                _read("READ_TIMEOUT_SECONDS", defaults.read_timeout_seconds)
+            ),
+            write_timeout_seconds=float(
+                _read("WRITE_TIMEOUT_SECONDS", defaults.write_timeout_seconds)
+            ),
+            pool_timeout_seconds=float(
+                _read("POOL_TIMEOUT_SECONDS", defaults.pool_timeout_seconds)
+            ),
+            max_concurrency=int(_read("MAX_CONCURRENCY", defaults.max_concurrency)),
+        )
+
+    def to_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry_seconds,
+        )
+
+    def to_timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout_seconds,
+            read=self.read_timeout_seconds,
+            write=self.write_timeout_seconds,
+            pool=self.pool_timeout_seconds,
+        )
+
+
+@dataclass
+class ProxiedStream:
+    status_code: int
+    headers: dict[str, str]
+    chunks: AsyncIterator[bytes]
+    _response: httpx.Response | None = field(default=None, repr=False)
+    _on_close: Callable[[], None] | None = field(default=None, repr=False)
+
+    async def aclose(self) -> None:
+        response, on_close = self._response, self._on_close
+        self._response, self._on_close = None, None
+        if response is not None:
+            await response.aclose()
+        if on_close is not None:
+            on_close()
+
+
+async def _single_chunk(payload: bytes) -> AsyncIterator[bytes]:
+    yield payload
+
+
+def _unavailable_stream(retry_after_seconds: int) -> ProxiedStream:
+    payload = json.dumps(UNAVAILABLE_DETAIL).encode("utf-8")
+    return ProxiedStream(
+        status_code=503,
+        headers={
+            "content-type": "application/json",
+            "content-length": str(len(payload)),
+            "retry-after": str(retry_after_seconds),
+        },
+        chunks=_single_chunk(payload),
+    )
+
+
+class _DeferredOutcome:
+    # Breaker result of a relayed stream, recorded once: a failure if the body breaks,
+    # otherwise the head's result when the stream ends or is closed.
+    def __init__(self, breaker: CircuitBreaker, failed: bool, elapsed_seconds: float):
+        self._breaker: CircuitBreaker | None = breaker
+        self._failed = failed
+        self._elapsed_seconds = elapsed_seconds
+
+    def record(self, failed: bool | None = None, elapsed_seconds: float | None = None) -> None:
+        breaker, self._breaker = self._breaker, None
+        if breaker is None:
+            return
+        breaker.record(
+            failed=self._failed if failed is None else failed,
+            elapsed_seconds=self._elapsed_seconds if elapsed_seconds is None else elapsed_seconds,
+        )
+
+
+def _close_losing_attempt(attempt: asyncio.Future) -> None:
+    # A hedge attempt that lost but still produced a response is closed so its
+    # connection goes back to the pool.
+    if attempt.cancelled() or attempt.exception() is not None:
+        return
+    asyncio.ensure_future(attempt.result().aclose())
+
 
 class HttpServiceProxy:
-    def __init__(self, base_url: str, timeout_seconds: float = 10.0):
+    def __init__(
+        self,
+        base_url: str,
+        settings: ProxyPoolSettings | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        breaker: CircuitBreaker | None = None,
+        name: str | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        bulkhead_settings: BulkheadSettings | None = None,
+    ):
         self._base_url = base_url.rstrip("/")
-        self._timeout_seconds = timeout_seconds
+        self._settings = settings or ProxyPoolSettings()
+        self._breaker = breaker or CircuitBreaker()
+        self._name = name or urlsplit(self._base_url).hostname or self._base_url
+        self._metrics = DownstreamMetrics(self._name)
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._retry_budget = retry_budget or RetryBudget()
+        self._latencies = LatencyTracker()
+        # Concurrency is capped per downstream rather than by the server threadpool:
+        # callers beyond the (adaptive) limit queue for up to pool_timeout_seconds,
+        # and get 503 straight away once the queue is full.
+        self._bulkhead = Bulkhead(
+            max_concurrency=self._settings.max_concurrency,
+            queue_timeout_seconds=self._settings.pool_timeout_seconds,
+            settings=bulkhead_settings,
+        )
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            limits=self._settings.to_limits(),
+            timeout=self._settings.to_timeout(),
+            transport=transport,
+        )
+
+    @property
+    def settings(self) -> ProxyPoolSettings:
+        return self._settings
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        return self._breaker
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def bulkhead(self) -> Bulkhead:
+        return self._bulkhead
+
+    def retry_after_seconds(self) -> int:
+        # Hint sent with gateway-generated 503s: the remaining open time of the circuit,
+        # otherwise the bulkhead's configured back-off.
+        open_seconds = self._breaker.retry_after_seconds()
+        if open_seconds > 0:
+            return max(1, math.ceil(open_seconds))
+        return self._bulkhead.retry_after_seconds()
 
-    def request(
+    async def request(
         self,
         method: str,
         path: str,
         authorization: str | None = None,
         json_body: dict | None = None,
         params: dict | None = None,
+        content: bytes | None = None,
+        extra_headers: dict[str, str] | None = None,
+        hedge: bool = False,
+        retry: bool = True,
+        timeout_seconds: float | None = None,
     ) -> tuple[int, object]:
-        url = f"{self._base_url}{path}"
-        headers = {"Content-Type": "application/json"}
-        if authorization:
-            headers["Authorization"] = authorization
+        def build_request() -> httpx.Request:
+            return self._build_request(
+                method,
+                path,
+                authorization,
+                json_body,
+                params,
+                content,
+                extra_headers,
+                timeout_seconds,
+            )
+
+        if not await self._admit():
+            return 503, dict(UNAVAILABLE_DETAIL)
+
+        started = time.monotonic()
+        try:
+            response = await self._send(method, build_request, hedge, retry)
+        except httpx.HTTPError as error:
+            self._release_slot()
+            self._record_transport_error(error, started)
+            return 503, dict(UNAVAILABLE_DETAIL)
+        except BaseException:
+            self._abandon_slot()
+            raise
 
         try:
-            with httpx.Client(timeout=self._timeout_seconds) as client:
-                response = client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    json=json_body,
-                    params=params,
-                )
-        except httpx.HTTPError:
-            return 503, {"detail": "downstream service unavailable"}
+            self._record_response(response, started)
+            await response.aread()
+        except httpx.HTTPError as error:
+            self._count_unavailable(error)
+            return 503, dict(UNAVAILABLE_DETAIL)
+        finally:
+            await response.aclose()
+            self._release_slot()
 
         try:
             body: object = response.json()
         except ValueError:
             body = {"detail": response.text}
 
-        return response.status_code, body
\ No newline at end of file
+        return response.status_code, body
+
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        authorization: str | None = None,
+        json_body: dict | None = None,
+        params: dict | None = None,
+        content: bytes | None = None,
+        extra_headers: dict[str, str] | None = None,
+        hedge: bool = False,
+        retry: bool = True,
+        timeout_seconds: float | None = None,
+    ) -> ProxiedStream:
+        # Pass-through: the downstream body is relayed as raw bytes (still encoded,
+        # never parsed), so gateway memory per request does not grow with payload size.
+        # The concurrency slot is held until the body ends (cleanly or not) or the
+        # caller closes the stream, whichever comes first.
+        def build_request() -> httpx.Request:
+            return self._build_request(
+                method,
+                path,
+                authorization,
+                json_body,
+                params,
+                content,
+                extra_headers,
+                timeout_seconds,
+            )
+
+        if not await self._admit():
+            return _unavailable_stream(self.retry_after_seconds())
+
+        started = time.monotonic()
+        try:
+            response = await self._send(method, build_request, hedge, retry)
+        except httpx.HTTPError as error:
+            self._release_slot()
+            self._record_transport_error(error, started)
+            return _unavailable_stream(self.retry_after_seconds())
+        except BaseException:
+            self._abandon_slot()
+            raise
+
+        stream = ProxiedStream(
+            status_code=response.status_code,
+            headers={},
+            chunks=_single_chunk(response.content if response.is_stream_consumed else b""),
+            _response=response,
+            _on_close=self._release_slot,
+        )
+        try:
+            # Latency is judged on the response head (time to first byte). A relayed
+            # body defers the breaker result until it ends, so a stream that breaks
+            # mid-body is one failed sample rather than a success plus a failure.
+            relayed = not response.is_stream_consumed
+            elapsed = self._record_response(response, started, record_breaker=not relayed)
+
+            stream.headers = {
+                name: response.headers[name]
+                for name in PASSTHROUGH_RESPONSE_HEADERS
+                if name in response.headers
+            }
+            if response.is_stream_consumed:
+                # Some transports (mocks, in-process ASGI) hand back an already-read,
+                # already-decoded body instead of a raw stream.
+                stream.headers.pop("content-encoding", None)
+                stream.headers["content-length"] = str(len(response.content))
+            else:
+                outcome = _DeferredOutcome(self._breaker, response.status_code >= 500, elapsed)
+                stream._on_close = partial(self._finish_relay, outcome)
+                stream.chunks = self._relay_body(stream, response, started, outcome)
+        except BaseException:
+            await stream.aclose()
+            raise
+        return stream
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _relay_body(
+        self,
+        stream: ProxiedStream,
+        response: httpx.Response,
+        started: float,
+        outcome: _DeferredOutcome,
+    ) -> AsyncIterator[bytes]:
+        # The slot is released here too, not only by the caller's aclose(): a read
+        # timeout or a reset mid-body ends the iteration with an error, and callers
+        # that only close on success (Starlette background tasks) would leak it.
+        try:
+            async for chunk in response.aiter_raw():
+                yield chunk
+        except httpx.HTTPError as error:
+            outcome.record(failed=True, elapsed_seconds=time.monotonic() - started)
+            self._count_unavailable(error)
+            raise
+        finally:
+            await stream.aclose()
+
+    def _build_request(
+        self,
+        method: str,
+        path: str,
+        authorization: str | None,
+        json_body: dict | None,
+        params: dict | None,
+        content: bytes | None,
+        extra_headers: dict[str, str] | None,
+        timeout_seconds: float | None,
+    ) -> httpx.Request:
+        timeout = (
+            httpx.USE_CLIENT_DEFAULT
+            if timeout_seconds is None
+            else replace(self._settings, read_timeout_seconds=timeout_seconds).to_timeout()
+        )
+        return self._client.build_request(
+            method=method,
+            url=path,
+            headers=self._build_headers(authorization, extra_headers),
+            json=json_body,
+            params=params,
+            content=content,
+            timeout=timeout,
+            extensions={"trace": self._metrics.connect_trace()},
+        )
+
+    async def _send(
+        self,
+        method: str,
+        build_request: Callable[[], httpx.Request],
+        hedge: bool,
+        retry: bool,
+    ) -> httpx.Response:
+        # Only GETs get extra attempts: connect errors (nothing reached the downstream)
+        # are retried with jittered backoff, and opted-in routes may be hedged. Both
+        # draw from the shared retry budget, so they cannot turn into a retry storm.
+        idempotent = method == "GET"
+        self._retry_budget.deposit()
+        hedge_delay = self._hedge_delay() if hedge and idempotent else None
+        max_retries = self._retry_policy.max_connect_retries if retry and idempotent else 0
+
+        attempt = 0
+        while True:
+            try:
+                if hedge_delay is not None:
+                    return await self._send_hedged(build_request, hedge_delay)
+                return await self._client.send(build_request(), stream=True)
+            except httpx.ConnectError:
+                if attempt >= max_retries:
+                    raise
+                if not self._retry_budget.try_spend():
+                    self._metrics.retry_budget_exhausted("connect_retry")
+                    raise
+                attempt += 1
+                self._metrics.extra_attempt("connect_retry")
+                await asyncio.sleep(self._retry_policy.backoff_seconds(attempt))
+
+    async def _send_hedged(
+        self,
+        build_request: Callable[[], httpx.Request],
+        delay: float,
+    ) -> httpx.Response:
+        attempts = {asyncio.ensure_future(self._client.send(build_request(), stream=True))}
+        winner = None
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done:
+                if self._retry_budget.try_spend():
+                    self._metrics.extra_attempt("hedge")
+                    attempts.add(
+                        asyncio.ensure_future(self._client.send(build_request(), stream=True))
+                    )
+                else:
+                    self._metrics.retry_budget_exhausted("hedge")
+
+            pending, error = set(attempts), None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        winner = attempt
+                        return attempt.result()
+                    error = error or attempt.exception()
+            raise error
+        finally:
+            for attempt in attempts - {winner}:
+                if not attempt.done():
+                    attempt.cancel()
+                attempt.add_done_callback(_close_losing_attempt)
+
+    def _hedge_delay(self) -> float | None:
+        if self._latencies.count() < self._retry_policy.hedge_min_samples:
+            return None
+        return max(
+            self._retry_policy.hedge_min_delay_seconds,
+            self._latencies.percentile(self._retry_policy.hedge_percentile),
+        )
+
+    @staticmethod
+    def _build_headers(
+        authorization: str | None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> dict[str, str]:
+        # Downstreams answer uncompressed: httpx would otherwise advertise gzip/br on the
+        # client's behalf and the raw stream would relay an encoding the client never
+        # asked for (and the response cache would store it). Negotiating with the
+        # client is left to the gateway's compression middleware.
+        headers = {"Content-Type": "application/json", "Accept-Encoding": "identity"}
+        if authorization:
+            headers["Authorization"] = authorization
+        if extra_headers:
+            headers.update(extra_headers)
+        return headers
+
+    async def _admit(self) -> bool:
+        # The breaker is consulted before queueing for a slot, so an open circuit
+        # answers immediately instead of waiting behind calls to a hung downstream.
+        if not self._breaker.allow_request():
+            self._metrics.unavailable("circuit_open")
+            return False
+        try:
+            rejection = await self._bulkhead.acquire()
+        except asyncio.CancelledError:
+            self._breaker.cancel()
+            raise
+        if rejection is not None:
+            self._breaker.cancel()
+            self._metrics.unavailable(rejection)
+            return False
+        self._metrics.in_flight.inc()
+        return True
+
+    def _release_slot(self) -> None:
+        self._metrics.in_flight.dec()
+        self._bulkhead.release()
+
+    def _finish_relay(self, outcome: _DeferredOutcome) -> None:
+        outcome.record()
+        self._release_slot()
+
+    def _abandon_slot(self) -> None:
+        # Cancellation, or a call that failed before reaching the downstream for a
+        # reason other than transport (a request that cannot be built, a failing trace
+        # hook): the slot goes back and the breaker sees no outcome.
+        self._release_slot()
+        self._breaker.cancel()
+
+    def _record_response(
+        self,
+        response: httpx.Response,
+        started: float,
+        record_breaker: bool = True,
+    ) -> float:
+        elapsed = time.monotonic() - started
+        self._metrics.duration.observe(elapsed)
+        if response.status_code < 500:
+            self._latencies.observe(elapsed)
+        self._bulkhead.observe(elapsed)
+        if record_breaker:
+            self._breaker.record(failed=response.status_code >= 500, elapsed_seconds=elapsed)
+        return elapsed
+
+    def _record_transport_error(self, error: httpx.HTTPError, started: float) -> None:
+        elapsed = time.monotonic() - started
+        self._metrics.duration.observe(elapsed)
+        self._breaker.record(failed=True, elapsed_seconds=elapsed)
+        self._bulkhead.observe(elapsed)
+        self._count_unavailable(error)
+
+    def _count_unavailable(self, error: httpx.HTTPError) -> None:
+        if isinstance(error, httpx.TimeoutException):
+            self._metrics.unavailable("timeout")
+        elif isinstance(error, httpx.ConnectError):
+            self._metrics.unavailable("connect_error")
+        else:
+            self._metrics.unavailable("transport_error")
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import os
+import re
+
+
+_PATH_PARAM = re.compile(r"\{[^/{}]+\}")
+
+
+def compile_path_template(template: str) -> re.Pattern[str]:
+    # "/api/v1/patients/{patient_id}" -> matches one non-empty path segment per parameter.
+    parts = _PATH_PARAM.split(template)
+    return re.compile("[^/]+".join(re.escape(part) for part in parts))
+
+
+class PathTemplateSet:
+    def __init__(self, templates: tuple[str, ...] = ()):
+        self.templates = templates
+        self._patterns = [compile_path_template(template) for template in templates]
+
+    @classmethod
+    def from_env(cls, name: str, default: tuple[str, ...] = ()) -> PathTemplateSet:
+        value = os.getenv(name)
+        if value is None:
+            return cls(default)
+        return cls(tuple(item.strip() for item in value.split(",") if item.strip()))
+
+    def matches(self, path: str) -> bool:
+        return any(pattern.fullmatch(path) for pattern in self._patterns)
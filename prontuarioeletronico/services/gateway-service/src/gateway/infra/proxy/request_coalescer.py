@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from .path_templates import compile_path_template
+
+
+@dataclass(frozen=True)
+class BufferedResponse:
+    status_code: int
+    headers: dict[str, str]
+    body: bytes
+
+
+CoalescingKey = tuple[str, str, tuple[tuple[str, str], ...], str]
+
+
+class RequestCoalescer:
+    def __init__(self, route_templates: tuple[str, ...] = (), enabled: bool = True):
+        self.enabled = enabled
+        self._route_templates = route_templates
+        self._patterns = [compile_path_template(template) for template in route_templates]
+        self._in_flight: dict[CoalescingKey, asyncio.Task] = {}
+        self._requests_total = 0
+        self._downstream_calls_total = 0
+        self._collapsed_total = 0
+
+    @classmethod
+    def from_env(cls, default_routes: tuple[str, ...]) -> RequestCoalescer:
+        routes = os.getenv("GATEWAY_COALESCE_ROUTES")
+        if routes is not None:
+            default_routes = tuple(route.strip() for route in routes.split(",") if route.strip())
+        return cls(
+            route_templates=default_routes,
+            enabled=os.getenv("GATEWAY_COALESCE_ENABLED", "true").lower() == "true",
+        )
+
+    def applies_to(self, method: str, path: str) -> bool:
+        if not self.enabled or method != "GET":
+            return False
+        return any(pattern.fullmatch(path) for pattern in self._patterns)
+
+    @staticmethod
+    def key_for(
+        method: str,
+        path: str,
+        params: dict | None,
+        authorization: str | None,
+    ) -> CoalescingKey:
+        query = tuple(
+            sorted((name, str(value)) for name, value in (params or {}).items() if value is not None)
+        )
+        # Scope by credential so one user's response is never handed to another.
+        scope = hashlib.sha256((authorization or "").encode("utf-8")).hexdigest()
+        return method, path, query, scope
+
+    async def run(
+        self,
+        key: CoalescingKey,
+        call: Callable[[], Awaitable[BufferedResponse]],
+    ) -> BufferedResponse:
+        self._requests_total += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            # The downstream call runs in its own task so a disconnecting first caller
+            # does not cancel it for everyone else waiting on the same key.
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self._downstream_calls_total += 1
+        else:
+            self._collapsed_total += 1
+        return await asyncio.shield(task)
+
+    def snapshot(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "routes": list(self._route_templates),
+            "in_flight": len(self._in_flight),
+            "requests_total": self._requests_total,
+            "downstream_calls_total": self._downstream_calls_total,
+            "collapsed_total": self._collapsed_total,
+        }
+
+    def _forget(self, key: CoalescingKey, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter went away.
+            task.exception()
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import math
+import os
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_connect_retries: int = 2
+    backoff_base_seconds: float = 0.05
+    backoff_max_seconds: float = 1.0
+    hedge_percentile: float = 0.95
+    hedge_min_delay_seconds: float = 0.02
+    hedge_min_samples: int = 20
+
+    @classmethod
+    def from_env(cls, prefix: str) -> RetryPolicy:
+        # Same lookup order as ProxyPoolSettings: EMR_SERVICE_RETRY_MAX_CONNECT_RETRIES,
+        # then GATEWAY_RETRY_MAX_CONNECT_RETRIES, then the default.
+        def _read(name: str, default: object) -> str:
+            value = os.getenv(f"{prefix}_RETRY_{name}")
+            if value is None:
+                value = os.getenv(f"GATEWAY_RETRY_{name}")
+            return str(default) if value is None else value
+
+        defaults = cls()
+        return cls(
+            max_connect_retries=int(
+                _read("MAX_CONNECT_RETRIES", defaults.max_connect_retries)
+            ),
+            backoff_base_seconds=float(
+                _read("BACKOFF_BASE_SECONDS", defaults.backoff_base_seconds)
+            ),
+            backoff_max_seconds=float(
+                _read("BACKOFF_MAX_SECONDS", defaults.backoff_max_seconds)
+            ),
+            hedge_percentile=float(_read("HEDGE_PERCENTILE", defaults.hedge_percentile)),
+            hedge_min_delay_seconds=float(
+                _read("HEDGE_MIN_DELAY_SECONDS", defaults.hedge_min_delay_seconds)
+            ),
+            hedge_min_samples=int(_read("HEDGE_MIN_SAMPLES", defaults.hedge_min_samples)),
+        )
+
+    def backoff_seconds(self, attempt: int) -> float:
+        # Full jitter: uniform in [0, min(max, base * 2^attempt)].
+        ceiling = min(self.backoff_max_seconds, self.backoff_base_seconds * (2 ** attempt))
+        return random.uniform(0.0, ceiling)
+
+
+class RetryBudget:
+    # Token bucket shared by every proxy: each original call deposits `ratio` tokens
+    # and each extra attempt (retry or hedge) spends one, so extra load stays around
+    # `ratio` of real traffic; `min_per_second` keeps low-traffic services retryable.
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_per_second: float = 1.0,
+        max_balance: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._ratio = ratio
+        self._min_per_second = min_per_second
+        self._max_balance = max_balance
+        self._clock = clock
+        self._balance = max_balance
+        self._last_refill = clock()
+        self._spent_total = 0
+        self._exhausted_total = 0
+
+    @classmethod
+    def from_env(cls) -> RetryBudget:
+        defaults = cls()
+        return cls(
+            ratio=float(os.getenv("GATEWAY_RETRY_BUDGET_RATIO", str(defaults._ratio))),
+            min_per_second=float(
+                os.getenv("GATEWAY_RETRY_BUDGET_MIN_PER_SECOND", str(defaults._min_per_second))
+            ),
+            max_balance=float(
+                os.getenv("GATEWAY_RETRY_BUDGET_MAX_BALANCE", str(defaults._max_balance))
+            ),
+        )
+
+    def deposit(self) -> None:
+        self._balance = min(self._max_balance, self._balance + self._ratio)
+
+    def try_spend(self) -> bool:
+        now = self._clock()
+        self._balance = min(
+            self._max_balance,
+            self._balance + (now - self._last_refill) * self._min_per_second,
+        )
+        self._last_refill = now
+        if self._balance < 1.0:
+            self._exhausted_total += 1
+            return False
+        self._balance -= 1.0
+        self._spent_total += 1
+        return True
+
+    def snapshot(self) -> dict:
+        return {
+            "balance": round(self._balance, 3),
+            "ratio": self._ratio,
+            "spent_total": self._spent_total,
+            "exhausted_total": self._exhausted_total,
+        }
+
+
+class LatencyTracker:
+    # Ring buffer of recent response-head latencies; the percentile is recomputed every
+    # `refresh_every` observations instead of sorting on each request.
+    def __init__(self, size: int = 256, refresh_every: int = 32):
+        self._samples: list[float] = []
+        self._size = size
+        self._next = 0
+        self._refresh_every = refresh_every
+        self._since_refresh = 0
+        self._cached: dict[float, float] = {}
+
+    def observe(self, seconds: float) -> None:
+        if len(self._samples) < self._size:
+            self._samples.append(seconds)
+        else:
+            self._samples[self._next] = seconds
+        self._next = (self._next + 1) % self._size
+        self._since_refresh += 1
+        if self._since_refresh >= self._refresh_every:
+            self._cached.clear()
+            self._since_refresh = 0
+
+    def count(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, fraction: float) -> float:
+        cached = self._cached.get(fraction)
+        if cached is None:
+            ordered = sorted(self._samples)
+            index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+            cached = ordered[index] if ordered else 0.0
+            self._cached[fraction] = cached
+        return cached
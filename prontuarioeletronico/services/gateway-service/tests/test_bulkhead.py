@@ -0,0 +1,222 @@
+import asyncio
+
+import httpx
+
+from src.gateway.infra.api import main as gateway_main
+from src.gateway.infra.metrics.gateway_metrics import REGISTRY
+from src.gateway.infra.proxy.bulkhead import AdaptiveLimit, Bulkhead, BulkheadSettings
+from src.gateway.infra.proxy.http_service_proxy import HttpServiceProxy, ProxyPoolSettings
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _fixed(max_queue: int) -> BulkheadSettings:
+    return BulkheadSettings(max_queue=max_queue, adaptive=False, retry_after_seconds=3)
+
+
+def test_slow_downstream_sheds_excess_without_starving_other_routes(monkeypatch):
+    release = asyncio.Event()
+
+    async def slow_audit(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={"items": []})
+
+    def patient(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"id": "p-1"})
+
+    audit_proxy = HttpServiceProxy(
+        base_url="http://audit-service",
+        settings=ProxyPoolSettings(max_concurrency=2, pool_timeout_seconds=5.0),
+        transport=httpx.MockTransport(slow_audit),
+        name="bulkhead-audit",
+        bulkhead_settings=_fixed(max_queue=1),
+    )
+    monkeypatch.setattr(gateway_main, "_audit_proxy", audit_proxy)
+    monkeypatch.setattr(
+        gateway_main,
+        "_patient_proxy",
+        HttpServiceProxy(base_url="http://patient-service", transport=httpx.MockTransport(patient)),
+    )
+    gateway_main._response_cache.clear()
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=gateway_main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+            audit_calls = [
+                asyncio.ensure_future(client.get("/api/v1/audit/events"))
+                for _ in range(6)
+            ]
+            while audit_proxy.bulkhead.queued < 1 or sum(call.done() for call in audit_calls) < 3:
+                await asyncio.sleep(0.01)
+            rejected = [call for call in audit_calls if call.done()]
+            patient_response = await client.get("/api/v1/patients/p-1")
+            release.set()
+            return rejected, await asyncio.gather(*audit_calls), patient_response
+
+    rejected, audit_responses, patient_response = asyncio.run(scenario())
+
+    assert patient_response.status_code == 200
+    assert len(rejected) == 3
+    assert sorted(response.status_code for response in audit_responses) == [200] * 3 + [503] * 3
+    shed = [response for response in audit_responses if response.status_code == 503]
+    assert all(response.headers["retry-after"] == "3" for response in shed)
+    assert _sample(
+        "gateway_downstream_unavailable_total",
+        downstream="bulkhead-audit",
+        cause="queue_full",
+    ) == 3
+    assert audit_proxy.bulkhead.snapshot()["in_flight"] == 0
+
+
+def test_queued_call_times_out_and_buffered_answer_carries_retry_after(monkeypatch):
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={"ok": True})
+
+    proxy = HttpServiceProxy(
+        base_url="http://emr-service",
+        settings=ProxyPoolSettings(max_concurrency=1, pool_timeout_seconds=0.05),
+        transport=httpx.MockTransport(handler),
+        name="bulkhead-emr",
+        bulkhead_settings=_fixed(max_queue=5),
+    )
+    monkeypatch.setattr(gateway_main, "_emr_proxy", proxy)
+    monkeypatch.setattr(gateway_main, "STREAM_RESPONSES", False)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=gateway_main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+            busy = asyncio.ensure_future(client.get("/api/v1/emr/soap/s-1"))
+            while proxy.bulkhead.in_flight < 1:
+                await asyncio.sleep(0.01)
+            timed_out = await client.get("/api/v1/emr/soap/s-2")
+            release.set()
+            return await busy, timed_out
+
+    busy, timed_out = asyncio.run(scenario())
+
+    assert busy.status_code == 200
+    assert timed_out.status_code == 503
+    assert timed_out.headers["retry-after"] == "3"
+    assert proxy.bulkhead.snapshot()["rejected_queue_timeout_total"] == 1
+
+
+def test_cancelled_waiter_does_not_leak_a_slot():
+    bulkhead = Bulkhead(max_concurrency=1, queue_timeout_seconds=5.0, settings=_fixed(max_queue=2))
+
+    async def scenario() -> tuple[str | None, int]:
+        assert await bulkhead.acquire() is None
+        waiter = asyncio.ensure_future(bulkhead.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        bulkhead.release()
+        return await bulkhead.acquire(), bulkhead.queued
+
+    admitted, queued = asyncio.run(scenario())
+
+    assert admitted is None
+    assert queued == 0
+    assert bulkhead.in_flight == 1
+
+
+def test_adaptive_limit_shrinks_when_latency_rises_and_recovers():
+    limiter = AdaptiveLimit(max_limit=100, min_limit=4, tolerance=2.0, smoothing=0.2)
+
+    for _ in range(200):
+        limiter.on_sample(0.01, in_flight=100)
+    assert limiter.limit == 100
+
+    for _ in range(30):
+        limiter.on_sample(0.2, in_flight=limiter.limit)
+    shrunk = limiter.limit
+    assert shrunk < 20
+
+    for _ in range(200):
+        limiter.on_sample(0.01, in_flight=limiter.limit)
+    assert limiter.limit > shrunk * 2
+
+
+def test_adaptive_limit_ignores_samples_far_below_the_limit():
+    limiter = AdaptiveLimit(max_limit=50, min_limit=4, tolerance=2.0, smoothing=0.2)
+
+    limiter.on_sample(0.01, in_flight=1)
+    for _ in range(50):
+        limiter.on_sample(1.0, in_flight=1)
+
+    assert limiter.limit == 50
+
+
+def test_queued_callers_are_admitted_when_the_adaptive_limit_grows():
+    bulkhead = Bulkhead(
+        max_concurrency=20,
+        queue_timeout_seconds=5.0,
+        settings=BulkheadSettings(max_queue=5, min_limit=2),
+    )
+
+    async def scenario() -> tuple[int, list[str | None]]:
+        for _ in range(20):
+            assert await bulkhead.acquire() is None
+        for _ in range(200):
+            bulkhead.observe(0.01)
+        for _ in range(30):
+            bulkhead.observe(0.2)
+        while bulkhead.in_flight > bulkhead.limit:
+            bulkhead.release()
+        shrunk = bulkhead.limit
+
+        waiters = [asyncio.ensure_future(bulkhead.acquire()) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert bulkhead.queued == 2
+        for _ in range(50):
+            bulkhead.observe(0.01)
+        return shrunk, await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+
+    shrunk, admitted = asyncio.run(scenario())
+
+    assert admitted == [None, None]
+    assert bulkhead.limit > shrunk
+    assert bulkhead.in_flight == shrunk + 2
+
+
+class _StallingBody(httpx.AsyncByteStream):
+    async def __aiter__(self):
+        yield b'{"events": ['
+        raise httpx.ReadTimeout("downstream stalled mid-body")
+
+
+def test_streamed_answer_failing_mid_body_gives_the_slot_back(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=_StallingBody())
+
+    proxy = HttpServiceProxy(
+        base_url="http://emr-service",
+        settings=ProxyPoolSettings(max_concurrency=1, pool_timeout_seconds=0.05),
+        transport=httpx.MockTransport(handler),
+        name="bulkhead-emr-stream",
+        bulkhead_settings=_fixed(max_queue=0),
+    )
+    monkeypatch.setattr(gateway_main, "_emr_proxy", proxy)
+    monkeypatch.setattr(gateway_main, "STREAM_RESPONSES", True)
+
+    async def scenario() -> list[int]:
+        statuses = []
+        transport = httpx.ASGITransport(app=gateway_main.app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+            for soap_id in ("s-1", "s-2", "s-3"):
+                try:
+                    statuses.append((await client.get(f"/api/v1/emr/soap/{soap_id}")).status_code)
+                except httpx.HTTPError:
+                    statuses.append(None)
+        return statuses
+
+    statuses = asyncio.run(scenario())
+
+    assert 503 not in statuses
+    assert proxy.bulkhead.in_flight == 0
+    assert _sample("gateway_downstream_in_flight", downstream="bulkhead-emr-stream") == 0
+    assert proxy.breaker.snapshot()["failures_total"] == 3
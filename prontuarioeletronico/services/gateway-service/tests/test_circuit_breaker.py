@@ -0,0 +1,150 @@
+import asyncio
+
+import httpx
+from fastapi.testclient import TestClient
+
+from src.gateway.infra.api import main as gateway_main
+from src.gateway.infra.proxy.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerSettings,
+)
+from src.gateway.infra.proxy.http_service_proxy import HttpServiceProxy
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+_SETTINGS = CircuitBreakerSettings(
+    window_seconds=10.0,
+    minimum_requests=4,
+    failure_rate_threshold=0.5,
+    slow_call_seconds=1.0,
+    slow_call_rate_threshold=0.5,
+    open_seconds=5.0,
+    half_open_probes=1,
+)
+
+
+def _admin_headers(monkeypatch) -> dict:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"valid": True, "claims": {"sub": "u-admin", "role": "admin"}})
+
+    monkeypatch.setattr(
+        gateway_main,
+        "_auth_proxy",
+        HttpServiceProxy(base_url="http://auth-service", transport=httpx.MockTransport(handler)),
+    )
+    return {"Authorization": "Bearer admin-token"}
+
+
+def test_breaker_opens_on_error_rate_and_recovers_through_half_open_probe():
+    clock = _FakeClock()
+    breaker = CircuitBreaker(_SETTINGS, clock=clock)
+
+    for failed in (False, True, True, False):
+        assert breaker.allow_request()
+        breaker.record(failed=failed, elapsed_seconds=0.01)
+
+    assert breaker.state == "open"
+    assert not breaker.allow_request()
+
+    clock.now += 5.0
+    assert breaker.state == "half_open"
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record(failed=False, elapsed_seconds=0.01)
+    assert breaker.state == "closed"
+    assert breaker.snapshot()["opened_total"] == 1
+    assert breaker.snapshot()["rejected_total"] == 2
+
+
+def test_breaker_opens_on_slow_calls_and_failed_probe_reopens():
+    clock = _FakeClock()
+    breaker = CircuitBreaker(_SETTINGS, clock=clock)
+
+    for _ in range(4):
+        breaker.allow_request()
+        breaker.record(failed=False, elapsed_seconds=1.5)
+
+    assert breaker.state == "open"
+
+    clock.now += 5.0
+    assert breaker.allow_request()
+    breaker.record(failed=True, elapsed_seconds=0.01)
+
+    assert breaker.state == "open"
+    assert breaker.retry_after_seconds() == 5.0
+
+
+def test_breaker_forgets_calls_outside_rolling_window():
+    clock = _FakeClock()
+    breaker = CircuitBreaker(_SETTINGS, clock=clock)
+
+    for _ in range(3):
+        breaker.allow_request()
+        breaker.record(failed=True, elapsed_seconds=0.01)
+
+    clock.now += 11.0
+    breaker.allow_request()
+    breaker.record(failed=True, elapsed_seconds=0.01)
+
+    assert breaker.state == "closed"
+    assert breaker.snapshot()["window_requests"] == 1
+
+
+def test_open_circuit_fails_fast_without_calling_downstream():
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        raise httpx.ReadTimeout("downstream hung", request=request)
+
+    proxy = HttpServiceProxy(
+        base_url="http://emr-service",
+        transport=httpx.MockTransport(handler),
+        breaker=CircuitBreaker(_SETTINGS),
+    )
+
+    async def scenario() -> list[int]:
+        statuses = []
+        for _ in range(6):
+            status_code, _ = await proxy.request("GET", "/api/v1/emr/timeline")
+            statuses.append(status_code)
+        stream = await proxy.stream("GET", "/api/v1/emr/timeline")
+        statuses.append(stream.status_code)
+        await stream.aclose()
+        await proxy.aclose()
+        return statuses
+
+    statuses = asyncio.run(scenario())
+
+    assert statuses == [503] * 7
+    assert len(calls) == 4
+    assert proxy.breaker.snapshot()["rejected_total"] == 3
+
+
+def test_circuits_endpoint_reports_state_per_downstream(monkeypatch):
+    breaker = CircuitBreaker(_SETTINGS)
+    for _ in range(4):
+        breaker.allow_request()
+        breaker.record(failed=True, elapsed_seconds=0.01)
+    monkeypatch.setattr(
+        gateway_main,
+        "_emr_proxy",
+        HttpServiceProxy(base_url="http://emr-service", breaker=breaker),
+    )
+    client = TestClient(gateway_main.app)
+
+    response = client.get("/api/v1/gateway/circuits", headers=_admin_headers(monkeypatch))
+
+    assert response.status_code == 200
+    circuits = response.json()["circuits"]
+    assert circuits["emr-service"]["state"] == "open"
+    assert circuits["emr-service"]["opened_total"] == 1
+    assert circuits["patient-service"]["state"] == "closed"
@@ -0,0 +1,279 @@
+import asyncio
+import time
+
+import httpx
+import jwt
+from fastapi.testclient import TestClient
+
+from src.gateway.infra.api import main as gateway_main
+from src.gateway.infra.auth.edge_token_verifier import EdgeTokenVerifier, RevocationCache
+from src.gateway.infra.proxy.http_service_proxy import HttpServiceProxy
+
+
+def _patient_proxy(calls: list[httpx.Request], delay_seconds: float = 0.0) -> HttpServiceProxy:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(delay_seconds)
+        if request.url.path.endswith("/p-404"):
+            return httpx.Response(404, json={"detail": "patient not found"})
+        if request.method == "POST":
+            return httpx.Response(201, json={"created": request.url.path})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    return HttpServiceProxy(
+        base_url="http://patient-service",
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def _auth_proxy(introspections: list[httpx.Request]) -> HttpServiceProxy:
+    def handler(request: httpx.Request) -> httpx.Response:
+        introspections.append(request)
+        if request.headers.get("authorization") != "Bearer token":
+            return httpx.Response(401, json={"detail": "invalid token"})
+        return httpx.Response(200, json={"valid": True, "claims": {"sub": "u-1", "role": "profissional"}})
+
+    return HttpServiceProxy(base_url="http://auth-service", transport=httpx.MockTransport(handler))
+
+
+def _setup(monkeypatch, delay_seconds: float = 0.0) -> list[httpx.Request]:
+    calls: list[httpx.Request] = []
+    monkeypatch.setattr(gateway_main, "_patient_proxy", _patient_proxy(calls, delay_seconds))
+    monkeypatch.setattr(gateway_main, "_auth_proxy", _auth_proxy([]))
+    gateway_main._response_cache.clear()
+    return calls
+
+
+_TOKEN = {"Authorization": "Bearer token"}
+
+
+def test_batch_runs_independent_requests_concurrently(monkeypatch):
+    calls = _setup(monkeypatch, delay_seconds=0.2)
+    client = TestClient(gateway_main.app)
+
+    started = time.perf_counter()
+    response = client.post(
+        "/api/v1/batch",
+        json={
+            "requests": [
+                {"id": f"r{index}", "method": "GET", "path": f"/api/v1/patients/p-{index}"}
+                for index in range(4)
+            ]
+        },
+        headers={"Authorization": "Bearer token"},
+    )
+    elapsed = time.perf_counter() - started
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["responses"]] == ["r0", "r1", "r2", "r3"]
+    assert {item["status"] for item in response.json()["responses"]} == {200}
+    assert all(call.headers["Authorization"] == "Bearer token" for call in calls)
+    assert elapsed < 0.6
+
+
+def test_batch_runs_dependents_after_dependencies_and_skips_on_failure(monkeypatch):
+    calls = _setup(monkeypatch)
+    client = TestClient(gateway_main.app)
+
+    response = client.post(
+        "/api/v1/batch",
+        json={
+            "requests": [
+                {
+                    "id": "consent",
+                    "method": "POST",
+                    "path": "/api/v1/patients/p-1/consents",
+                    "body": {"legal_basis": "consentimento", "purpose": "tratamento"},
+                    "depends_on": ["patient"],
+                },
+                {"id": "patient", "method": "GET", "path": "/api/v1/patients/p-1"},
+                {"id": "missing", "method": "GET", "path": "/api/v1/patients/p-404"},
+                {
+                    "id": "after-missing",
+                    "method": "GET",
+                    "path": "/api/v1/patients/p-1/consents",
+                    "depends_on": ["missing"],
+                },
+            ]
+        },
+        headers=_TOKEN,
+    )
+
+    outcomes = {item["id"]: item for item in response.json()["responses"]}
+    assert outcomes["patient"]["status"] == 200
+    assert outcomes["consent"]["status"] == 201
+    assert outcomes["missing"]["status"] == 404
+    assert outcomes["after-missing"] == {
+        "id": "after-missing",
+        "status": 424,
+        "body": {"detail": "dependency missing failed"},
+    }
+    paths = [(call.method, call.url.path) for call in calls]
+    assert paths.index(("GET", "/api/v1/patients/p-1")) < paths.index(
+        ("POST", "/api/v1/patients/p-1/consents")
+    )
+    assert ("GET", "/api/v1/patients/p-1/consents") not in paths
+
+
+def test_batch_rejects_invalid_plans(monkeypatch):
+    _setup(monkeypatch)
+    client = TestClient(gateway_main.app)
+
+    cycle = client.post(
+        "/api/v1/batch",
+        json={
+            "requests": [
+                {"id": "a", "method": "GET", "path": "/api/v1/patients", "depends_on": ["b"]},
+                {"id": "b", "method": "GET", "path": "/api/v1/patients", "depends_on": ["a"]},
+            ]
+        },
+        headers=_TOKEN,
+    )
+    nested = client.post(
+        "/api/v1/batch",
+        json={"requests": [{"id": "a", "method": "POST", "path": "/api/v1/batch"}]},
+        headers=_TOKEN,
+    )
+    unknown = client.post(
+        "/api/v1/batch",
+        json={
+            "requests": [
+                {"id": "a", "method": "GET", "path": "/api/v1/patients", "depends_on": ["x"]}
+            ]
+        },
+        headers=_TOKEN,
+    )
+
+    assert cycle.status_code == 400
+    assert cycle.json() == {"detail": "batch dependencies contain a cycle"}
+    assert nested.status_code == 400
+    assert unknown.status_code == 400
+
+
+def test_batch_envelope_is_validated_in_raw_body_mode(monkeypatch):
+    calls = _setup(monkeypatch)
+    monkeypatch.setattr(gateway_main._raw_body_policy, "enabled", True)
+    client = TestClient(gateway_main.app)
+
+    response = client.post("/api/v1/batch", json={"requests": [{"id": "a"}]}, headers=_TOKEN)
+
+    assert response.status_code == 422
+    assert calls == []
+
+
+def test_batch_verifies_token_once_and_checks_role_per_item(monkeypatch):
+    calls = _setup(monkeypatch)
+    verified_tokens: list[str] = []
+
+    class CountingVerifier(EdgeTokenVerifier):
+        async def verify(self, token: str) -> dict:
+            verified_tokens.append(token)
+            return await super().verify(token)
+
+    monkeypatch.setattr(
+        gateway_main._edge_auth,
+        "verifier",
+        CountingVerifier(secret_key="batch-secret", revocations=RevocationCache()),
+    )
+    monkeypatch.setattr(gateway_main._edge_auth, "enabled", True)
+    now = int(time.time())
+    token = jwt.encode(
+        {
+            "sub": "u-prof",
+            "role": "profissional",
+            "type": "access",
+            "jti": "jti-batch",
+            "exp": now + 300,
+        },
+        "batch-secret",
+        algorithm="HS256",
+    )
+    client = TestClient(gateway_main.app)
+
+    response = client.post(
+        "/api/v1/batch",
+        json={
+            "requests": [
+                {"id": "read", "method": "GET", "path": "/api/v1/patients/p-1"},
+                {"id": "delete", "method": "DELETE", "path": "/api/v1/patients/p-1"},
+            ]
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    outcomes = {item["id"]: item["status"] for item in response.json()["responses"]}
+    assert outcomes == {"read": 200, "delete": 403}
+    assert len(verified_tokens) == 1
+    assert [call.method for call in calls] == ["GET"]
+
+
+def test_batch_sub_requests_are_not_compressed_in_process(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"notes": ["nota clínica " * 20] * 40})
+
+    monkeypatch.setattr(
+        gateway_main,
+        "_patient_proxy",
+        HttpServiceProxy(base_url="http://patient-service", transport=httpx.MockTransport(handler)),
+    )
+    monkeypatch.setattr(gateway_main, "_auth_proxy", _auth_proxy([]))
+    gateway_main._response_cache.clear()
+    client = TestClient(gateway_main.app)
+    bytes_in_before = gateway_main._response_compression.snapshot()["bytes_in_total"]
+
+    response = client.post(
+        "/api/v1/batch",
+        json={"requests": [{"id": "r1", "method": "GET", "path": "/api/v1/patients/p-1"}]},
+        headers={"Authorization": "Bearer token", "Accept-Encoding": "identity"},
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()["responses"][0]["body"]["notes"]) == 40
+    assert gateway_main._response_compression.snapshot()["bytes_in_total"] == bytes_in_before
+
+
+def test_batch_only_reaches_routes_of_the_proxy_table(monkeypatch):
+    calls = _setup(monkeypatch)
+    client = TestClient(gateway_main.app)
+
+    for method, path in [
+        ("GET", "/api/v1/gateway/cache"),
+        ("GET", "/metrics"),
+        ("GET", "/api/v1/patients/p-1/chart"),
+        ("POST", "/api/v1/auth/logout"),
+        ("PATCH", "/api/v1/patients/p-1"),
+        ("GET", "/api/v1/patients/p-1/unknown"),
+    ]:
+        response = client.post(
+            "/api/v1/batch",
+            json={"requests": [{"id": "a", "method": method, "path": path}]},
+            headers=_TOKEN,
+        )
+        assert response.status_code == 400, path
+        assert response.json() == {"detail": "unsupported path for a"}
+    assert calls == []
+
+
+def test_batch_authenticates_once_at_auth_service_when_edge_auth_is_off(monkeypatch):
+    calls = _setup(monkeypatch)
+    introspections: list[httpx.Request] = []
+    monkeypatch.setattr(gateway_main, "_auth_proxy", _auth_proxy(introspections))
+    monkeypatch.setattr(gateway_main._edge_auth, "enabled", False)
+    client = TestClient(gateway_main.app)
+    plan = {
+        "requests": [
+            {"id": f"r{index}", "method": "GET", "path": f"/api/v1/patients/p-{index}"}
+            for index in range(3)
+        ]
+    }
+
+    missing = client.post("/api/v1/batch", json=plan)
+    invalid = client.post("/api/v1/batch", json=plan, headers={"Authorization": "Bearer nope"})
+    accepted = client.post("/api/v1/batch", json=plan, headers=_TOKEN)
+
+    assert missing.status_code == 401
+    assert invalid.status_code == 401
+    assert invalid.json() == {"detail": "invalid token"}
+    assert {item["status"] for item in accepted.json()["responses"]} == {200}
+    assert len(introspections) == 2
+    assert len(calls) == 3
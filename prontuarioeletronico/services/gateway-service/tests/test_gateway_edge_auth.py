@@ -0,0 +1,310 @@
+import asyncio
+import time
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ed25519
+from fastapi.testclient import TestClient
+
+from src.gateway.infra.api import main as gateway_main
+from src.gateway.infra.auth.edge_token_verifier import (
+    EdgeTokenVerifier,
+    JwksKeyCache,
+    RevocationCache,
+)
+from src.gateway.infra.proxy.http_service_proxy import HttpServiceProxy
+
+
+EDGE_SECRET = "edge-test-secret"
+
+
+def _token(role: str = "profissional", token_type: str = "access", **overrides) -> str:
+    now = int(time.time())
+    payload = {
+        "sub": f"u-{role}",
+        "username": role,
+        "role": role,
+        "type": token_type,
+        "jti": f"jti-{role}-{token_type}",
+        "iat": now,
+        "exp": now + 300,
+    }
+    payload.update(overrides)
+    return jwt.encode(payload, EDGE_SECRET, algorithm="HS256")
+
+
+@pytest.fixture
+def captured(monkeypatch) -> list[httpx.Request]:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    proxy = HttpServiceProxy(base_url="http://patient-service", transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(gateway_main, "_patient_proxy", proxy)
+    monkeypatch.setattr(
+        gateway_main._edge_auth,
+        "verifier",
+        EdgeTokenVerifier(secret_key=EDGE_SECRET, revocations=RevocationCache()),
+    )
+    monkeypatch.setattr(gateway_main._edge_auth, "enabled", True)
+    gateway_main._response_cache.clear()
+    return requests
+
+
+def test_edge_rejects_missing_and_invalid_tokens_without_calling_downstream(captured):
+    client = TestClient(gateway_main.app)
+
+    missing = client.get("/api/v1/patients")
+    invalid = client.get("/api/v1/patients", headers={"Authorization": "Bearer token-invalido"})
+    refresh_type = client.get(
+        "/api/v1/patients",
+        headers={"Authorization": f"Bearer {_token(token_type='refresh')}"},
+    )
+    expired = client.get(
+        "/api/v1/patients",
+        headers={"Authorization": f"Bearer {_token(exp=int(time.time()) - 10)}"},
+    )
+
+    assert missing.status_code == 401
+    assert invalid.status_code == 401
+    assert refresh_type.json() == {"detail": "invalid access token type"}
+    assert expired.json() == {"detail": "token expired"}
+    assert captured == []
+
+
+def test_edge_enforces_route_role_table(captured):
+    client = TestClient(gateway_main.app)
+
+    forbidden = client.delete(
+        "/api/v1/patients/p-1",
+        headers={"Authorization": f"Bearer {_token('profissional')}"},
+    )
+    allowed = client.delete(
+        "/api/v1/patients/p-1",
+        headers={"Authorization": f"Bearer {_token('admin')}"},
+    )
+
+    assert forbidden.status_code == 403
+    assert forbidden.json() == {"detail": "insufficient role"}
+    assert allowed.status_code == 200
+    assert len(captured) == 1
+
+
+def test_edge_forwards_the_original_bearer_token_only(captured):
+    client = TestClient(gateway_main.app)
+    token = _token("profissional")
+
+    response = client.get("/api/v1/patients/p-1", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    assert captured[0].headers["authorization"] == f"Bearer {token}"
+    assert "x-gateway-claims" not in captured[0].headers
+
+
+def test_edge_rejects_token_present_in_cached_revocation_set(captured, monkeypatch):
+    async def fetch_revocations() -> list[tuple[str, float]]:
+        return [("jti-profissional-access", time.time() + 300)]
+
+    revocations = RevocationCache(fetcher=fetch_revocations)
+    assert asyncio.run(revocations.refresh())
+    monkeypatch.setattr(
+        gateway_main._edge_auth,
+        "verifier",
+        EdgeTokenVerifier(secret_key=EDGE_SECRET, revocations=revocations),
+    )
+    client = TestClient(gateway_main.app)
+
+    response = client.get(
+        "/api/v1/patients",
+        headers={"Authorization": f"Bearer {_token('profissional')}"},
+    )
+
+    assert response.status_code == 401
+    assert response.json() == {"detail": "access token revoked"}
+    assert captured == []
+
+
+def test_revocation_refresh_runs_in_background_and_lookups_never_wait():
+    async def scenario() -> tuple[bool, bool, int]:
+        release = asyncio.Event()
+        fetches: list[int] = []
+
+        async def fetch_revocations() -> list[tuple[str, float]]:
+            fetches.append(1)
+            await release.wait()
+            return [("jti-revoked", time.time() + 300)]
+
+        revocations = RevocationCache(fetcher=fetch_revocations, refresh_interval_seconds=0.01)
+        revocations.start()
+        await asyncio.sleep(0.05)
+        # The fetch is hanging: the lookup answers from the current set straight away.
+        during_fetch = revocations.is_revoked("jti-revoked")
+
+        release.set()
+        for _ in range(100):
+            if revocations.is_revoked("jti-revoked"):
+                break
+            await asyncio.sleep(0.01)
+        after_fetch = revocations.is_revoked("jti-revoked")
+        await revocations.stop()
+        return during_fetch, after_fetch, len(fetches)
+
+    during_fetch, after_fetch, fetches = asyncio.run(scenario())
+
+    assert during_fetch is False
+    assert after_fetch is True
+    assert fetches >= 1
+
+
+def test_edge_verifies_jwks_signed_tokens_by_kid(captured, monkeypatch):
+    signing_key = ed25519.Ed25519PrivateKey.generate()
+    jwk = jwt.get_algorithm_by_name("EdDSA").to_jwk(signing_key.public_key(), as_dict=True)
+    fetches: list[int] = []
+
+    async def fetch_jwks() -> dict:
+        fetches.append(1)
+        return {"keys": [{**jwk, "kid": "k1", "alg": "EdDSA", "use": "sig"}]}
+
+    def signed(kid: str, key=signing_key) -> str:
+        now = int(time.time())
+        payload = {
+            "sub": "u-1",
+            "role": "profissional",
+            "type": "access",
+            "jti": f"jti-{kid}",
+            "exp": now + 300,
+        }
+        return jwt.encode(payload, key, algorithm="EdDSA", headers={"kid": kid})
+
+    monkeypatch.setattr(
+        gateway_main._edge_auth,
+        "verifier",
+        EdgeTokenVerifier(
+            secret_key=None,
+            revocations=RevocationCache(),
+            keys=JwksKeyCache(fetcher=fetch_jwks),
+        ),
+    )
+    client = TestClient(gateway_main.app)
+
+    allowed = [
+        client.get("/api/v1/patients", headers={"Authorization": f"Bearer {signed('k1')}"})
+        for _ in range(3)
+    ]
+    unknown_kid = client.get("/api/v1/patients", headers={"Authorization": f"Bearer {signed('k9')}"})
+    forged = client.get(
+        "/api/v1/patients",
+        headers={"Authorization": f"Bearer {signed('k1', ed25519.Ed25519PrivateKey.generate())}"},
+    )
+    hs256 = client.get("/api/v1/patients", headers={"Authorization": f"Bearer {_token()}"})
+
+    assert [response.status_code for response in allowed] == [200, 200, 200]
+    assert unknown_kid.status_code == 401
+    assert forged.status_code == 401
+    assert hs256.status_code == 401
+    assert len(fetches) == 1
+    assert len(captured) == 3
+
+
+def test_public_routes_bypass_edge_verification(captured):
+    client = TestClient(gateway_main.app)
+
+    assert client.get("/health").status_code == 200
+
+
+def test_malformed_revocation_feed_keeps_the_refresher_alive_and_reports_staleness():
+    clock = {"now": 0.0}
+
+    async def scenario() -> tuple[dict, dict]:
+        bodies = [{"revoked": [{"jti": "jti-revoked", "expires_at": time.time() + 300}]}]
+
+        async def fetch_revocations() -> list[tuple[str, float]]:
+            # Same parsing as the gateway's feed reader; later bodies are malformed.
+            body = bodies.pop(0) if bodies else {"revoked": [{"id": "jti-other"}]}
+            return [(item["jti"], float(item["expires_at"])) for item in body["revoked"]]
+
+        revocations = RevocationCache(
+            fetcher=fetch_revocations,
+            refresh_interval_seconds=0.01,
+            max_staleness_seconds=30.0,
+            clock=lambda: clock["now"],
+        )
+        revocations.start()
+        for _ in range(100):
+            if revocations.snapshot()["refresh_failures"] >= 3:
+                break
+            await asyncio.sleep(0.01)
+        fresh = revocations.snapshot()
+        clock["now"] = 60.0
+        stale = revocations.snapshot()
+        assert revocations.is_revoked("jti-revoked")
+        await revocations.stop()
+        return fresh, stale
+
+    fresh, stale = asyncio.run(scenario())
+
+    assert fresh["running"] is True
+    assert fresh["refresh_failures"] >= 3
+    assert fresh["stale"] is False
+    assert stale["stale"] is True
+    assert stale["seconds_since_sync"] == 60.0
+
+
+_INTROSPECTION_PATHS = [
+    f"/api/v1/gateway/{name}"
+    for name in ("circuits", "bulkheads", "coalescing", "cache", "compression", "retries")
+]
+
+
+def test_gateway_introspection_is_admin_only_and_out_of_the_schema(captured):
+    client = TestClient(gateway_main.app)
+    professional = {"Authorization": f"Bearer {_token('profissional')}"}
+    admin = {"Authorization": f"Bearer {_token('admin')}"}
+
+    for path in _INTROSPECTION_PATHS:
+        assert client.get(path).status_code == 401
+        assert client.get(path, headers=professional).status_code == 403
+        assert client.get(path, headers=admin).status_code == 200
+    batch = client.post(
+        "/api/v1/batch",
+        json={"requests": [{"id": "cache", "method": "GET", "path": "/api/v1/gateway/cache"}]},
+        headers=professional,
+    )
+
+    assert batch.status_code == 400
+    assert not any(path.startswith("/api/v1/gateway/") for path in gateway_main.app.openapi()["paths"])
+
+
+def test_gateway_introspection_asks_auth_service_when_edge_auth_is_off(monkeypatch):
+    roles = {"Bearer admin-token": "admin", "Bearer prof-token": "profissional"}
+    introspections: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        introspections.append(request)
+        role = roles.get(request.headers["authorization"])
+        if role is None:
+            return httpx.Response(401, json={"detail": "access token revoked"})
+        return httpx.Response(200, json={"valid": True, "claims": {"sub": "u-1", "role": role}})
+
+    monkeypatch.setattr(
+        gateway_main,
+        "_auth_proxy",
+        HttpServiceProxy(base_url="http://auth-service", transport=httpx.MockTransport(handler)),
+    )
+    monkeypatch.setattr(gateway_main._edge_auth, "enabled", False)
+    client = TestClient(gateway_main.app)
+
+    missing = client.get("/api/v1/gateway/cache")
+    revoked = client.get("/api/v1/gateway/cache", headers={"Authorization": "Bearer old-token"})
+    forbidden = client.get("/api/v1/gateway/cache", headers={"Authorization": "Bearer prof-token"})
+    allowed = client.get("/api/v1/gateway/cache", headers={"Authorization": "Bearer admin-token"})
+
+    assert missing.status_code == 401
+    assert revoked.json() == {"detail": "access token revoked"}
+    assert forbidden.status_code == 403
+    assert allowed.status_code == 200
+    assert {request.url.path for request in introspections} == {"/api/v1/auth/introspect"}
+    assert len(introspections) == 3
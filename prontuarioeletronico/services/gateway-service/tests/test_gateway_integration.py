@@ -2,6 +2,7 @@ import os
 import sys
 from pathlib import Path
 
+import httpx
 from fastapi.testclient import TestClient
 
 
@@ -41,36 +42,15 @@ from src.scheduling.infra.api import main as scheduling_main
 from src.patient.infra.api import main as patient_main
 from src.professional.infra.api import main as professional_main
 from src.gateway.infra.api import main as gateway_main
+from src.gateway.infra.auth.edge_token_verifier import EdgeTokenVerifier, RevocationCache
+from src.gateway.infra.proxy.http_service_proxy import HttpServiceProxy
 
 
-class LocalServiceProxy:
-    def __init__(self, client: TestClient):
-        self._client = client
-
-    def request(
-        self,
-        method: str,
-        path: str,
-        authorization: str | None = None,
-        json_body: dict | None = None,
-        params: dict | None = None,
-    ) -> tuple[int, object]:
-        headers = {}
-        if authorization:
-            headers["Authorization"] = authorization
-
-        response = self._client.request(
-            method=method,
-            url=path,
-            headers=headers,
-            json=json_body,
-            params=params,
-        )
-        try:
-            body = response.json()
-        except ValueError:
-            body = {"detail": response.text}
-        return response.status_code, body
+def _local_service_proxy(app) -> HttpServiceProxy:
+    return HttpServiceProxy(
+        base_url="http://testserver",
+        transport=httpx.ASGITransport(app=app),
+    )
 
 
 class LocalAuthServiceClient:
@@ -96,6 +76,16 @@ class LocalAuthServiceClient:
             raise ValueError(response.json().get("detail", "unauthorized"))
         return bool(response.json().get("authorized"))
 
+    def introspect(self, token: str, roles: list[str]) -> dict:
+        response = self._auth_client.get(
+            "/api/v1/auth/introspect",
+            params=[("roles", role) for role in roles],
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        if response.status_code >= 400:
+            raise ValueError(response.json().get("detail", "invalid token"))
+        return response.json()
+
 
 def setup_function() -> None:
     auth_client = TestClient(auth_app)
@@ -110,12 +100,12 @@ def setup_function() -> None:
     audit_main._reset_for_tests()
     professional_main._reset_for_tests()
 
-    gateway_main._auth_proxy = LocalServiceProxy(auth_client)
-    gateway_main._patient_proxy = LocalServiceProxy(TestClient(patient_main.app))
-    gateway_main._emr_proxy = LocalServiceProxy(TestClient(emr_main.app))
-    gateway_main._scheduling_proxy = LocalServiceProxy(TestClient(scheduling_main.app))
-    gateway_main._audit_proxy = LocalServiceProxy(TestClient(audit_main.app))
-    gateway_main._professional_proxy = LocalServiceProxy(TestClient(professional_main.app))
+    gateway_main._auth_proxy = _local_service_proxy(auth_app)
+    gateway_main._patient_proxy = _local_service_proxy(patient_main.app)
+    gateway_main._emr_proxy = _local_service_proxy(emr_main.app)
+    gateway_main._scheduling_proxy = _local_service_proxy(scheduling_main.app)
+    gateway_main._audit_proxy = _local_service_proxy(audit_main.app)
+    gateway_main._professional_proxy = _local_service_proxy(professional_main.app)
 
 
 def _gateway_login(client: TestClient, username: str, password: str) -> dict:
@@ -464,4 +454,78 @@ def test_gateway_end_to_end_professional_flow():
         headers=auth_header_admin,
     )
     assert deactivated.status_code == 200
-    assert deactivated.json()["status"] == "inactive"
\ No newline at end of file
+    assert deactivated.json()["status"] == "inactive"
+
+def test_gateway_edge_auth_rejects_token_after_logout_through_gateway(monkeypatch):
+    monkeypatch.setattr(
+        gateway_main._edge_auth,
+        "verifier",
+        EdgeTokenVerifier(
+            secret_key=os.environ["AUTH_JWT_SECRET"],
+            revocations=RevocationCache(),
+        ),
+    )
+    monkeypatch.setattr(gateway_main._edge_auth, "enabled", True)
+    gateway_client = TestClient(gateway_main.app)
+    prof_tokens = _gateway_login(gateway_client, "profissional", "prof123")
+    auth_header = {"Authorization": f"Bearer {prof_tokens['access_token']}"}
+
+    assert gateway_client.get("/api/v1/patients", headers=auth_header).status_code == 200
+    assert gateway_client.delete("/api/v1/patients/p-1", headers=auth_header).status_code == 403
+
+    logout = gateway_client.post(
+        "/api/v1/auth/logout",
+        json={"refresh_token": prof_tokens["refresh_token"]},
+        headers=auth_header,
+    )
+    assert logout.status_code == 200
+
+    revoked = gateway_client.get("/api/v1/patients", headers=auth_header)
+    assert revoked.status_code == 401
+    assert revoked.json() == {"detail": "access token revoked"}
+
+
+def test_gateway_patient_chart_composes_all_sections():
+    gateway_client = TestClient(gateway_main.app)
+    prof_tokens = _gateway_login(gateway_client, "profissional", "prof123")
+    auth_header = {"Authorization": f"Bearer {prof_tokens['access_token']}"}
+
+    create_patient = gateway_client.post(
+        "/api/v1/patients",
+        json={
+            "name": "Paciente Prontuario",
+            "cpf": "77777777777",
+            "date_of_birth": "1988-02-20",
+            "gender": "M",
+        },
+        headers=auth_header,
+    )
+    assert create_patient.status_code == 201
+    patient_id = create_patient.json()["id"]
+
+    for appointment_patient_id in (patient_id, "outro-paciente"):
+        create_appointment = gateway_client.post(
+            "/api/v1/scheduling/appointments",
+            json={
+                "patient_id": appointment_patient_id,
+                "professional_id": "professional-gw-chart-1",
+                "scheduled_at": "2026-04-11T10:00:00Z",
+                "reason": "Retorno",
+            },
+            headers=auth_header,
+        )
+        assert create_appointment.status_code == 201
+
+    chart = gateway_client.get(f"/api/v1/patients/{patient_id}/chart", headers=auth_header)
+
+    assert chart.status_code == 200
+    body = chart.json()
+    assert body["partial"] is False
+    assert body["sections"]["patient"]["data"]["id"] == patient_id
+    assert body["sections"]["consents"]["status"] == "ok"
+    assert body["sections"]["timeline"]["status"] == "ok"
+    appointments = body["sections"]["appointments"]["data"]
+    assert [item["patient_id"] for item in appointments] == [patient_id]
+
+    missing = gateway_client.get("/api/v1/patients/nao-existe/chart", headers=auth_header)
+    assert missing.status_code == 404
@@ -0,0 +1,132 @@
+import asyncio
+
+import httpx
+from fastapi.testclient import TestClient
+
+from src.gateway.infra.api import main as gateway_main
+from src.gateway.infra.auth.edge_token_verifier import EdgeTokenVerifier, RevocationCache
+from src.gateway.infra.metrics.gateway_metrics import REGISTRY, DownstreamMetrics
+from src.gateway.infra.proxy.circuit_breaker import CircuitBreaker, CircuitBreakerSettings
+from src.gateway.infra.proxy.http_service_proxy import HttpServiceProxy
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_metrics_endpoint_exposes_route_and_downstream_series(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"id": "p-1"})
+
+    monkeypatch.setattr(
+        gateway_main,
+        "_emr_proxy",
+        HttpServiceProxy(
+            base_url="http://emr-service",
+            transport=httpx.MockTransport(handler),
+            name="emr-service",
+        ),
+    )
+    route_labels = {"method": "GET", "route": "/api/v1/emr/soap/{soap_id}", "status": "200"}
+    requests_before = _sample("gateway_http_requests_total", **route_labels)
+    downstream_before = _sample(
+        "gateway_downstream_request_duration_seconds_count",
+        downstream="emr-service",
+    )
+    client = TestClient(gateway_main.app)
+
+    assert client.get("/api/v1/emr/soap/s-1").status_code == 200
+    assert client.get("/api/v1/emr/soap/s-2").status_code == 200
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert _sample("gateway_http_requests_total", **route_labels) == requests_before + 2
+    assert _sample(
+        "gateway_downstream_request_duration_seconds_count",
+        downstream="emr-service",
+    ) == downstream_before + 2
+    assert "gateway_http_request_duration_seconds_bucket" in response.text
+    assert 'gateway_circuit_state{downstream="emr-service",state="closed"} 1.0' in response.text
+    assert "gateway_cache_hits_total" in response.text
+    assert "gateway_coalescing_collapsed_total" in response.text
+
+
+def test_unmatched_paths_share_one_route_label():
+    before = _sample("gateway_http_requests_total", method="GET", route="unmatched", status="404")
+    client = TestClient(gateway_main.app)
+
+    client.get("/nao/existe/1")
+    client.get("/nao/existe/2")
+
+    after = _sample("gateway_http_requests_total", method="GET", route="unmatched", status="404")
+    assert after == before + 2
+
+
+def test_unavailable_answers_are_counted_by_cause():
+    def connect_error(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    def timeout(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("downstream hung", request=request)
+
+    proxy_connect = HttpServiceProxy(
+        base_url="http://metrics-connect",
+        transport=httpx.MockTransport(connect_error),
+        breaker=CircuitBreaker(CircuitBreakerSettings(minimum_requests=1)),
+    )
+    proxy_timeout = HttpServiceProxy(
+        base_url="http://metrics-timeout",
+        transport=httpx.MockTransport(timeout),
+    )
+
+    async def scenario() -> None:
+        await proxy_connect.request("GET", "/x")
+        await proxy_connect.request("GET", "/x")
+        await proxy_timeout.request("GET", "/x")
+
+    asyncio.run(scenario())
+
+    counter = "gateway_downstream_unavailable_total"
+    assert _sample(counter, downstream="metrics-connect", cause="connect_error") == 1
+    assert _sample(counter, downstream="metrics-connect", cause="circuit_open") == 1
+    assert _sample(counter, downstream="metrics-timeout", cause="timeout") == 1
+    assert _sample("gateway_downstream_in_flight", downstream="metrics-connect") == 0
+
+
+def test_connect_trace_observes_only_new_connections():
+    metrics = DownstreamMetrics("metrics-trace")
+    before = _sample("gateway_downstream_connect_duration_seconds_count", downstream="metrics-trace")
+
+    async def scenario() -> None:
+        new_connection = metrics.connect_trace()
+        await new_connection("connection.connect_tcp.started", {})
+        await new_connection("connection.connect_tcp.complete", {})
+        await new_connection("http11.send_request_headers.started", {})
+
+        pooled_connection = metrics.connect_trace()
+        await pooled_connection("http11.send_request_headers.started", {})
+
+    asyncio.run(scenario())
+
+    after = _sample("gateway_downstream_connect_duration_seconds_count", downstream="metrics-trace")
+    assert after == before + 1
+
+
+def test_stale_revocation_list_is_exported(monkeypatch):
+    async def feed_down() -> list[tuple[str, float]]:
+        raise ValueError("revocation feed unavailable")
+
+    revocations = RevocationCache(fetcher=feed_down)
+    assert asyncio.run(revocations.refresh()) is False
+    monkeypatch.setattr(
+        gateway_main._edge_auth,
+        "verifier",
+        EdgeTokenVerifier(secret_key="metrics-secret", revocations=revocations),
+    )
+    monkeypatch.setattr(gateway_main._edge_auth, "enabled", True)
+
+    TestClient(gateway_main.app).get("/metrics")
+
+    assert _sample("gateway_revocations_stale") == 1.0
+    assert _sample("gateway_revocations_refresh_failures_total") == 1.0
@@ -0,0 +1,88 @@
+import httpx
+from fastapi.testclient import TestClient
+
+from src.gateway.infra.api import main as gateway_main
+from src.gateway.infra.proxy.http_service_proxy import HttpServiceProxy
+
+
+def _capturing_proxy(captured: list[httpx.Request]) -> HttpServiceProxy:
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.append(request)
+        return httpx.Response(422, json={"detail": "validated downstream"})
+
+    return HttpServiceProxy(
+        base_url="http://patient-service",
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def test_raw_mode_forwards_request_bytes_without_gateway_validation(monkeypatch):
+    captured: list[httpx.Request] = []
+    monkeypatch.setattr(gateway_main, "_patient_proxy", _capturing_proxy(captured))
+    monkeypatch.setattr(gateway_main._raw_body_policy, "enabled", True)
+    client = TestClient(gateway_main.app)
+
+    raw_body = b'{"name": "Paciente Raw", "unexpected": 1}'
+    response = client.post(
+        "/api/v1/patients",
+        content=raw_body,
+        headers={"Content-Type": "application/json", "Authorization": "Bearer token"},
+    )
+
+    assert response.status_code == 422
+    assert response.json() == {"detail": "validated downstream"}
+    assert captured[0].content == raw_body
+    assert captured[0].headers["Authorization"] == "Bearer token"
+
+
+def test_validated_mode_still_rejects_invalid_body_at_gateway(monkeypatch):
+    captured: list[httpx.Request] = []
+    monkeypatch.setattr(gateway_main, "_patient_proxy", _capturing_proxy(captured))
+    monkeypatch.setattr(gateway_main._raw_body_policy, "enabled", False)
+    client = TestClient(gateway_main.app)
+
+    response = client.post("/api/v1/patients", json={"name": "Paciente Incompleto"})
+
+    assert response.status_code == 422
+    assert captured == []
+
+
+def test_raw_mode_checks_content_type_and_size(monkeypatch):
+    captured: list[httpx.Request] = []
+    monkeypatch.setattr(gateway_main, "_patient_proxy", _capturing_proxy(captured))
+    monkeypatch.setattr(gateway_main._raw_body_policy, "enabled", True)
+    monkeypatch.setattr(gateway_main._raw_body_policy, "max_body_bytes", 16)
+    client = TestClient(gateway_main.app)
+
+    wrong_type = client.post(
+        "/api/v1/patients",
+        content=b"name=x",
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    too_large = client.post(
+        "/api/v1/patients",
+        content=b'{"name": "' + b"x" * 64 + b'"}',
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert wrong_type.status_code == 415
+    assert too_large.status_code == 413
+    assert captured == []
+
+
+def test_openapi_schema_is_identical_in_both_forwarding_modes(monkeypatch):
+    client = TestClient(gateway_main.app)
+
+    monkeypatch.setattr(gateway_main._raw_body_policy, "enabled", False)
+    gateway_main.app.openapi_schema = None
+    validated_spec = client.get("/openapi.json").json()
+
+    monkeypatch.setattr(gateway_main._raw_body_policy, "enabled", True)
+    gateway_main.app.openapi_schema = None
+    raw_spec = client.get("/openapi.json").json()
+
+    assert raw_spec == validated_spec
+    request_body = raw_spec["paths"]["/api/v1/patients"]["post"]["requestBody"]
+    assert request_body["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/PatientPayload"
+    }
@@ -0,0 +1,315 @@
+import asyncio
+
+import httpx
+
+from src.gateway.infra.metrics.gateway_metrics import REGISTRY
+from src.gateway.infra.proxy.circuit_breaker import (
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerSettings,
+)
+from src.gateway.infra.proxy.http_service_proxy import HttpServiceProxy, ProxyPoolSettings
+
+
+def test_proxy_reuses_single_pooled_client_across_requests():
+    seen_paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_paths.append(request.url.path)
+        return httpx.Response(200, json={"ok": True})
+
+    proxy = HttpServiceProxy(
+        base_url="http://patient-service/",
+        transport=httpx.MockTransport(handler),
+    )
+    first_client = proxy._client
+
+    async def scenario() -> None:
+        assert await proxy.request("GET", "/api/v1/patients") == (200, {"ok": True})
+        assert await proxy.request("GET", "/api/v1/patients/p-1") == (200, {"ok": True})
+        await proxy.aclose()
+
+    asyncio.run(scenario())
+
+    assert proxy._client is first_client
+    assert seen_paths == ["/api/v1/patients", "/api/v1/patients/p-1"]
+    assert first_client.is_closed
+
+
+def test_proxy_returns_503_when_downstream_is_unreachable():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    proxy = HttpServiceProxy(
+        base_url="http://emr-service",
+        transport=httpx.MockTransport(handler),
+    )
+
+    status_code, body = asyncio.run(proxy.request("GET", "/api/v1/emr/timeline"))
+
+    assert status_code == 503
+    assert body == {"detail": "downstream service unavailable"}
+
+
+def test_pool_settings_prefer_downstream_override_over_gateway_default(monkeypatch):
+    monkeypatch.setenv("GATEWAY_PROXY_MAX_CONNECTIONS", "50")
+    monkeypatch.setenv("GATEWAY_PROXY_READ_TIMEOUT_SECONDS", "4")
+    monkeypatch.setenv("EMR_SERVICE_READ_TIMEOUT_SECONDS", "1.5")
+
+    settings = ProxyPoolSettings.from_env("EMR_SERVICE")
+
+    assert settings.max_connections == 50
+    assert settings.read_timeout_seconds == 1.5
+    assert settings.keepalive_expiry_seconds == ProxyPoolSettings().keepalive_expiry_seconds
+    assert settings.to_timeout().read == 1.5
+
+
+def test_proxy_caps_concurrent_downstream_calls_per_downstream():
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"ok": True})
+
+    proxy = HttpServiceProxy(
+        base_url="http://audit-service",
+        settings=ProxyPoolSettings(max_concurrency=3, pool_timeout_seconds=5.0),
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def scenario() -> list[tuple[int, object]]:
+        return await asyncio.gather(
+            *(proxy.request("GET", "/api/v1/audit/events") for _ in range(12))
+        )
+
+    results = asyncio.run(scenario())
+
+    assert all(status_code == 200 for status_code, _ in results)
+    assert peak_in_flight == 3
+
+
+def test_proxy_returns_503_when_concurrency_slot_wait_times_out():
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={"ok": True})
+
+    proxy = HttpServiceProxy(
+        base_url="http://emr-service",
+        settings=ProxyPoolSettings(max_concurrency=1, pool_timeout_seconds=0.05),
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def scenario() -> tuple[tuple[int, object], tuple[int, object]]:
+        slow = asyncio.create_task(proxy.request("GET", "/api/v1/emr/timeline"))
+        await asyncio.sleep(0)
+        rejected = await proxy.request("GET", "/api/v1/emr/timeline")
+        release.set()
+        return await slow, rejected
+
+    slow_result, rejected_result = asyncio.run(scenario())
+
+    assert slow_result[0] == 200
+    assert rejected_result == (503, {"detail": "downstream service unavailable"})
+
+
+class _ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, chunks: list[bytes]):
+        self._chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+def test_stream_relays_raw_downstream_bytes_and_selected_headers():
+    chunks = [b'{"events": [', b'{"id": "e-1"}', b"]}"]
+    raw_body = b"".join(chunks)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            stream=_ChunkedStream(chunks),
+            headers={
+                "Content-Type": "application/json",
+                "ETag": '"v1"',
+                "X-Internal-Debug": "hidden",
+            },
+        )
+
+    proxy = HttpServiceProxy(
+        base_url="http://emr-service",
+        settings=ProxyPoolSettings(max_concurrency=1, pool_timeout_seconds=0.05),
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def scenario() -> tuple[int, dict[str, str], bytes, int]:
+        stream = await proxy.stream("GET", "/api/v1/emr/timeline")
+        body = b"".join([chunk async for chunk in stream.chunks])
+        await stream.aclose()
+        follow_up_status, _ = await proxy.request("GET", "/api/v1/emr/timeline")
+        return stream.status_code, stream.headers, body, follow_up_status
+
+    status_code, headers, body, follow_up_status = asyncio.run(scenario())
+
+    assert status_code == 200
+    assert body == raw_body
+    assert headers["etag"] == '"v1"'
+    assert "x-internal-debug" not in headers
+    assert follow_up_status == 200
+
+
+def test_stream_returns_503_body_when_downstream_is_unreachable():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    proxy = HttpServiceProxy(
+        base_url="http://audit-service",
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def scenario() -> tuple[int, bytes]:
+        stream = await proxy.stream("GET", "/api/v1/audit/events")
+        body = b"".join([chunk async for chunk in stream.chunks])
+        await stream.aclose()
+        return stream.status_code, body
+
+    status_code, body = asyncio.run(scenario())
+
+    assert status_code == 503
+    assert body == b'{"detail": "downstream service unavailable"}'
+
+
+class _BrokenStream(httpx.AsyncByteStream):
+    def __init__(self, first_chunk: bytes):
+        self._first_chunk = first_chunk
+
+    async def __aiter__(self):
+        yield self._first_chunk
+        raise httpx.ReadTimeout("downstream stalled mid-body")
+
+
+def test_stream_failing_mid_body_releases_slot_and_counts_as_failure():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=_BrokenStream(b'{"events": ['))
+
+    proxy = HttpServiceProxy(
+        base_url="http://emr-service",
+        settings=ProxyPoolSettings(max_concurrency=1, pool_timeout_seconds=0.05),
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def scenario() -> list[bytes]:
+        received = []
+        for _ in range(3):
+            stream = await proxy.stream("GET", "/api/v1/emr/timeline")
+            assert stream.status_code == 200
+            try:
+                async for chunk in stream.chunks:
+                    received.append(chunk)
+            except httpx.ReadTimeout:
+                pass
+        return received
+
+    received = asyncio.run(scenario())
+
+    assert received == [b'{"events": ['] * 3
+    assert proxy.bulkhead.in_flight == 0
+    breaker = proxy.breaker.snapshot()
+    assert breaker["failures_total"] == 3
+    assert breaker["window_requests"] == 3
+    assert breaker["failure_rate"] == 1.0
+
+
+def test_half_open_probe_broken_mid_body_reopens_the_circuit():
+    clock = {"now": 0.0}
+    breaker = CircuitBreaker(
+        CircuitBreakerSettings(minimum_requests=2, open_seconds=5.0),
+        clock=lambda: clock["now"],
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/down":
+            return httpx.Response(503, json={})
+        return httpx.Response(200, stream=_BrokenStream(b'{"events": ['))
+
+    proxy = HttpServiceProxy(
+        base_url="http://emr-service",
+        transport=httpx.MockTransport(handler),
+        breaker=breaker,
+    )
+
+    async def scenario() -> None:
+        for _ in range(2):
+            assert (await proxy.request("GET", "/down"))[0] == 503
+        assert breaker.state == OPEN
+        clock["now"] = 10.0
+        assert breaker.state == HALF_OPEN
+
+        stream = await proxy.stream("GET", "/api/v1/emr/timeline")
+        assert stream.status_code == 200
+        try:
+            async for _ in stream.chunks:
+                pass
+        except httpx.ReadTimeout:
+            pass
+
+    asyncio.run(scenario())
+
+    assert breaker.state == OPEN
+    assert breaker.snapshot()["opened_total"] == 2
+
+
+def test_stream_closed_by_the_caller_records_the_head_once():
+    proxy = HttpServiceProxy(
+        base_url="http://emr-service",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, stream=_BrokenStream(b'{"events": ['))
+        ),
+    )
+
+    async def scenario() -> None:
+        stream = await proxy.stream("GET", "/api/v1/emr/timeline")
+        await stream.aclose()
+        await stream.aclose()
+
+    asyncio.run(scenario())
+
+    assert proxy.bulkhead.in_flight == 0
+    assert proxy.breaker.snapshot()["window_requests"] == 1
+    assert proxy.breaker.snapshot()["failures_total"] == 0
+
+
+def test_slot_is_released_when_the_request_cannot_be_built():
+    proxy = HttpServiceProxy(
+        base_url="http://emr-service",
+        settings=ProxyPoolSettings(max_concurrency=1, pool_timeout_seconds=0.05),
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+        name="unbuildable-requests",
+    )
+    bad_header = {"X-Note": "não-ascii"}
+
+    async def scenario() -> None:
+        for call in (proxy.request, proxy.stream):
+            try:
+                await call("GET", "/api/v1/emr/timeline", extra_headers=bad_header)
+            except UnicodeEncodeError:
+                pass
+            else:
+                raise AssertionError("expected the request build to fail")
+        assert await proxy.request("GET", "/api/v1/emr/timeline") == (200, {})
+
+    asyncio.run(scenario())
+
+    assert proxy.bulkhead.in_flight == 0
+    assert REGISTRY.get_sample_value(
+        "gateway_downstream_in_flight",
+        {"downstream": "unbuildable-requests"},
+    ) == 0
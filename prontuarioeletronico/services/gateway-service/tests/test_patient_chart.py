@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+import httpx
+
+from src.gateway.infra.api import main as gateway_main
+from src.gateway.infra.proxy.http_service_proxy import HttpServiceProxy
+
+
+def _delayed_proxy(base_url: str, delay_seconds: float, responses: dict) -> HttpServiceProxy:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(delay_seconds)
+        status_code, body = responses[request.url.path]
+        return httpx.Response(status_code, json=body)
+
+    return HttpServiceProxy(base_url=base_url, transport=httpx.MockTransport(handler))
+
+
+def _install_downstreams(monkeypatch, delay_seconds: float, timeline_delay: float | None = None):
+    monkeypatch.setattr(
+        gateway_main,
+        "_patient_proxy",
+        _delayed_proxy(
+            "http://patient-service",
+            delay_seconds,
+            {
+                "/api/v1/patients/p-1": (200, {"id": "p-1", "name": "Paciente"}),
+                "/api/v1/patients/p-1/consents": (200, []),
+                "/api/v1/patients/p-404": (404, {"detail": "patient not found"}),
+                "/api/v1/patients/p-404/consents": (404, {"detail": "patient not found"}),
+            },
+        ),
+    )
+    monkeypatch.setattr(
+        gateway_main,
+        "_emr_proxy",
+        _delayed_proxy(
+            "http://emr-service",
+            delay_seconds if timeline_delay is None else timeline_delay,
+            {"/api/v1/emr/timeline": (200, {"patient_id": "p-1", "items": []})},
+        ),
+    )
+    monkeypatch.setattr(
+        gateway_main,
+        "_scheduling_proxy",
+        _delayed_proxy(
+            "http://scheduling-service",
+            delay_seconds,
+            {
+                "/api/v1/scheduling/appointments": (
+                    200,
+                    [{"id": "a-1", "patient_id": "p-1"}, {"id": "a-2", "patient_id": "p-2"}],
+                )
+            },
+        ),
+    )
+
+
+async def _get_chart(patient_id: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=gateway_main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+        return await client.get(
+            f"/api/v1/patients/{patient_id}/chart",
+            headers={"Authorization": "Bearer token"},
+        )
+
+
+def test_chart_sections_are_fetched_concurrently(monkeypatch):
+    _install_downstreams(monkeypatch, delay_seconds=0.2)
+
+    started = time.perf_counter()
+    response = asyncio.run(_get_chart("p-1"))
+    elapsed = time.perf_counter() - started
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["partial"] is False
+    assert body["sections"]["patient"]["data"]["id"] == "p-1"
+    assert body["sections"]["appointments"]["data"] == [{"id": "a-1", "patient_id": "p-1"}]
+    # Four sequential calls would take at least 0.8s.
+    assert elapsed < 0.6
+
+
+def test_chart_returns_partial_result_when_a_section_times_out(monkeypatch):
+    _install_downstreams(monkeypatch, delay_seconds=0.0, timeline_delay=1.0)
+    monkeypatch.setenv("GATEWAY_CHART_TIMELINE_TIMEOUT_SECONDS", "0.05")
+
+    response = asyncio.run(_get_chart("p-1"))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["partial"] is True
+    assert body["sections"]["timeline"]["status"] == "timeout"
+    assert body["sections"]["patient"]["status"] == "ok"
+    assert body["sections"]["appointments"]["status"] == "ok"
+
+
+def test_chart_propagates_patient_client_errors(monkeypatch):
+    _install_downstreams(monkeypatch, delay_seconds=0.0)
+
+    response = asyncio.run(_get_chart("p-404"))
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "patient not found"}
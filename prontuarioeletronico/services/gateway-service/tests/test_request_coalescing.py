@@ -0,0 +1,100 @@
+import asyncio
+
+import httpx
+
+from src.gateway.infra.api import main as gateway_main
+from src.gateway.infra.proxy.http_service_proxy import HttpServiceProxy
+from src.gateway.infra.proxy.request_coalescer import BufferedResponse, RequestCoalescer
+
+
+def _slow_proxy(calls: list[httpx.Request], base_url: str) -> HttpServiceProxy:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"items": [request.url.path, str(request.url.query)]})
+
+    return HttpServiceProxy(base_url=base_url, transport=httpx.MockTransport(handler))
+
+
+async def _burst(requests: list[tuple[str, dict]]) -> list[httpx.Response]:
+    transport = httpx.ASGITransport(app=gateway_main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+        return await asyncio.gather(
+            *(client.get(path, headers=headers) for path, headers in requests)
+        )
+
+
+def test_identical_concurrent_gets_share_one_downstream_call(monkeypatch):
+    calls: list[httpx.Request] = []
+    monkeypatch.setattr(
+        gateway_main,
+        "_professional_proxy",
+        _slow_proxy(calls, "http://professional-service"),
+    )
+    monkeypatch.setattr(gateway_main, "_coalescer", RequestCoalescer(gateway_main._COALESCED_ROUTES))
+    headers = {"Authorization": "Bearer token-recepcao"}
+
+    responses = asyncio.run(_burst([("/api/v1/professionals", headers)] * 10))
+
+    assert len(calls) == 1
+    assert {response.status_code for response in responses} == {200}
+    assert all(response.content == responses[0].content for response in responses)
+    snapshot = gateway_main._coalescer.snapshot()
+    assert snapshot["requests_total"] == 10
+    assert snapshot["downstream_calls_total"] == 1
+    assert snapshot["collapsed_total"] == 9
+    assert snapshot["in_flight"] == 0
+
+
+def test_coalescing_is_scoped_by_query_and_authorization(monkeypatch):
+    calls: list[httpx.Request] = []
+    monkeypatch.setattr(
+        gateway_main,
+        "_professional_proxy",
+        _slow_proxy(calls, "http://professional-service"),
+    )
+    monkeypatch.setattr(gateway_main, "_coalescer", RequestCoalescer(gateway_main._COALESCED_ROUTES))
+
+    asyncio.run(
+        _burst(
+            [
+                ("/api/v1/professionals", {"Authorization": "Bearer token-a"}),
+                ("/api/v1/professionals", {"Authorization": "Bearer token-b"}),
+                ("/api/v1/professionals?status=ativo", {"Authorization": "Bearer token-a"}),
+                ("/api/v1/professionals?status=ativo", {"Authorization": "Bearer token-a"}),
+            ]
+        )
+    )
+
+    assert len(calls) == 3
+    assert {call.headers["Authorization"] for call in calls} == {"Bearer token-a", "Bearer token-b"}
+
+
+def test_routes_without_opt_in_are_not_coalesced(monkeypatch):
+    calls: list[httpx.Request] = []
+    monkeypatch.setattr(gateway_main, "_patient_proxy", _slow_proxy(calls, "http://patient-service"))
+    monkeypatch.setattr(gateway_main, "_coalescer", RequestCoalescer(gateway_main._COALESCED_ROUTES))
+
+    asyncio.run(_burst([("/api/v1/patients", {"Authorization": "Bearer token"})] * 3))
+
+    assert len(calls) == 3
+    assert gateway_main._coalescer.snapshot()["requests_total"] == 0
+
+
+def test_leader_cancellation_does_not_fail_other_waiters():
+    coalescer = RequestCoalescer(("/api/v1/professionals",))
+    key = coalescer.key_for("GET", "/api/v1/professionals", None, "Bearer token")
+
+    async def call() -> BufferedResponse:
+        await asyncio.sleep(0.05)
+        return BufferedResponse(status_code=200, headers={}, body=b"[]")
+
+    async def scenario() -> BufferedResponse:
+        leader = asyncio.ensure_future(coalescer.run(key, call))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(coalescer.run(key, call))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(scenario()).body == b"[]"
@@ -0,0 +1,235 @@
+import time
+
+import httpx
+import jwt
+import pytest
+from fastapi.testclient import TestClient
+
+from src.gateway.infra.api import main as gateway_main
+from src.gateway.infra.auth.edge_token_verifier import EdgeTokenVerifier, RevocationCache
+from src.gateway.infra.cache.response_cache import CachedResponse, ResponseCache
+from src.gateway.infra.proxy.http_service_proxy import HttpServiceProxy
+
+
+EDGE_SECRET = "cache-test-secret"
+
+
+def _bearer(name: str, role: str = "profissional", expires_in: int = 300) -> dict:
+    now = int(time.time())
+    token = jwt.encode(
+        {
+            "sub": f"u-{name}",
+            "role": role,
+            "type": "access",
+            "jti": f"jti-{name}",
+            "iat": now,
+            "exp": now + expires_in,
+        },
+        EDGE_SECRET,
+        algorithm="HS256",
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def professional_calls(monkeypatch):
+    calls: list[httpx.Request] = []
+    state = {"status": "ativo"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.method == "POST" and request.url.path.endswith("/deactivate"):
+            state["status"] = "inativo"
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, json={"detail": "professional not found"})
+        return httpx.Response(200, json={"id": "prof-1", "status": state["status"]})
+
+    monkeypatch.setattr(
+        gateway_main,
+        "_professional_proxy",
+        HttpServiceProxy(
+            base_url="http://professional-service",
+            transport=httpx.MockTransport(handler),
+        ),
+    )
+    monkeypatch.setattr(
+        gateway_main._edge_auth,
+        "verifier",
+        EdgeTokenVerifier(secret_key=EDGE_SECRET, revocations=RevocationCache()),
+    )
+    monkeypatch.setattr(gateway_main._edge_auth, "enabled", True)
+    gateway_main._response_cache.clear()
+    yield calls
+    gateway_main._response_cache.clear()
+
+
+@pytest.fixture
+def client(professional_calls) -> TestClient:
+    return TestClient(gateway_main.app)
+
+
+def test_repeated_get_is_served_from_cache_with_etag(client, professional_calls):
+    headers = _bearer("a")
+
+    first = client.get("/api/v1/professionals/prof-1", headers=headers)
+    second = client.get("/api/v1/professionals/prof-1", headers=headers)
+
+    assert first.status_code == 200
+    assert second.json() == first.json()
+    assert second.headers["etag"] == first.headers["etag"]
+    assert len(professional_calls) == 1
+
+
+def test_if_none_match_returns_304_without_body(client, professional_calls):
+    headers = _bearer("a")
+    etag = client.get("/api/v1/professionals/prof-1", headers=headers).headers["etag"]
+
+    response = client.get(
+        "/api/v1/professionals/prof-1",
+        headers={**headers, "If-None-Match": etag},
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert len(professional_calls) == 1
+
+
+def test_cache_is_scoped_by_authorization(client, professional_calls):
+    token_a, token_b = _bearer("a"), _bearer("b")
+    client.get("/api/v1/professionals/prof-1", headers=token_a)
+    client.get("/api/v1/professionals/prof-1", headers=token_b)
+
+    assert [call.headers["Authorization"] for call in professional_calls] == [
+        token_a["Authorization"],
+        token_b["Authorization"],
+    ]
+
+
+def test_write_through_gateway_invalidates_cached_resource(client, professional_calls):
+    headers = _bearer("admin", role="admin")
+    before = client.get("/api/v1/professionals/prof-1", headers=headers)
+
+    client.post("/api/v1/professionals/prof-1/deactivate", headers=headers)
+    after = client.get("/api/v1/professionals/prof-1", headers=headers)
+
+    assert before.json()["status"] == "ativo"
+    assert after.json()["status"] == "inativo"
+    assert after.headers["etag"] != before.headers["etag"]
+    assert len(professional_calls) == 3
+
+
+def test_error_responses_are_not_cached(client, professional_calls):
+    headers = _bearer("a")
+
+    client.get("/api/v1/professionals/missing", headers=headers)
+    response = client.get("/api/v1/professionals/missing", headers=headers)
+
+    assert response.status_code == 404
+    assert len(professional_calls) == 2
+
+
+def test_cached_hit_is_refused_after_logout(client, professional_calls, monkeypatch):
+    def auth_handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"message": "logged out"})
+
+    monkeypatch.setattr(
+        gateway_main,
+        "_auth_proxy",
+        HttpServiceProxy(base_url="http://auth-service", transport=httpx.MockTransport(auth_handler)),
+    )
+    headers = _bearer("a")
+    assert client.get("/api/v1/professionals/prof-1", headers=headers).status_code == 200
+    assert client.get("/api/v1/professionals/prof-1", headers=headers).status_code == 200
+    hits = gateway_main._response_cache.snapshot()["hits_total"]
+
+    logout = client.post("/api/v1/auth/logout", json={"refresh_token": "r"}, headers=headers)
+    after = client.get("/api/v1/professionals/prof-1", headers=headers)
+
+    assert logout.status_code == 200
+    assert after.status_code == 401
+    assert after.json() == {"detail": "access token revoked"}
+    assert gateway_main._response_cache.snapshot()["hits_total"] == hits
+    assert len(professional_calls) == 1
+
+
+def test_nothing_is_cached_without_edge_auth(client, professional_calls, monkeypatch):
+    monkeypatch.setattr(gateway_main._edge_auth, "enabled", False)
+    headers = _bearer("a")
+
+    client.get("/api/v1/professionals/prof-1", headers=headers)
+    client.get("/api/v1/professionals/prof-1", headers=headers)
+
+    assert len(professional_calls) == 2
+    assert gateway_main._response_cache.snapshot()["entries"] == 0
+
+
+def test_stale_revocation_list_bypasses_the_cache(client, professional_calls, monkeypatch):
+    async def feed_down() -> list[tuple[str, float]]:
+        raise ValueError("revocation feed unavailable")
+
+    monkeypatch.setattr(
+        gateway_main._edge_auth,
+        "verifier",
+        EdgeTokenVerifier(secret_key=EDGE_SECRET, revocations=RevocationCache(fetcher=feed_down)),
+    )
+    headers = _bearer("a")
+
+    client.get("/api/v1/professionals/prof-1", headers=headers)
+    client.get("/api/v1/professionals/prof-1", headers=headers)
+
+    assert len(professional_calls) == 2
+    assert gateway_main._response_cache.snapshot()["refused_total"] == 2
+
+
+def test_entry_lives_no_longer_than_the_token(client, professional_calls):
+    headers = _bearer("a", expires_in=5)
+
+    client.get("/api/v1/professionals/prof-1", headers=headers)
+
+    (entry,) = gateway_main._response_cache._entries.values()
+    assert entry.expires_at - time.monotonic() <= 5
+
+
+def _entry(path: str, expires_at: float) -> CachedResponse:
+    return CachedResponse(
+        path=path,
+        status_code=200,
+        headers=[],
+        body=b"{}",
+        etag='"e"',
+        expires_at=expires_at,
+    )
+
+
+def test_cache_expires_entries_and_evicts_least_recently_used():
+    now = {"value": 100.0}
+    cache = ResponseCache(
+        {"/api/v1/patients/{patient_id}": 30.0},
+        max_entries=2,
+        clock=lambda: now["value"],
+    )
+    keys = [cache.key_for(f"/api/v1/patients/p-{index}", b"", "Bearer t") for index in range(3)]
+
+    cache.put(keys[0], _entry("/api/v1/patients/p-0", 130.0), cache.generation)
+    cache.put(keys[1], _entry("/api/v1/patients/p-1", 130.0), cache.generation)
+    assert cache.get(keys[0]) is not None
+    cache.put(keys[2], _entry("/api/v1/patients/p-2", 130.0), cache.generation)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+
+    now["value"] = 130.0
+    assert cache.get(keys[0]) is None
+    assert cache.snapshot()["evictions_total"] == 1
+
+
+def test_cache_skips_store_when_a_write_happened_during_the_read():
+    cache = ResponseCache({"/api/v1/patients/{patient_id}": 30.0})
+    key = cache.key_for("/api/v1/patients/p-1", b"", "Bearer t")
+    generation = cache.generation
+
+    cache.invalidate("/api/v1/patients/p-1")
+    cache.put(key, _entry("/api/v1/patients/p-1", float("inf")), generation)
+
+    assert cache.get(key) is None
@@ -0,0 +1,184 @@
+import gzip
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from src.gateway.infra.api import main as gateway_main
+from src.gateway.infra.compression.response_compression import (
+    ResponseCompression,
+    ResponseCompressionMiddleware,
+)
+from src.gateway.infra.proxy.http_service_proxy import HttpServiceProxy
+
+LARGE_BODY = json.dumps({"items": [{"id": f"evt-{index}"} for index in range(200)]}).encode()
+
+
+def _app(compression: ResponseCompression) -> Starlette:
+    async def large(request):
+        return Response(LARGE_BODY, media_type="application/json", headers={"etag": '"v1"'})
+
+    async def small(request):
+        return Response(b'{"ok": true}', media_type="application/json")
+
+    async def streamed(request):
+        async def chunks():
+            for start in range(0, len(LARGE_BODY), 512):
+                yield LARGE_BODY[start : start + 512]
+
+        return StreamingResponse(chunks(), media_type="application/json")
+
+    async def precompressed(request):
+        return Response(
+            gzip.compress(LARGE_BODY),
+            media_type="application/json",
+            headers={"content-encoding": "gzip"},
+        )
+
+    async def binary(request):
+        return Response(b"\x00" * 4096, media_type="application/octet-stream")
+
+    app = Starlette(
+        routes=[
+            Route("/large", large),
+            Route("/small", small),
+            Route("/streamed", streamed),
+            Route("/precompressed", precompressed),
+            Route("/binary", binary),
+            Route("/reports/{report_id}", large),
+        ]
+    )
+    app.add_middleware(ResponseCompressionMiddleware, compression=compression)
+    return app
+
+
+def _raw(app: Starlette, path: str, accept_encoding: str) -> tuple[httpx.Response, bytes]:
+    with TestClient(app) as client:
+        with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+            return response, b"".join(response.iter_raw())
+
+
+def test_gzip_is_negotiated_for_large_json_bodies():
+    compression = ResponseCompression(route_levels={}, encodings=("gzip",))
+    response, body = _raw(_app(compression), "/large", "gzip, deflate")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(body)
+    assert gzip.decompress(body) == LARGE_BODY
+    assert response.headers["etag"] == 'W/"v1"'
+    assert compression.snapshot()["compressed_total"] == {"gzip": 1}
+
+
+def test_bodies_below_threshold_are_sent_uncompressed():
+    compression = ResponseCompression(route_levels={}, encodings=("gzip",))
+    response, body = _raw(_app(compression), "/small", "gzip")
+
+    assert "content-encoding" not in response.headers
+    assert body == b'{"ok": true}'
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_streamed_bodies_are_compressed_incrementally():
+    compression = ResponseCompression(route_levels={}, encodings=("gzip",))
+    response, body = _raw(_app(compression), "/streamed", "gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(body) == LARGE_BODY
+
+
+def test_already_encoded_bodies_pass_through_untouched():
+    compression = ResponseCompression(route_levels={}, encodings=("gzip",))
+    response, body = _raw(_app(compression), "/precompressed", "gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body) == LARGE_BODY
+    assert compression.snapshot()["compressed_total"] == {}
+
+
+def test_identity_and_non_compressible_types_are_not_encoded():
+    compression = ResponseCompression(route_levels={}, encodings=("gzip",))
+    app = _app(compression)
+
+    identity, identity_body = _raw(app, "/large", "identity")
+    refused, _ = _raw(app, "/large", "gzip;q=0")
+    binary, _ = _raw(app, "/binary", "gzip")
+
+    assert "content-encoding" not in identity.headers
+    assert identity_body == LARGE_BODY
+    assert "content-encoding" not in refused.headers
+    assert "content-encoding" not in binary.headers
+
+
+def test_route_level_overrides_default_and_zero_disables():
+    compression = ResponseCompression(
+        route_levels={"/reports/{report_id}": 0, "/large": 9},
+        default_level=1,
+        encodings=("gzip",),
+    )
+    app = _app(compression)
+
+    disabled, _ = _raw(app, "/reports/r-1", "gzip")
+    _, best = _raw(app, "/large", "gzip")
+
+    assert "content-encoding" not in disabled.headers
+    assert compression.level_for("/large") == 9
+    assert compression.level_for("/streamed") == 1
+    assert len(best) == len(gzip.compress(LARGE_BODY, compresslevel=9))
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip, br, zstd", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("zstd;q=0.8, gzip;q=0.8", "zstd"),
+        ("*", "br"),
+        ("*;q=0.5, br;q=0", "zstd"),
+        ("deflate", None),
+        ("", None),
+    ],
+)
+def test_negotiation_honours_q_values_then_server_preference(accept_encoding, expected):
+    compression = ResponseCompression(route_levels={}, encodings=("br", "zstd", "gzip"))
+
+    assert compression.negotiate(accept_encoding) == expected
+
+
+def test_negotiation_only_offers_installed_encoders():
+    compression = ResponseCompression(route_levels={}, encodings=("gzip",))
+
+    assert compression.negotiate("br, zstd") is None
+    assert compression.negotiate("br, gzip;q=0.1") == "gzip"
+
+
+def test_gateway_compresses_large_downstream_lists(monkeypatch):
+    events = [{"id": f"evt-{index}", "operation": "read"} for index in range(100)]
+    downstream_encodings: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        downstream_encodings.append(request.headers.get("accept-encoding"))
+        return httpx.Response(200, json=events)
+
+    monkeypatch.setattr(
+        gateway_main,
+        "_audit_proxy",
+        HttpServiceProxy(base_url="http://audit-service", transport=httpx.MockTransport(handler)),
+    )
+    client = TestClient(gateway_main.app)
+
+    response = client.get(
+        "/api/v1/audit/events",
+        headers={"Authorization": "Bearer token", "Accept-Encoding": "gzip"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == events
+    assert downstream_encodings == ["identity"]
+    assert gateway_main._response_compression.level_for("/api/v1/audit/events") == 7
@@ -0,0 +1,206 @@
+import asyncio
+import time
+
+import httpx
+from fastapi.testclient import TestClient
+
+from src.gateway.infra.api import main as gateway_main
+from src.gateway.infra.metrics.gateway_metrics import REGISTRY
+from src.gateway.infra.proxy.http_service_proxy import HttpServiceProxy
+from src.gateway.infra.proxy.path_templates import PathTemplateSet
+from src.gateway.infra.proxy.retry_policy import RetryBudget, RetryPolicy
+
+_FAST_RETRIES = RetryPolicy(backoff_base_seconds=0.001, backoff_max_seconds=0.001)
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _admin_headers(monkeypatch) -> dict:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"valid": True, "claims": {"sub": "u-admin", "role": "admin"}})
+
+    monkeypatch.setattr(
+        gateway_main,
+        "_auth_proxy",
+        HttpServiceProxy(base_url="http://auth-service", transport=httpx.MockTransport(handler)),
+    )
+    return {"Authorization": "Bearer admin-token"}
+
+
+def _warm_latencies(proxy: HttpServiceProxy, seconds: float = 0.01) -> None:
+    for _ in range(32):
+        proxy._latencies.observe(seconds)
+
+
+def test_backoff_stays_within_jittered_ceiling():
+    policy = RetryPolicy(backoff_base_seconds=0.1, backoff_max_seconds=0.3)
+
+    assert all(0.0 <= policy.backoff_seconds(1) <= 0.2 for _ in range(50))
+    assert all(0.0 <= policy.backoff_seconds(5) <= 0.3 for _ in range(50))
+
+
+def test_retry_budget_tracks_ratio_and_refills_over_time():
+    now = {"value": 0.0}
+    budget = RetryBudget(ratio=0.5, min_per_second=1.0, max_balance=2.0, clock=lambda: now["value"])
+
+    assert budget.try_spend() and budget.try_spend()
+    assert not budget.try_spend()
+    budget.deposit()
+    budget.deposit()
+    assert budget.try_spend()
+    now["value"] = 1.0
+    assert budget.try_spend()
+    assert budget.snapshot()["spent_total"] == 4
+    assert budget.snapshot()["exhausted_total"] == 1
+
+
+def test_connect_errors_on_get_are_retried():
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if len(calls) < 3:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"ok": True})
+
+    proxy = HttpServiceProxy(
+        base_url="http://retry-get",
+        transport=httpx.MockTransport(handler),
+        name="retry-get",
+        retry_policy=_FAST_RETRIES,
+        retry_budget=RetryBudget(),
+    )
+
+    status, body = asyncio.run(proxy.request("GET", "/x"))
+
+    assert (status, body) == (200, {"ok": True})
+    assert len(calls) == 3
+    assert _sample(
+        "gateway_downstream_extra_attempts_total", downstream="retry-get", kind="connect_retry"
+    ) == 2
+
+
+def test_writes_and_exhausted_budget_are_not_retried():
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    proxy = HttpServiceProxy(
+        base_url="http://retry-none",
+        transport=httpx.MockTransport(handler),
+        name="retry-none",
+        retry_policy=_FAST_RETRIES,
+        retry_budget=RetryBudget(ratio=0.0, min_per_second=0.0, max_balance=0.0),
+    )
+
+    async def scenario() -> None:
+        assert (await proxy.request("POST", "/x", json_body={}))[0] == 503
+        assert (await proxy.request("GET", "/x"))[0] == 503
+
+    asyncio.run(scenario())
+
+    assert calls == ["POST", "GET"]
+    assert _sample(
+        "gateway_retry_budget_exhausted_total", downstream="retry-none", kind="connect_retry"
+    ) == 1
+
+
+def test_hedged_get_returns_the_faster_attempt_and_cancels_the_other():
+    calls: list[int] = []
+    cancelled: list[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        attempt = len(calls)
+        calls.append(attempt)
+        try:
+            await asyncio.sleep(1.0 if attempt == 0 else 0.0)
+        except asyncio.CancelledError:
+            cancelled.append(attempt)
+            raise
+        return httpx.Response(200, json={"attempt": attempt})
+
+    proxy = HttpServiceProxy(
+        base_url="http://hedge",
+        transport=httpx.MockTransport(handler),
+        name="hedge",
+        retry_budget=RetryBudget(),
+    )
+    _warm_latencies(proxy)
+
+    async def scenario() -> tuple[int, object]:
+        result = await proxy.request("GET", "/slow", hedge=True)
+        await asyncio.sleep(0)
+        return result
+
+    started = time.perf_counter()
+    status, body = asyncio.run(scenario())
+    elapsed = time.perf_counter() - started
+
+    assert (status, body) == (200, {"attempt": 1})
+    assert elapsed < 0.5
+    assert cancelled == [0]
+    assert _sample("gateway_downstream_extra_attempts_total", downstream="hedge", kind="hedge") == 1
+
+
+def test_hedging_needs_opt_in_and_budget():
+    calls: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={})
+
+    proxy = HttpServiceProxy(
+        base_url="http://hedge-off",
+        transport=httpx.MockTransport(handler),
+        name="hedge-off",
+        retry_budget=RetryBudget(ratio=0.0, min_per_second=0.0, max_balance=0.0),
+    )
+    _warm_latencies(proxy)
+
+    async def scenario() -> None:
+        await proxy.request("GET", "/not-opted-in")
+        await proxy.request("GET", "/no-budget", hedge=True)
+
+    asyncio.run(scenario())
+
+    assert calls == ["/not-opted-in", "/no-budget"]
+    assert _sample(
+        "gateway_retry_budget_exhausted_total", downstream="hedge-off", kind="hedge"
+    ) == 1
+
+
+def test_gateway_hedges_only_configured_routes(monkeypatch):
+    hedged: list[bool] = []
+
+    class RecordingProxy(HttpServiceProxy):
+        async def stream(self, *args, hedge: bool = False, **kwargs):
+            hedged.append(hedge)
+            return await super().stream(*args, hedge=hedge, **kwargs)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"id": "s-1"})
+
+    monkeypatch.setattr(
+        gateway_main,
+        "_emr_proxy",
+        RecordingProxy(base_url="http://emr-service", transport=httpx.MockTransport(handler)),
+    )
+    monkeypatch.setattr(
+        gateway_main,
+        "_hedged_routes",
+        PathTemplateSet(("/api/v1/emr/soap/{soap_id}",)),
+    )
+    client = TestClient(gateway_main.app)
+
+    assert client.get("/api/v1/emr/soap/s-1").status_code == 200
+    assert client.get("/api/v1/emr/problems/pr-1").status_code == 200
+    retries = client.get("/api/v1/gateway/retries", headers=_admin_headers(monkeypatch)).json()
+
+    assert hedged == [True, False]
+    assert retries["hedged_routes"] == ["/api/v1/emr/soap/{soap_id}"]
+    assert set(retries["budget"]) == {"balance", "ratio", "spent_total", "exhausted_total"}
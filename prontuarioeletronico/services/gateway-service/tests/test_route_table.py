@@ -0,0 +1,171 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from src.gateway.infra.api import main as gateway_main
+from src.gateway.infra.api.route_table import (
+    ProxyRoute,
+    QueryParam,
+    RoutePolicy,
+    add_proxy_routes,
+    cached_route_ttls,
+    required_roles,
+    route_templates,
+)
+from src.gateway.infra.proxy.http_service_proxy import HttpServiceProxy
+from src.gateway.infra.proxy.retry_policy import RetryBudget, RetryPolicy
+
+
+class _NotePayload(BaseModel):
+    text: str
+
+
+_ROUTES = (
+    ProxyRoute(
+        name="list_events",
+        method="GET",
+        path="/api/v1/events",
+        downstream="audit-service",
+        query=(QueryParam("actor_id", required=True), QueryParam("from")),
+        policy=RoutePolicy(roles=("admin",), coalesce=True),
+    ),
+    ProxyRoute(
+        name="get_note",
+        method="GET",
+        path="/api/v1/notes/{note_id}/versions/{version}",
+        downstream="emr-service",
+        policy=RoutePolicy(cache_ttl_seconds=15.0, hedge=True, timeout_seconds=0.5),
+    ),
+    ProxyRoute(
+        name="create_note",
+        method="POST",
+        path="/api/v1/notes",
+        downstream="emr-service",
+        body=_NotePayload,
+        authorization=False,
+    ),
+)
+
+
+def _recording_app() -> tuple[FastAPI, list]:
+    forwarded: list = []
+
+    async def forward(route: ProxyRoute, **request_kwargs):
+        forwarded.append((route.name, request_kwargs))
+        return {"ok": True}
+
+    app = FastAPI()
+    add_proxy_routes(app, _ROUTES, forward)
+    return app, forwarded
+
+
+def test_generated_routes_forward_path_query_body_and_authorization():
+    app, forwarded = _recording_app()
+    client = TestClient(app)
+
+    client.get(
+        "/api/v1/events",
+        params={"actor_id": "u-1", "from": "2026-01-01", "ignored": "x"},
+        headers={"Authorization": "Bearer t"},
+    )
+    client.get("/api/v1/notes/n-1/versions/3")
+    client.post("/api/v1/notes", json={"text": "ok"}, headers={"Authorization": "Bearer t"})
+    missing_query = client.get("/api/v1/events")
+
+    assert forwarded[0] == (
+        "list_events",
+        {
+            "method": "GET",
+            "path": "/api/v1/events",
+            "params": {"actor_id": "u-1", "from": "2026-01-01"},
+            "authorization": "Bearer t",
+        },
+    )
+    assert forwarded[1] == (
+        "get_note",
+        {"method": "GET", "path": "/api/v1/notes/n-1/versions/3", "authorization": None},
+    )
+    assert forwarded[2][1]["payload"] == _NotePayload(text="ok")
+    assert "authorization" not in forwarded[2][1]
+    assert missing_query.status_code == 422
+    assert len(forwarded) == 3
+
+
+def test_generated_routes_publish_openapi_like_hand_written_handlers():
+    app, _ = _recording_app()
+
+    spec = app.openapi()
+    events = spec["paths"]["/api/v1/events"]["get"]
+    note = spec["paths"]["/api/v1/notes"]["post"]
+
+    assert events["operationId"] == "list_events_api_v1_events_get"
+    assert [(param["name"], param["in"], param["required"]) for param in events["parameters"]] == [
+        ("actor_id", "query", True),
+        ("from", "query", False),
+        ("authorization", "header", False),
+    ]
+    assert note["requestBody"]["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/_NotePayload"
+    }
+
+
+def test_policies_are_derived_from_the_table():
+    assert required_roles(_ROUTES) == {("GET", "/api/v1/events"): ("admin",)}
+    assert cached_route_ttls(_ROUTES) == {"/api/v1/notes/{note_id}/versions/{version}": 15.0}
+    assert route_templates(_ROUTES, "coalesce") == ("/api/v1/events",)
+    assert route_templates(_ROUTES, "hedge") == ("/api/v1/notes/{note_id}/versions/{version}",)
+
+
+def test_gateway_table_covers_previous_role_and_cache_defaults():
+    roles = gateway_main._ROUTE_REQUIRED_ROLES
+
+    assert roles[("DELETE", "/api/v1/patients/{patient_id}")] == ("admin",)
+    assert roles[("GET", "/api/v1/audit/events")] == ("admin",)
+    assert roles[("GET", "/api/v1/patients/{patient_id}/chart")] == ("admin", "profissional")
+    assert ("POST", "/api/v1/auth/login") not in roles
+    assert set(gateway_main._CACHED_ROUTE_TTLS) == {
+        "/api/v1/patients/{patient_id}",
+        "/api/v1/patients/{patient_id}/consents",
+        "/api/v1/professionals/{professional_id}",
+    }
+    assert set(gateway_main._COALESCED_ROUTES) == {
+        "/api/v1/professionals",
+        "/api/v1/scheduling/appointments",
+    }
+
+
+def test_route_timeout_and_retry_policy_reach_the_downstream_call():
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.path == "/refused":
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={})
+
+    proxy = HttpServiceProxy(
+        base_url="http://route-policy",
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(backoff_base_seconds=0.001),
+        retry_budget=RetryBudget(),
+    )
+
+    async def scenario() -> None:
+        await proxy.request("GET", "/slow-route", timeout_seconds=0.5)
+        await proxy.request("GET", "/default-route")
+        await proxy.request("GET", "/refused", retry=False)
+
+    asyncio.run(scenario())
+
+    assert seen[0].extensions["timeout"]["read"] == 0.5
+    assert seen[1].extensions["timeout"]["read"] == 10.0
+    assert [request.url.path for request in seen].count("/refused") == 1
+
+
+def test_revocation_feed_is_not_routed_to_clients():
+    client = TestClient(gateway_main.app)
+
+    assert client.get("/api/v1/auth/revocations").status_code == 404
@@ -6,6 +6,9 @@ from fastapi import Depends, FastAPI, Header, HTTPException, Query, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, ConfigDict
 
+from db_session import DatabaseSessionMiddleware
+from service_client import AuditServiceClient, AuthServiceClient
+
 from ...application.consent.create_consent_usecase import (
     CreateConsentInputDTO,
     CreateConsentUseCase,
@@ -35,9 +38,12 @@ from ...application.patient.delete_patient_usecase import (
     DeletePatientInputDTO,
     DeletePatientUseCase,
 )
-from ...infra.audit.audit_service_client import AuditServiceClient
-from ...infra.auth.auth_service_client import AuthServiceClient
-from ...infra.patient.database import SessionLocal, init_database
+from ...infra.patient.database import (
+    ScopedSession,
+    init_database,
+    pool_status,
+    request_sessions,
+)
 from ...infra.patient.sqlalchemy_consent_repository import SqlAlchemyConsentRepository
 from ...infra.patient.sqlalchemy_patient_repository import SqlAlchemyPatientRepository
 
@@ -47,6 +53,7 @@ app = FastAPI(
     version="1.0.0",
     description="Microsserviço de pacientes em Clean Architecture (MS-02)",
 )
+app.add_middleware(DatabaseSessionMiddleware, sessions=request_sessions)
 
 
 APP_ENV = os.getenv("APP_ENV", "development")
@@ -113,7 +120,7 @@ class CreateConsentRequest(BaseModel):
 
 
 init_database()
-_db_session = SessionLocal()
+_db_session = ScopedSession
 _repository = SqlAlchemyPatientRepository(_db_session)
 _consent_repository = SqlAlchemyConsentRepository(_db_session)
 _create_patient_usecase = CreatePatientUseCase(_repository)
@@ -124,10 +131,8 @@ _delete_patient_usecase = DeletePatientUseCase(_repository)
 _create_consent_usecase = CreateConsentUseCase(_consent_repository, _repository)
 _list_consents_usecase = ListPatientConsentsUseCase(_consent_repository)
 _revoke_consent_usecase = RevokeConsentUseCase(_consent_repository)
-_auth_client = AuthServiceClient(
-    base_url=AUTH_SERVICE_URL,
-)
-_audit_client = AuditServiceClient(base_url=AUDIT_SERVICE_URL)
+_auth_client = AuthServiceClient.from_env(AUTH_SERVICE_URL)
+_audit_client = AuditServiceClient.from_env(AUDIT_SERVICE_URL)
 _bearer_scheme = HTTPBearer(auto_error=False)
 
 
@@ -153,18 +158,13 @@ def _require_roles(required_roles: list[str]):
         token = bearer.credentials if bearer else _extract_bearer_token(authorization)
 
         try:
-            verified = _auth_client.verify(token)
+            introspection = _auth_client.introspect(token, required_roles)
         except ValueError as error:
             raise HTTPException(status_code=401, detail=str(error)) from error
 
-        for role in required_roles:
-            try:
-                if _auth_client.authorize(token, role):
-                    return verified
-            except ValueError:
-                continue
-
-        raise HTTPException(status_code=403, detail="insufficient role")
+        if not introspection.get("authorized"):
+            raise HTTPException(status_code=403, detail="insufficient role")
+        return introspection
 
     return dependency
 
@@ -218,6 +218,11 @@ def service_info():
     }
 
 
+@app.get("/api/v1/maintenance/db-pool")
+def db_pool_status(_auth: dict = Depends(_require_roles(["admin"]))):
+    return pool_status()
+
+
 @app.post("/api/v1/patients", status_code=201)
 def create_patient(
     payload: CreatePatientRequest,
@@ -41,6 +41,16 @@ class LocalAuthServiceClient:
             raise ValueError(response.json().get("detail", "unauthorized"))
         return bool(response.json().get("authorized"))
 
+    def introspect(self, token: str, roles: list[str]) -> dict:
+        response = self._auth_client.get(
+            "/api/v1/auth/introspect",
+            params=[("roles", role) for role in roles],
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        if response.status_code >= 400:
+            raise ValueError(response.json().get("detail", "invalid token"))
+        return response.json()
+
 
 def _login(auth_client: TestClient, username: str, password: str) -> dict:
     response = auth_client.post(
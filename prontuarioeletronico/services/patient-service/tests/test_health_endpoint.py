@@ -1,9 +1,9 @@
 from fastapi.testclient import TestClient
 
-from src.patient.infra.api.main import app
+from src.patient.infra.api import main
 
 
-client = TestClient(app)
+client = TestClient(main.app)
 
 
 def test_health_endpoint():
@@ -13,3 +13,30 @@ def test_health_endpoint():
     body = response.json()
     assert body["status"] == "healthy"
     assert body["service"] == "patient"
+
+
+def test_db_pool_status_endpoint_requires_admin(monkeypatch):
+    def introspect(token: str, required_roles: list[str]) -> dict:
+        assert required_roles == ["admin"]
+        role = "admin" if token == "admin-token" else "profissional"
+        return {"valid": True, "claims": {"sub": "1", "role": role}, "authorized": role == "admin"}
+
+    monkeypatch.setattr(main._auth_client, "introspect", introspect)
+
+    assert client.get("/api/v1/maintenance/db-pool").status_code == 401
+    forbidden = client.get(
+        "/api/v1/maintenance/db-pool",
+        headers={"Authorization": "Bearer prof-token"},
+    )
+    assert forbidden.status_code == 403
+
+    response = client.get(
+        "/api/v1/maintenance/db-pool",
+        headers={"Authorization": "Bearer admin-token"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["pool"] == "InstrumentedQueuePool"
+    assert body["checked_out"] == 0
+    assert set(body) >= {"size", "max_overflow", "overflow", "wait_seconds_total", "wait_seconds_max"}
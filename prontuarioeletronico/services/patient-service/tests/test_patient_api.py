@@ -14,23 +14,24 @@ def setup_function() -> None:
 def _auth_ok(monkeypatch, allowed_roles: set[str] | None = None):
     roles = allowed_roles or {"admin", "profissional"}
 
-    def verify(token: str) -> dict:
+    def introspect(token: str, required_roles: list[str]) -> dict:
         assert token == "fake-token"
-        return {"valid": True, "claims": {"sub": "1"}}
+        matched = next((role for role in required_roles if role in roles), None)
+        return {
+            "valid": True,
+            "claims": {"sub": "1"},
+            "authorized": matched is not None,
+            "matched_role": matched,
+        }
 
-    def authorize(token: str, required_role: str) -> bool:
-        assert token == "fake-token"
-        return required_role in roles
-
-    monkeypatch.setattr(main._auth_client, "verify", verify)
-    monkeypatch.setattr(main._auth_client, "authorize", authorize)
+    monkeypatch.setattr(main._auth_client, "introspect", introspect)
 
 
 def _auth_invalid(monkeypatch):
-    def verify(_token: str) -> dict:
+    def introspect(_token: str, _required_roles: list[str]) -> dict:
         raise ValueError("invalid token")
 
-    monkeypatch.setattr(main._auth_client, "verify", verify)
+    monkeypatch.setattr(main._auth_client, "introspect", introspect)
 
 
 def test_create_patient_success(monkeypatch):
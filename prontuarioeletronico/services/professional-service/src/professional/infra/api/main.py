@@ -6,6 +6,9 @@ from fastapi import Depends, FastAPI, Header, HTTPException, Query, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, ConfigDict
 
+from db_session import DatabaseSessionMiddleware
+from service_client import AuditServiceClient, AuthServiceClient
+
 from ...application.professional.activate_professional_usecase import (
     ActivateProfessionalInputDTO,
     ActivateProfessionalUseCase,
@@ -26,9 +29,12 @@ from ...application.professional.register_professional_usecase import (
     RegisterProfessionalInputDTO,
     RegisterProfessionalUseCase,
 )
-from ...infra.audit.audit_service_client import AuditServiceClient
-from ...infra.auth.auth_service_client import AuthServiceClient
-from ...infra.professional.database import SessionLocal, init_database
+from ...infra.professional.database import (
+    ScopedSession,
+    init_database,
+    pool_status,
+    request_sessions,
+)
 from ...infra.professional.sqlalchemy_professional_repository import (
     SqlAlchemyProfessionalRepository,
 )
@@ -39,6 +45,7 @@ app = FastAPI(
     version="1.0.0",
     description="Microsservico de profissionais em Clean Architecture (MS-06)",
 )
+app.add_middleware(DatabaseSessionMiddleware, sessions=request_sessions)
 
 
 APP_ENV = os.getenv("APP_ENV", "development")
@@ -81,15 +88,15 @@ class CreateProfessionalRequest(BaseModel):
 
 
 init_database()
-_db_session = SessionLocal()
+_db_session = ScopedSession
 _repository = SqlAlchemyProfessionalRepository(_db_session)
 _register_usecase = RegisterProfessionalUseCase(_repository)
 _find_usecase = FindProfessionalUseCase(_repository)
 _list_usecase = ListProfessionalsUseCase(_repository)
 _activate_usecase = ActivateProfessionalUseCase(_repository)
 _deactivate_usecase = DeactivateProfessionalUseCase(_repository)
-_auth_client = AuthServiceClient(base_url=AUTH_SERVICE_URL)
-_audit_client = AuditServiceClient(base_url=AUDIT_SERVICE_URL)
+_auth_client = AuthServiceClient.from_env(AUTH_SERVICE_URL)
+_audit_client = AuditServiceClient.from_env(AUDIT_SERVICE_URL)
 _bearer_scheme = HTTPBearer(auto_error=False)
 
 
@@ -115,18 +122,13 @@ def _require_roles(required_roles: list[str]):
         token = bearer.credentials if bearer else _extract_bearer_token(authorization)
 
         try:
-            verified = _auth_client.verify(token)
+            introspection = _auth_client.introspect(token, required_roles)
         except ValueError as error:
             raise HTTPException(status_code=401, detail=str(error)) from error
 
-        for role in required_roles:
-            try:
-                if _auth_client.authorize(token, role):
-                    return verified
-            except ValueError:
-                continue
-
-        raise HTTPException(status_code=403, detail="insufficient role")
+        if not introspection.get("authorized"):
+            raise HTTPException(status_code=403, detail="insufficient role")
+        return introspection
 
     return dependency
 
@@ -180,6 +182,11 @@ def service_info():
     }
 
 
+@app.get("/api/v1/maintenance/db-pool")
+def db_pool_status(_auth: dict = Depends(_require_roles(["admin"]))):
+    return pool_status()
+
+
 @app.post("/api/v1/professionals", status_code=201)
 def create_professional(
     payload: CreateProfessionalRequest,
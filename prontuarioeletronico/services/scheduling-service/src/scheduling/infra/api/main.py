@@ -5,6 +5,9 @@ from fastapi import Depends, FastAPI, Header, HTTPException, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, ConfigDict
 
+from db_session import DatabaseSessionMiddleware
+from service_client import AuthServiceClient
+
 from ...application.scheduling.create_appointment_usecase import (
     CreateAppointmentInputDTO,
     CreateAppointmentUseCase,
@@ -18,8 +21,12 @@ from ...application.scheduling.find_appointment_usecase import (
     FindAppointmentUseCase,
 )
 from ...application.scheduling.list_appointments_usecase import ListAppointmentsUseCase
-from ...infra.auth.auth_service_client import AuthServiceClient
-from ...infra.scheduling.database import SessionLocal, init_database
+from ...infra.scheduling.database import (
+    ScopedSession,
+    init_database,
+    pool_status,
+    request_sessions,
+)
 from ...infra.scheduling.sqlalchemy_appointment_repository import (
     SqlAlchemyAppointmentRepository,
 )
@@ -30,6 +37,7 @@ app = FastAPI(
     version="1.0.0",
     description="Microsserviço de agendamento em Clean Architecture (MS-04)",
 )
+app.add_middleware(DatabaseSessionMiddleware, sessions=request_sessions)
 
 
 APP_ENV = os.getenv("APP_ENV", "development")
@@ -59,13 +67,13 @@ class CreateAppointmentRequest(BaseModel):
 
 
 init_database()
-_db_session = SessionLocal()
+_db_session = ScopedSession
 _repository = SqlAlchemyAppointmentRepository(_db_session)
 _create_appointment_usecase = CreateAppointmentUseCase(_repository)
 _find_appointment_usecase = FindAppointmentUseCase(_repository)
 _list_appointments_usecase = ListAppointmentsUseCase(_repository)
 _delete_appointment_usecase = DeleteAppointmentUseCase(_repository)
-_auth_client = AuthServiceClient(base_url=AUTH_SERVICE_URL)
+_auth_client = AuthServiceClient.from_env(AUTH_SERVICE_URL)
 _bearer_scheme = HTTPBearer(auto_error=False)
 
 
@@ -91,18 +99,13 @@ def _require_roles(required_roles: list[str]):
         token = bearer.credentials if bearer else _extract_bearer_token(authorization)
 
         try:
-            verified = _auth_client.verify(token)
+            introspection = _auth_client.introspect(token, required_roles)
         except ValueError as error:
             raise HTTPException(status_code=401, detail=str(error)) from error
 
-        for role in required_roles:
-            try:
-                if _auth_client.authorize(token, role):
-                    return verified
-            except ValueError:
-                continue
-
-        raise HTTPException(status_code=403, detail="insufficient role")
+        if not introspection.get("authorized"):
+            raise HTTPException(status_code=403, detail="insufficient role")
+        return introspection
 
     return dependency
 
@@ -121,6 +124,11 @@ def service_info():
     }
 
 
+@app.get("/api/v1/maintenance/db-pool")
+def db_pool_status(_auth: dict = Depends(_require_roles(["admin"]))):
+    return pool_status()
+
+
 @app.post("/api/v1/scheduling/appointments", status_code=201)
 def create_appointment(
     payload: CreateAppointmentRequest,
@@ -1,6 +1,11 @@
 import os
 
-from sqlalchemy import create_engine
+from db_session import (
+    DatabasePoolSettings,
+    RequestScopedSession,
+    create_pooled_engine,
+    describe_pool,
+)
 from sqlalchemy.orm import sessionmaker
 
 from .sqlalchemy_base import Base
@@ -12,12 +17,16 @@ DATABASE_URL = os.getenv("SCHEDULING_DATABASE_URL", "sqlite:///./scheduling.db")
 if APP_ENV in {"production", "staging"} and "SCHEDULING_DATABASE_URL" not in os.environ:
     raise RuntimeError("SCHEDULING_DATABASE_URL is required for production/staging")
 
-_engine_kwargs = {}
-if DATABASE_URL.startswith("sqlite"):
-    _engine_kwargs["connect_args"] = {"check_same_thread": False}
+POOL_SETTINGS = DatabasePoolSettings.from_env("SCHEDULING", DATABASE_URL)
 
-engine = create_engine(DATABASE_URL, **_engine_kwargs)
+engine = create_pooled_engine(DATABASE_URL, POOL_SETTINGS)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+request_sessions = RequestScopedSession(SessionLocal, name="scheduling")
+ScopedSession = request_sessions.session
+
+
+def pool_status() -> dict:
+    return describe_pool(engine, POOL_SETTINGS)
 
 
 def init_database() -> None:
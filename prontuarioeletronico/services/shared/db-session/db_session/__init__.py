@@ -0,0 +1,12 @@
+from .pool import InstrumentedQueuePool, create_pooled_engine, describe_pool
+from .session import DatabaseSessionMiddleware, RequestScopedSession
+from .settings import DatabasePoolSettings
+
+__all__ = [
+    "DatabasePoolSettings",
+    "DatabaseSessionMiddleware",
+    "InstrumentedQueuePool",
+    "RequestScopedSession",
+    "create_pooled_engine",
+    "describe_pool",
+]
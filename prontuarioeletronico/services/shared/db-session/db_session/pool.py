@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from sqlalchemy import create_engine, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from .settings import DatabasePoolSettings
+
+
+class InstrumentedQueuePool(QueuePool):
+    # QueuePool that also records how long checkouts wait for a free connection.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self._checkouts += 1
+                self._timeouts += int(timed_out)
+                self._wait_seconds_total += waited
+                self._wait_seconds_max = max(self._wait_seconds_max, waited)
+
+    def wait_stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "wait_seconds_total": round(self._wait_seconds_total, 6),
+                "wait_seconds_max": round(self._wait_seconds_max, 6),
+            }
+
+
+def create_pooled_engine(database_url: str, settings: DatabasePoolSettings) -> Engine:
+    engine_kwargs = {}
+    if database_url.startswith("sqlite"):
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+    if ":memory:" not in database_url and database_url.rstrip("/") != "sqlite:":
+        # In-memory SQLite keeps SQLAlchemy's default single-connection pool.
+        engine_kwargs.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            pool_timeout=settings.timeout_seconds,
+            pool_recycle=settings.recycle_seconds,
+            pool_pre_ping=settings.pre_ping,
+        )
+    return create_engine(database_url, **engine_kwargs)
+
+
+def describe_pool(engine: Engine, settings: DatabasePoolSettings) -> dict:
+    pool = engine.pool
+    status = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            {
+                "size": pool.size(),
+                "max_overflow": settings.max_overflow,
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(0, pool.overflow()),
+            }
+        )
+    if isinstance(pool, InstrumentedQueuePool):
+        status.update(pool.wait_stats())
+    return status
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+
+class RequestScopedSession:
+    # Repositories are built once at import time with the `session` proxy; behind it every
+    # HTTP request gets its own session (see DatabaseSessionMiddleware). Code running
+    # outside a request shares the default-scope session.
+    def __init__(self, session_factory: sessionmaker, name: str):
+        self._scope: ContextVar[object | None] = ContextVar(
+            f"{name}_db_request_scope",
+            default=None,
+        )
+        self.session = scoped_session(session_factory, scopefunc=self._scope.get)
+
+    @contextmanager
+    def request_scope(self):
+        token = self._scope.set(object())
+        try:
+            yield
+        finally:
+            # Closes the request's session, if one was opened, and returns its connection.
+            self.session.remove()
+            self._scope.reset(token)
+
+
+class DatabaseSessionMiddleware:
+    def __init__(self, app, sessions: RequestScopedSession):
+        self._app = app
+        self._sessions = sessions
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        with self._sessions.request_scope():
+            await self._app(scope, receive, send)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class DatabasePoolSettings:
+    pool_size: int = 10
+    max_overflow: int = 20
+    timeout_seconds: float = 10.0
+    recycle_seconds: int = 1800
+    pre_ping: bool = True
+
+    @classmethod
+    def from_env(cls, prefix: str, database_url: str) -> DatabasePoolSettings:
+        # PATIENT_DB_POOL_SIZE, PATIENT_DB_POOL_MAX_OVERFLOW, ... Pre-ping defaults to off
+        # for SQLite, where a dead connection is not a concern.
+        def _read(name: str, default: object) -> str:
+            value = os.getenv(f"{prefix}_DB_POOL_{name}")
+            return str(default) if value is None else value
+
+        defaults = cls()
+        return cls(
+            pool_size=int(_read("SIZE", defaults.pool_size)),
+            max_overflow=int(_read("MAX_OVERFLOW", defaults.max_overflow)),
+            timeout_seconds=float(_read("TIMEOUT_SECONDS", defaults.timeout_seconds)),
+            recycle_seconds=int(_read("RECYCLE_SECONDS", defaults.recycle_seconds)),
+            pre_ping=_read(
+                "PRE_PING",
+                "false" if database_url.startswith("sqlite") else "true",
+            ).lower() == "true",
+        )
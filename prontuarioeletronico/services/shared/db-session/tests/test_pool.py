@@ -0,0 +1,61 @@
+import threading
+
+import pytest
+from sqlalchemy import exc, text
+
+from db_session import (
+    DatabasePoolSettings,
+    InstrumentedQueuePool,
+    create_pooled_engine,
+    describe_pool,
+)
+
+
+def test_settings_read_the_service_prefix(monkeypatch):
+    monkeypatch.setenv("PATIENT_DB_POOL_SIZE", "3")
+    monkeypatch.setenv("PATIENT_DB_POOL_TIMEOUT_SECONDS", "0.5")
+
+    settings = DatabasePoolSettings.from_env("PATIENT", "postgresql://db/patient")
+
+    assert settings.pool_size == 3
+    assert settings.timeout_seconds == 0.5
+    assert settings.max_overflow == 20
+    assert settings.pre_ping is True
+    assert DatabasePoolSettings.from_env("PATIENT", "sqlite:///./patient.db").pre_ping is False
+
+
+def test_in_memory_sqlite_keeps_the_default_pool():
+    engine = create_pooled_engine("sqlite:///:memory:", DatabasePoolSettings())
+
+    assert describe_pool(engine, DatabasePoolSettings()) == {"pool": "SingletonThreadPool"}
+
+
+def test_file_database_reports_checkouts_and_timeouts(tmp_path):
+    settings = DatabasePoolSettings(pool_size=1, max_overflow=0, timeout_seconds=0.05)
+    engine = create_pooled_engine(f"sqlite:///{tmp_path / 'pool.db'}", settings)
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+
+    with engine.connect() as held:
+        held.execute(text("SELECT 1"))
+        assert describe_pool(engine, settings)["checked_out"] == 1
+
+        errors = []
+
+        def second_checkout():
+            try:
+                engine.connect()
+            except exc.TimeoutError as error:
+                errors.append(error)
+
+        worker = threading.Thread(target=second_checkout)
+        worker.start()
+        worker.join()
+
+    status = describe_pool(engine, settings)
+    assert len(errors) == 1
+    assert status["pool"] == "InstrumentedQueuePool"
+    assert status["checked_out"] == 0
+    assert status["max_overflow"] == 0
+    assert status["checkouts"] == 2
+    assert status["timeouts"] == 1
+    assert status["wait_seconds_max"] == pytest.approx(0.05, abs=0.2)
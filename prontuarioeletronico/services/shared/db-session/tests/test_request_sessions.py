@@ -0,0 +1,48 @@
+import asyncio
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from db_session import DatabaseSessionMiddleware, RequestScopedSession
+
+
+def _sessions() -> RequestScopedSession:
+    engine = create_engine("sqlite:///:memory:")
+    return RequestScopedSession(sessionmaker(bind=engine), name="test")
+
+
+def test_each_request_scope_gets_its_own_session_and_closes_it():
+    sessions = _sessions()
+    outside = sessions.session()
+
+    with sessions.request_scope():
+        first = sessions.session()
+        assert sessions.session() is first
+    with sessions.request_scope():
+        second = sessions.session()
+
+    assert len({id(outside), id(first), id(second)}) == 3
+    assert sessions.session() is outside
+
+
+def test_middleware_scopes_http_requests_only():
+    sessions = _sessions()
+    outside = sessions.session()
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append((scope["type"], sessions.session()))
+
+    middleware = DatabaseSessionMiddleware(app, sessions=sessions)
+
+    async def call(scope_type: str):
+        await middleware({"type": scope_type}, None, None)
+
+    asyncio.run(call("http"))
+    asyncio.run(call("http"))
+    asyncio.run(call("lifespan"))
+
+    http_sessions = [session for kind, session in seen if kind == "http"]
+    assert len({id(session) for session in http_sessions}) == 2
+    assert outside not in http_sessions
+    assert seen[-1] == ("lifespan", outside)
@@ -0,0 +1,40 @@
+from .audit import AuditServiceClient
+from .auth import AuthServiceClient
+from .circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from .client import (
+    ServiceClient,
+    ServiceClientError,
+    ServiceRequestError,
+    ServiceUnavailableError,
+)
+from .jwks import JwksKeySet
+from .local_verifier import LocalTokenVerifier
+from .revocations import RevocationList
+from .settings import (
+    CircuitBreakerSettings,
+    LocalVerificationSettings,
+    ServiceClientSettings,
+    TokenCacheSettings,
+)
+from .token_cache import TokenCache
+
+__all__ = [
+    "AuditServiceClient",
+    "AuthServiceClient",
+    "CLOSED",
+    "HALF_OPEN",
+    "OPEN",
+    "CircuitBreaker",
+    "CircuitBreakerSettings",
+    "JwksKeySet",
+    "LocalTokenVerifier",
+    "LocalVerificationSettings",
+    "RevocationList",
+    "ServiceClient",
+    "ServiceClientError",
+    "ServiceClientSettings",
+    "ServiceRequestError",
+    "ServiceUnavailableError",
+    "TokenCache",
+    "TokenCacheSettings",
+]
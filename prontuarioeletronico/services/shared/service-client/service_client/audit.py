@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import httpx
+
+from .client import ServiceClient
+from .settings import CircuitBreakerSettings, ServiceClientSettings
+
+
+class AuditServiceClient:
+    def __init__(
+        self,
+        base_url: str,
+        settings: ServiceClientSettings | None = None,
+        breaker_settings: CircuitBreakerSettings | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        self._client = ServiceClient(
+            name="audit",
+            base_url=base_url,
+            settings=settings,
+            breaker_settings=breaker_settings,
+            transport=transport,
+        )
+
+    @classmethod
+    def from_env(cls, base_url: str) -> AuditServiceClient:
+        return cls(
+            base_url=base_url,
+            settings=ServiceClientSettings.from_env("AUDIT_SERVICE"),
+            breaker_settings=CircuitBreakerSettings.from_env("AUDIT_SERVICE"),
+        )
+
+    @property
+    def client(self) -> ServiceClient:
+        return self._client
+
+    def create_event(self, token: str, payload: dict) -> dict:
+        response = self._client.request("POST", "/api/v1/audit/events", token=token, json=payload)
+        return response.json()
+
+    def close(self) -> None:
+        self._client.close()
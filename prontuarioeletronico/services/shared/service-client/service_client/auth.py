@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import time
+
+import httpx
+
+from .client import ServiceClient, ServiceRequestError
+from .jwks import JwksKeySet
+from .local_verifier import LocalTokenVerifier
+from .revocations import RevocationList
+from .settings import (
+    CircuitBreakerSettings,
+    LocalVerificationSettings,
+    ServiceClientSettings,
+    TokenCacheSettings,
+)
+from .token_cache import TokenCache
+
+ADMIN_ROLE = "admin"
+
+# Only definite answers about the token are cached; a 5xx or 429 says nothing about it.
+_REJECTION_STATUS_CODES = (401, 403)
+
+
+def _public_claims(claims: dict) -> dict:
+    return {
+        "sub": claims.get("sub"),
+        "username": claims.get("username"),
+        "role": claims.get("role"),
+    }
+
+
+def _matched_role(role: str | None, required_roles: tuple[str, ...]) -> str | None:
+    # Same rule as auth-service's IntrospectTokenUseCase: admin satisfies any role.
+    for required_role in required_roles:
+        if role == required_role or role == ADMIN_ROLE:
+            return required_role
+    return None
+
+
+class AuthServiceClient:
+    def __init__(
+        self,
+        base_url: str,
+        settings: ServiceClientSettings | None = None,
+        breaker_settings: CircuitBreakerSettings | None = None,
+        cache_settings: TokenCacheSettings | None = None,
+        local_settings: LocalVerificationSettings | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        self._client = ServiceClient(
+            name="auth",
+            base_url=base_url,
+            settings=settings,
+            breaker_settings=breaker_settings,
+            transport=transport,
+        )
+        self._cache = TokenCache(cache_settings)
+        self._local_verifier = self._build_local_verifier(local_settings or LocalVerificationSettings())
+
+    @classmethod
+    def from_env(cls, base_url: str) -> AuthServiceClient:
+        return cls(
+            base_url=base_url,
+            settings=ServiceClientSettings.from_env("AUTH_SERVICE"),
+            breaker_settings=CircuitBreakerSettings.from_env("AUTH_SERVICE"),
+            cache_settings=TokenCacheSettings.from_env("AUTH_SERVICE"),
+            local_settings=LocalVerificationSettings.from_env("AUTH_SERVICE"),
+        )
+
+    @property
+    def client(self) -> ServiceClient:
+        return self._client
+
+    @property
+    def cache(self) -> TokenCache:
+        return self._cache
+
+    @property
+    def local_verifier(self) -> LocalTokenVerifier | None:
+        return self._local_verifier
+
+    def verify(self, token: str) -> dict:
+        cached = self._cache.get_verified(token)
+        if cached is not None:
+            return cached
+        claims = self._verify_locally(token)
+        if claims is not None:
+            return {"valid": True, "claims": _public_claims(claims)}
+
+        started = time.perf_counter()
+        try:
+            response = self._client.request("GET", "/api/v1/auth/verify", token=token)
+            body = response.json()
+            if not body.get("valid"):
+                raise ServiceRequestError("invalid token", 401)
+        except ServiceRequestError as error:
+            # Rejections are cached briefly; an unavailable or failing auth-service is not.
+            self._remember_rejection(token, None, error)
+            raise
+        self._cache.observe_call("verify", time.perf_counter() - started)
+        self._cache.put_verified(token, body)
+        return body
+
+    def authorize(self, token: str, required_role: str) -> bool:
+        cached = self._cache.get_role(token, required_role)
+        if cached is not None:
+            return cached
+        claims = self._verify_locally(token)
+        if claims is not None:
+            return _matched_role(claims.get("role"), (required_role,)) is not None
+
+        started = time.perf_counter()
+        try:
+            response = self._client.request(
+                "GET",
+                "/api/v1/auth/authorize",
+                token=token,
+                params={"required_role": required_role},
+            )
+        except ServiceRequestError as error:
+            self._remember_rejection(token, required_role, error)
+            raise
+        self._cache.observe_call("authorize", time.perf_counter() - started)
+        authorized = bool(response.json().get("authorized"))
+        self._cache.put_role(token, required_role, authorized)
+        return authorized
+
+    def introspect(self, token: str, roles: list[str] | tuple[str, ...]) -> dict:
+        # One auth round trip for validity, claims and the first acceptable role.
+        roles = tuple(roles)
+        cached = self._cache.get_introspection(token, roles)
+        if cached is not None:
+            return cached
+        claims = self._verify_locally(token)
+        if claims is not None:
+            matched_role = _matched_role(claims.get("role"), roles)
+            return {
+                "valid": True,
+                "claims": {**_public_claims(claims), "exp": claims.get("exp")},
+                "authorized": not roles or matched_role is not None,
+                "matched_role": matched_role,
+                "required_roles": list(roles),
+            }
+
+        started = time.perf_counter()
+        try:
+            response = self._client.request(
+                "GET",
+                "/api/v1/auth/introspect",
+                token=token,
+                params={"roles": list(roles)},
+            )
+            body = response.json()
+            if not body.get("valid"):
+                raise ServiceRequestError("invalid token", 401)
+        except ServiceRequestError as error:
+            self._remember_rejection(token, None, error)
+            raise
+        self._cache.observe_call("introspect", time.perf_counter() - started)
+        self._cache.put_introspection(token, roles, body)
+        return body
+
+    def snapshot(self) -> dict:
+        snapshot = {**self._client.snapshot(), "token_cache": self._cache.snapshot()}
+        if self._local_verifier is not None:
+            snapshot["local_verification"] = self._local_verifier.snapshot()
+        return snapshot
+
+    def close(self) -> None:
+        if self._local_verifier is not None:
+            self._local_verifier.stop()
+        self._client.close()
+
+    def _verify_locally(self, token: str) -> dict | None:
+        if self._local_verifier is None:
+            return None
+        try:
+            return self._local_verifier.verify(token)
+        except ServiceRequestError as error:
+            self._remember_rejection(token, None, error)
+            raise
+
+    def _remember_rejection(self, token: str, role: str | None, error: ServiceRequestError) -> None:
+        if error.status_code in _REJECTION_STATUS_CODES:
+            self._cache.put_failure(token, role, error)
+
+    def _build_local_verifier(self, settings: LocalVerificationSettings) -> LocalTokenVerifier | None:
+        # Tokens signed with a key published at /.well-known/jwks.json are checked here;
+        # anything else (HS256 deployments included) still goes to auth-service.
+        if not settings.enabled:
+            return None
+        return LocalTokenVerifier(
+            keys=JwksKeySet(
+                fetch=self._fetch_jwks,
+                max_age_seconds=settings.jwks_max_age_seconds,
+                min_refresh_seconds=settings.jwks_min_refresh_seconds,
+            ),
+            revocations=RevocationList(
+                fetch=self._fetch_revocations,
+                refresh_seconds=settings.revocation_refresh_seconds,
+                max_staleness_seconds=settings.revocation_max_staleness_seconds,
+            ),
+            leeway_seconds=settings.leeway_seconds,
+        )
+
+    def _fetch_jwks(self) -> dict:
+        return self._client.request("GET", "/.well-known/jwks.json").json()
+
+    def _fetch_revocations(self) -> list[tuple[str, float]]:
+        body = self._client.request("GET", "/api/v1/auth/revocations").json()
+        return [(item["jti"], float(item["expires_at"])) for item in body.get("revoked", [])]
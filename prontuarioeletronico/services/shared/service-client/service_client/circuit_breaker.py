@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+from .settings import CircuitBreakerSettings
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    # Thread-safe: sync FastAPI dependencies call the clients from the worker threadpool.
+    def __init__(
+        self,
+        settings: CircuitBreakerSettings | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._settings = settings or CircuitBreakerSettings()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        # (finished_at, failed) for every call inside the rolling window.
+        self._window: deque[tuple[float, bool]] = deque()
+        self._opened_total = 0
+        self._rejected_total = 0
+
+    @property
+    def settings(self) -> CircuitBreakerSettings:
+        return self._settings
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self._open_elapsed():
+                return HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        if not self._settings.enabled:
+            return True
+
+        with self._lock:
+            if self._state == OPEN and self._open_elapsed():
+                self._state = HALF_OPEN
+                self._probe_in_flight = False
+
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+
+            self._rejected_total += 1
+            return False
+
+    def record(self, failed: bool) -> None:
+        if not self._settings.enabled:
+            return
+
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probe_in_flight = False
+                if failed:
+                    self._trip()
+                else:
+                    self._state = CLOSED
+                    self._window.clear()
+                return
+            if self._state == OPEN:
+                return
+
+            now = self._clock()
+            self._window.append((now, failed))
+            while self._window and now - self._window[0][0] > self._settings.window_seconds:
+                self._window.popleft()
+
+            total = len(self._window)
+            if total < self._settings.minimum_requests:
+                return
+            failures = sum(1 for _, call_failed in self._window if call_failed)
+            if failures / total >= self._settings.failure_rate_threshold:
+                self._trip()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "state": HALF_OPEN if self._state == OPEN and self._open_elapsed() else self._state,
+                "window_calls": len(self._window),
+                "opened_total": self._opened_total,
+                "rejected_total": self._rejected_total,
+            }
+
+    def _trip(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._opened_total += 1
+        self._window.clear()
+
+    def _open_elapsed(self) -> bool:
+        return self._clock() - self._opened_at >= self._settings.open_seconds
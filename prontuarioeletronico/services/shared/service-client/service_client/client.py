@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import httpx
+
+from .circuit_breaker import CircuitBreaker
+from .metrics import CIRCUIT_OPEN, HTTP_ERROR, OK, UNAVAILABLE, ClientMetrics
+from .settings import CircuitBreakerSettings, ServiceClientSettings
+
+
+class ServiceClientError(ValueError):
+    pass
+
+
+class ServiceUnavailableError(ServiceClientError):
+    pass
+
+
+class ServiceRequestError(ServiceClientError):
+    def __init__(self, detail: str, status_code: int):
+        super().__init__(detail)
+        self.status_code = status_code
+
+
+class ServiceClient:
+    # One pooled keep-alive httpx.Client per instance, created on first use and shared
+    # by every call (httpx.Client is safe to use from several threads).
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        settings: ServiceClientSettings | None = None,
+        breaker_settings: CircuitBreakerSettings | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        self.name = name
+        self._base_url = base_url.rstrip("/")
+        self._settings = settings or ServiceClientSettings()
+        self._transport = transport
+        self._breaker = CircuitBreaker(breaker_settings)
+        self._metrics = ClientMetrics()
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def settings(self) -> ServiceClientSettings:
+        return self._settings
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        return self._breaker
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        token: str | None = None,
+        params: dict | None = None,
+        json: dict | None = None,
+    ) -> httpx.Response:
+        if not self._breaker.allow_request():
+            self._metrics.observe(CIRCUIT_OPEN)
+            raise ServiceUnavailableError(f"{self.name} service unavailable")
+
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        started = time.perf_counter()
+        try:
+            response = self._http().request(method, path, headers=headers, params=params, json=json)
+        except httpx.HTTPError as error:
+            self._breaker.record(failed=True)
+            self._metrics.observe(UNAVAILABLE, time.perf_counter() - started)
+            raise ServiceUnavailableError(f"{self.name} service unavailable") from error
+
+        elapsed = time.perf_counter() - started
+        self._breaker.record(failed=response.status_code >= 500)
+        if response.status_code >= 400:
+            self._metrics.observe(HTTP_ERROR, elapsed)
+            try:
+                detail = response.json().get("detail", f"{self.name} request failed")
+            except ValueError:
+                detail = f"{self.name} request failed"
+            raise ServiceRequestError(str(detail), response.status_code)
+
+        self._metrics.observe(OK, elapsed)
+        return response
+
+    def snapshot(self) -> dict:
+        return {
+            "name": self.name,
+            "circuit": self._breaker.snapshot(),
+            **self._metrics.snapshot(),
+        }
+
+    def close(self) -> None:
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def _http(self) -> httpx.Client:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._build_client()
+        return self._client
+
+    def _build_client(self) -> httpx.Client:
+        settings = self._settings
+        return httpx.Client(
+            base_url=self._base_url,
+            timeout=httpx.Timeout(
+                connect=settings.connect_timeout_seconds,
+                read=settings.read_timeout_seconds,
+                write=settings.write_timeout_seconds,
+                pool=settings.pool_timeout_seconds,
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry_seconds,
+            ),
+            transport=self._transport,
+        )
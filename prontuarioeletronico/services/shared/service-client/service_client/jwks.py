@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+import jwt
+
+ASYMMETRIC_ALGORITHMS = ("RS256", "EdDSA")
+
+
+class JwksKeySet:
+    # Public keys from the auth-service JWKS, fetched once and refetched after
+    # max_age_seconds or when a token names an unknown kid (key rotation). Refetches are
+    # spaced by min_refresh_seconds, so made-up kids cannot drive traffic to auth-service.
+    def __init__(
+        self,
+        fetch: Callable[[], dict],
+        max_age_seconds: float = 300.0,
+        min_refresh_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._fetch = fetch
+        self._max_age_seconds = max_age_seconds
+        self._min_refresh_seconds = min_refresh_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._fetched_at = float("-inf")
+        self._attempted_at = float("-inf")
+        self._refreshes = 0
+        self._refresh_failures = 0
+
+    def key_for(self, kid: str) -> jwt.PyJWK | None:
+        now = self._clock()
+        key = self._keys.get(kid)
+        if key is not None and now - self._fetched_at < self._max_age_seconds:
+            return key
+        if now - self._attempted_at < self._min_refresh_seconds:
+            return key
+
+        with self._lock:
+            if now - self._attempted_at >= self._min_refresh_seconds:
+                self._refresh(now)
+        # A known key keeps working while the JWKS endpoint is unreachable.
+        return self._keys.get(kid)
+
+    def snapshot(self) -> dict:
+        return {
+            "kids": sorted(self._keys),
+            "refreshes": self._refreshes,
+            "refresh_failures": self._refresh_failures,
+        }
+
+    def _refresh(self, now: float) -> None:
+        self._attempted_at = now
+        try:
+            body = self._fetch()
+        except ValueError:
+            self._refresh_failures += 1
+            return
+
+        keys = {}
+        for data in body.get("keys", []):
+            if data.get("alg") not in ASYMMETRIC_ALGORITHMS or not data.get("kid"):
+                continue
+            if data.get("use", "sig") != "sig":
+                continue
+            try:
+                keys[data["kid"]] = jwt.PyJWK(data)
+            except jwt.PyJWTError:
+                continue
+        self._keys = keys
+        self._fetched_at = now
+        self._refreshes += 1
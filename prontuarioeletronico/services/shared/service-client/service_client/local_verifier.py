@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import threading
+from collections import Counter
+
+import jwt
+
+from .client import ServiceRequestError
+from .jwks import ASYMMETRIC_ALGORITHMS, JwksKeySet
+from .revocations import RevocationList
+
+VERIFIED = "verified"
+REJECTED = "rejected"
+
+
+class LocalTokenVerifier:
+    # Checks an access token signed with a JWKS key without calling auth-service: the
+    # signature, exp, type=access and the revocation list. verify() returns the claims,
+    # raises ServiceRequestError (401, same details as auth-service) for a token that is
+    # invalid, and returns None when it cannot decide (HS256 token, unknown kid, keys or
+    # revocations unavailable) so the caller falls back to auth-service.
+    def __init__(self, keys: JwksKeySet, revocations: RevocationList, leeway_seconds: float = 0.0):
+        self._keys = keys
+        self._revocations = revocations
+        self._leeway_seconds = leeway_seconds
+        self._lock = threading.Lock()
+        self._outcomes: Counter = Counter()
+
+    def verify(self, token: str) -> dict | None:
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.PyJWTError:
+            return self._fallback("malformed")
+        kid = header.get("kid")
+        if header.get("alg") not in ASYMMETRIC_ALGORITHMS or not kid:
+            return self._fallback("not_asymmetric")
+
+        key = self._keys.key_for(kid)
+        if key is None:
+            return self._fallback("unknown_kid")
+
+        try:
+            claims = jwt.decode(
+                token,
+                key.key,
+                algorithms=[key.algorithm_name],
+                options={"require": ["exp"]},
+                leeway=self._leeway_seconds,
+            )
+        except jwt.ExpiredSignatureError:
+            # Same detail auth-service and the gateway edge answer for an expired token.
+            self._reject("token expired")
+        except jwt.PyJWTError:
+            self._reject("invalid token")
+        if claims.get("type") != "access":
+            self._reject("invalid access token type")
+        jti = claims.get("jti")
+        if not jti:
+            self._reject("invalid access token payload")
+
+        revoked = self._revocations.is_revoked(jti)
+        if revoked is None:
+            return self._fallback("revocations_stale")
+        if revoked:
+            self._reject("access token revoked")
+
+        self._count(VERIFIED)
+        return claims
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            outcomes = dict(self._outcomes)
+        return {
+            "outcomes": outcomes,
+            "keys": self._keys.snapshot(),
+            "revocations": self._revocations.snapshot(),
+        }
+
+    def stop(self) -> None:
+        self._revocations.stop()
+
+    def _fallback(self, reason: str) -> None:
+        self._count(f"fallback_{reason}")
+        return None
+
+    def _reject(self, detail: str) -> None:
+        self._count(REJECTED)
+        raise ServiceRequestError(detail, 401)
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self._outcomes[outcome] += 1
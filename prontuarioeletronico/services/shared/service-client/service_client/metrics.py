@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from collections import Counter
+
+
+# Outcomes counted per client call.
+OK = "ok"
+HTTP_ERROR = "http_error"
+UNAVAILABLE = "unavailable"
+CIRCUIT_OPEN = "circuit_open"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class ClientMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._outcomes: Counter = Counter()
+        self._latency_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._latency_sum = 0.0
+
+    def observe(self, outcome: str, elapsed_seconds: float | None = None) -> None:
+        with self._lock:
+            self._outcomes[outcome] += 1
+            if elapsed_seconds is not None:
+                self._latency_counts[bisect_left(LATENCY_BUCKETS, elapsed_seconds)] += 1
+                self._latency_sum += elapsed_seconds
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            cumulative, buckets = 0, {}
+            for bound, count in zip((*LATENCY_BUCKETS, "+Inf"), self._latency_counts):
+                cumulative += count
+                buckets[str(bound)] = cumulative
+            return {
+                "requests_total": dict(self._outcomes),
+                "latency_seconds": {
+                    "count": cumulative,
+                    "sum": round(self._latency_sum, 6),
+                    "buckets": buckets,
+                },
+            }
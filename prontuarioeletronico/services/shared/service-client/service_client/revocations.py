@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+RevocationFetcher = Callable[[], list[tuple[str, float]]]
+
+
+class RevocationList:
+    # Revoked access-token jtis from the auth-service revocation feed. The first lookup
+    # loads the list and starts a background thread (start/stop) that polls the feed every
+    # refresh_seconds, so requests never wait on auth-service afterwards. A failed poll of
+    # any kind keeps the last good list; past max_staleness_seconds without a successful
+    # poll the list is no longer trusted and is_revoked() answers None instead of a guess.
+    def __init__(
+        self,
+        fetch: RevocationFetcher,
+        refresh_seconds: float = 5.0,
+        max_staleness_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self._fetch = fetch
+        self._refresh_seconds = refresh_seconds
+        self._max_staleness_seconds = max_staleness_seconds
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._start_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._revoked: dict[str, float] = {}
+        self._synced_at = float("-inf")
+        self._refresh_failures = 0
+
+    def is_revoked(self, jti: str) -> bool | None:
+        if self._thread is None and not self._stop.is_set():
+            self.start()
+        if self._clock() - self._synced_at > self._max_staleness_seconds:
+            return None
+        expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > self._wall_clock()
+
+    def start(self) -> None:
+        # Threads that find a start in progress answer from the (still empty, so stale) list.
+        if not self._start_lock.acquire(blocking=False):
+            return
+        try:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self.refresh()
+            self._thread = threading.Thread(target=self._loop, name="revocation-list", daemon=True)
+            self._thread.start()
+        finally:
+            self._start_lock.release()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def refresh(self) -> bool:
+        try:
+            entries = self._fetch()
+            wall_now = self._wall_clock()
+            revoked = {jti: float(expires_at) for jti, expires_at in entries if float(expires_at) > wall_now}
+        except Exception:
+            # Malformed feed or auth-service unavailable: keep the last good list.
+            self._refresh_failures += 1
+            return False
+        self._revoked = revoked
+        self._synced_at = self._clock()
+        return True
+
+    def snapshot(self) -> dict:
+        return {
+            "running": self._thread is not None,
+            "revoked": len(self._revoked),
+            "seconds_since_sync": round(max(0.0, self._clock() - self._synced_at), 3)
+            if self._synced_at != float("-inf")
+            else None,
+            "refresh_failures": self._refresh_failures,
+        }
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self._refresh_seconds):
+            self.refresh()
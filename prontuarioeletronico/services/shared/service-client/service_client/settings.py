@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+
+def _env_reader(prefix: str, group: str):
+    # AUTH_SERVICE_READ_TIMEOUT_SECONDS first, then SERVICE_CLIENT_READ_TIMEOUT_SECONDS,
+    # then the default; the same names the gateway uses for its own downstream pools.
+    def _read(name: str, default: object) -> str:
+        value = os.getenv(f"{prefix}_{group}{name}")
+        if value is None:
+            value = os.getenv(f"SERVICE_CLIENT_{group}{name}")
+        return str(default) if value is None else value
+
+    return _read
+
+
+@dataclass(frozen=True)
+class ServiceClientSettings:
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_seconds: float = 30.0
+    connect_timeout_seconds: float = 2.0
+    read_timeout_seconds: float = 5.0
+    write_timeout_seconds: float = 5.0
+    pool_timeout_seconds: float = 2.0
+
+    @classmethod
+    def from_env(cls, prefix: str) -> ServiceClientSettings:
+        _read = _env_reader(prefix, "")
+        defaults = cls()
+        return cls(
+            max_connections=int(_read("MAX_CONNECTIONS", defaults.max_connections)),
+            max_keepalive_connections=int(
+                _read("MAX_KEEPALIVE_CONNECTIONS", defaults.max_keepalive_connections)
+            ),
+            keepalive_expiry_seconds=float(
+                _read("KEEPALIVE_EXPIRY_SECONDS", defaults.keepalive_expiry_seconds)
+            ),
+            connect_timeout_seconds=float(
+                _read("CONNECT_TIMEOUT_SECONDS", defaults.connect_timeout_seconds)
+            ),
+            read_timeout_seconds=float(_read("READ_TIMEOUT_SECONDS", defaults.read_timeout_seconds)),
+            write_timeout_seconds=float(
+                _read("WRITE_TIMEOUT_SECONDS", defaults.write_timeout_seconds)
+            ),
+            pool_timeout_seconds=float(_read("POOL_TIMEOUT_SECONDS", defaults.pool_timeout_seconds)),
+        )
+
+
+@dataclass(frozen=True)
+class CircuitBreakerSettings:
+    enabled: bool = True
+    window_seconds: float = 30.0
+    minimum_requests: int = 10
+    failure_rate_threshold: float = 0.5
+    open_seconds: float = 10.0
+
+    @classmethod
+    def from_env(cls, prefix: str) -> CircuitBreakerSettings:
+        _read = _env_reader(prefix, "CIRCUIT_")
+        defaults = cls()
+        return cls(
+            enabled=_read("ENABLED", "true").lower() == "true",
+            window_seconds=float(_read("WINDOW_SECONDS", defaults.window_seconds)),
+            minimum_requests=int(_read("MINIMUM_REQUESTS", defaults.minimum_requests)),
+            failure_rate_threshold=float(
+                _read("FAILURE_RATE_THRESHOLD", defaults.failure_rate_threshold)
+            ),
+            open_seconds=float(_read("OPEN_SECONDS", defaults.open_seconds)),
+        )
+
+
+@dataclass(frozen=True)
+class TokenCacheSettings:
+    enabled: bool = True
+    max_entries: int = 10000
+    ttl_seconds: float = 15.0
+    negative_ttl_seconds: float = 2.0
+
+    @classmethod
+    def from_env(cls, prefix: str) -> TokenCacheSettings:
+        _read = _env_reader(prefix, "TOKEN_CACHE_")
+        defaults = cls()
+        return cls(
+            enabled=_read("ENABLED", "true").lower() == "true",
+            max_entries=int(_read("MAX_ENTRIES", defaults.max_entries)),
+            ttl_seconds=float(_read("TTL_SECONDS", defaults.ttl_seconds)),
+            negative_ttl_seconds=float(
+                _read("NEGATIVE_TTL_SECONDS", defaults.negative_ttl_seconds)
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class LocalVerificationSettings:
+    enabled: bool = True
+    jwks_max_age_seconds: float = 300.0
+    jwks_min_refresh_seconds: float = 30.0
+    revocation_refresh_seconds: float = 5.0
+    revocation_max_staleness_seconds: float = 30.0
+    leeway_seconds: float = 0.0
+
+    @classmethod
+    def from_env(cls, prefix: str) -> LocalVerificationSettings:
+        _read = _env_reader(prefix, "LOCAL_VERIFY_")
+        defaults = cls()
+        return cls(
+            enabled=_read("ENABLED", "true").lower() == "true",
+            jwks_max_age_seconds=float(_read("JWKS_MAX_AGE_SECONDS", defaults.jwks_max_age_seconds)),
+            jwks_min_refresh_seconds=float(
+                _read("JWKS_MIN_REFRESH_SECONDS", defaults.jwks_min_refresh_seconds)
+            ),
+            revocation_refresh_seconds=float(
+                _read("REVOCATION_REFRESH_SECONDS", defaults.revocation_refresh_seconds)
+            ),
+            revocation_max_staleness_seconds=float(
+                _read("REVOCATION_MAX_STALENESS_SECONDS", defaults.revocation_max_staleness_seconds)
+            ),
+            leeway_seconds=float(_read("LEEWAY_SECONDS", defaults.leeway_seconds)),
+        )
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from .settings import TokenCacheSettings
+
+
+def token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def token_expiry(token: str) -> float | None:
+    # Reads `exp` without checking the signature: it only shortens how long a result the
+    # auth-service already returned for this exact token may be reused.
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+@dataclass
+class _Entry:
+    expires_at: float
+    verified: dict | None = None
+    # role -> (authorized, expires_at)
+    roles: dict[str, tuple[bool, float]] = field(default_factory=dict)
+    # acceptable roles -> (introspection, expires_at)
+    introspections: dict[tuple[str, ...], tuple[dict, float]] = field(default_factory=dict)
+
+
+@dataclass
+class _Failure:
+    error: ValueError
+    expires_at: float
+
+
+class TokenCache:
+    # Bounded LRU keyed by the SHA-256 of the token. Positive results live until the
+    # earlier of the token `exp` and ttl_seconds (how stale a revocation may be seen);
+    # rejections live for negative_ttl_seconds.
+    def __init__(
+        self,
+        settings: TokenCacheSettings | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self._settings = settings or TokenCacheSettings()
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._failures: OrderedDict[tuple[str, str], _Failure] = OrderedDict()
+        self._hits = {"verify": 0, "authorize": 0, "introspect": 0}
+        self._misses = {"verify": 0, "authorize": 0, "introspect": 0}
+        self._negative_hits = 0
+        self._call_seconds = {"verify": 0.0, "authorize": 0.0, "introspect": 0.0}
+        self._calls = {"verify": 0, "authorize": 0, "introspect": 0}
+        self._saved_seconds = 0.0
+
+    @property
+    def settings(self) -> TokenCacheSettings:
+        return self._settings
+
+    def get_verified(self, token: str) -> dict | None:
+        return self._lookup("verify", token, None)
+
+    def get_role(self, token: str, role: str) -> bool | None:
+        return self._lookup("authorize", token, role)
+
+    def get_introspection(self, token: str, roles: tuple[str, ...]) -> dict | None:
+        return self._lookup("introspect", token, roles)
+
+    def put_verified(self, token: str, verified: dict) -> None:
+        key = token_key(token)
+        with self._lock:
+            entry = self._entry(key, token)
+            if entry is not None:
+                entry.verified = verified
+
+    def put_role(self, token: str, role: str, authorized: bool) -> None:
+        key = token_key(token)
+        with self._lock:
+            entry = self._entry(key, token)
+            if entry is None:
+                return
+            expires_at = entry.expires_at
+            if not authorized:
+                expires_at = min(expires_at, self._clock() + self._settings.negative_ttl_seconds)
+            entry.roles[role] = (authorized, expires_at)
+
+    def put_introspection(self, token: str, roles: tuple[str, ...], introspection: dict) -> None:
+        key = token_key(token)
+        with self._lock:
+            entry = self._entry(key, token)
+            if entry is None:
+                return
+            entry.verified = {"valid": True, "claims": introspection.get("claims", {})}
+            expires_at = entry.expires_at
+            if not introspection.get("authorized"):
+                expires_at = min(expires_at, self._clock() + self._settings.negative_ttl_seconds)
+            entry.introspections[roles] = (introspection, expires_at)
+
+    def put_failure(self, token: str, role: str | None, error: ValueError) -> None:
+        if not self._settings.enabled or self._settings.negative_ttl_seconds <= 0:
+            return
+        key = (token_key(token), role or "")
+        with self._lock:
+            self._failures[key] = _Failure(error, self._clock() + self._settings.negative_ttl_seconds)
+            self._failures.move_to_end(key)
+            while len(self._failures) > self._settings.max_entries:
+                self._failures.popitem(last=False)
+
+    def observe_call(self, kind: str, elapsed_seconds: float) -> None:
+        with self._lock:
+            self._calls[kind] += 1
+            self._call_seconds[kind] += elapsed_seconds
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._failures.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            hits = sum(self._hits.values())
+            lookups = hits + sum(self._misses.values())
+            return {
+                "enabled": self._settings.enabled,
+                "entries": len(self._entries),
+                "negative_entries": len(self._failures),
+                "hits": dict(self._hits),
+                "misses": dict(self._misses),
+                "negative_hits": self._negative_hits,
+                "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+                "latency_saved_seconds": round(self._saved_seconds, 6),
+            }
+
+    def _lookup(self, kind: str, token: str, role):
+        if not self._settings.enabled:
+            return None
+        key = token_key(token)
+        now = self._clock()
+        # Token-level rejections (verify/introspect) are shared; authorize keeps its own per role.
+        failure_key = (key, role if kind == "authorize" else "")
+        with self._lock:
+            failure = self._failures.get(failure_key)
+            if failure is not None:
+                if failure.expires_at > now:
+                    self._record_hit(kind)
+                    self._negative_hits += 1
+                    raise failure.error.with_traceback(None)
+                del self._failures[failure_key]
+
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                del self._entries[key]
+                entry = None
+            value = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if kind == "verify":
+                    value = entry.verified
+                else:
+                    cached = (entry.roles if kind == "authorize" else entry.introspections).get(role)
+                    if cached is not None and cached[1] > now:
+                        value = cached[0]
+            if value is None:
+                self._misses[kind] += 1
+            else:
+                self._record_hit(kind)
+            return value
+
+    def _record_hit(self, kind: str) -> None:
+        self._hits[kind] += 1
+        if self._calls[kind]:
+            self._saved_seconds += self._call_seconds[kind] / self._calls[kind]
+
+    def _entry(self, key: str, token: str) -> _Entry | None:
+        if not self._settings.enabled:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            now = self._clock()
+            expires_at = now + self._settings.ttl_seconds
+            exp = token_expiry(token)
+            if exp is not None:
+                expires_at = min(expires_at, now + (exp - self._wall_clock()))
+            if expires_at <= now:
+                return None
+            entry = _Entry(expires_at=expires_at)
+            self._entries[key] = entry
+            while len(self._entries) > self._settings.max_entries:
+                self._entries.popitem(last=False)
+        self._entries.move_to_end(key)
+        return entry
@@ -0,0 +1,79 @@
+from service_client import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerSettings
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(
+        CircuitBreakerSettings(
+            window_seconds=10.0,
+            minimum_requests=4,
+            failure_rate_threshold=0.5,
+            open_seconds=5.0,
+        ),
+        clock=clock,
+    )
+
+
+def test_opens_once_failure_rate_crosses_threshold():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+
+    for failed in (False, True, False):
+        breaker.record(failed)
+    assert breaker.state == CLOSED
+
+    breaker.record(True)
+
+    assert breaker.state == OPEN
+    assert breaker.allow_request() is False
+    assert breaker.snapshot()["rejected_total"] == 1
+
+
+def test_old_calls_leave_the_window():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(3):
+        breaker.record(True)
+
+    clock.now = 20.0
+    breaker.record(True)
+
+    assert breaker.state == CLOSED
+
+
+def test_half_open_admits_one_probe_and_closes_on_success():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(4):
+        breaker.record(True)
+
+    clock.now = 5.0
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False
+
+    breaker.record(False)
+
+    assert breaker.state == CLOSED
+    assert breaker.allow_request() is True
+
+
+def test_failed_probe_reopens():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(4):
+        breaker.record(True)
+    clock.now = 5.0
+    breaker.allow_request()
+
+    breaker.record(True)
+
+    assert breaker.state == OPEN
+    assert breaker.snapshot()["opened_total"] == 2
@@ -0,0 +1,283 @@
+import threading
+import time
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from service_client import (
+    AuthServiceClient,
+    JwksKeySet,
+    LocalVerificationSettings,
+    RevocationList,
+    ServiceRequestError,
+    TokenCacheSettings,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeAuthService:
+    def __init__(self):
+        self.keys = {"k1": ed25519.Ed25519PrivateKey.generate()}
+        self.revoked: list[dict] = []
+        self.revocations_down = False
+        self.calls: list[str] = []
+
+    def token(self, kid: str = "k1", role: str = "profissional", **overrides) -> str:
+        now = int(time.time())
+        payload = {
+            "sub": "u-1",
+            "username": role,
+            "role": role,
+            "type": "access",
+            "jti": f"jti-{role}",
+            "iat": now,
+            "exp": now + 300,
+            **overrides,
+        }
+        return jwt.encode(payload, self.keys[kid], algorithm="EdDSA", headers={"kid": kid})
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(request.url.path)
+        if request.url.path == "/.well-known/jwks.json":
+            okp = jwt.get_algorithm_by_name("EdDSA")
+            keys = [
+                {**okp.to_jwk(key.public_key(), as_dict=True), "kid": kid, "alg": "EdDSA", "use": "sig"}
+                for kid, key in self.keys.items()
+            ]
+            return httpx.Response(200, json={"keys": keys})
+        if request.url.path == "/api/v1/auth/revocations":
+            if self.revocations_down:
+                return httpx.Response(503, json={"detail": "unavailable"})
+            return httpx.Response(200, json={"generated_at": 0, "revoked": self.revoked})
+        return httpx.Response(
+            200,
+            json={
+                "valid": True,
+                "claims": {"sub": "remote", "role": "admin"},
+                "authorized": True,
+                "matched_role": "admin",
+            },
+        )
+
+    def client(self, **local) -> AuthServiceClient:
+        return AuthServiceClient(
+            base_url="http://auth-service",
+            cache_settings=TokenCacheSettings(enabled=False),
+            local_settings=LocalVerificationSettings(**local),
+            transport=httpx.MockTransport(self.handler),
+        )
+
+
+def test_jwks_signed_tokens_are_verified_without_auth_round_trips():
+    auth = FakeAuthService()
+    client = auth.client()
+    token = auth.token(role="profissional")
+
+    for _ in range(5):
+        claims = client.verify(token)["claims"]
+        assert claims == {"sub": "u-1", "username": "profissional", "role": "profissional"}
+        assert client.authorize(token, "profissional") is True
+        assert client.authorize(token, "admin") is False
+        introspection = client.introspect(token, ["admin", "profissional"])
+
+    assert introspection["authorized"] is True
+    assert introspection["matched_role"] == "profissional"
+    assert introspection["claims"]["exp"] == jwt.decode(token, options={"verify_signature": False})["exp"]
+    assert auth.calls == ["/.well-known/jwks.json", "/api/v1/auth/revocations"]
+    assert client.snapshot()["local_verification"]["outcomes"] == {"verified": 20}
+
+
+def test_admin_satisfies_any_role_locally():
+    auth = FakeAuthService()
+    client = auth.client()
+
+    introspection = client.introspect(auth.token(role="admin"), ["profissional"])
+
+    assert introspection["authorized"] is True
+    assert introspection["matched_role"] == "profissional"
+
+
+def test_invalid_expired_and_revoked_tokens_are_rejected_locally():
+    auth = FakeAuthService()
+    auth.revoked = [{"jti": "jti-revoked", "expires_at": int(time.time()) + 300}]
+    client = auth.client()
+    forged = jwt.encode(
+        {"sub": "u-1", "role": "admin", "type": "access", "jti": "x", "exp": int(time.time()) + 300},
+        ed25519.Ed25519PrivateKey.generate(),
+        algorithm="EdDSA",
+        headers={"kid": "k1"},
+    )
+
+    cases = {
+        forged: "invalid token",
+        auth.token(exp=int(time.time()) - 10): "token expired",
+        auth.token(type="refresh"): "invalid access token type",
+        auth.token(jti="jti-revoked"): "access token revoked",
+    }
+    for token, detail in cases.items():
+        with pytest.raises(ServiceRequestError, match=detail) as error:
+            client.verify(token)
+        assert error.value.status_code == 401
+
+    assert "/api/v1/auth/verify" not in auth.calls
+
+
+def test_unknown_kid_refetches_jwks_for_key_rotation():
+    auth = FakeAuthService()
+    client = auth.client(jwks_min_refresh_seconds=0)
+    client.verify(auth.token())
+
+    auth.keys["k2"] = ed25519.Ed25519PrivateKey.generate()
+    rotated = client.verify(auth.token(kid="k2"))
+
+    assert rotated["claims"]["sub"] == "u-1"
+    assert auth.calls.count("/.well-known/jwks.json") == 2
+    assert "/api/v1/auth/verify" not in auth.calls
+
+
+def test_unknown_kid_within_refresh_interval_falls_back_to_auth_service():
+    auth = FakeAuthService()
+    client = auth.client()
+    client.verify(auth.token())
+
+    auth.keys["k2"] = ed25519.Ed25519PrivateKey.generate()
+    fallback = client.verify(auth.token(kid="k2"))
+
+    assert fallback["claims"]["sub"] == "remote"
+    assert auth.calls.count("/.well-known/jwks.json") == 1
+    assert auth.calls[-1] == "/api/v1/auth/verify"
+
+
+def test_hs256_tokens_and_disabled_local_verification_go_to_auth_service():
+    auth = FakeAuthService()
+    hs256 = jwt.encode({"sub": "u-1", "exp": int(time.time()) + 300}, "secret", algorithm="HS256")
+
+    assert auth.client().verify(hs256)["claims"]["sub"] == "remote"
+    assert auth.client(enabled=False).verify(auth.token())["claims"]["sub"] == "remote"
+    assert auth.client(enabled=False).local_verifier is None
+    assert "/.well-known/jwks.json" not in auth.calls
+
+
+def test_stale_revocation_list_falls_back_to_auth_service():
+    fetches: list[int] = []
+    clock = FakeClock()
+    feed_up = True
+
+    def fetch() -> list[tuple[str, float]]:
+        fetches.append(1)
+        if not feed_up:
+            raise ValueError("auth service unavailable")
+        return [("jti-1", time.time() + 60), ("jti-expired", time.time() - 1)]
+
+    revocations = RevocationList(fetch, refresh_seconds=60, max_staleness_seconds=30, clock=clock)
+
+    assert revocations.is_revoked("jti-1") is True
+    assert revocations.is_revoked("jti-expired") is False
+    clock.now = 25
+    assert revocations.is_revoked("jti-2") is False
+    assert len(fetches) == 1
+
+    feed_up = False
+    assert revocations.refresh() is False
+    assert revocations.is_revoked("jti-1") is True
+    clock.now = 31
+    assert revocations.is_revoked("jti-1") is None
+    assert revocations.snapshot()["refresh_failures"] == 1
+    revocations.stop()
+
+    auth = FakeAuthService()
+    auth.revocations_down = True
+    assert auth.client().verify(auth.token())["claims"]["sub"] == "remote"
+
+
+def test_revocation_list_is_polled_off_the_request_path():
+    fetched = threading.Event()
+    fetches: list[int] = []
+
+    def fetch() -> list[tuple[str, float]]:
+        fetches.append(1)
+        if len(fetches) >= 3:
+            fetched.set()
+        return [("jti-1", time.time() + 60)]
+
+    revocations = RevocationList(fetch, refresh_seconds=0.01)
+    try:
+        assert revocations.is_revoked("jti-1") is True
+        assert revocations.snapshot()["running"] is True
+        assert fetched.wait(timeout=2)
+    finally:
+        revocations.stop()
+    assert revocations.snapshot()["running"] is False
+
+
+def test_malformed_revocation_feed_keeps_the_last_good_list():
+    feed = [{"jti": "jti-1", "expires_at": time.time() + 60}]
+
+    def fetch() -> list[tuple[str, float]]:
+        return [(item["jti"], float(item["expires_at"])) for item in feed]
+
+    revocations = RevocationList(fetch, refresh_seconds=60)
+    assert revocations.is_revoked("jti-1") is True
+
+    feed = [{"expires_at": time.time() + 60}]
+    assert revocations.refresh() is False
+    feed = [{"jti": "jti-2", "expires_at": "soon"}]
+    assert revocations.refresh() is False
+
+    assert revocations.is_revoked("jti-1") is True
+    assert revocations.snapshot()["refresh_failures"] == 2
+    revocations.stop()
+
+
+def test_jwks_key_set_keeps_known_keys_when_refresh_fails():
+    clock = FakeClock()
+    key = ed25519.Ed25519PrivateKey.generate()
+    jwk = {
+        **jwt.get_algorithm_by_name("EdDSA").to_jwk(key.public_key(), as_dict=True),
+        "kid": "k1",
+        "alg": "EdDSA",
+    }
+    responses = [{"keys": [jwk, {"kty": "oct", "k": "c2VjcmV0", "kid": "hs", "alg": "HS256"}]}]
+
+    def fetch() -> dict:
+        if not responses:
+            raise ValueError("auth service unavailable")
+        return responses.pop(0)
+
+    keys = JwksKeySet(fetch, max_age_seconds=300, min_refresh_seconds=30, clock=clock)
+
+    assert keys.key_for("k1") is not None
+    assert keys.key_for("hs") is None
+    clock.now = 10
+    assert keys.key_for("made-up") is None
+    clock.now = 301
+    assert keys.key_for("k1") is not None
+    assert keys.key_for("made-up") is None
+    assert keys.snapshot() == {"kids": ["k1"], "refreshes": 1, "refresh_failures": 1}
+
+
+def test_expired_token_gets_the_auth_service_detail_and_no_remote_call():
+    auth = FakeAuthService()
+    client = auth.client()
+    expired = auth.token(exp=int(time.time()) - 10)
+
+    for call in (
+        lambda: client.verify(expired),
+        lambda: client.authorize(expired, "profissional"),
+        lambda: client.introspect(expired, ["profissional"]),
+    ):
+        with pytest.raises(ServiceRequestError) as error:
+            call()
+        assert str(error.value) == "token expired"
+        assert error.value.status_code == 401
+
+    assert auth.calls == ["/.well-known/jwks.json"]
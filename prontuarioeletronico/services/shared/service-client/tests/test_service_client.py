@@ -0,0 +1,131 @@
+import threading
+
+import httpx
+import pytest
+
+from service_client import (
+    OPEN,
+    AuditServiceClient,
+    AuthServiceClient,
+    CircuitBreakerSettings,
+    ServiceClient,
+    ServiceClientSettings,
+    ServiceRequestError,
+    ServiceUnavailableError,
+    TokenCacheSettings,
+)
+
+
+def _auth_handler(calls: list[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get("Authorization") != "Bearer good":
+            return httpx.Response(401, json={"detail": "token expired"})
+        if request.url.path == "/api/v1/auth/verify":
+            return httpx.Response(200, json={"valid": True, "claims": {"sub": "u-1"}})
+        role = request.url.params["required_role"]
+        return httpx.Response(200, json={"authorized": role == "medico"})
+
+    return handler
+
+
+def test_auth_client_verifies_and_authorizes_over_one_pooled_client():
+    calls: list[httpx.Request] = []
+    client = AuthServiceClient(
+        base_url="http://auth-service/",
+        transport=httpx.MockTransport(_auth_handler(calls)),
+    )
+
+    assert client.verify("good")["claims"] == {"sub": "u-1"}
+    assert client.authorize("good", "medico") is True
+    assert client.authorize("good", "admin") is False
+    assert str(calls[0].url) == "http://auth-service/api/v1/auth/verify"
+    assert client.client._http() is client.client._http()
+    assert client.client.snapshot()["requests_total"] == {"ok": 3}
+
+
+def test_downstream_errors_keep_the_value_error_contract():
+    client = AuthServiceClient(
+        base_url="http://auth-service",
+        transport=httpx.MockTransport(_auth_handler([])),
+    )
+
+    with pytest.raises(ServiceRequestError) as error:
+        client.verify("expired")
+
+    assert isinstance(error.value, ValueError)
+    assert str(error.value) == "token expired"
+    assert error.value.status_code == 401
+
+
+def test_transport_failures_raise_unavailable_and_open_the_circuit():
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = AuditServiceClient(
+        base_url="http://audit-service",
+        breaker_settings=CircuitBreakerSettings(minimum_requests=3, open_seconds=60.0),
+        transport=httpx.MockTransport(handler),
+    )
+
+    for _ in range(5):
+        with pytest.raises(ServiceUnavailableError, match="audit service unavailable"):
+            client.create_event("good", {"operation": "read"})
+
+    assert len(attempts) == 3
+    snapshot = client.client.snapshot()
+    assert snapshot["circuit"]["state"] == OPEN
+    assert snapshot["requests_total"] == {"unavailable": 3, "circuit_open": 2}
+
+
+def test_client_errors_do_not_count_against_the_circuit():
+    client = ServiceClient(
+        name="auth",
+        base_url="http://auth-service",
+        breaker_settings=CircuitBreakerSettings(minimum_requests=2),
+        transport=httpx.MockTransport(lambda request: httpx.Response(404, json={})),
+    )
+
+    for _ in range(4):
+        with pytest.raises(ServiceRequestError, match="auth request failed"):
+            client.request("GET", "/missing")
+
+    assert client.breaker.state == "closed"
+
+
+def test_concurrent_calls_share_the_client():
+    calls: list[httpx.Request] = []
+    client = AuthServiceClient(
+        base_url="http://auth-service",
+        cache_settings=TokenCacheSettings(enabled=False),
+        transport=httpx.MockTransport(_auth_handler(calls)),
+    )
+    threads = [threading.Thread(target=client.verify, args=("good",)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 8
+    assert client.client.snapshot()["latency_seconds"]["count"] == 8
+
+
+def test_settings_read_service_then_shared_env(monkeypatch):
+    monkeypatch.setenv("AUTH_SERVICE_READ_TIMEOUT_SECONDS", "1.5")
+    monkeypatch.setenv("SERVICE_CLIENT_READ_TIMEOUT_SECONDS", "9")
+    monkeypatch.setenv("SERVICE_CLIENT_MAX_CONNECTIONS", "40")
+    monkeypatch.setenv("AUTH_SERVICE_CIRCUIT_ENABLED", "false")
+
+    settings = ServiceClientSettings.from_env("AUTH_SERVICE")
+    client = AuthServiceClient.from_env("http://auth-service")
+    http = client.client._http()
+
+    assert settings.read_timeout_seconds == 1.5
+    assert settings.max_connections == 40
+    assert ServiceClientSettings.from_env("AUDIT_SERVICE").read_timeout_seconds == 9.0
+    assert http.timeout.read == 1.5
+    assert http.timeout.connect == ServiceClientSettings().connect_timeout_seconds
+    assert client.client.breaker.settings.enabled is False
@@ -0,0 +1,217 @@
+import base64
+import json
+
+import httpx
+import pytest
+
+from service_client import (
+    AuthServiceClient,
+    ServiceRequestError,
+    ServiceUnavailableError,
+    TokenCache,
+    TokenCacheSettings,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"sub": "u-1", "exp": exp}).encode()).rstrip(b"=")
+    return f"eyJhbGciOiJIUzI1NiJ9.{payload.decode()}.signature"
+
+
+def _auth_client(calls: list[httpx.Request], **cache) -> AuthServiceClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers["Authorization"].endswith("revoked"):
+            return httpx.Response(401, json={"detail": "token revoked"})
+        if request.url.path == "/api/v1/auth/verify":
+            return httpx.Response(200, json={"valid": True, "claims": {"sub": "u-1", "role": "admin"}})
+        return httpx.Response(200, json={"authorized": request.url.params["required_role"] == "admin"})
+
+    return AuthServiceClient(
+        base_url="http://auth-service",
+        cache_settings=TokenCacheSettings(**cache),
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def test_verify_and_role_decisions_are_served_from_cache():
+    calls: list[httpx.Request] = []
+    client = _auth_client(calls)
+
+    for _ in range(3):
+        assert client.verify("token-a")["claims"]["role"] == "admin"
+        assert client.authorize("token-a", "admin") is True
+        assert client.authorize("token-a", "profissional") is False
+
+    assert len(calls) == 3
+    snapshot = client.snapshot()["token_cache"]
+    assert snapshot["hits"] == {"verify": 2, "authorize": 4, "introspect": 0}
+    assert snapshot["misses"] == {"verify": 1, "authorize": 2, "introspect": 0}
+    assert snapshot["hit_ratio"] == pytest.approx(6 / 9, abs=1e-4)
+    assert snapshot["latency_saved_seconds"] > 0
+
+
+def test_rejections_are_cached_briefly_but_outages_are_not():
+    calls: list[httpx.Request] = []
+    client = _auth_client(calls)
+
+    for _ in range(2):
+        with pytest.raises(ServiceRequestError, match="token revoked"):
+            client.verify("token-revoked")
+    assert len(calls) == 1
+    assert client.cache.snapshot()["negative_hits"] == 1
+
+    def down(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    offline = AuthServiceClient(base_url="http://auth-service", transport=httpx.MockTransport(down))
+    with pytest.raises(ServiceUnavailableError):
+        offline.verify("token-a")
+    assert offline.cache.snapshot()["negative_entries"] == 0
+
+
+def _scripted_auth_client(calls: list[httpx.Request], status_code: int) -> AuthServiceClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(status_code, json={"detail": f"auth answered {status_code}"})
+
+    return AuthServiceClient(base_url="http://auth-service", transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.parametrize("status_code", [401, 403])
+def test_unauthorized_and_forbidden_answers_are_cached(status_code):
+    calls: list[httpx.Request] = []
+    client = _scripted_auth_client(calls, status_code)
+
+    for _ in range(2):
+        with pytest.raises(ServiceRequestError) as error:
+            client.introspect("token-a", ["admin"])
+        assert error.value.status_code == status_code
+        with pytest.raises(ServiceRequestError):
+            client.authorize("token-a", "admin")
+
+    assert len(calls) == 2
+    assert client.cache.snapshot()["negative_entries"] == 2
+
+
+@pytest.mark.parametrize("status_code", [500, 503])
+def test_server_errors_are_raised_without_being_cached(status_code):
+    calls: list[httpx.Request] = []
+    client = _scripted_auth_client(calls, status_code)
+
+    for call in (
+        lambda: client.verify("token-a"),
+        lambda: client.authorize("token-a", "admin"),
+        lambda: client.introspect("token-a", ["admin"]),
+    ):
+        for _ in range(2):
+            with pytest.raises(ServiceRequestError) as error:
+                call()
+            assert error.value.status_code == status_code
+
+    assert len(calls) == 6
+    assert client.cache.snapshot()["negative_entries"] == 0
+
+
+def test_entries_expire_at_ttl_or_token_exp_whichever_is_first():
+    clock, wall = FakeClock(), FakeClock(now=1_000.0)
+    cache = TokenCache(TokenCacheSettings(ttl_seconds=30.0), clock=clock, wall_clock=wall)
+    short_lived = _jwt(exp=1_010.0)
+
+    cache.put_verified("opaque", {"valid": True})
+    cache.put_verified(short_lived, {"valid": True})
+
+    clock.now = 9.0
+    assert cache.get_verified(short_lived) == {"valid": True}
+    clock.now = 11.0
+    assert cache.get_verified(short_lived) is None
+    assert cache.get_verified("opaque") == {"valid": True}
+    clock.now = 31.0
+    assert cache.get_verified("opaque") is None
+
+
+def test_expired_tokens_are_never_cached():
+    cache = TokenCache(wall_clock=FakeClock(now=1_000.0))
+
+    cache.put_verified(_jwt(exp=999.0), {"valid": True})
+
+    assert cache.snapshot()["entries"] == 0
+
+
+def test_denied_roles_use_the_negative_ttl():
+    clock = FakeClock()
+    cache = TokenCache(
+        TokenCacheSettings(ttl_seconds=30.0, negative_ttl_seconds=2.0),
+        clock=clock,
+    )
+    cache.put_role("token-a", "admin", True)
+    cache.put_role("token-a", "profissional", False)
+
+    clock.now = 3.0
+
+    assert cache.get_role("token-a", "admin") is True
+    assert cache.get_role("token-a", "profissional") is None
+
+
+def test_cache_is_bounded_and_keyed_by_token_hash():
+    cache = TokenCache(TokenCacheSettings(max_entries=2))
+    for token in ("token-a", "token-b", "token-c"):
+        cache.put_verified(token, {"token": token})
+
+    assert cache.get_verified("token-a") is None
+    assert cache.get_verified("token-c") == {"token": "token-c"}
+    assert all("token-" not in key for key in cache._entries)
+
+
+def test_introspection_is_one_round_trip_and_cached_per_role_set():
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        roles = request.url.params.get_list("roles")
+        matched = "profissional" if "profissional" in roles else None
+        return httpx.Response(
+            200,
+            json={
+                "valid": True,
+                "claims": {"sub": "u-2", "role": "profissional"},
+                "authorized": matched is not None,
+                "matched_role": matched,
+            },
+        )
+
+    client = AuthServiceClient(base_url="http://auth-service", transport=httpx.MockTransport(handler))
+
+    for _ in range(3):
+        allowed = client.introspect("token-b", ["admin", "profissional"])
+    denied = client.introspect("token-b", ["admin"])
+
+    assert allowed["matched_role"] == "profissional"
+    assert denied["authorized"] is False
+    assert [call.url.params.get_list("roles") for call in calls] == [
+        ["admin", "profissional"],
+        ["admin"],
+    ]
+    assert client.verify("token-b")["claims"]["sub"] == "u-2"
+    assert len(calls) == 2
+    assert client.cache.snapshot()["hits"]["introspect"] == 2
+
+
+def test_introspection_rejection_is_shared_with_verify():
+    calls: list[httpx.Request] = []
+    client = _auth_client(calls)
+
+    with pytest.raises(ServiceRequestError, match="token revoked"):
+        client.introspect("token-revoked", ["admin"])
+    with pytest.raises(ServiceRequestError, match="token revoked"):
+        client.verify("token-revoked")
+
+    assert len(calls) == 1
@@ -37,15 +37,25 @@ Microsserviço gerado a partir do template ARC-02 com Clean Architecture por con
 ```bash
 python -m venv .venv
 .venv\\Scripts\\activate
-pip install -r requirements.txt
+pip install -r requirements.txt ../shared/service-client
 pytest -q
 uvicorn src.{{PACKAGE_NAME}}.infra.api.main:app --reload --port 8001
 ```
 
+As chamadas ao auth-service e ao audit-service usam os clientes compartilhados de
+`services/shared/service-client` (pool keep-alive, timeouts, circuit breaker e métricas),
+configuráveis por `AUTH_SERVICE_*`/`AUDIT_SERVICE_*` ou `SERVICE_CLIENT_*`. A imagem é construída a
+partir de `services/` para copiar essa biblioteca:
+
+```bash
+docker build -f {{SERVICE_FOLDER}}/Dockerfile -t {{SERVICE_FOLDER}} .
+```
+
 ## Endpoints base
 
 - `GET /health` -> liveness/readiness
 - `GET /api/v1/info` -> metadados do serviço
+- `POST /api/v1/samples` -> exemplo protegido por perfil (`admin`), com evento de auditoria
 """,
     "requirements.txt": """fastapi==0.109.0
 uvicorn==0.27.0
@@ -63,10 +73,12 @@ if __name__ == \"__main__\":
     "Dockerfile": """FROM python:3.11-slim
 
 WORKDIR /app
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
+COPY {{SERVICE_FOLDER}}/requirements.txt .
+COPY shared/service-client /tmp/service-client
+RUN pip install --no-cache-dir -r requirements.txt /tmp/service-client \\
+\t&& rm -rf /tmp/service-client
 
-COPY src ./src
+COPY {{SERVICE_FOLDER}}/src ./src
 
 EXPOSE 8000
 CMD [\"uvicorn\", \"src.{{PACKAGE_NAME}}.infra.api.main:app\", \"--host\", \"0.0.0.0\", \"--port\", \"8000\"]
@@ -226,7 +238,21 @@ class InMemorySampleRepository(SampleRepositoryInterface):
         return list(self._data.values())
 """,
     "src/{{PACKAGE_NAME}}/infra/api/__init__.py": "",
-    "src/{{PACKAGE_NAME}}/infra/api/main.py": """from fastapi import FastAPI
+    "src/{{PACKAGE_NAME}}/infra/api/main.py": """from dataclasses import asdict
+from datetime import datetime, timezone
+import os
+
+from fastapi import Depends, FastAPI, Header, HTTPException, Security
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import BaseModel
+
+from service_client import AuditServiceClient, AuthServiceClient
+
+from ...application.sample.create_sample_usecase import (
+    CreateSampleInputDTO,
+    CreateSampleUseCase,
+)
+from ...infra.sample.in_memory_sample_repository import InMemorySampleRepository
 
 
 app = FastAPI(
@@ -236,6 +262,85 @@ app = FastAPI(
 )
 
 
+APP_ENV = os.getenv(\"APP_ENV\", \"development\")
+AUTH_SERVICE_URL = os.getenv(\"AUTH_SERVICE_URL\")
+AUDIT_SERVICE_URL = os.getenv(\"AUDIT_SERVICE_URL\")
+if AUTH_SERVICE_URL is None:
+    if APP_ENV in {\"production\", \"staging\"}:
+        raise RuntimeError(\"AUTH_SERVICE_URL is required for production/staging\")
+    AUTH_SERVICE_URL = \"http://localhost:8001\"
+if AUDIT_SERVICE_URL is None:
+    if APP_ENV in {\"production\", \"staging\"}:
+        raise RuntimeError(\"AUDIT_SERVICE_URL is required for production/staging\")
+    AUDIT_SERVICE_URL = \"http://localhost:8005\"
+
+
+class CreateSampleRequest(BaseModel):
+    name: str
+
+
+_repository = InMemorySampleRepository()
+_create_sample_usecase = CreateSampleUseCase(_repository)
+# Pooled clients from services/shared/service-client; timeouts, pool and circuit
+# breaker come from AUTH_SERVICE_* / AUDIT_SERVICE_* (or SERVICE_CLIENT_*).
+_auth_client = AuthServiceClient.from_env(AUTH_SERVICE_URL)
+_audit_client = AuditServiceClient.from_env(AUDIT_SERVICE_URL)
+_bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def _extract_bearer_token(authorization: str | None) -> str:
+    if not authorization:
+        raise HTTPException(status_code=401, detail=\"missing authorization header\")
+
+    prefix = \"Bearer \"
+    if not authorization.startswith(prefix):
+        raise HTTPException(status_code=401, detail=\"invalid authorization scheme\")
+
+    token = authorization[len(prefix):].strip()
+    if not token:
+        raise HTTPException(status_code=401, detail=\"empty bearer token\")
+    return token
+
+
+def _require_roles(required_roles: list[str]):
+    def dependency(
+        authorization: str | None = Header(default=None),
+        bearer: HTTPAuthorizationCredentials | None = Security(_bearer_scheme),
+    ) -> dict:
+        token = bearer.credentials if bearer else _extract_bearer_token(authorization)
+
+        try:
+            introspection = _auth_client.introspect(token, required_roles)
+        except ValueError as error:
+            raise HTTPException(status_code=401, detail=str(error)) from error
+
+        if not introspection.get(\"authorized\"):
+            raise HTTPException(status_code=403, detail=\"insufficient role\")
+        return {**introspection, \"token\": token}
+
+    return dependency
+
+
+def _emit_audit_event(auth: dict, operation: str, resource_id: str) -> None:
+    claims = auth.get(\"claims\", {})
+    try:
+        _audit_client.create_event(
+            token=auth[\"token\"],
+            payload={
+                \"actor_id\": str(claims.get(\"sub\") or \"unknown\"),
+                \"actor_role\": str(claims.get(\"role\") or \"unknown\"),
+                \"context\": \"{{SERVICE_NAME}}\",
+                \"operation\": operation,
+                \"resource_type\": \"sample\",
+                \"resource_id\": resource_id,
+                \"status\": \"success\",
+                \"occurred_at\": datetime.now(timezone.utc).isoformat().replace(\"+00:00\", \"Z\"),
+            },
+        )
+    except ValueError:
+        return
+
+
 @app.get(\"/health\")
 def health_check():
     return {\"status\": \"healthy\", \"service\": \"{{SERVICE_NAME}}\"}
@@ -248,6 +353,20 @@ def service_info():
         \"architecture\": \"clean-architecture\",
         \"layers\": [\"domain\", \"application\", \"infra\"],
     }
+
+
+@app.post(\"/api/v1/samples\", status_code=201)
+def create_sample(
+    payload: CreateSampleRequest,
+    auth: dict = Depends(_require_roles([\"admin\"])),
+):
+    try:
+        output = _create_sample_usecase.execute(CreateSampleInputDTO(name=payload.name))
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
+
+    _emit_audit_event(auth, \"create_sample\", output.id)
+    return asdict(output)
 """,
     "tests/test_create_sample_usecase.py": """from src.{{PACKAGE_NAME}}.application.sample.create_sample_usecase import (
     CreateSampleInputDTO,
@@ -278,6 +397,54 @@ def test_create_sample_usecase_rejects_short_name():
         assert False, \"expected ValueError\"
     except ValueError as error:
         assert \"at least 3 characters\" in str(error)
+""",
+    "tests/test_sample_api.py": """from fastapi.testclient import TestClient
+
+from src.{{PACKAGE_NAME}}.infra.api import main
+
+
+client = TestClient(main.app)
+AUTH_HEADER = {\"Authorization\": \"Bearer fake-token\"}
+
+
+def _auth(monkeypatch, roles: set[str]) -> list[dict]:
+    events: list[dict] = []
+
+    def introspect(token: str, required_roles: list[str]) -> dict:
+        assert token == \"fake-token\"
+        matched = next((role for role in required_roles if role in roles), None)
+        return {
+            \"valid\": True,
+            \"claims\": {\"sub\": \"1\", \"role\": \"admin\"},
+            \"authorized\": matched is not None,
+            \"matched_role\": matched,
+        }
+
+    def create_event(token: str, payload: dict) -> dict:
+        events.append(payload)
+        return payload
+
+    monkeypatch.setattr(main._auth_client, \"introspect\", introspect)
+    monkeypatch.setattr(main._audit_client, \"create_event\", create_event)
+    return events
+
+
+def test_create_sample_requires_role_and_emits_audit_event(monkeypatch):
+    events = _auth(monkeypatch, {\"admin\"})
+
+    response = client.post(\"/api/v1/samples\", json={\"name\": \"example\"}, headers=AUTH_HEADER)
+
+    assert response.status_code == 201
+    assert events[0][\"operation\"] == \"create_sample\"
+    assert events[0][\"resource_id\"] == response.json()[\"id\"]
+
+
+def test_create_sample_rejects_missing_role(monkeypatch):
+    _auth(monkeypatch, set())
+
+    response = client.post(\"/api/v1/samples\", json={\"name\": \"example\"}, headers=AUTH_HEADER)
+
+    assert response.status_code == 403
 """,
     "tests/test_health_endpoint.py": """from fastapi.testclient import TestClient
 
@@ -366,7 +533,7 @@ def main() -> int:
 
     print(f"[OK] Serviço criado em: {service_root}")
     print("[NEXT] Entre na pasta do serviço e execute:")
-    print("       pip install -r requirements.txt")
+    print("       pip install -r requirements.txt ../shared/service-client")
     print("       pytest -q")
     return 0
 